@@ -11,6 +11,10 @@
  * 2. If running, exit successfully
  * 3. If not running, spawn the server and wait for health check
  * 4. Exit with code 0 on success, 1 on failure
+ *
+ * If PMXT_READY_FD names an open pipe, readiness is event-driven instead:
+ * the pipe is handed to the server, which writes "ready <port>" once it is
+ * listening, and the launcher exits as soon as the server is spawned.
  */
 
 const fs = require('fs');
@@ -23,6 +27,8 @@ const LOCK_FILE = path.join(os.homedir(), '.pmxt', 'server.lock');
 const DEFAULT_PORT = 3847;
 const HEALTH_CHECK_TIMEOUT = 10000; // 10 seconds
 const HEALTH_CHECK_INTERVAL = 100; // 100ms
+const READY_FD = parseInt(process.env.PMXT_READY_FD, 10);
+const HAS_READY_FD = Number.isInteger(READY_FD) && READY_FD > 2;
 
 /**
  * Check if the server is currently running
@@ -85,6 +91,21 @@ function waitForHealth(port, timeout = HEALTH_CHECK_TIMEOUT) {
     });
 }
 
+/**
+ * Tell the caller the server is ready (when a readiness pipe was given)
+ */
+function signalReady(port) {
+    if (!HAS_READY_FD) {
+        return;
+    }
+    try {
+        fs.writeSync(READY_FD, `ready ${port}\n`);
+        fs.closeSync(READY_FD);
+    } catch (err) {
+        // Caller stopped listening; it falls back to health checks
+    }
+}
+
 /**
  * Start the PMXT server
  */
@@ -113,16 +134,31 @@ async function startServer() {
         serverCmd = localBinServer;
     }
 
+    // Hand the readiness pipe to the server as fd 3
+    const env = { ...process.env };
+    delete env.PMXT_READY_FD;
+    let stdio = 'ignore';
+    if (HAS_READY_FD) {
+        env.PMXT_READY_FD = '3';
+        stdio = ['ignore', 'ignore', 'ignore', READY_FD];
+    }
+
     // Spawn server as detached process
     const serverProcess = spawn(serverCmd, args, {
         detached: true,
-        stdio: 'ignore',
-        env: process.env
+        stdio,
+        env
     });
 
     // Detach from parent process
     serverProcess.unref();
 
+    if (HAS_READY_FD) {
+        // The server signals readiness itself
+        fs.closeSync(READY_FD);
+        return;
+    }
+
     // Wait for server to be ready
     await waitForHealth(DEFAULT_PORT);
 }
@@ -139,6 +175,7 @@ async function main() {
             // Server is running, verify it's healthy
             try {
                 await waitForHealth(serverStatus.port, 2000);
+                signalReady(serverStatus.port);
                 process.exit(0);
             } catch (err) {
                 // Server process exists but not responding, try to start fresh
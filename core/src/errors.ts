@@ -57,6 +57,15 @@ export class AuthenticationError extends BaseError {
     }
 }
 
+/**
+ * 401 Unauthorized - The sidecar session is unknown or expired; open a new one
+ */
+export class SessionNotFound extends BaseError {
+    constructor(message: string, exchange?: string) {
+        super(message, 401, 'SESSION_NOT_FOUND', false, exchange);
+    }
+}
+
 /**
  * 403 Forbidden - The authenticated user doesn't have permission
  */
@@ -157,3 +166,12 @@ export class ExchangeNotAvailable extends BaseError {
         super(message, 503, 'EXCHANGE_NOT_AVAILABLE', true, exchange);
     }
 }
+
+/**
+ * 504 Gateway Timeout - The request exceeded the caller's time budget (retryable)
+ */
+export class RequestTimeout extends BaseError {
+    constructor(message: string, exchange?: string) {
+        super(message, 504, 'REQUEST_TIMEOUT', true, exchange);
+    }
+}
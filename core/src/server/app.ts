@@ -4,7 +4,18 @@ import { PolymarketExchange } from '../exchanges/polymarket';
 import { LimitlessExchange } from '../exchanges/limitless';
 import { KalshiExchange } from '../exchanges/kalshi';
 import { ExchangeCredentials } from '../BaseExchange';
-import { BaseError } from '../errors';
+import { BadRequest, BaseError, RequestTimeout, SessionNotFound } from '../errors';
+import { ExchangeCache } from './utils/exchange-cache';
+import { encodeResponses } from './utils/response-encoding';
+import { FieldTree, fieldTree, project, PROJECTABLE_METHODS } from './utils/projection';
+import { FILTER_METHODS, parseCriteria } from './utils/pushdown';
+import { CatalogSync } from './utils/catalog-sync';
+
+// Remaining time budget forwarded by the SDKs, in milliseconds
+const TIMEOUT_HEADER = 'x-pmxt-timeout-ms';
+
+// Session opened via POST /session/:exchange, sent instead of raw credentials
+const SESSION_HEADER = 'x-pmxt-session-id';
 
 // Singleton instances for local usage (when no credentials provided)
 const defaultExchanges: Record<string, any> = {
@@ -16,7 +27,15 @@ const defaultExchanges: Record<string, any> = {
 export async function startServer(port: number, accessToken: string) {
     const app: Express = express();
 
+    // Authenticated exchange instances, reused across requests and sessions
+    const credentialedExchanges = new ExchangeCache(createExchange);
+
+    // Catalog snapshots behind incremental syncMarkets calls
+    const catalogSync = new CatalogSync();
+
     app.use(cors());
+    // Opt-in MessagePack bodies (Accept) and compression (Accept-Encoding)
+    app.use(encodeResponses());
     app.use(express.json());
 
     // Health check (public)
@@ -34,6 +53,23 @@ export async function startServer(port: number, accessToken: string) {
         next();
     });
 
+    // Session handshake: POST /session/:exchange
+    // Body: { credentials: ExchangeCredentials } -> { sessionId }
+    app.post('/session/:exchange', (req: Request, res: Response, next: NextFunction) => {
+        try {
+            const exchangeName = (req.params.exchange as string).toLowerCase();
+            const credentials = req.body.credentials as ExchangeCredentials | undefined;
+            if (!credentials || !(credentials.privateKey || credentials.apiKey)) {
+                throw new BadRequest('Credentials are required to open a session', exchangeName);
+            }
+
+            const sessionId = credentialedExchanges.openSession(exchangeName, credentials);
+            res.json({ success: true, data: { sessionId } });
+        } catch (error: any) {
+            next(error);
+        }
+    });
+
     // API endpoint: POST /api/:exchange/:method
     // Body: { args: any[], credentials?: ExchangeCredentials }
     app.post('/api/:exchange/:method', async (req: Request, res: Response, next: NextFunction) => {
@@ -44,11 +80,17 @@ export async function startServer(port: number, accessToken: string) {
             const credentials = req.body.credentials as ExchangeCredentials | undefined;
 
             // 1. Get or Initialize Exchange
-            // If credentials are provided, create a new instance for this request
+            // Credentials or a session resolve to a cached authenticated instance
             // Otherwise, use the singleton instance
+            const sessionId = req.headers[SESSION_HEADER];
             let exchange: any;
             if (credentials && (credentials.privateKey || credentials.apiKey)) {
-                exchange = createExchange(exchangeName, credentials);
+                exchange = credentialedExchanges.get(exchangeName, credentials);
+            } else if (typeof sessionId === 'string' && sessionId) {
+                exchange = credentialedExchanges.fromSession(exchangeName, sessionId);
+                if (!exchange) {
+                    throw new SessionNotFound(`Unknown or expired session for ${exchangeName}`, exchangeName);
+                }
             } else {
                 if (!defaultExchanges[exchangeName]) {
                     defaultExchanges[exchangeName] = createExchange(exchangeName);
@@ -57,15 +99,56 @@ export async function startServer(port: number, accessToken: string) {
             }
 
             // 2. Validate Method
-            if (typeof exchange[methodName] !== 'function') {
+            // syncMarkets is served by the sidecar: fetchMarkets, diffed against the caller's cursor
+            const sync = methodName === 'syncMarkets';
+            const target = sync ? 'fetchMarkets' : methodName;
+            if (typeof exchange[target] !== 'function') {
                 res.status(404).json({ success: false, error: `Method '${methodName}' not found on ${exchangeName}` });
                 return;
             }
 
-            // 3. Execute with direct argument spreading
-            const result = await exchange[methodName](...args);
+            // Sync baselines are kept per exchange and query, filter and fields included
+            const stream = sync ? CatalogSync.stream(exchangeName, args[0]) : '';
 
-            res.json({ success: true, data: result });
+            // 3. Split off the filter and field projection, applied to the result
+            // before serializing so only what the caller keeps goes over the wire
+            let fields: FieldTree | undefined;
+            let criteria: ReturnType<typeof parseCriteria> | undefined;
+            if (PROJECTABLE_METHODS.has(methodName) && args[0] && typeof args[0] === 'object') {
+                const { fields: requestedFields, filter: requestedFilter, ...params } = args[0];
+                if (requestedFields !== undefined) {
+                    fields = fieldTree(requestedFields);
+                    if (sync) {
+                        fields.marketId = true; // Deltas are keyed by market
+                    }
+                }
+                if (requestedFilter !== undefined && FILTER_METHODS[methodName]) {
+                    criteria = parseCriteria(requestedFilter);
+                }
+                args[0] = params;
+            }
+
+            // 4. Execute with direct argument spreading, bounded by the caller's time budget
+            const timeoutMs = parseTimeout(req.headers[TIMEOUT_HEADER]);
+            const result = await withTimeout(
+                exchange[target](...(sync ? args.slice(0, 1) : args)),
+                timeoutMs,
+                `${exchangeName}.${methodName}`
+            );
+
+            let data = result;
+            if (criteria !== undefined) {
+                data = exchange[FILTER_METHODS[methodName]](data, criteria);
+            }
+            if (fields) {
+                data = project(data, fields);
+            }
+            if (sync) {
+                const cursor = typeof args[1] === 'string' ? args[1] : undefined;
+                data = catalogSync.diff(stream, data, cursor);
+            }
+
+            res.json({ success: true, data });
         } catch (error: any) {
             next(error);
         }
@@ -121,6 +204,35 @@ export async function startServer(port: number, accessToken: string) {
     return app.listen(port, '127.0.0.1');
 }
 
+function parseTimeout(header: string | string[] | undefined): number | undefined {
+    const value = Number(Array.isArray(header) ? header[0] : header);
+    return Number.isFinite(value) && value > 0 ? value : undefined;
+}
+
+/**
+ * Resolve with the call's result, or reject with RequestTimeout once the caller's
+ * budget is spent. The caller has given up by then, so we answer immediately
+ * and let the abandoned upstream call settle in the background.
+ */
+function withTimeout<T>(call: Promise<T>, timeoutMs: number | undefined, label: string): Promise<T> {
+    if (timeoutMs === undefined) {
+        return call;
+    }
+
+    let timer: NodeJS.Timeout;
+    const timeout = new Promise<never>((_, reject) => {
+        timer = setTimeout(
+            () => reject(new RequestTimeout(`${label} timed out after ${timeoutMs}ms`)),
+            timeoutMs
+        );
+    });
+
+    // Swallow late failures of an abandoned call
+    Promise.resolve(call).catch(() => { });
+
+    return Promise.race([call, timeout]).finally(() => clearTimeout(timer));
+}
+
 function createExchange(name: string, credentials?: ExchangeCredentials) {
     switch (name) {
         case 'polymarket':
@@ -1,5 +1,6 @@
 #!/usr/bin/env node
 import 'dotenv/config';
+import cluster from 'cluster';
 import { startServer } from './app';
 import { PortManager } from './utils/port-manager';
 import { LockFile } from './utils/lock-file';
@@ -7,7 +8,7 @@ import { LockFile } from './utils/lock-file';
 import { randomUUID } from 'crypto';
 
 import { createHash } from 'crypto';
-import { readFileSync, statSync } from 'fs';
+import { closeSync, readFileSync, statSync, writeSync } from 'fs';
 import { join } from 'path';
 
 function getServerVersion(): string {
@@ -62,7 +63,109 @@ function getServerVersion(): string {
     }
 }
 
+/**
+ * Signal readiness on the pipe handed down by pmxt-ensure-server, if any,
+ * so SDKs can stop waiting without polling /health.
+ */
+function notifyReady(port: number): void {
+    const fd = parseInt(process.env.PMXT_READY_FD || '', 10);
+    if (!Number.isInteger(fd) || fd < 3) {
+        return;
+    }
+    // Signal once: the fd number may be reused after it is closed
+    delete process.env.PMXT_READY_FD;
+    try {
+        writeSync(fd, `ready ${port}\n`);
+        closeSync(fd);
+    } catch {
+        // Nobody is waiting on the pipe anymore
+    }
+}
+
+// Delay before re-forking a shard that exited
+const SHARD_RESPAWN_DELAY_MS = 500;
+
+function shardCount(): number {
+    const shards = parseInt(process.env.PMXT_SHARDS || '', 10);
+    return Number.isInteger(shards) && shards > 1 ? shards : 1;
+}
+
+/**
+ * Primary process of a sharded sidecar: forks one worker per port, records
+ * every port in the lock file, and re-forks shards that die.
+ */
+async function runShardPrimary(shards: number) {
+    const portManager = new PortManager();
+    const ports: number[] = [];
+    let nextPort = 3847; // Default port
+    for (let i = 0; i < shards; i++) {
+        const port = await portManager.findAvailablePort(nextPort);
+        ports.push(port);
+        nextPort = port + 1;
+    }
+    const accessToken = process.env.PMXT_ACCESS_TOKEN || randomUUID();
+    const version = getServerVersion();
+
+    const lockFile = new LockFile();
+    await lockFile.create(ports[0], process.pid, accessToken, version, ports);
+
+    let shuttingDown = false;
+    let starting = shards;
+    const fork = (index: number) => {
+        const worker = cluster.fork({
+            PMXT_SHARD_PORT: String(ports[index]),
+            PMXT_ACCESS_TOKEN: accessToken,
+            PMXT_READY_FD: '',
+        });
+        worker.once('listening', () => {
+            starting--;
+            if (starting === 0) {
+                notifyReady(ports[0]);
+            }
+        });
+        worker.once('exit', () => {
+            if (!shuttingDown) {
+                console.error(`Shard on port ${ports[index]} exited, restarting...`);
+                setTimeout(() => fork(index), SHARD_RESPAWN_DELAY_MS);
+            }
+        });
+    };
+    ports.forEach((_, index) => fork(index));
+
+    console.log(`PMXT Sidecar Server v${version} running ${shards} shards on ports ${ports.join(', ')}`);
+    console.log(`Lock file created at ${lockFile.lockPath}`);
+
+    const shutdown = async () => {
+        console.log('\nShutting down gracefully...');
+        shuttingDown = true;
+        for (const worker of Object.values(cluster.workers || {})) {
+            worker?.kill();
+        }
+        await lockFile.remove();
+        process.exit(0);
+    };
+
+    process.on('SIGTERM', shutdown);
+    process.on('SIGINT', shutdown);
+}
+
+/**
+ * Worker process of a sharded sidecar; the primary owns the lock file.
+ */
+async function runShard() {
+    const port = parseInt(process.env.PMXT_SHARD_PORT || '', 10);
+    await startServer(port, process.env.PMXT_ACCESS_TOKEN || '');
+}
+
 async function main() {
+    if (cluster.isWorker) {
+        return runShard();
+    }
+    const shards = shardCount();
+    if (shards > 1) {
+        return runShardPrimary(shards);
+    }
+
     const portManager = new PortManager();
     const port = await portManager.findAvailablePort(3847); // Default port
     const accessToken = process.env.PMXT_ACCESS_TOKEN || randomUUID();
@@ -72,6 +175,11 @@ async function main() {
     await lockFile.create(port, process.pid, accessToken, version);
 
     const server = await startServer(port, accessToken);
+    if (server.listening) {
+        notifyReady(port);
+    } else {
+        server.once('listening', () => notifyReady(port));
+    }
 
     console.log(`PMXT Sidecar Server v${version} running on http://localhost:${port}`);
     if (version.includes('-dev.')) {
@@ -0,0 +1,99 @@
+import { createHash, randomUUID } from 'crypto';
+
+// Streams unsynced for this long are forgotten (clients then get a full snapshot)
+const DEFAULT_IDLE_MS = 15 * 60 * 1000;
+
+// Upper bound on streams holding a baseline; the least recently synced is dropped first
+const DEFAULT_MAX_STREAMS = 16;
+
+export interface CatalogDelta {
+    cursor: string;
+    /** True if `upserts` is the whole catalog and anything else should be dropped */
+    full: boolean;
+    upserts: any[];
+    removed: string[];
+}
+
+interface Baseline {
+    cursor: string;
+    hashes: Map<string, string>; // marketId -> content hash
+    lastUsed: number;
+}
+
+/**
+ * Catalog baselines for incremental syncMarkets calls.
+ *
+ * Each call diffs the freshly fetched markets against the caller's cursor
+ * and returns only what changed, plus a new cursor. A stream (an exchange
+ * and the query it is synced with) keeps a single baseline, the last one
+ * handed out: redeeming its cursor replaces it, and any other cursor
+ * (reused, superseded by another client of the stream, or evicted) is
+ * unknown and gets a full snapshot, which clients reconcile against their
+ * own table.
+ */
+export class CatalogSync {
+    private streams = new Map<string, Baseline>(); // insertion order = LRU order
+
+    constructor(
+        private idleMs: number = DEFAULT_IDLE_MS,
+        private maxStreams: number = DEFAULT_MAX_STREAMS
+    ) { }
+
+    static hash(market: any): string {
+        return createHash('sha1').update(JSON.stringify(market)).digest('base64');
+    }
+
+    /** Stream key for an exchange synced with `params` (the request's first argument). */
+    static stream(exchangeName: string, params: unknown): string {
+        return `${exchangeName}:${JSON.stringify(params ?? {})}`;
+    }
+
+    diff(stream: string, markets: any[], cursor?: string): CatalogDelta {
+        this.evictIdle();
+
+        const previous = this.streams.get(stream);
+        this.streams.delete(stream); // Re-inserted below as the most recent
+        const known = previous && cursor && previous.cursor === cursor ? previous.hashes : undefined;
+
+        const hashes = new Map<string, string>();
+        const upserts: any[] = [];
+        for (const market of markets) {
+            const hash = CatalogSync.hash(market);
+            hashes.set(market.marketId, hash);
+            if (!known || known.get(market.marketId) !== hash) {
+                upserts.push(market);
+            }
+        }
+
+        const removed: string[] = [];
+        if (known) {
+            for (const marketId of known.keys()) {
+                if (!hashes.has(marketId)) {
+                    removed.push(marketId);
+                }
+            }
+        }
+
+        const next = randomUUID();
+        this.streams.set(stream, { cursor: next, hashes, lastUsed: Date.now() });
+        while (this.streams.size > this.maxStreams) {
+            const oldest = this.streams.keys().next().value as string;
+            this.streams.delete(oldest);
+        }
+
+        return { cursor: next, full: !known, upserts, removed };
+    }
+
+    evictIdle(now: number = Date.now()): void {
+        for (const [stream, baseline] of this.streams) {
+            if (now - baseline.lastUsed > this.idleMs) {
+                this.streams.delete(stream);
+            }
+        }
+    }
+
+    /** Streams holding a baseline */
+    get size(): number {
+        return this.streams.size;
+    }
+}
@@ -0,0 +1,85 @@
+import * as zlib from 'zlib';
+
+export type Encoding = 'zstd' | 'br' | 'gzip';
+
+type Compressor = (payload: Buffer) => Promise<Buffer>;
+type Callback = (error: Error | null, result: Buffer) => void;
+
+function callbackToPromise(run: (callback: Callback) => void): Promise<Buffer> {
+    return new Promise((resolve, reject) => {
+        run((error, result) => (error ? reject(error) : resolve(result)));
+    });
+}
+
+// zstd is only available in newer Node releases
+const zstdCompress = (zlib as any).zstdCompress as
+    | ((payload: Buffer, callback: Callback) => void)
+    | undefined;
+
+// Levels favour speed: most responses travel over loopback, where a slow
+// compressor costs more than the bytes it saves
+const COMPRESSORS: Partial<Record<Encoding, Compressor>> = {
+    ...(zstdCompress ? { zstd: (payload: Buffer) => callbackToPromise((cb) => zstdCompress(payload, cb)) } : {}),
+    br: (payload) => callbackToPromise((cb) => zlib.brotliCompress(payload, {
+        params: {
+            [zlib.constants.BROTLI_PARAM_QUALITY]: 4,
+            [zlib.constants.BROTLI_PARAM_SIZE_HINT]: payload.length,
+        },
+    }, cb)),
+    gzip: (payload) => callbackToPromise((cb) => zlib.gzip(payload, { level: 6 }, cb)),
+};
+
+// Server preference when the client rates several encodings equally
+const PREFERENCE: Encoding[] = ['zstd', 'br', 'gzip'];
+
+export function supportedEncodings(): Encoding[] {
+    return PREFERENCE.filter((encoding) => COMPRESSORS[encoding] !== undefined);
+}
+
+/**
+ * Pick a response encoding from an Accept-Encoding header.
+ *
+ * Only explicitly listed encodings are used (no "*"), so clients that don't
+ * ask for compression never get it. The client's q-values decide; ties go
+ * to the server's preference.
+ */
+export function negotiateEncoding(header: string | string[] | undefined): Encoding | undefined {
+    const value = Array.isArray(header) ? header.join(',') : header;
+    if (!value) {
+        return undefined;
+    }
+
+    const weights = new Map<string, number>();
+    for (const part of value.split(',')) {
+        const [name, ...params] = part.trim().toLowerCase().split(';');
+        let q = 1;
+        for (const param of params) {
+            const [key, raw] = param.trim().split('=');
+            if (key === 'q') {
+                q = Number(raw);
+            }
+        }
+        if (name && Number.isFinite(q)) {
+            weights.set(name, q);
+        }
+    }
+
+    let best: Encoding | undefined;
+    let bestWeight = 0;
+    for (const encoding of supportedEncodings()) {
+        const weight = weights.get(encoding) ?? 0;
+        if (weight > bestWeight) {
+            best = encoding;
+            bestWeight = weight;
+        }
+    }
+    return best;
+}
+
+export function compress(encoding: Encoding, payload: Buffer): Promise<Buffer> {
+    const compressor = COMPRESSORS[encoding];
+    if (!compressor) {
+        return Promise.reject(new Error(`Unsupported encoding: ${encoding}`));
+    }
+    return compressor(payload);
+}
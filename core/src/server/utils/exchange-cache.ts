@@ -0,0 +1,119 @@
+import { createHash, randomUUID } from 'crypto';
+import { ExchangeCredentials } from '../../BaseExchange';
+
+// Evict authenticated exchanges unused for this long (override with PMXT_SESSION_IDLE_MS)
+const DEFAULT_IDLE_MS = 15 * 60 * 1000;
+
+interface CacheEntry {
+    exchangeName: string;
+    exchange: any;
+    lastUsed: number;
+}
+
+interface Session {
+    key: string; // Fingerprint of the cached exchange
+    lastUsed: number;
+}
+
+/**
+ * Authenticated exchange instances, keyed by a fingerprint of their credentials.
+ *
+ * Building an exchange from credentials is expensive (API key derivation,
+ * key parsing, websocket clients), so instances are reused across requests
+ * and evicted once idle. Sessions let SDKs refer to an instance by an opaque
+ * ID instead of sending raw keys with every request.
+ */
+export class ExchangeCache {
+    private entries = new Map<string, CacheEntry>();
+    private sessions = new Map<string, Session>();
+    private sweeper: NodeJS.Timeout;
+
+    constructor(
+        private factory: (exchangeName: string, credentials: ExchangeCredentials) => any,
+        private idleMs: number = Number(process.env.PMXT_SESSION_IDLE_MS) || DEFAULT_IDLE_MS
+    ) {
+        this.sweeper = setInterval(() => this.evictIdle(), Math.min(this.idleMs, 60_000));
+        this.sweeper.unref();
+    }
+
+    static fingerprint(exchangeName: string, credentials: ExchangeCredentials): string {
+        const fields = Object.keys(credentials)
+            .sort()
+            .map((key) => [key, (credentials as any)[key]]);
+        return createHash('sha256')
+            .update(JSON.stringify([exchangeName, fields]))
+            .digest('hex');
+    }
+
+    /**
+     * Get the cached exchange for these credentials, creating it on first use.
+     */
+    get(exchangeName: string, credentials: ExchangeCredentials): any {
+        const key = ExchangeCache.fingerprint(exchangeName, credentials);
+        let entry = this.entries.get(key);
+        if (!entry) {
+            entry = { exchangeName, exchange: this.factory(exchangeName, credentials), lastUsed: 0 };
+            this.entries.set(key, entry);
+        }
+        entry.lastUsed = Date.now();
+        return entry.exchange;
+    }
+
+    /**
+     * Open a session for these credentials and return its ID.
+     */
+    openSession(exchangeName: string, credentials: ExchangeCredentials): string {
+        this.get(exchangeName, credentials);
+        const sessionId = randomUUID();
+        this.sessions.set(sessionId, {
+            key: ExchangeCache.fingerprint(exchangeName, credentials),
+            lastUsed: Date.now(),
+        });
+        return sessionId;
+    }
+
+    /**
+     * Resolve a session to its exchange, or undefined if it is unknown,
+     * evicted, or belongs to another exchange.
+     */
+    fromSession(exchangeName: string, sessionId: string): any {
+        const session = this.sessions.get(sessionId);
+        const entry = session ? this.entries.get(session.key) : undefined;
+        if (!session || !entry || entry.exchangeName !== exchangeName) {
+            return undefined;
+        }
+        session.lastUsed = entry.lastUsed = Date.now();
+        return entry.exchange;
+    }
+
+    /**
+     * Evict exchanges and sessions unused for ``idleMs``. Sessions expire on
+     * their own too, so clients that come and go while sharing credentials
+     * don't pile up session IDs on an instance that stays busy.
+     */
+    evictIdle(now: number = Date.now()): void {
+        for (const [key, entry] of this.entries) {
+            if (now - entry.lastUsed >= this.idleMs) {
+                this.entries.delete(key);
+                Promise.resolve(entry.exchange.close?.()).catch(() => { });
+            }
+        }
+        for (const [sessionId, session] of this.sessions) {
+            if (now - session.lastUsed >= this.idleMs || !this.entries.has(session.key)) {
+                this.sessions.delete(sessionId);
+            }
+        }
+    }
+
+    get size(): number {
+        return this.entries.size;
+    }
+
+    get sessionCount(): number {
+        return this.sessions.size;
+    }
+
+    dispose(): void {
+        clearInterval(this.sweeper);
+    }
+}
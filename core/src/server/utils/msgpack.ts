@@ -0,0 +1,327 @@
+/**
+ * Minimal MessagePack encoder for sidecar responses.
+ *
+ * Follows JSON.stringify semantics (toJSON, dropped undefined properties,
+ * non-finite numbers as nil) so a response decodes to exactly what the JSON
+ * wire format would have produced, just without the number/string round trip.
+ */
+
+export const MSGPACK_CONTENT_TYPE = 'application/msgpack';
+
+/**
+ * Whether an Accept header asks for MessagePack.
+ */
+export function acceptsMsgpack(header: string | string[] | undefined): boolean {
+    const value = Array.isArray(header) ? header.join(',') : header;
+    if (!value) {
+        return false;
+    }
+    return value.split(',').some((part) => {
+        const [type, ...params] = part.trim().toLowerCase().split(';');
+        const rejected = params.some((param) => /^q=0(\.0*)?$/.test(param.trim()));
+        return !rejected && (type === MSGPACK_CONTENT_TYPE || type === 'application/x-msgpack');
+    });
+}
+
+// Strings shorter than this are UTF-8 encoded in JS: cheaper than a native call
+const SHORT_STRING = 64;
+
+class Writer {
+    private buffer = Buffer.allocUnsafe(64 * 1024);
+    private view = new DataView(this.buffer.buffer, this.buffer.byteOffset, this.buffer.length);
+    private offset = 0;
+
+    private reserve(bytes: number): void {
+        if (this.offset + bytes <= this.buffer.length) {
+            return;
+        }
+        let size = this.buffer.length * 2;
+        while (size < this.offset + bytes) {
+            size *= 2;
+        }
+        const grown = Buffer.allocUnsafe(size);
+        this.buffer.copy(grown, 0, 0, this.offset);
+        this.buffer = grown;
+        this.view = new DataView(grown.buffer, grown.byteOffset, grown.length);
+    }
+
+    u8(value: number): void {
+        this.reserve(1);
+        this.buffer[this.offset++] = value;
+    }
+
+    u16(tag: number, value: number): void {
+        this.reserve(3);
+        this.buffer[this.offset] = tag;
+        this.view.setUint16(this.offset + 1, value);
+        this.offset += 3;
+    }
+
+    u32(tag: number, value: number): void {
+        this.reserve(5);
+        this.buffer[this.offset] = tag;
+        this.view.setUint32(this.offset + 1, value);
+        this.offset += 5;
+    }
+
+    i8(tag: number, value: number): void {
+        this.reserve(2);
+        this.buffer[this.offset] = tag;
+        this.view.setInt8(this.offset + 1, value);
+        this.offset += 2;
+    }
+
+    i16(tag: number, value: number): void {
+        this.reserve(3);
+        this.buffer[this.offset] = tag;
+        this.view.setInt16(this.offset + 1, value);
+        this.offset += 3;
+    }
+
+    i32(tag: number, value: number): void {
+        this.reserve(5);
+        this.buffer[this.offset] = tag;
+        this.view.setInt32(this.offset + 1, value);
+        this.offset += 5;
+    }
+
+    u64(tag: number, value: bigint): void {
+        this.reserve(9);
+        this.buffer[this.offset] = tag;
+        this.view.setBigUint64(this.offset + 1, value);
+        this.offset += 9;
+    }
+
+    i64(tag: number, value: bigint): void {
+        this.reserve(9);
+        this.buffer[this.offset] = tag;
+        this.view.setBigInt64(this.offset + 1, value);
+        this.offset += 9;
+    }
+
+    f64(value: number): void {
+        this.reserve(9);
+        this.buffer[this.offset] = 0xcb;
+        this.view.setFloat64(this.offset + 1, value);
+        this.offset += 9;
+    }
+
+    bytes(data: Uint8Array): void {
+        this.reserve(data.length);
+        this.buffer.set(data, this.offset);
+        this.offset += data.length;
+    }
+
+    string(value: string): void {
+        if (value.length < SHORT_STRING) {
+            this.shortString(value);
+        } else {
+            this.longString(value);
+        }
+    }
+
+    /**
+     * At most 189 UTF-8 bytes, encoded inline. The header is sized for ASCII
+     * and widened afterwards in the rare case that doesn't fit.
+     */
+    private shortString(value: string): void {
+        this.reserve(2 + value.length * 3);
+        const buffer = this.buffer;
+        const fixstr = value.length < 32;
+        const start = this.offset + (fixstr ? 1 : 2);
+        let pos = start;
+        for (let i = 0; i < value.length; i++) {
+            let code = value.charCodeAt(i);
+            if (code < 0x80) {
+                buffer[pos++] = code;
+            } else if (code < 0x800) {
+                buffer[pos++] = 0xc0 | (code >> 6);
+                buffer[pos++] = 0x80 | (code & 0x3f);
+            } else {
+                if (code >= 0xd800 && code < 0xdc00 && i + 1 < value.length) {
+                    const low = value.charCodeAt(i + 1);
+                    if (low >= 0xdc00 && low < 0xe000) {
+                        i++;
+                        code = 0x10000 + ((code - 0xd800) << 10) + (low - 0xdc00);
+                        buffer[pos++] = 0xf0 | (code >> 18);
+                        buffer[pos++] = 0x80 | ((code >> 12) & 0x3f);
+                        buffer[pos++] = 0x80 | ((code >> 6) & 0x3f);
+                        buffer[pos++] = 0x80 | (code & 0x3f);
+                        continue;
+                    }
+                }
+                if (code >= 0xd800 && code < 0xe000) {
+                    code = 0xfffd; // Lone surrogate, as Buffer.from would encode it
+                }
+                buffer[pos++] = 0xe0 | (code >> 12);
+                buffer[pos++] = 0x80 | ((code >> 6) & 0x3f);
+                buffer[pos++] = 0x80 | (code & 0x3f);
+            }
+        }
+
+        const length = pos - start;
+        if (fixstr && length < 32) {
+            buffer[this.offset] = 0xa0 | length;
+            this.offset = pos;
+            return;
+        }
+        if (fixstr) {
+            buffer.copy(buffer, start + 1, start, pos);
+            pos++;
+        }
+        buffer[this.offset] = 0xd9;
+        buffer[this.offset + 1] = length;
+        this.offset = pos;
+    }
+
+    /**
+     * Write a str32 header and the UTF-8 bytes, then shrink the header to
+     * the smallest that fits.
+     */
+    private longString(value: string): void {
+        this.reserve(5 + value.length * 3);
+        const start = this.offset + 5;
+        const length = this.buffer.write(value, start, 'utf8');
+
+        const header = length < 32 ? 1 : length < 0x100 ? 2 : length < 0x10000 ? 3 : 5;
+        if (header < 5) {
+            this.buffer.copy(this.buffer, this.offset + header, start, start + length);
+        }
+        if (header === 1) {
+            this.buffer[this.offset] = 0xa0 | length;
+        } else if (header === 2) {
+            this.buffer[this.offset] = 0xd9;
+            this.buffer[this.offset + 1] = length;
+        } else if (header === 3) {
+            this.buffer[this.offset] = 0xda;
+            this.view.setUint16(this.offset + 1, length);
+        } else {
+            this.buffer[this.offset] = 0xdb;
+            this.view.setUint32(this.offset + 1, length);
+        }
+        this.offset += header + length;
+    }
+
+    result(): Buffer {
+        return this.buffer.subarray(0, this.offset);
+    }
+}
+
+function writeInteger(writer: Writer, value: number): void {
+    if (value >= 0) {
+        if (value < 0x80) {
+            writer.u8(value);
+        } else if (value < 0x100) {
+            writer.u8(0xcc);
+            writer.u8(value);
+        } else if (value < 0x10000) {
+            writer.u16(0xcd, value);
+        } else if (value < 0x100000000) {
+            writer.u32(0xce, value);
+        } else {
+            writer.u64(0xcf, BigInt(value));
+        }
+    } else if (value >= -32) {
+        writer.u8(0x100 + value); // negative fixint
+    } else if (value >= -0x80) {
+        writer.i8(0xd0, value);
+    } else if (value >= -0x8000) {
+        writer.i16(0xd1, value);
+    } else if (value >= -0x80000000) {
+        writer.i32(0xd2, value);
+    } else {
+        writer.i64(0xd3, BigInt(value));
+    }
+}
+
+function writeHeader(writer: Writer, length: number, fix: number, tag16: number, tag32: number): void {
+    if (length < 16) {
+        writer.u8(fix | length);
+    } else if (length < 0x10000) {
+        writer.u16(tag16, length);
+    } else {
+        writer.u32(tag32, length);
+    }
+}
+
+// Object properties JSON.stringify would drop
+function isEncodable(value: any): boolean {
+    return value !== undefined && typeof value !== 'function' && typeof value !== 'symbol';
+}
+
+function write(writer: Writer, value: any): void {
+    if (value !== null && typeof value === 'object' && typeof value.toJSON === 'function') {
+        value = value.toJSON();
+    }
+
+    switch (typeof value) {
+        case 'string':
+            writer.string(value);
+            return;
+        case 'number':
+            if (Number.isSafeInteger(value)) {
+                writeInteger(writer, value);
+            } else if (Number.isFinite(value)) {
+                writer.f64(value);
+            } else {
+                writer.u8(0xc0);
+            }
+            return;
+        case 'boolean':
+            writer.u8(value ? 0xc3 : 0xc2);
+            return;
+        case 'bigint':
+            if (value >= 0) {
+                writer.u64(0xcf, value);
+            } else {
+                writer.i64(0xd3, value);
+            }
+            return;
+        case 'object':
+            break;
+        default:
+            // undefined, functions and symbols, as JSON does inside arrays
+            writer.u8(0xc0);
+            return;
+    }
+
+    if (value === null) {
+        writer.u8(0xc0);
+    } else if (Array.isArray(value)) {
+        writeHeader(writer, value.length, 0x90, 0xdc, 0xdd);
+        for (const item of value) {
+            write(writer, item);
+        }
+    } else if (value instanceof Uint8Array) {
+        if (value.length < 0x100) {
+            writer.u8(0xc4);
+            writer.u8(value.length);
+        } else if (value.length < 0x10000) {
+            writer.u16(0xc5, value.length);
+        } else {
+            writer.u32(0xc6, value.length);
+        }
+        writer.bytes(value);
+    } else {
+        // Count first: the header precedes the entries
+        let count = 0;
+        for (const key in value) {
+            if (Object.prototype.hasOwnProperty.call(value, key) && isEncodable(value[key])) {
+                count++;
+            }
+        }
+        writeHeader(writer, count, 0x80, 0xde, 0xdf);
+        for (const key in value) {
+            if (Object.prototype.hasOwnProperty.call(value, key) && isEncodable(value[key])) {
+                writer.string(key);
+                write(writer, value[key]);
+            }
+        }
+    }
+}
+
+export function encode(value: any): Buffer {
+    const writer = new Writer();
+    write(writer, value);
+    return writer.result();
+}
@@ -0,0 +1,55 @@
+import { BadRequest } from '../../errors';
+
+// Sidecar methods whose first argument may carry a `fields` projection
+export const PROJECTABLE_METHODS = new Set(['fetchMarkets', 'fetchEvents', 'syncMarkets']);
+
+export type FieldTree = { [field: string]: FieldTree | true };
+
+/**
+ * Build a projection tree from dotted paths, e.g.
+ * ['title', 'markets.marketId', 'markets.yes.price'].
+ */
+export function fieldTree(fields: unknown): FieldTree {
+    if (!Array.isArray(fields) || fields.some((field) => typeof field !== 'string' || !field)) {
+        throw new BadRequest('fields must be a list of field names');
+    }
+
+    const tree: FieldTree = {};
+    for (const field of fields as string[]) {
+        let node = tree;
+        const path = field.split('.');
+        for (let i = 0; i < path.length; i++) {
+            const segment = path[i];
+            if (i === path.length - 1) {
+                node[segment] = true;
+            } else if (node[segment] === true) {
+                break; // A parent field is already kept whole
+            } else {
+                node = (node[segment] ??= {}) as FieldTree;
+            }
+        }
+    }
+    return tree;
+}
+
+/**
+ * Keep only the fields in `tree`, applied to every element of arrays.
+ * Fields missing from the value are skipped rather than sent as null.
+ */
+export function project(value: any, tree: FieldTree): any {
+    if (Array.isArray(value)) {
+        return value.map((item) => project(item, tree));
+    }
+    if (value === null || typeof value !== 'object') {
+        return value;
+    }
+
+    const result: Record<string, any> = {};
+    for (const [field, child] of Object.entries(tree)) {
+        const item = value[field];
+        if (item !== undefined) {
+            result[field] = child === true ? item : project(item, child);
+        }
+    }
+    return result;
+}
@@ -0,0 +1,57 @@
+import { EventFilterCriteria, MarketFilterCriteria } from '../../BaseExchange';
+import { BadRequest } from '../../errors';
+
+// Fetch methods that accept a `filter`, and the exchange method evaluating it
+export const FILTER_METHODS: Record<string, 'filterMarkets' | 'filterEvents'> = {
+    fetchMarkets: 'filterMarkets',
+    fetchEvents: 'filterEvents',
+    syncMarkets: 'filterMarkets',
+};
+
+/**
+ * Turn a `filter` argument received as JSON into criteria for
+ * filterMarkets / filterEvents: a plain search string, or a criteria object
+ * with its dates revived.
+ *
+ * Criteria that the Python SDK's local filter_markets / filter_events would
+ * match differently are rejected, so a filter never matches differently
+ * depending on where it runs: an empty text or category (a constraint there,
+ * ignored here) and price bounds without an outcome (matching everything
+ * there, nothing here).
+ */
+export function parseCriteria(raw: unknown): string | MarketFilterCriteria | EventFilterCriteria {
+    if (typeof raw === 'string') {
+        return raw;
+    }
+    if (raw === null || typeof raw !== 'object' || Array.isArray(raw)) {
+        throw new BadRequest('filter must be a search string or a criteria object');
+    }
+
+    const criteria: any = { ...raw };
+    for (const key of ['text', 'category']) {
+        if (criteria[key] === '') {
+            throw new BadRequest(`filter.${key} must not be empty; leave it out instead`);
+        }
+    }
+    for (const key of ['price', 'priceChange24h']) {
+        if (criteria[key] !== undefined && !criteria[key]?.outcome) {
+            throw new BadRequest(`filter.${key} needs an outcome (yes, no, up or down)`);
+        }
+    }
+    if (criteria.resolutionDate !== undefined) {
+        const range: any = {};
+        for (const bound of ['before', 'after']) {
+            const value = criteria.resolutionDate?.[bound];
+            if (value === undefined || value === null) {
+                continue;
+            }
+            const date = new Date(value);
+            if (Number.isNaN(date.getTime())) {
+                throw new BadRequest(`filter.resolutionDate.${bound} is not a valid date: ${value}`);
+            }
+            range[bound] = date;
+        }
+        criteria.resolutionDate = range;
+    }
+    return criteria;
+}
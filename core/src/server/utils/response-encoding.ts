@@ -0,0 +1,66 @@
+import { NextFunction, Request, Response } from 'express';
+import { compress, negotiateEncoding } from './compression';
+import { acceptsMsgpack, encode, MSGPACK_CONTENT_TYPE } from './msgpack';
+
+// Responses smaller than this are sent uncompressed (override with PMXT_COMPRESSION_THRESHOLD)
+const DEFAULT_THRESHOLD = 1024;
+
+export interface ResponseEncodingOptions {
+    threshold?: number;
+}
+
+/**
+ * Encode JSON responses the way the client asked for.
+ *
+ * - `Accept: application/msgpack` gets successful responses as MessagePack.
+ *   Errors stay JSON so every client can parse them.
+ * - `Accept-Encoding` gets responses over the threshold compressed (see
+ *   ./compression). Compression runs on the libuv threadpool, so large
+ *   catalog responses don't stall the event loop.
+ *
+ * Both are opt-in: clients that ask for neither get plain `res.json`.
+ */
+export function encodeResponses(options: ResponseEncodingOptions = {}) {
+    const configured = Number(process.env.PMXT_COMPRESSION_THRESHOLD);
+    const threshold = options.threshold ?? (Number.isFinite(configured) && configured >= 0 ? configured : DEFAULT_THRESHOLD);
+
+    return (req: Request, res: Response, next: NextFunction) => {
+        res.vary('Accept');
+        res.vary('Accept-Encoding');
+        const msgpack = acceptsMsgpack(req.headers.accept);
+        const encoding = negotiateEncoding(req.headers['accept-encoding']);
+        if (!msgpack && !encoding) {
+            next();
+            return;
+        }
+
+        res.json = (body: any) => {
+            const binary = msgpack && res.statusCode < 400;
+            const payload = binary ? encode(body) : Buffer.from(JSON.stringify(body));
+            const contentType = binary ? MSGPACK_CONTENT_TYPE : 'application/json; charset=utf-8';
+
+            if (!encoding || payload.length < threshold) {
+                res.setHeader('Content-Type', contentType);
+                res.setHeader('Content-Length', payload.length);
+                res.end(payload);
+                return res;
+            }
+            compress(encoding, payload).then(
+                (compressed) => {
+                    res.setHeader('Content-Type', contentType);
+                    res.setHeader('Content-Encoding', encoding);
+                    res.setHeader('Content-Length', compressed.length);
+                    res.end(compressed);
+                },
+                // Fall back to an uncompressed response
+                () => {
+                    res.setHeader('Content-Type', contentType);
+                    res.setHeader('Content-Length', payload.length);
+                    res.end(payload);
+                }
+            );
+            return res;
+        };
+        next();
+    };
+}
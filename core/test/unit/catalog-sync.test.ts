@@ -0,0 +1,69 @@
+import { CatalogSync } from '../../src/server/utils/catalog-sync';
+
+const market = (marketId: string, price: number) => ({ marketId, title: marketId, yes: { price } });
+
+describe('CatalogSync', () => {
+    it('should send a full snapshot without a cursor', () => {
+        const sync = new CatalogSync();
+        const delta = sync.diff('polymarket', [market('a', 0.1), market('b', 0.2)]);
+        expect(delta.full).toBe(true);
+        expect(delta.upserts).toHaveLength(2);
+        expect(delta.removed).toEqual([]);
+    });
+
+    it('should send only changes since the cursor', () => {
+        const sync = new CatalogSync();
+        const first = sync.diff('polymarket', [market('a', 0.1), market('b', 0.2)]);
+        const second = sync.diff('polymarket', [market('a', 0.1), market('b', 0.3), market('c', 0.5)], first.cursor);
+
+        expect(second.full).toBe(false);
+        expect(second.upserts.map((m) => m.marketId)).toEqual(['b', 'c']);
+
+        const third = sync.diff('polymarket', [market('c', 0.5)], second.cursor);
+        expect(third.upserts).toEqual([]);
+        expect(third.removed.sort()).toEqual(['a', 'b']);
+    });
+
+    it('should treat reused, superseded, foreign or evicted cursors as unknown', () => {
+        const sync = new CatalogSync(1000, 2);
+        const first = sync.diff('polymarket', [market('a', 0.1)]);
+        sync.diff('polymarket', [market('a', 0.1)], first.cursor);
+        expect(sync.diff('polymarket', [market('a', 0.1)], first.cursor).full).toBe(true);
+
+        // A new baseline for the stream replaces the previous one
+        const superseded = sync.diff('polymarket', []);
+        sync.diff('polymarket', []);
+        expect(sync.diff('polymarket', [], superseded.cursor).full).toBe(true);
+
+        const kalshi = sync.diff('kalshi', [market('a', 0.1)]);
+        expect(sync.diff('polymarket', [market('a', 0.1)], kalshi.cursor).full).toBe(true);
+
+        const old = sync.diff('limitless', []);
+        sync.diff('polymarket', []);
+        sync.diff('kalshi', []);
+        expect(sync.size).toBe(2);
+        expect(sync.diff('limitless', [], old.cursor).full).toBe(true);
+    });
+
+    it('should keep one baseline per stream', () => {
+        const sync = new CatalogSync();
+        let cursor: string | undefined;
+        for (let i = 0; i < 5; i++) {
+            cursor = sync.diff('polymarket', [market('a', 0.1)], cursor).cursor;
+        }
+        const other = CatalogSync.stream('polymarket', { query: 'trump' });
+        sync.diff(other, [market('b', 0.2)]);
+        expect(sync.size).toBe(2);
+        expect(CatalogSync.stream('polymarket', undefined)).toBe(CatalogSync.stream('polymarket', {}));
+
+        // Streams don't share baselines
+        expect(sync.diff(other, [market('b', 0.2)], cursor).full).toBe(true);
+    });
+
+    it('should evict idle cursors', () => {
+        const sync = new CatalogSync(1000);
+        sync.diff('polymarket', []);
+        sync.evictIdle(Date.now() + 2000);
+        expect(sync.size).toBe(0);
+    });
+});
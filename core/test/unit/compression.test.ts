@@ -0,0 +1,41 @@
+import * as zlib from 'zlib';
+import { compress, negotiateEncoding, supportedEncodings } from '../../src/server/utils/compression';
+
+describe('negotiateEncoding', () => {
+    it('should not compress without an explicit request', () => {
+        expect(negotiateEncoding(undefined)).toBeUndefined();
+        expect(negotiateEncoding('identity')).toBeUndefined();
+        expect(negotiateEncoding('*')).toBeUndefined();
+    });
+
+    it('should honour q-values', () => {
+        expect(negotiateEncoding('gzip;q=1.0, br;q=0.5')).toBe('gzip');
+        expect(negotiateEncoding('gzip;q=0.2, br;q=0.9')).toBe('br');
+        expect(negotiateEncoding('gzip;q=0, br;q=0')).toBeUndefined();
+    });
+
+    it('should break ties by server preference', () => {
+        expect(negotiateEncoding('gzip, br')).toBe('br');
+        expect(negotiateEncoding(['gzip', 'deflate'])).toBe('gzip');
+    });
+
+    it('should only pick zstd where the runtime supports it', () => {
+        const expected = supportedEncodings().includes('zstd') ? 'zstd' : 'gzip';
+        expect(negotiateEncoding('zstd, gzip;q=0.5')).toBe(expected);
+    });
+});
+
+describe('compress', () => {
+    const payload = Buffer.from(JSON.stringify({ data: Array(200).fill({ title: 'Will it rain?' }) }));
+
+    it('should round-trip gzip', async () => {
+        const compressed = await compress('gzip', payload);
+        expect(compressed.length).toBeLessThan(payload.length);
+        expect(zlib.gunzipSync(compressed).equals(payload)).toBe(true);
+    });
+
+    it('should round-trip brotli', async () => {
+        const compressed = await compress('br', payload);
+        expect(zlib.brotliDecompressSync(compressed).equals(payload)).toBe(true);
+    });
+});
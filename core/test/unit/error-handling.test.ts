@@ -13,6 +13,8 @@ import {
     ValidationError,
     NetworkError,
     ExchangeNotAvailable,
+    RequestTimeout,
+    SessionNotFound,
 } from '../../src/errors';
 import { ErrorMapper } from '../../src/utils/error-mapper';
 import { PolymarketErrorMapper } from '../../src/exchanges/polymarket/errors';
@@ -159,6 +161,26 @@ describe('Error Classes', () => {
             expect(error.retryable).toBe(true);
         });
     });
+
+    describe('RequestTimeout', () => {
+        it('should have correct properties', () => {
+            const error = new RequestTimeout('Timed out', 'TestExchange');
+            expect(error.status).toBe(504);
+            expect(error.code).toBe('REQUEST_TIMEOUT');
+            expect(error.retryable).toBe(true);
+            expect(error.exchange).toBe('TestExchange');
+        });
+    });
+
+    describe('SessionNotFound', () => {
+        it('should have correct properties', () => {
+            const error = new SessionNotFound('Unknown session', 'TestExchange');
+            expect(error.status).toBe(401);
+            expect(error.code).toBe('SESSION_NOT_FOUND');
+            expect(error.retryable).toBe(false);
+            expect(error.exchange).toBe('TestExchange');
+        });
+    });
 });
 
 describe('ErrorMapper', () => {
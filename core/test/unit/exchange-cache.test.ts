@@ -0,0 +1,65 @@
+import { ExchangeCache } from '../../src/server/utils/exchange-cache';
+
+describe('ExchangeCache', () => {
+    let factory: jest.Mock;
+    let cache: ExchangeCache;
+
+    beforeEach(() => {
+        factory = jest.fn((exchangeName: string) => ({ name: exchangeName, close: jest.fn() }));
+        cache = new ExchangeCache(factory, 1000);
+    });
+
+    afterEach(() => cache.dispose());
+
+    it('should reuse the instance for the same credentials', () => {
+        const first = cache.get('kalshi', { apiKey: 'k', privateKey: 'p' });
+        const second = cache.get('kalshi', { privateKey: 'p', apiKey: 'k' });
+        expect(second).toBe(first);
+        expect(factory).toHaveBeenCalledTimes(1);
+    });
+
+    it('should separate different credentials and exchanges', () => {
+        cache.get('kalshi', { apiKey: 'a' });
+        cache.get('kalshi', { apiKey: 'b' });
+        cache.get('polymarket', { apiKey: 'a' });
+        expect(factory).toHaveBeenCalledTimes(3);
+        expect(cache.size).toBe(3);
+    });
+
+    it('should resolve sessions to the cached instance', () => {
+        const sessionId = cache.openSession('polymarket', { privateKey: '0xabc' });
+        const exchange = cache.get('polymarket', { privateKey: '0xabc' });
+        expect(cache.fromSession('polymarket', sessionId)).toBe(exchange);
+        expect(cache.fromSession('kalshi', sessionId)).toBeUndefined();
+        expect(cache.fromSession('polymarket', 'unknown')).toBeUndefined();
+    });
+
+    it('should evict idle instances and their sessions', () => {
+        const sessionId = cache.openSession('polymarket', { privateKey: '0xabc' });
+        const exchange = cache.fromSession('polymarket', sessionId);
+
+        cache.evictIdle(Date.now() + 1000);
+        expect(cache.size).toBe(0);
+        expect(exchange.close).toHaveBeenCalled();
+        expect(cache.fromSession('polymarket', sessionId)).toBeUndefined();
+    });
+
+    it('should expire idle sessions of an instance that stays in use', () => {
+        const credentials = { privateKey: '0xabc' };
+        const stale = cache.openSession('polymarket', credentials);
+        const start = Date.now();
+        const now = jest.spyOn(Date, 'now').mockReturnValue(start + 600);
+        try {
+            const active = cache.openSession('polymarket', credentials);
+            cache.get('polymarket', credentials);
+
+            cache.evictIdle(start + 1000);
+            expect(cache.size).toBe(1);
+            expect(cache.sessionCount).toBe(1);
+            expect(cache.fromSession('polymarket', stale)).toBeUndefined();
+            expect(cache.fromSession('polymarket', active)).toBeDefined();
+        } finally {
+            now.mockRestore();
+        }
+    });
+});
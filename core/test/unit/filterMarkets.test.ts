@@ -277,6 +277,14 @@ describe('filterMarkets', () => {
             expect(result.map(m => m.id)).toContain('1');
             expect(result.map(m => m.id)).toContain('2');
         });
+
+        it('should exclude markets without a resolutionDate', () => {
+            const undated = { ...mockMarkets[0], id: '5', resolutionDate: undefined as any };
+            const result = api.filterMarkets([...mockMarkets, undated], {
+                resolutionDate: { after: new Date('2024-01-01') },
+            });
+            expect(result.map(m => m.id)).not.toContain('5');
+        });
     });
 
     describe('category filtering', () => {
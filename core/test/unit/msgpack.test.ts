@@ -0,0 +1,45 @@
+import { acceptsMsgpack, encode } from '../../src/server/utils/msgpack';
+
+const hex = (value: any) => encode(value).toString('hex');
+
+describe('msgpack encode', () => {
+    it('should encode scalars with the smallest type', () => {
+        expect(hex(null)).toBe('c0');
+        expect(hex(true)).toBe('c3');
+        expect(hex(5)).toBe('05');
+        expect(hex(200)).toBe('ccc8');
+        expect(hex(-1)).toBe('ff');
+        expect(hex(-200)).toBe('d1ff38');
+        expect(hex(0.5)).toBe('cb3fe0000000000000');
+        expect(hex('hi')).toBe('a26869');
+    });
+
+    it('should follow JSON semantics', () => {
+        expect(hex({ a: 1, b: undefined })).toBe('81a16101');
+        expect(hex([undefined, NaN])).toBe('92c0c0');
+        expect(hex(new Date(0))).toBe(hex('1970-01-01T00:00:00.000Z'));
+    });
+
+    it('should size string headers by encoded length', () => {
+        const long = 'é'.repeat(20); // 40 bytes: str8, not fixstr
+        expect(hex(long).slice(0, 4)).toBe('d928');
+        expect(encode('x'.repeat(70000)).subarray(0, 5).toString('hex')).toBe('db00011170');
+    });
+
+    it('should encode large containers', () => {
+        const book = { bids: Array.from({ length: 2000 }, (_, i) => ({ price: i / 2000, size: i })) };
+        const encoded = encode(book);
+        expect(encoded.subarray(0, 9).toString('hex')).toBe('81a462696473dc07d0');
+        expect(encoded.length).toBeLessThan(Buffer.byteLength(JSON.stringify(book)));
+    });
+});
+
+describe('acceptsMsgpack', () => {
+    it('should only match an explicit request', () => {
+        expect(acceptsMsgpack(undefined)).toBe(false);
+        expect(acceptsMsgpack('application/json')).toBe(false);
+        expect(acceptsMsgpack('*/*')).toBe(false);
+        expect(acceptsMsgpack('application/msgpack, application/json;q=0.5')).toBe(true);
+        expect(acceptsMsgpack('application/msgpack;q=0')).toBe(false);
+    });
+});
@@ -0,0 +1,44 @@
+import { BadRequest } from '../../src/errors';
+import { fieldTree, project } from '../../src/server/utils/projection';
+
+const market = {
+    marketId: 'm1',
+    title: 'Will it rain?',
+    description: 'Long text',
+    volume24h: 100,
+    yes: { outcomeId: 'y', label: 'Yes', price: 0.4, metadata: { big: true } },
+    outcomes: [{ outcomeId: 'y', label: 'Yes', price: 0.4 }],
+};
+
+describe('projection', () => {
+    it('should keep only requested fields', () => {
+        const tree = fieldTree(['marketId', 'volume24h', 'yes.price']);
+        expect(project([market], tree)).toEqual([{ marketId: 'm1', volume24h: 100, yes: { price: 0.4 } }]);
+    });
+
+    it('should project through nested arrays', () => {
+        const event = { id: 'e1', title: 'Weather', markets: [market, market] };
+        const result = project(event, fieldTree(['id', 'markets.marketId', 'markets.outcomes.price']));
+        expect(result).toEqual({
+            id: 'e1',
+            markets: [
+                { marketId: 'm1', outcomes: [{ price: 0.4 }] },
+                { marketId: 'm1', outcomes: [{ price: 0.4 }] },
+            ],
+        });
+    });
+
+    it('should let a whole field win over its sub-fields', () => {
+        expect(fieldTree(['yes.price', 'yes'])).toEqual({ yes: true });
+        expect(fieldTree(['yes', 'yes.price'])).toEqual({ yes: true });
+    });
+
+    it('should skip missing fields and keep nulls', () => {
+        expect(project({ a: null }, fieldTree(['a', 'b']))).toEqual({ a: null });
+    });
+
+    it('should reject malformed fields', () => {
+        expect(() => fieldTree('title')).toThrow(BadRequest);
+        expect(() => fieldTree(['title', 3])).toThrow(BadRequest);
+    });
+});
@@ -0,0 +1,37 @@
+import { BadRequest } from '../../src/errors';
+import { parseCriteria } from '../../src/server/utils/pushdown';
+
+describe('parseCriteria', () => {
+    it('should pass search strings through', () => {
+        expect(parseCriteria('Trump')).toBe('Trump');
+    });
+
+    it('should revive resolution dates', () => {
+        const criteria: any = parseCriteria({
+            volume24h: { min: 1000 },
+            resolutionDate: { before: '2025-01-01T00:00:00Z' },
+        });
+        expect(criteria.volume24h).toEqual({ min: 1000 });
+        expect(criteria.resolutionDate.before).toEqual(new Date('2025-01-01T00:00:00Z'));
+        expect(criteria.resolutionDate.after).toBeUndefined();
+    });
+
+    it('should reject malformed criteria', () => {
+        expect(() => parseCriteria(['Trump'])).toThrow(BadRequest);
+        expect(() => parseCriteria(42)).toThrow(BadRequest);
+        expect(() => parseCriteria({ resolutionDate: { after: 'soon' } })).toThrow(BadRequest);
+    });
+
+    // Same cases as sdks/python/tests/test_pushdown.py::TestFilterParity
+    it('should reject price bounds without an outcome', () => {
+        expect(() => parseCriteria({ price: { max: 0.3 } })).toThrow(BadRequest);
+        expect(() => parseCriteria({ priceChange24h: { min: 0 } })).toThrow(BadRequest);
+        expect(parseCriteria({ price: { outcome: 'yes', max: 0.3 } })).toEqual({ price: { outcome: 'yes', max: 0.3 } });
+    });
+
+    it('should reject an empty text or category', () => {
+        expect(() => parseCriteria({ category: '' })).toThrow(BadRequest);
+        expect(() => parseCriteria({ text: '' })).toThrow(BadRequest);
+        expect(parseCriteria({ category: 'Politics' })).toEqual({ category: 'Politics' });
+    });
+});
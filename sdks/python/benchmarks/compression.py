@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Compression benchmark: catalog transfer time and bytes on the wire.
+
+Requests go through a local TCP proxy that counts the bytes the sidecar
+sends back and can emulate a slower link (bandwidth cap plus round-trip
+delay), so the loopback and remote-sidecar cases can both be measured on
+one machine. The sidecar must be running (or startable) locally.
+
+Usage:
+    python benchmarks/compression.py                          # loopback
+    python benchmarks/compression.py --mbps 20 --rtt 40       # simulated WAN
+    python benchmarks/compression.py --method fetch_markets --limit 2000
+"""
+
+import argparse
+import socket
+import statistics
+import threading
+import time
+
+import pmxt
+from pmxt.compression import PREFERENCE, supported_encodings
+
+CHUNK = 16 * 1024
+
+
+class LinkProxy:
+    """Forwards localhost:<port> to the sidecar, counting and throttling responses."""
+
+    def __init__(self, upstream_port: int, mbps: float, rtt: float):
+        self.upstream_port = upstream_port
+        self.bytes_per_second = mbps * 125_000 if mbps else None
+        self.rtt = rtt
+        self.received = 0
+        self._lock = threading.Lock()
+        self._server = socket.create_server(("127.0.0.1", 0))
+        self.port = self._server.getsockname()[1]
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self) -> None:
+        while True:
+            client, _ = self._server.accept()
+            upstream = socket.create_connection(("127.0.0.1", self.upstream_port))
+            threading.Thread(target=self._pipe, args=(client, upstream, False), daemon=True).start()
+            threading.Thread(target=self._pipe, args=(upstream, client, True), daemon=True).start()
+
+    def _pipe(self, source: socket.socket, target: socket.socket, response: bool) -> None:
+        try:
+            while True:
+                data = source.recv(CHUNK)
+                if not data:
+                    break
+                if response:
+                    with self._lock:
+                        self.received += len(data)
+                    if self.bytes_per_second:
+                        time.sleep(len(data) / self.bytes_per_second)
+                elif self.rtt:
+                    time.sleep(self.rtt)
+                target.sendall(data)
+        except OSError:
+            pass
+        finally:
+            source.close()
+            target.close()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.received = 0
+
+
+def measure(proxy: LinkProxy, exchange_name: str, compression, method: str, limit: int, runs: int):
+    exchange = getattr(pmxt, exchange_name)(
+        base_url=f"http://127.0.0.1:{proxy.port}",
+        auto_start_server=False,
+        compression=compression,
+    )
+    call = getattr(exchange, method)
+    call(limit=limit)  # Warm the sidecar's upstream cache and the connection pool
+
+    times, sizes = [], []
+    for _ in range(runs):
+        proxy.reset()
+        start = time.perf_counter()
+        call(limit=limit)
+        times.append(time.perf_counter() - start)
+        sizes.append(proxy.received)
+    return statistics.median(times), statistics.median(sizes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--exchange", default="Polymarket")
+    parser.add_argument("--method", default="fetch_events", choices=["fetch_events", "fetch_markets"])
+    parser.add_argument("--limit", type=int, default=500)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--mbps", type=float, default=0, help="Link bandwidth in Mbit/s (0 = unlimited)")
+    parser.add_argument("--rtt", type=float, default=0, help="Round-trip delay in ms")
+    args = parser.parse_args()
+
+    manager = pmxt.ServerManager()
+    manager.ensure_server_running()
+    proxy = LinkProxy(manager.get_running_port(), args.mbps, args.rtt / 1000)
+
+    link = f"{args.mbps:g} Mbit/s, {args.rtt:g} ms RTT" if args.mbps or args.rtt else "loopback"
+    print(f"{args.exchange}.{args.method}(limit={args.limit}) over {link}, median of {args.runs} runs")
+
+    available = supported_encodings()
+    baseline = None
+    for encoding in (None,) + PREFERENCE:
+        label = encoding or "identity"
+        if encoding and encoding not in available:
+            print(f"  {label:<9} skipped (decoder not installed)")
+            continue
+        seconds, size = measure(proxy, args.exchange, encoding or False, args.method, args.limit, args.runs)
+        baseline = baseline or size
+        print(
+            f"  {label:<9} {seconds * 1000:8.1f} ms   {size / 1024:9.1f} KiB"
+            f"   ({size / baseline:6.1%} of identity)"
+        )
+
+
+if __name__ == "__main__":
+    main()
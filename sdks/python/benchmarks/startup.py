@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark: time from interpreter start to the first fetch_markets.
+
+Each run is a fresh Python process, so import time, sidecar discovery and
+(for cold runs) sidecar startup are all included. Phases are reported
+separately so regressions can be attributed.
+
+Usage:
+    python benchmarks/startup.py                 # warm: sidecar already running
+    python benchmarks/startup.py --cold          # stop the sidecar before each run
+    python benchmarks/startup.py --prespawn      # start the sidecar on import (PMXT_PRESPAWN=1)
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+RUN = r"""
+import json, sys, time
+t0 = time.perf_counter()
+import pmxt
+t1 = time.perf_counter()
+exchange = getattr(pmxt, sys.argv[1])()
+t2 = time.perf_counter()
+exchange.fetch_markets(limit=1)
+t3 = time.perf_counter()
+print(json.dumps({"import": t1 - t0, "construct": t2 - t1, "first_call": t3 - t2, "total": t3 - t0}))
+"""
+
+PHASES = ("import", "construct", "first_call", "total")
+
+
+def run_once(exchange: str, cold: bool, prespawn: bool) -> dict:
+    env = dict(os.environ)
+    if prespawn:
+        env["PMXT_PRESPAWN"] = "1"
+    if cold:
+        subprocess.run([sys.executable, "-c", "import pmxt; pmxt.stop_server()"], check=True, env=env)
+
+    result = subprocess.run(
+        [sys.executable, "-c", RUN, exchange],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--exchange", default="Polymarket")
+    parser.add_argument("--cold", action="store_true", help="Stop the sidecar before each run")
+    parser.add_argument("--prespawn", action="store_true", help="Set PMXT_PRESPAWN=1")
+    args = parser.parse_args()
+
+    samples = [run_once(args.exchange, args.cold, args.prespawn) for _ in range(args.runs)]
+
+    mode = "cold" if args.cold else "warm"
+    print(f"{args.exchange} time-to-first-fetch_markets ({mode}, {args.runs} runs)")
+    for phase in PHASES:
+        values = [s[phase] * 1000 for s in samples]
+        print(
+            f"  {phase:<11} median {statistics.median(values):8.1f} ms"
+            f"   min {min(values):8.1f} ms   max {max(values):8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Wire format benchmark: encode (Node) plus decode (Python) time, JSON vs MessagePack.
+
+Payloads are synthetic but shaped like sidecar responses: an order book with
+2000 levels per side and a 10k-market catalog. Encoding runs in Node with
+the sidecar's own encoder, so build core first (``cd core && npm run build``).
+
+Decode times cover everything up to pmxt.models objects. For JSON that is
+the current path: json.loads, the generated response models, then to_dict
+and conversion. For MessagePack, the SDK skips the generated models.
+
+Usage:
+    python benchmarks/wire_format.py
+    python benchmarks/wire_format.py --levels 5000 --markets 20000 --runs 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import msgpack
+
+import pmxt.client as client
+
+CORE_DIST = os.path.join(os.path.dirname(__file__), "..", "..", "..", "core", "dist")
+
+# Times JSON.stringify and the sidecar's MessagePack encoder on one payload
+NODE_ENCODE = r"""
+const fs = require('fs');
+const { encode } = require(process.argv[1]);
+const [payloadPath, runs] = [process.argv[2], Number(process.argv[3])];
+const body = JSON.parse(fs.readFileSync(payloadPath, 'utf8'));
+const time = (fn) => {
+    const samples = [];
+    let out;
+    for (let i = 0; i < runs; i++) {
+        const start = process.hrtime.bigint();
+        out = fn();
+        samples.push(Number(process.hrtime.bigint() - start) / 1e6);
+    }
+    samples.sort((a, b) => a - b);
+    return [samples[Math.floor(samples.length / 2)], out];
+};
+const [jsonMs, json] = time(() => Buffer.from(JSON.stringify(body)));
+const [msgpackMs, packed] = time(() => encode(body));
+fs.writeFileSync(payloadPath + '.json', json);
+fs.writeFileSync(payloadPath + '.msgpack', packed);
+console.log(JSON.stringify({ json: jsonMs, msgpack: msgpackMs }));
+"""
+
+
+def order_book(levels: int) -> dict:
+    return {
+        "bids": [{"price": round(0.5 - i * 0.0001, 4), "size": 100.0 + i * 1.5} for i in range(levels)],
+        "asks": [{"price": round(0.5 + i * 0.0001, 4), "size": 90.0 + i * 2.25} for i in range(levels)],
+        "timestamp": 1735689600000,
+    }
+
+
+def catalog(markets: int) -> list:
+    return [
+        {
+            "marketId": f"0x{i:064x}",
+            "title": f"Will outcome #{i} happen before the end of the year?",
+            "description": "Resolves Yes if the outcome happens before December 31. " * 4,
+            "outcomes": [
+                {"outcomeId": f"{i}1", "label": "Yes", "price": 0.37, "priceChange24h": -0.02},
+                {"outcomeId": f"{i}2", "label": "No", "price": 0.63, "priceChange24h": 0.02},
+            ],
+            "resolutionDate": "2026-12-31T00:00:00.000Z",
+            "volume24h": 12500.5 + i,
+            "volume": 985000.25 + i,
+            "liquidity": 45000.0,
+            "openInterest": 30000.0,
+            "url": f"https://example.com/market/{i}",
+            "image": f"https://example.com/market/{i}.png",
+            "category": "Politics",
+            "tags": ["politics", "elections"],
+        }
+        for i in range(markets)
+    ]
+
+
+def generated_model(name: str):
+    """Generated response model used by the JSON path, if the client is installed."""
+    try:
+        client._load_internal()
+        return getattr(client.internal_models, name)
+    except (ImportError, AttributeError):
+        return None
+
+
+def median_ms(fn, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def bench(name: str, data, model_name: str, convert, runs: int, encoder: str) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "payload")
+        with open(path, "w") as f:
+            json.dump({"success": True, "data": data}, f)
+        result = subprocess.run(
+            ["node", "-e", NODE_ENCODE, encoder, path, str(runs)],
+            capture_output=True, text=True, check=True,
+        )
+        encode_ms = json.loads(result.stdout)
+        with open(path + ".json", "rb") as f:
+            json_bytes = f.read()
+        with open(path + ".msgpack", "rb") as f:
+            msgpack_bytes = f.read()
+
+    model = generated_model(model_name)
+
+    def decode_json():
+        body = json.loads(json_bytes)
+        if model is not None:
+            body = model.from_dict(body).to_dict()
+        return convert(body["data"])
+
+    def decode_msgpack():
+        return convert(msgpack.unpackb(msgpack_bytes)["data"])
+
+    decode_ms = {"json": median_ms(decode_json, runs), "msgpack": median_ms(decode_msgpack, runs)}
+    sizes = {"json": len(json_bytes), "msgpack": len(msgpack_bytes)}
+
+    print(f"{name}{'' if model else '  (generated client not installed: json.loads only)'}")
+    for fmt in ("json", "msgpack"):
+        total = encode_ms[fmt] + decode_ms[fmt]
+        print(
+            f"  {fmt:<8} encode {encode_ms[fmt]:7.1f} ms   decode {decode_ms[fmt]:7.1f} ms"
+            f"   total {total:7.1f} ms   {sizes[fmt] / 1024:8.1f} KiB"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--levels", type=int, default=2000, help="Order book levels per side")
+    parser.add_argument("--markets", type=int, default=10000, help="Markets in the catalog")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    encoder = os.path.abspath(os.path.join(CORE_DIST, "server", "utils", "msgpack.js"))
+    if not os.path.exists(encoder):
+        sys.exit(f"{encoder} not found: run `npm run build` in core first")
+
+    bench(
+        f"Order book, {args.levels} levels per side",
+        order_book(args.levels), "FetchOrderBook200Response", client._convert_order_book, args.runs, encoder,
+    )
+    bench(
+        f"Catalog, {args.markets} markets",
+        catalog(args.markets), "FetchMarkets200Response",
+        lambda markets: [client._convert_market(m) for m in markets], args.runs, encoder,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -16,8 +16,28 @@ Example:
     >>> print(markets[0].title)
 """
 
-from .client import Polymarket, Kalshi, Limitless, Exchange
-from .server_manager import ServerManager
+import os as _os
+from importlib import import_module as _import_module
+from typing import TYPE_CHECKING
+
+from .errors import (
+    PmxtError,
+    BadRequest,
+    AuthenticationError,
+    SessionNotFound,
+    PermissionDenied,
+    NotFound,
+    OrderNotFound,
+    MarketNotFound,
+    RateLimitExceeded,
+    InvalidOrder,
+    InsufficientFunds,
+    ValidationError,
+    NetworkError,
+    ExchangeNotAvailable,
+    RequestTimeout,
+    CircuitOpen,
+)
 from .models import (
     UnifiedMarket,
     UnifiedEvent,
@@ -31,21 +51,95 @@ from .models import (
     Balance,
 )
 
+# The exchange clients (and with them the generated OpenAPI client), server
+# management and client policies are imported on first access (PEP 562), so
+# `import pmxt` stays cheap for CLI tools and forked workers.
+_LAZY_ATTRIBUTES = {
+    "Polymarket": ".client",
+    "Kalshi": ".client",
+    "Limitless": ".client",
+    "Exchange": ".client",
+    "ServerManager": ".server_manager",
+    "RateLimiter": ".rate_limiter",
+    "RateLimit": ".rate_limiter",
+    "RetryPolicy": ".retry",
+    "HedgePolicy": ".hedging",
+    "CircuitBreaker": ".circuit_breaker",
+    "MarketCatalog": ".catalog",
+    "CatalogDiff": ".catalog",
+    "MarketRegistry": ".registry",
+    "MarketFrame": ".shared_catalog",
+    "SharedCatalogWriter": ".shared_catalog",
+    "SharedCatalogReader": ".shared_catalog",
+    "SharedBookFeeder": ".shared_books",
+    "SharedBookReader": ".shared_books",
+    "OrderBookStream": ".streaming",
+    "StreamStats": ".streaming",
+    "TradeBuffer": ".trades",
+    "TradeTracker": ".trades",
+    "TradeWindowStats": ".trades",
+    "BookAnalytics": ".book_analytics",
+    "BookAnalyticsBatch": ".book_analytics",
+    "Recorder": ".recording",
+    "Replay": ".recording",
+    "ReplayEvent": ".recording",
+}
+
+if TYPE_CHECKING:
+    from .client import Polymarket, Kalshi, Limitless, Exchange
+    from .server_manager import ServerManager
+    from .rate_limiter import RateLimiter, RateLimit
+    from .retry import RetryPolicy
+    from .hedging import HedgePolicy
+    from .circuit_breaker import CircuitBreaker
+    from .catalog import MarketCatalog, CatalogDiff
+    from .registry import MarketRegistry
+    from .shared_catalog import MarketFrame, SharedCatalogWriter, SharedCatalogReader
+    from .shared_books import SharedBookFeeder, SharedBookReader
+    from .streaming import OrderBookStream, StreamStats
+    from .trades import TradeBuffer, TradeTracker, TradeWindowStats
+    from .book_analytics import BookAnalytics, BookAnalyticsBatch
+    from .recording import Recorder, Replay, ReplayEvent
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 # Global server management functions
-_default_manager = ServerManager()
+_default_manager = None
+
+def _get_default_manager():
+    global _default_manager
+    if _default_manager is None:
+        from .server_manager import ServerManager
+        _default_manager = ServerManager()
+    return _default_manager
+
+# Opt-in pre-spawn: start the sidecar in the background as soon as pmxt is imported
+if _os.getenv('PMXT_PRESPAWN') == '1':
+    _get_default_manager().start_background()
 
 def stop_server():
     """
     Stop the background PMXT sidecar server.
     """
-    _default_manager.stop()
+    _get_default_manager().stop()
 
 def restart_server():
     """
     Restart the background PMXT sidecar server.
     """
-    _default_manager.restart()
+    _get_default_manager().restart()
 
 __version__ = "2.0.0"
 __all__ = [
@@ -58,6 +152,48 @@ __all__ = [
     "ServerManager",
     "stop_server",
     "restart_server",
+    # Client Policies
+    "RateLimiter",
+    "RateLimit",
+    "RetryPolicy",
+    "HedgePolicy",
+    "CircuitBreaker",
+    # Market Data
+    "MarketCatalog",
+    "CatalogDiff",
+    "MarketRegistry",
+    "MarketFrame",
+    "SharedCatalogWriter",
+    "SharedCatalogReader",
+    "SharedBookFeeder",
+    "SharedBookReader",
+    "OrderBookStream",
+    "StreamStats",
+    "TradeBuffer",
+    "TradeTracker",
+    "TradeWindowStats",
+    "BookAnalytics",
+    "BookAnalyticsBatch",
+    "Recorder",
+    "Replay",
+    "ReplayEvent",
+    # Errors
+    "PmxtError",
+    "BadRequest",
+    "AuthenticationError",
+    "SessionNotFound",
+    "PermissionDenied",
+    "NotFound",
+    "OrderNotFound",
+    "MarketNotFound",
+    "RateLimitExceeded",
+    "InvalidOrder",
+    "InsufficientFunds",
+    "ValidationError",
+    "NetworkError",
+    "ExchangeNotAvailable",
+    "RequestTimeout",
+    "CircuitOpen",
     # Data Models
     "UnifiedMarket",
     "UnifiedEvent",
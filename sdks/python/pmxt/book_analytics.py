@@ -0,0 +1,266 @@
+"""
+Incremental order book analytics.
+
+Spread, mid, microprice, depth near the touch and book imbalance are
+usually recomputed by walking every level of ``OrderBook.bids``/``asks``
+on each tick. ``BookAnalytics`` instead keeps each side of the book on a
+fixed price grid (0 to 1 in ``tick`` steps) in Fenwick trees, so a level
+change is O(log ticks) and every metric is a couple of tree queries,
+independent of book depth.
+
+Feed it level changes with ``apply()``, or whole books with ``update()``
+(which only applies the levels that changed since the previous book).
+``BookAnalyticsBatch`` tracks many outcomes and returns each metric as an
+``array('d')`` column across all of them (ready for ``numpy.frombuffer``).
+
+Example:
+    >>> analytics = pmxt.BookAnalytics(depth_band=0.05)
+    >>> analytics.update(poly.watch_order_book(outcome_id))
+    >>> analytics.spread, analytics.microprice, analytics.imbalance
+    >>> analytics.depth_within(0.02)           # (bid size, ask size) within 2 cents of the touch
+
+    >>> batch = pmxt.BookAnalyticsBatch()
+    >>> batch.update(outcome_id, book)
+    >>> columns = batch.columns()               # {"outcome_id": [...], "mid": array('d'), ...}
+"""
+
+import math
+from array import array
+from typing import Dict, Literal, Optional, Tuple
+
+from .models import OrderBook
+
+
+class _Fenwick:
+    """Prefix sums over positions 1..size with O(log size) updates and queries."""
+
+    def __init__(self, size: int, typecode: str):
+        self.size = size
+        self.tree = array(typecode, bytes(array(typecode).itemsize * (size + 1)))
+        self.top = 1 << (size.bit_length() - 1)
+
+    def add(self, position: int, delta) -> None:
+        tree = self.tree
+        while position <= self.size:
+            tree[position] += delta
+            position += position & -position
+
+    def prefix(self, position: int):
+        tree = self.tree
+        total = 0
+        while position > 0:
+            total += tree[position]
+            position -= position & -position
+        return total
+
+    def search(self, target) -> int:
+        """Smallest position whose prefix sum reaches ``target`` (integer trees)."""
+        tree = self.tree
+        position = 0
+        step = self.top
+        while step:
+            following = position + step
+            if following <= self.size and tree[following] < target:
+                position = following
+                target -= tree[following]
+            step >>= 1
+        return position + 1
+
+
+class _Side:
+    """One side of a book on the price grid."""
+
+    def __init__(self, ticks: int):
+        self.sizes = array("d", bytes(8 * (ticks + 1)))
+        self.size_tree = _Fenwick(ticks, "d")
+        self.level_tree = _Fenwick(ticks, "q")  # Non-empty levels, for best-price search
+        self.occupied = set()
+
+    def set(self, position: int, size: float) -> None:
+        previous = self.sizes[position]
+        if size == previous:
+            return
+        self.sizes[position] = size
+        self.size_tree.add(position, size - previous)
+        if previous == 0:
+            self.level_tree.add(position, 1)
+            self.occupied.add(position)
+        elif size == 0:
+            self.level_tree.add(position, -1)
+            self.occupied.discard(position)
+
+    def lowest(self) -> Optional[int]:
+        return self.level_tree.search(1) if self.occupied else None
+
+    def highest(self) -> Optional[int]:
+        return self.level_tree.search(len(self.occupied)) if self.occupied else None
+
+    def between(self, low: int, high: int) -> float:
+        # Clamp: sums of removed levels can leave tiny negative residues
+        return max(0.0, self.size_tree.prefix(high) - self.size_tree.prefix(low - 1))
+
+
+class BookAnalytics:
+    """
+    Order book metrics maintained incrementally.
+
+    Args:
+        tick: Price grid step; prices are rounded to it
+        depth_band: Distance from the touch (in price) used by ``bid_depth``,
+            ``ask_depth`` and ``imbalance``
+    """
+
+    def __init__(self, tick: float = 0.001, depth_band: float = 0.05):
+        self.tick = tick
+        self.depth_band = depth_band
+        self._ticks = int(round(1 / tick)) + 1
+        self._bids = _Side(self._ticks)
+        self._asks = _Side(self._ticks)
+        self.timestamp: Optional[int] = None
+        """Timestamp of the last book passed to ``update()``"""
+
+    def _position(self, price: float) -> int:
+        position = int(round(price / self.tick)) + 1
+        if not 1 <= position <= self._ticks:
+            raise ValueError(f"Price {price} is outside 0-1")
+        return position
+
+    def _price(self, position: Optional[int]) -> Optional[float]:
+        return round((position - 1) * self.tick, 10) if position is not None else None
+
+    def apply(self, side: Literal["bid", "ask"], price: float, size: float) -> None:
+        """Set the size at one price level (0 removes it)."""
+        book_side = self._bids if side == "bid" else self._asks
+        book_side.set(self._position(price), float(size))
+
+    def update(self, book: OrderBook) -> None:
+        """Replace the book, applying only the levels that changed."""
+        for book_side, levels in ((self._bids, book.bids), (self._asks, book.asks)):
+            incoming: Dict[int, float] = {}
+            for level in levels:
+                position = self._position(level.price)
+                incoming[position] = incoming.get(position, 0.0) + level.size
+            for position in book_side.occupied - incoming.keys():
+                book_side.set(position, 0.0)
+            for position, size in incoming.items():
+                book_side.set(position, size)
+        self.timestamp = book.timestamp
+
+    def clear(self) -> None:
+        self._bids = _Side(self._ticks)
+        self._asks = _Side(self._ticks)
+        self.timestamp = None
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        return self._price(self._bids.highest())
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        return self._price(self._asks.lowest())
+
+    @property
+    def best_bid_size(self) -> float:
+        position = self._bids.highest()
+        return self._bids.sizes[position] if position is not None else 0.0
+
+    @property
+    def best_ask_size(self) -> float:
+        position = self._asks.lowest()
+        return self._asks.sizes[position] if position is not None else 0.0
+
+    @property
+    def spread(self) -> Optional[float]:
+        bid, ask = self.best_bid, self.best_ask
+        return round(ask - bid, 10) if bid is not None and ask is not None else None
+
+    @property
+    def mid(self) -> Optional[float]:
+        bid, ask = self.best_bid, self.best_ask
+        return (bid + ask) / 2 if bid is not None and ask is not None else None
+
+    @property
+    def microprice(self) -> Optional[float]:
+        """Mid weighted by top-of-book sizes: leans toward the side with less size."""
+        bid, ask = self.best_bid, self.best_ask
+        if bid is None or ask is None:
+            return None
+        bid_size, ask_size = self.best_bid_size, self.best_ask_size
+        if bid_size + ask_size <= 0:
+            return (bid + ask) / 2
+        return (bid * ask_size + ask * bid_size) / (bid_size + ask_size)
+
+    def depth_within(self, distance: float) -> Tuple[float, float]:
+        """Total (bid, ask) size within ``distance`` of the best bid and best ask."""
+        band = int(math.floor(distance / self.tick + 1e-9))
+        bid_depth = ask_depth = 0.0
+        best = self._bids.highest()
+        if best is not None:
+            bid_depth = self._bids.between(max(1, best - band), best)
+        best = self._asks.lowest()
+        if best is not None:
+            ask_depth = self._asks.between(best, min(self._ticks, best + band))
+        return bid_depth, ask_depth
+
+    @property
+    def bid_depth(self) -> float:
+        return self.depth_within(self.depth_band)[0]
+
+    @property
+    def ask_depth(self) -> float:
+        return self.depth_within(self.depth_band)[1]
+
+    @property
+    def imbalance(self) -> Optional[float]:
+        """(bid depth - ask depth) / (bid depth + ask depth) within ``depth_band``, -1 to 1."""
+        bid_depth, ask_depth = self.depth_within(self.depth_band)
+        total = bid_depth + ask_depth
+        return (bid_depth - ask_depth) / total if total > 0 else None
+
+
+METRICS = (
+    "best_bid", "best_ask", "spread", "mid", "microprice", "bid_depth", "ask_depth", "imbalance",
+)
+
+
+class BookAnalyticsBatch:
+    """
+    BookAnalytics for many outcomes, with metrics as columns.
+
+    Args:
+        **options: BookAnalytics arguments (tick, depth_band) for every outcome
+    """
+
+    def __init__(self, **options):
+        self._options = options
+        self._books: Dict[str, BookAnalytics] = {}
+
+    def update(self, outcome_id: str, book: OrderBook) -> BookAnalytics:
+        analytics = self._books.get(outcome_id)
+        if analytics is None:
+            analytics = self._books[outcome_id] = BookAnalytics(**self._options)
+        analytics.update(book)
+        return analytics
+
+    def remove(self, outcome_id: str) -> None:
+        self._books.pop(outcome_id, None)
+
+    def __getitem__(self, outcome_id: str) -> BookAnalytics:
+        return self._books[outcome_id]
+
+    def __len__(self) -> int:
+        return len(self._books)
+
+    def columns(self) -> Dict[str, object]:
+        """
+        Every metric for every outcome.
+
+        Returns:
+            ``{"outcome_id": [ids...], metric: array('d'), ...}`` with rows in
+            the same order and NaN where a metric is undefined
+        """
+        columns: Dict[str, object] = {"outcome_id": list(self._books)}
+        for metric in METRICS:
+            values = (getattr(analytics, metric) for analytics in self._books.values())
+            columns[metric] = array("d", (math.nan if v is None else v for v in values))
+        return columns
@@ -0,0 +1,245 @@
+"""
+Incremental market catalogs.
+
+Refetching every market to notice a handful of price or status changes
+re-sends and re-converts the whole catalog each poll. A ``MarketCatalog``
+keeps a local table keyed by market ID and calls ``syncMarkets`` instead:
+the sidecar remembers what it last sent (behind a cursor) and only returns
+inserted/changed markets and removed IDs.
+
+When the sidecar doesn't know the cursor (first sync, sidecar restart,
+expired cursor, or another catalog syncing the same query since) it returns
+a full snapshot, which is reconciled against the local table so callers
+still see an accurate diff.
+
+With ``snapshot_path`` the table is persisted after every sync and reloaded
+on startup: the file is memory-mapped and markets are decoded on first
+access, so a restarted service can serve the last known catalog at once
+while ``start()`` reconciles it with live data in the background.
+
+Example:
+    >>> catalog = pmxt.MarketCatalog(poly, limit=1000)
+    >>> catalog.sync()                       # full snapshot
+    >>> diff = catalog.sync()                # only what changed since
+    >>> for market in diff.updated:
+    ...     print(market.title, market.yes.price)
+
+    >>> catalog = pmxt.MarketCatalog(poly, snapshot_path="markets.snap", limit=1000)
+    >>> catalog.start(interval=30)           # warm from disk, refresh in the background
+    >>> catalog.age(market_id)               # seconds since last confirmed live
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional
+
+from .models import UnifiedMarket
+from .snapshot import MarketSnapshot, encode_record
+
+if TYPE_CHECKING:
+    from .client import Exchange
+
+
+@dataclass
+class CatalogDiff:
+    """Changes applied to a MarketCatalog by one sync."""
+
+    added: List[UnifiedMarket] = field(default_factory=list)
+    """Markets new to the catalog"""
+
+    updated: List[UnifiedMarket] = field(default_factory=list)
+    """Markets whose data changed (new versions)"""
+
+    removed: List[UnifiedMarket] = field(default_factory=list)
+    """Markets dropped from the catalog (last known versions)"""
+
+    full: bool = False
+    """Whether the sidecar sent a full snapshot rather than a delta"""
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+
+class MarketCatalog:
+    """
+    Local table of an exchange's markets, kept current with delta syncs.
+
+    Args:
+        exchange: Exchange client to sync from
+        snapshot_path: Optional file to persist the table to after each sync
+            and to load it from on construction
+        **params: fetch_markets arguments selecting the markets to track
+            (query, limit, sort, fields, filter, ...)
+    """
+
+    def __init__(self, exchange: "Exchange", snapshot_path: Optional[str] = None, **params: Any):
+        self._exchange = exchange
+        self._params = params
+        # None marks a market still only in the snapshot file (decoded on access)
+        self._markets: Dict[str, Optional[UnifiedMarket]] = {}
+        self._cursor: Optional[str] = None
+        self._subscribers: List[Callable[[CatalogDiff], None]] = []
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+        self.synced_at: Optional[float] = None
+        """Wall-clock time of the last successful sync (None while serving the snapshot)"""
+
+        self.last_error: Optional[BaseException] = None
+        """Error raised by the last background sync, if it failed"""
+
+        self._snapshot_path = snapshot_path
+        self._snapshot: Optional[MarketSnapshot] = None
+        self._records: Dict[str, bytes] = {}  # upserts not yet written to the snapshot
+        if snapshot_path is not None:
+            self._snapshot = MarketSnapshot(snapshot_path)
+            self._markets = dict.fromkeys(self._snapshot.keys())
+
+        self._stopped = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
+
+    def sync(self, timeout: Optional[float] = None) -> CatalogDiff:
+        """
+        Fetch changes since the last sync and apply them.
+
+        Subscribers are called with the diff when it is non-empty.
+
+        Args:
+            timeout: Per-call time budget in seconds (defaults to the client timeout)
+
+        Returns:
+            The applied changes
+        """
+        with self._sync_lock:
+            delta = self._exchange._sync_markets(self._cursor, timeout=timeout, **self._params)
+            with self._lock:
+                diff = self._apply(delta)
+                self._cursor = delta["cursor"]
+                self.synced_at = time.time()
+                subscribers = list(self._subscribers)
+            if self._snapshot_path is not None:
+                self._save()
+
+        if diff:
+            for callback in subscribers:
+                callback(diff)
+        return diff
+
+    def _apply(self, delta: Dict[str, Any]) -> CatalogDiff:
+        diff = CatalogDiff(full=delta["full"])
+        upserts: List[UnifiedMarket] = delta["upserts"]
+
+        removed = list(delta["removed"])
+        if delta["full"]:
+            # Everything not in the snapshot is gone
+            current = {market.market_id for market in upserts}
+            removed.extend(m for m in self._markets if m not in current)
+        for market_id in removed:
+            if market_id in self._markets:
+                diff.removed.append(self._model(market_id))
+                del self._markets[market_id]
+                self._records.pop(market_id, None)
+
+        for market, raw in zip(upserts, delta["raw_upserts"]):
+            previous = self._model(market.market_id) if market.market_id in self._markets else None
+            self._markets[market.market_id] = market
+            if self._snapshot_path is not None:
+                self._records[market.market_id] = encode_record(raw)
+            if previous is None:
+                diff.added.append(market)
+            elif previous != market:
+                diff.updated.append(market)
+        return diff
+
+    def _model(self, market_id: str) -> UnifiedMarket:
+        # Called with the lock held
+        market = self._markets[market_id]
+        if market is None:
+            from .client import _convert_market
+            market = self._markets[market_id] = _convert_market(self._snapshot.get(market_id))
+        return market
+
+    def _save(self) -> None:
+        # Called with the sync lock held; readers only wait for the swap
+        with self._lock:
+            records = [
+                (market_id, self.synced_at, self._records.get(market_id) or self._snapshot.raw(market_id))
+                for market_id in self._markets
+            ]
+        MarketSnapshot.write(self._snapshot_path, records, saved_at=self.synced_at)
+        with self._lock:
+            self._snapshot.close()
+            self._snapshot = MarketSnapshot(self._snapshot_path)
+            self._records.clear()
+
+    def start(self, interval: float = 60.0) -> None:
+        """
+        Sync now and then every ``interval`` seconds on a background thread.
+
+        Failed syncs are kept in ``last_error`` and retried at the next interval.
+        """
+        if self._refresher is not None:
+            return
+        self._stopped.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh, args=(interval,), name="pmxt-catalog", daemon=True
+        )
+        self._refresher.start()
+
+    def stop(self) -> None:
+        """Stop the background refresh started by ``start()``."""
+        self._stopped.set()
+        if self._refresher is not None:
+            self._refresher.join()
+            self._refresher = None
+
+    def _refresh(self, interval: float) -> None:
+        while not self._stopped.is_set():
+            try:
+                self.sync()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = e
+            self._stopped.wait(interval)
+
+    def subscribe(self, callback: Callable[[CatalogDiff], None]) -> None:
+        """Call ``callback`` with every non-empty diff, e.g. to maintain a derived index."""
+        with self._lock:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[CatalogDiff], None]) -> None:
+        with self._lock:
+            self._subscribers.remove(callback)
+
+    def fetched_at(self, market_id: str) -> Optional[float]:
+        """When the market's data was last confirmed live (``time.time()``), or None if unknown."""
+        with self._lock:
+            if market_id not in self._markets:
+                return None
+            if self.synced_at is not None:
+                return self.synced_at
+            return self._snapshot.fetched_at(market_id)
+
+    def age(self, market_id: str) -> Optional[float]:
+        """Seconds since the market's data was last confirmed live, or None if unknown."""
+        fetched_at = self.fetched_at(market_id)
+        return time.time() - fetched_at if fetched_at is not None else None
+
+    def get(self, market_id: str) -> Optional[UnifiedMarket]:
+        with self._lock:
+            return self._model(market_id) if market_id in self._markets else None
+
+    def __getitem__(self, market_id: str) -> UnifiedMarket:
+        with self._lock:
+            return self._model(market_id)
+
+    def __contains__(self, market_id: object) -> bool:
+        return market_id in self._markets
+
+    def __len__(self) -> int:
+        return len(self._markets)
+
+    def __iter__(self) -> Iterator[UnifiedMarket]:
+        with self._lock:
+            return iter([self._model(market_id) for market_id in self._markets])
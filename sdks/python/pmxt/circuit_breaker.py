@@ -0,0 +1,251 @@
+"""
+Circuit breaking for degraded exchanges.
+
+When an exchange degrades, callers that keep waiting on timeouts pile up
+threads and memory. A ``CircuitBreaker`` watches the error rate and
+latency of each exchange/method pair over a sliding window:
+
+- **closed**: calls flow normally while outcomes are recorded.
+- **open**: too many recent calls failed or were slow; calls fail fast
+  with ``CircuitOpen`` (or, for market data reads, return the last good
+  response when ``serve_stale`` is enabled).
+- **half_open**: after ``open_duration``, a few trial calls are let
+  through. If they succeed the circuit closes, otherwise it reopens.
+
+Example:
+    >>> breaker = pmxt.CircuitBreaker(failure_rate=0.5, slow_call_duration=2.0, serve_stale=True)
+    >>> poly = pmxt.Polymarket(circuit_breaker=breaker)
+    >>> breaker.states()["polymarket.fetch_order_book"].state
+    'closed'
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+from .errors import CircuitOpen
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Reads that may be answered from the last good response while a circuit is open.
+# Streams and account state are never served stale.
+STALE_READ_METHODS = frozenset({
+    "fetch_markets",
+    "fetch_events",
+    "fetch_ohlcv",
+    "fetch_order_book",
+    "fetch_trades",
+})
+
+
+@dataclass
+class CircuitStats:
+    """Monitoring snapshot of one circuit."""
+
+    state: str
+    """"closed", "open" or "half_open\""""
+
+    calls: int
+    """Calls in the current window"""
+
+    failures: int
+    """Failed calls in the current window"""
+
+    slow_calls: int
+    """Slow calls in the current window"""
+
+    times_opened: int
+    """How many times the circuit has opened"""
+
+    opened_at: Optional[float] = None
+    """Monotonic time the circuit last opened"""
+
+    @property
+    def failure_rate(self) -> float:
+        """Fraction of calls in the window that failed."""
+        return self.failures / self.calls if self.calls else 0.0
+
+
+class _Circuit:
+    def __init__(self, window: int):
+        self.state = CLOSED
+        self.outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window)  # (failed, slow)
+        self.opened_at: Optional[float] = None
+        self.times_opened = 0
+        self.trials = 0
+
+
+class CircuitBreaker:
+    """
+    Per exchange/method circuit breakers driven by error rate and latency.
+
+    Only retryable failures (network errors, timeouts, rate limits,
+    exchange outages) count against a circuit. A rejected order or an
+    unknown market says nothing about the health of the exchange.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        slow_call_duration: Optional[float] = None,
+        slow_call_rate: float = 1.0,
+        window: int = 20,
+        min_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_calls: int = 1,
+        serve_stale: bool = False,
+        on_state_change: Optional[Callable[[str, str, str], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            failure_rate: Failure fraction in the window that opens the circuit
+            slow_call_duration: Calls slower than this (seconds) count as slow
+                (None = latency is ignored)
+            slow_call_rate: Slow-call fraction in the window that opens the circuit
+            window: Number of recent calls evaluated per circuit
+            min_calls: Calls required in the window before the circuit can open
+            open_duration: Seconds to fail fast before letting trial calls through
+            half_open_calls: Successful trial calls required to close again
+            serve_stale: While open, answer market data reads with the last good response
+            on_state_change: Optional callback ``(key, old_state, new_state)``
+            clock: Monotonic clock, injectable for testing
+        """
+        self.failure_rate = failure_rate
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate = slow_call_rate
+        self.window = window
+        self.min_calls = min_calls
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+        self.serve_stale = serve_stale
+        self.on_state_change = on_state_change
+        self._clock = clock
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, key: str) -> _Circuit:
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = _Circuit(self.window)
+        return circuit
+
+    def _transition(self, key: str, circuit: _Circuit, state: str) -> Optional[Tuple[str, str]]:
+        if circuit.state == state:
+            return None
+        old = circuit.state
+        circuit.state = state
+        circuit.trials = 0
+        if state == OPEN:
+            circuit.opened_at = self._clock()
+            circuit.times_opened += 1
+        else:
+            # Half-open counts only trial calls; closed starts a fresh window.
+            # The window that tripped the circuit stays visible while open.
+            circuit.outcomes.clear()
+        return old, state
+
+    def _notify(self, key: str, change: Optional[Tuple[str, str]]) -> None:
+        if change is not None and self.on_state_change is not None:
+            self.on_state_change(key, *change)
+
+    def allow(self, key: str) -> None:
+        """
+        Check whether a call may proceed.
+
+        Args:
+            key: "<exchange>.<method>"
+
+        Raises:
+            CircuitOpen: If the circuit is open (or half-open with its trial
+                calls already in flight)
+        """
+        with self._lock:
+            circuit = self._circuit(key)
+            change = None
+            if circuit.state == OPEN:
+                remaining = circuit.opened_at + self.open_duration - self._clock()
+                if remaining > 0:
+                    raise CircuitOpen(
+                        f"Circuit for {key} is open; failing fast",
+                        retry_after=remaining,
+                    )
+                change = self._transition(key, circuit, HALF_OPEN)
+
+            if circuit.state == HALF_OPEN:
+                if circuit.trials >= self.half_open_calls:
+                    raise CircuitOpen(f"Circuit for {key} is half-open; trial call in progress")
+                circuit.trials += 1
+        self._notify(key, change)
+
+    def record(self, key: str, failed: bool, latency: float) -> None:
+        """
+        Record the outcome of a call that ``allow`` let through.
+
+        Args:
+            key: "<exchange>.<method>"
+            failed: Whether the call failed in a way that indicates degradation
+            latency: Call duration (seconds)
+        """
+        slow = self.slow_call_duration is not None and latency > self.slow_call_duration
+        with self._lock:
+            circuit = self._circuit(key)
+            change = None
+
+            if circuit.state == HALF_OPEN:
+                if failed or slow:
+                    change = self._transition(key, circuit, OPEN)
+                else:
+                    circuit.outcomes.append((False, False))
+                    if len(circuit.outcomes) >= self.half_open_calls:
+                        change = self._transition(key, circuit, CLOSED)
+            elif circuit.state == CLOSED:
+                circuit.outcomes.append((failed, slow))
+                calls = len(circuit.outcomes)
+                if calls >= self.min_calls:
+                    failures = sum(1 for f, _ in circuit.outcomes if f)
+                    slow_calls = sum(1 for _, s in circuit.outcomes if s)
+                    if (
+                        failures / calls >= self.failure_rate
+                        or (self.slow_call_duration is not None and slow_calls / calls >= self.slow_call_rate)
+                    ):
+                        change = self._transition(key, circuit, OPEN)
+        self._notify(key, change)
+
+    def state(self, key: str) -> str:
+        """Current state of a circuit ("closed", "open" or "half_open")."""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            return circuit.state if circuit else CLOSED
+
+    def states(self) -> Dict[str, CircuitStats]:
+        """
+        Snapshot of every circuit, for monitoring.
+
+        Returns:
+            Mapping of "<exchange>.<method>" to CircuitStats
+        """
+        with self._lock:
+            return {
+                key: CircuitStats(
+                    state=c.state,
+                    calls=len(c.outcomes),
+                    failures=sum(1 for f, _ in c.outcomes if f),
+                    slow_calls=sum(1 for _, s in c.outcomes if s),
+                    times_opened=c.times_opened,
+                    opened_at=c.opened_at,
+                )
+                for key, c in self._circuits.items()
+            }
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """Force one circuit (or all circuits) back to closed."""
+        with self._lock:
+            keys = [key] if key is not None else list(self._circuits)
+            for k in keys:
+                self._circuits.pop(k, None)
@@ -7,20 +7,16 @@ OpenAPI client, matching the JavaScript API exactly.
 
 import os
 import sys
-from typing import List, Optional, Dict, Any, Literal, Union
+import threading
+import time
+from typing import List, Optional, Dict, Any, Callable, Literal, Sequence, Union
+from collections import OrderedDict
 from datetime import datetime
 from abc import ABC, abstractmethod
 import json
 
-# Add generated client to path
+# Location of the generated client when running from a source checkout
 _GENERATED_PATH = os.path.join(os.path.dirname(__file__), "..", "generated")
-if _GENERATED_PATH not in sys.path:
-    sys.path.insert(0, _GENERATED_PATH)
-
-from pmxt_internal import ApiClient, Configuration
-from pmxt_internal.api.default_api import DefaultApi
-from pmxt_internal.exceptions import ApiException
-from pmxt_internal import models as internal_models
 
 from .models import (
     UnifiedMarket,
@@ -40,6 +36,117 @@ from .models import (
     EventFilterFunction,
 )
 from .server_manager import ServerManager
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy, IDEMPOTENT_METHODS
+from .hedging import HedgePolicy
+from .circuit_breaker import CircuitBreaker, STALE_READ_METHODS
+from .sharding import ShardPool, LEAST_OUTSTANDING
+from .compression import Compression, accept_encoding
+from .projection import event_fields, market_fields
+from .pushdown import event_criteria, market_criteria
+from .registry import MarketRegistry
+from .errors import (
+    PmxtError,
+    NetworkError,
+    RateLimitExceeded,
+    RequestTimeout,
+    CircuitOpen,
+    SessionNotFound,
+    error_from_detail,
+)
+
+
+# The generated OpenAPI client (and pydantic, urllib3) is imported on first use
+# by _load_internal(), not with pmxt. No sidecar call can happen before an
+# Exchange has been constructed, which loads it.
+ApiClient: Any = None
+Configuration: Any = None
+DefaultApi: Any = None
+ApiException: Any = None
+internal_models: Any = None
+HTTPError: Any = None
+MaxRetryError: Any = None
+Urllib3TimeoutError: Any = None
+
+# Errors raised by the generated client for failed sidecar calls
+_TRANSPORT_ERRORS: tuple = ()
+
+_internal_lock = threading.Lock()
+
+
+def _load_internal() -> None:
+    """Import the generated client into this module's namespace (once)."""
+    global ApiClient, Configuration, DefaultApi, ApiException, internal_models
+    global HTTPError, MaxRetryError, Urllib3TimeoutError, _TRANSPORT_ERRORS
+
+    if _TRANSPORT_ERRORS:
+        return
+    with _internal_lock:
+        if _TRANSPORT_ERRORS:
+            return
+
+        # Add generated client to path
+        if _GENERATED_PATH not in sys.path:
+            sys.path.insert(0, _GENERATED_PATH)
+
+        from pmxt_internal import ApiClient, Configuration
+        from pmxt_internal.api.default_api import DefaultApi
+        from pmxt_internal.exceptions import ApiException
+        from pmxt_internal import models as internal_models
+        from urllib3.exceptions import HTTPError, MaxRetryError
+        from urllib3.exceptions import TimeoutError as Urllib3TimeoutError
+
+        _TRANSPORT_ERRORS = (ApiException, HTTPError)
+
+# Header carrying the caller's remaining time budget to the sidecar (milliseconds)
+TIMEOUT_HEADER = "x-pmxt-timeout-ms"
+
+# Header identifying a sidecar session, sent instead of raw credentials
+SESSION_HEADER = "x-pmxt-session-id"
+
+# Distinct read requests whose last good response is kept for serve_stale
+_STALE_CACHE_SIZE = 256
+
+# Response body formats the sidecar can send (see Exchange(wire_format=...))
+WIRE_FORMATS = ("json", "msgpack")
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+
+def _without_credentials(request: Any) -> Any:
+    """Copy of a request model with its credentials removed."""
+    body = request.to_dict()
+    if "credentials" not in body:
+        return request
+    del body["credentials"]
+    return type(request).from_dict(body)
+
+
+def _load_msgpack() -> Any:
+    try:
+        import msgpack
+    except ImportError:
+        raise ImportError(
+            "wire_format='msgpack' requires the msgpack package: pip install 'pmxt[msgpack]'"
+        ) from None
+    return msgpack
+
+
+def _decode_raw(response: Any) -> Dict[str, Any]:
+    """
+    Decode an unparsed sidecar response, skipping the generated models.
+
+    Errors are always JSON; successful responses are MessagePack unless the
+    sidecar predates it and answered with JSON anyway.
+    """
+    try:
+        data = response.data
+    finally:
+        response.release_conn()
+    if response.status >= 400:
+        raise ApiException(status=response.status, reason=response.reason, body=data.decode())
+    if response.headers.get("Content-Type", "").startswith(MSGPACK_CONTENT_TYPE):
+        return _load_msgpack().unpackb(data)
+    return json.loads(data)
 
 
 def _convert_outcome(raw: Dict[str, Any]) -> MarketOutcome:
@@ -211,6 +318,18 @@ class Exchange(ABC):
         auto_start_server: bool = True,
         proxy_address: Optional[str] = None,
         signature_type: Optional[Any] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        timeout: Optional[float] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        shards: Optional[int] = None,
+        shard_strategy: str = LEAST_OUTSTANDING,
+        supervise: bool = False,
+        use_sessions: bool = True,
+        compression: Compression = False,
+        wire_format: str = "json",
+        registry: Optional[MarketRegistry] = None,
     ):
         """
         Initialize an exchange client.
@@ -220,72 +339,416 @@ class Exchange(ABC):
             api_key: API key for authentication (optional)
             private_key: Private key for authentication (optional)
             base_url: Base URL of the PMXT sidecar server
-            auto_start_server: Automatically start server if not running (default: True)
+            auto_start_server: Automatically start server if not running (default: True).
+                Startup runs in the background; the first API call waits for it.
+            rate_limiter: Optional client-side RateLimiter. Calls over budget
+                queue locally instead of hitting upstream rate limits.
+            retry_policy: Optional RetryPolicy. Idempotent calls that fail with a
+                retryable error are retried with jittered exponential backoff.
+            timeout: Default time budget in seconds for every call (None = no limit).
+                Enforced on the socket and forwarded to the sidecar so it can
+                abandon the upstream request. Methods accept ``timeout=`` to override.
+            hedge_policy: Optional HedgePolicy. Market data reads slower than a
+                recent latency percentile get a second request; the first answer wins.
+            circuit_breaker: Optional CircuitBreaker. Calls to an exchange/method whose
+                recent error rate or latency is too high fail fast with CircuitOpen.
+            shards: Number of sidecar processes to launch if the server has to be
+                started (default: ``PMXT_SHARDS`` or 1)
+            shard_strategy: How requests are spread over a sharded sidecar:
+                "least_outstanding" or "round_robin". ``watch_*`` calls are
+                always pinned to one shard per watched outcome.
+            supervise: Keep the local server running with a watchdog that restarts it
+                if it dies. Idempotent calls that fail because the server is
+                unreachable are replayed once it is back.
+            use_sessions: Authenticate once per sidecar and send a session ID instead
+                of raw credentials with every call (default: True). Falls back to
+                sending credentials if the sidecar doesn't support sessions.
+            compression: Ask the sidecar to compress large responses: True for any
+                encoding urllib3 can decode here (zstd, br, gzip), or an encoding
+                or list of encodings in order of preference (default: False)
+            wire_format: Response body format, "json" or "msgpack". MessagePack
+                is faster to produce and parse for large books and catalogs,
+                and requires ``pip install 'pmxt[msgpack]'``.
+            registry: MarketRegistry indexing fetched markets and events (default:
+                a new one per client). Pass a shared registry to index several
+                clients together.
         """
+        _load_internal()
+        accept = accept_encoding(compression)
+        if wire_format not in WIRE_FORMATS:
+            raise ValueError(f"wire_format must be one of {WIRE_FORMATS}, got {wire_format!r}")
+        if wire_format == "msgpack":
+            _load_msgpack()
+        self.wire_format = wire_format
+        self.registry = registry if registry is not None else MarketRegistry()
+
         self.exchange_name = exchange_name.lower()
         self.api_key = api_key
         self.private_key = private_key
         self.proxy_address = proxy_address
         self.signature_type = signature_type
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self.timeout = timeout
+        self._hedge_policy = hedge_policy
+        self._circuit_breaker = circuit_breaker
+        # Last good response per read request, served while a circuit is open
+        self._stale_responses: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._stale_lock = threading.Lock()
         
         # Initialize server manager
-        self._server_manager = ServerManager(base_url)
+        self._server_manager = ServerManager(base_url, shards=shards)
+        self._shard_strategy = shard_strategy
+        self._shards: Optional[ShardPool] = None
+        self._use_sessions = use_sessions
+        # Session ID per sidecar client (one per shard)
+        self._sessions: Dict[int, str] = {}
+        self._session_lock = threading.Lock()
         
-        # Ensure server is running (unless disabled)
+        # Start the server in the background (unless disabled); the first
+        # API call waits for it, so construction never blocks
+        self._server_ready = not auto_start_server
         if auto_start_server:
-            try:
-                self._server_manager.ensure_server_running()
-                
-                # Get the actual port the server is running on
-                # (may differ from default if default port was busy)
-                actual_port = self._server_manager.get_running_port()
-                base_url = f"http://localhost:{actual_port}"
-                
-            except Exception as e:
-                raise Exception(
-                    f"Failed to start PMXT server: {e}\n\n"
-                    f"Please ensure 'pmxtjs' is installed: npm install -g pmxtjs\n"
-                    f"Or start the server manually: pmxt-server"
-                )
+            self._server_manager.start_background()
+        if supervise:
+            self._server_manager.supervise()
         
-        # Configure the API client with the actual base URL
+        # Configure the API client with the base URL (updated once the
+        # server reports its actual port)
         config = Configuration(host=base_url)
         self._api_client = ApiClient(configuration=config)
+        if accept:
+            self._api_client.default_headers['Accept-Encoding'] = accept
         
         # Add access token from lock file
-        server_info = self._server_manager.get_server_info()
-        if server_info and 'accessToken' in server_info:
-            self._api_client.default_headers['x-pmxt-access-token'] = server_info['accessToken']
+        if self._server_ready:
+            self._configure_access_token()
             
         self._api = DefaultApi(api_client=self._api_client)
     
     def close(self):
         """No-op for now, kept for API compatibility with TS."""
         pass
+
+    def _configure_access_token(self) -> None:
+        """Attach the sidecar's access token from the lock file."""
+        server_info = self._server_manager.get_server_info()
+        if server_info and 'accessToken' in server_info:
+            self._api_client.default_headers['x-pmxt-access-token'] = server_info['accessToken']
+
+    def _ensure_server(self) -> None:
+        """Wait for the background server startup on the first API call."""
+        if self._server_ready:
+            return
+        try:
+            self._server_manager.wait_until_ready()
+        except Exception as e:
+            raise Exception(
+                f"Failed to start PMXT server: {e}\n\n"
+                f"Please ensure 'pmxtjs' is installed: npm install -g pmxtjs\n"
+                f"Or start the server manually: pmxt-server"
+            )
+        
+        # Get the actual port the server is running on
+        # (may differ from default if default port was busy)
+        actual_port = self._server_manager.get_running_port()
+        self._api_client.configuration.host = f"http://localhost:{actual_port}"
+        self._configure_access_token()
+        self._configure_shards()
+        self._server_ready = True
+
+    def _configure_shards(self) -> None:
+        """Create one API client per sidecar shard, if the server is sharded."""
+        ports = self._server_manager.get_shard_ports()
+        if len(ports) < 2:
+            self._shards = None
+            return
+        apis = []
+        for port in ports:
+            client = ApiClient(configuration=Configuration(host=f"http://localhost:{port}"))
+            client.default_headers.update(self._api_client.default_headers)
+            apis.append(DefaultApi(api_client=client))
+        self._shards = ShardPool(apis, strategy=self._shard_strategy)
+
+    def _shard_pin(self, method: str, params: Dict[str, Any]) -> Optional[str]:
+        """Affinity key keeping a stream or sync on the shard that holds its state."""
+        if method == "sync_markets":
+            # Catalog cursors only exist in the shard that issued them
+            return f"{self.exchange_name}.{method}"
+        if not method.startswith("watch_"):
+            return None
+        args = []
+        for request in params.values():
+            args = request.to_dict().get("args") or []
+        # Streams for the same outcome share a shard (and its upstream socket)
+        if args:
+            return f"{self.exchange_name}:{args[0]}"
+        return f"{self.exchange_name}.{method}"
     
+    def _call_api(
+        self,
+        method: str,
+        timeout: Optional[float] = None,
+        **params
+    ) -> Dict[str, Any]:
+        """
+        Invoke a generated API method and return the raw response body.
+
+        Every sidecar call goes through here so that client-side policies
+        (rate limiting, retries, timeouts, hedging, circuit breaking) apply
+        uniformly.
+
+        Args:
+            method: DefaultApi method name (e.g. "fetch_markets")
+            timeout: Time budget for the whole call, including rate limit
+                queueing and retries (defaults to the client timeout)
+            **params: Request model keyword argument for the method
+        """
+        self._ensure_server()
+        if timeout is None:
+            timeout = self.timeout
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        def remaining_budget() -> Optional[float]:
+            if deadline is None:
+                return None
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise RequestTimeout(f"Request timed out after {timeout}s")
+            return remaining
+
+        def attempt() -> Dict[str, Any]:
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire(self.exchange_name, method, timeout=remaining_budget())
+
+            options: Dict[str, Any] = {}
+            remaining = remaining_budget()
+            if remaining is not None:
+                options["_request_timeout"] = remaining
+                options["_headers"] = {TIMEOUT_HEADER: str(max(1, int(remaining * 1000)))}
+
+            if self._shards is None:
+                return self._send(self._api, method, params, options)
+            with self._shards.checkout(self._shard_pin(method, params)) as api:
+                return self._send(api, method, params, options)
+
+        call = attempt
+        hedge = self._hedge_policy
+        if hedge is not None and method in hedge.methods:
+            call = lambda: hedge.run(f"{self.exchange_name}.{method}", attempt)
+
+        policy = self._retry_policy
+        if policy is not None and method in policy.methods:
+            def on_retry(error: PmxtError, delay: float) -> None:
+                # Let other callers sharing the budget back off too
+                if isinstance(error, RateLimitExceeded) and self._rate_limiter is not None:
+                    self._rate_limiter.pause(self.exchange_name, method, delay)
+
+            hedged = call
+            call = lambda: policy.run(hedged, self._api_error, on_retry=on_retry, deadline=timeout)
+
+        if method in IDEMPOTENT_METHODS and self._server_manager.supervised:
+            unsupervised = call
+            call = lambda: self._replay_after_restart(unsupervised, deadline)
+
+        if self._circuit_breaker is None:
+            return call()
+        return self._call_with_breaker(method, call, params)
+
+    def _send(
+        self,
+        api: "DefaultApi",
+        method: str,
+        params: Dict[str, Any],
+        options: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Call a generated API method on one sidecar, authenticating by session if possible."""
+        def send(request_params: Dict[str, Any], session_id: Optional[str] = None) -> Dict[str, Any]:
+            headers = dict(options.get("_headers", {}))
+            if session_id is not None:
+                headers[SESSION_HEADER] = session_id
+            call = getattr(api, method)
+            if self.wire_format == "msgpack":
+                headers["Accept"] = MSGPACK_CONTENT_TYPE
+                call = getattr(api, f"{method}_without_preload_content")
+            request_options = {**options, "_headers": headers} if headers else options
+            response = call(exchange=self.exchange_name, **request_params, **request_options)
+            if self.wire_format == "msgpack":
+                # Parse the raw body ourselves instead of through the generated models
+                return _decode_raw(response)
+            return response.to_dict()
+
+        if not self._use_sessions or self._get_credentials_dict() is None:
+            return send(params)
+
+        session_id = self._session(api, options.get("_request_timeout"))
+        if session_id is None:
+            return send(params)
+        anonymous = {name: _without_credentials(request) for name, request in params.items()}
+        try:
+            return send(anonymous, session_id)
+        except ApiException as e:
+            if not isinstance(self._api_error(e), SessionNotFound):
+                raise
+
+        # The sidecar restarted or evicted the session: open a new one, once
+        self._forget_session(api, session_id)
+        session_id = self._session(api, options.get("_request_timeout"))
+        if session_id is None:
+            return send(params)
+        return send(anonymous, session_id)
+
+    def _session(self, api: "DefaultApi", timeout: Optional[float] = None) -> Optional[str]:
+        """Session ID for a sidecar client, opening one on first use within ``timeout``."""
+        with self._session_lock:
+            session_id = self._sessions.get(id(api))
+            if session_id is None and self._use_sessions:
+                session_id = self._open_session(api.api_client, timeout)
+                if session_id is None:
+                    # Sidecar predates sessions: keep sending credentials
+                    self._use_sessions = False
+                else:
+                    self._sessions[id(api)] = session_id
+            return session_id
+
+    def _forget_session(self, api: "DefaultApi", session_id: str) -> None:
+        with self._session_lock:
+            if self._sessions.get(id(api)) == session_id:
+                del self._sessions[id(api)]
+
+    def _open_session(self, api_client: "ApiClient", timeout: Optional[float] = None) -> Optional[str]:
+        """Exchange credentials for a session ID (None if the sidecar has no sessions)."""
+        url = f"{api_client.configuration.host}/session/{self.exchange_name}"
+        headers = {"Content-Type": "application/json", "Accept": "application/json"}
+        headers.update(api_client.default_headers)
+
+        response = api_client.call_api(
+            method="POST",
+            url=url,
+            body={"credentials": self._get_credentials_dict()},
+            header_params=headers,
+            _request_timeout=timeout,
+        )
+        response.read()
+        if response.status == 404:
+            return None
+        return self._handle_response(json.loads(response.data))["sessionId"]
+
+    def _replay_after_restart(
+        self,
+        call: Callable[[], Dict[str, Any]],
+        deadline: Optional[float],
+    ) -> Dict[str, Any]:
+        """Run an idempotent ``call``, replaying it once if the server was down."""
+        try:
+            return call()
+        except HTTPError as e:
+            # Only connection failures mean the sidecar itself is gone
+            if not isinstance(self._api_error(e), NetworkError):
+                raise
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not self._server_manager.wait_for_recovery(timeout):
+                raise
+
+        # The restarted server may listen on another port with a new token
+        self._server_ready = False
+        self._ensure_server()
+        return call()
+
+    def _call_with_breaker(
+        self,
+        method: str,
+        call: Callable[[], Dict[str, Any]],
+        params: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Run ``call`` through the circuit breaker, serving stale reads if enabled."""
+        breaker = self._circuit_breaker
+        key = f"{self.exchange_name}.{method}"
+        stale_key = None
+        if breaker.serve_stale and method in STALE_READ_METHODS:
+            # Keyed by the request alone: credentials never sit in memory as keys
+            body = {
+                name: {field: value for field, value in request.to_dict().items() if field != "credentials"}
+                for name, request in params.items()
+            }
+            stale_key = method + json.dumps(body, sort_keys=True, default=str)
+
+        try:
+            breaker.allow(key)
+        except CircuitOpen:
+            with self._stale_lock:
+                cached = self._stale_responses.get(stale_key) if stale_key else None
+            if cached is None:
+                raise
+            return cached
+
+        start = time.monotonic()
+        try:
+            response = call()
+        except Exception as e:
+            breaker.record(key, self._api_error(e).retryable, time.monotonic() - start)
+            raise
+
+        failed = False
+        if not response.get("success", True):
+            failed = error_from_detail(response.get("error")).retryable
+        breaker.record(key, failed, time.monotonic() - start)
+
+        if stale_key is not None and response.get("success"):
+            with self._stale_lock:
+                self._stale_responses[stale_key] = response
+                self._stale_responses.move_to_end(stale_key)
+                while len(self._stale_responses) > _STALE_CACHE_SIZE:
+                    self._stale_responses.popitem(last=False)
+        return response
+
     def _handle_response(self, response: Dict[str, Any]) -> Any:
         """Handle API response and extract data."""
         if not response.get("success"):
-            error = response.get("error", {})
-            if isinstance(error, str):
-                raise Exception(error)
-            raise Exception(error.get("message", "Unknown error"))
+            raise error_from_detail(response.get("error"))
         return response.get("data")
     
-    def _extract_api_error(self, e: Exception) -> str:
-        """Extract clean error message from ApiException body if possible."""
-        if isinstance(e, ApiException) and hasattr(e, "body") and e.body:
-            try:
-                body_json = json.loads(e.body)
-                if not body_json.get("success") and "error" in body_json:
-                    error_detail = body_json["error"]
-                    if isinstance(error_detail, dict):
-                        return error_detail.get("message", str(e))
-                    elif isinstance(error_detail, str):
-                        return error_detail
-            except:
-                pass
-        return str(e)
+    def _api_error(self, e: Exception, prefix: Optional[str] = None) -> PmxtError:
+        """
+        Convert a failed sidecar call into a typed PmxtError.
+
+        Args:
+            e: Exception raised by the generated client (or an existing PmxtError)
+            prefix: Optional context prepended to the message
+        """
+        if isinstance(e, PmxtError):
+            message = f"{prefix}: {e.message}" if prefix else e.message
+            return type(e)(
+                message,
+                code=e.code,
+                status=e.status,
+                retryable=e.retryable,
+                retry_after=e.retry_after,
+                exchange=e.exchange,
+            )
+
+        if isinstance(e, ApiException):
+            detail: Any = None
+            if getattr(e, "body", None):
+                try:
+                    body_json = json.loads(e.body)
+                    if isinstance(body_json, dict) and not body_json.get("success"):
+                        detail = body_json.get("error")
+                except (ValueError, TypeError):
+                    pass
+            return error_from_detail(detail or str(e), status=e.status, prefix=prefix)
+
+        if isinstance(e, Urllib3TimeoutError) or (
+            isinstance(e, MaxRetryError) and isinstance(e.reason, Urllib3TimeoutError)
+        ):
+            message = f"{prefix}: Request timed out" if prefix else "Request timed out"
+            return RequestTimeout(message)
+
+        if isinstance(e, HTTPError):
+            message = f"{prefix}: {e}" if prefix else str(e)
+            return NetworkError(message)
+
+        return error_from_detail(str(e), prefix=prefix)
 
     def _get_credentials_dict(self) -> Optional[Dict[str, Any]]:
         """Build credentials dictionary for API requests."""
@@ -305,12 +768,25 @@ class Exchange(ABC):
     
     # Market Data Methods
     
-    def fetch_markets(self, query: Optional[str] = None, **kwargs) -> List[UnifiedMarket]:
+    def fetch_markets(
+        self,
+        query: Optional[str] = None,
+        timeout: Optional[float] = None,
+        fields: Optional[Sequence[str]] = None,
+        filter: Optional[Union[str, MarketFilterCriteria]] = None,
+        **kwargs
+    ) -> List[UnifiedMarket]:
         """
         Get active markets from the exchange.
 
         Args:
             query: Optional search keyword
+            timeout: Per-call time budget in seconds (defaults to the client timeout)
+            fields: Only return these UnifiedMarket attributes, e.g.
+                ["market_id", "title", "volume_24h", "yes.price"]. The sidecar
+                drops the rest; other attributes keep their defaults.
+            filter: Criteria evaluated by the sidecar before sending, with the same
+                results as ``filter_markets`` on the fetched markets
             **kwargs: Additional parameters (limit, offset, sort, search_in)
 
         Returns:
@@ -318,19 +794,13 @@ class Exchange(ABC):
 
         Example:
             >>> markets = exchange.fetch_markets("Trump", limit=20, sort="volume")
+            >>> screen = exchange.fetch_markets(fields=["market_id", "title", "yes.price"])
+            >>> liquid = exchange.fetch_markets(filter={"liquidity": {"min": 50000}})
         """
         try:
             body_dict = {"args": []}
 
-            # Prepare arguments
-            search_params = {}
-            if query:
-                search_params["query"] = query
-
-            # Add any extra keyword arguments
-            for key, value in kwargs.items():
-                search_params[key] = value
-
+            search_params = self._market_search_params(query, fields, filter, kwargs)
             if search_params:
                 body_dict["args"] = [search_params]
             
@@ -341,23 +811,100 @@ class Exchange(ABC):
             
             request_body = internal_models.FetchMarketsRequest.from_dict(body_dict)
             
-            response = self._api.fetch_markets(
-                exchange=self.exchange_name,
-                fetch_markets_request=request_body,
+            data = self._handle_response(
+                self._call_api("fetch_markets", fetch_markets_request=request_body, timeout=timeout)
             )
-            
-            data = self._handle_response(response.to_dict())
-            return [_convert_market(m) for m in data]
-        except ApiException as e:
-            raise Exception(f"Failed to fetch markets: {self._extract_api_error(e)}") from None
+            markets = [_convert_market(m) for m in data]
+            self.registry.add_markets(markets)
+            return markets
+        except _TRANSPORT_ERRORS as e:
+            raise self._api_error(e, "Failed to fetch markets") from None
+
+    @staticmethod
+    def _market_search_params(
+        query: Optional[str],
+        fields: Optional[Sequence[str]],
+        filter: Optional[Union[str, MarketFilterCriteria]],
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        search_params = {}
+        if query:
+            search_params["query"] = query
+
+        # Add any extra keyword arguments
+        for key, value in kwargs.items():
+            search_params[key] = value
+
+        if fields is not None:
+            search_params["fields"] = market_fields(fields)
+        if filter is not None:
+            search_params["filter"] = market_criteria(filter)
+        return search_params
+
+    def _sync_markets(
+        self,
+        cursor: Optional[str] = None,
+        query: Optional[str] = None,
+        timeout: Optional[float] = None,
+        fields: Optional[Sequence[str]] = None,
+        filter: Optional[Union[str, MarketFilterCriteria]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Fetch markets changed since ``cursor`` (see MarketCatalog).
+
+        Takes the same arguments as fetch_markets. Without a cursor, or with
+        one the sidecar no longer knows, the delta is a full snapshot.
+
+        Returns:
+            Dict with ``cursor`` (for the next call), ``full``, ``upserts``
+            (unified markets), ``raw_upserts`` (as sent by the sidecar) and
+            ``removed`` (market IDs)
+        """
+        try:
+            search_params = self._market_search_params(query, fields, filter, kwargs)
+            body_dict = {"args": [search_params, cursor] if cursor else [search_params]}
+
+            creds = self._get_credentials_dict()
+            if creds:
+                body_dict["credentials"] = creds
+
+            request_body = internal_models.SyncMarketsRequest.from_dict(body_dict)
+
+            data = self._handle_response(
+                self._call_api("sync_markets", sync_markets_request=request_body, timeout=timeout)
+            )
+            upserts = [_convert_market(m) for m in data["upserts"]]
+            self.registry.add_markets(upserts)
+            return {
+                "cursor": data["cursor"],
+                "full": data["full"],
+                "upserts": upserts,
+                "raw_upserts": data["upserts"],
+                "removed": data["removed"],
+            }
+        except _TRANSPORT_ERRORS as e:
+            raise self._api_error(e, "Failed to sync markets") from None
 
-    def fetch_events(self, query: Optional[str] = None, **kwargs) -> List[UnifiedEvent]:
+    def fetch_events(
+        self,
+        query: Optional[str] = None,
+        timeout: Optional[float] = None,
+        fields: Optional[Sequence[str]] = None,
+        filter: Optional[Union[str, EventFilterCriteria]] = None,
+        **kwargs
+    ) -> List[UnifiedEvent]:
         """
         Fetch events with optional keyword search.
         Events group related markets together.
 
         Args:
             query: Optional search keyword
+            timeout: Per-call time budget in seconds (defaults to the client timeout)
+            fields: Only return these UnifiedEvent attributes; dotted paths such as
+                "markets.volume_24h" project the nested markets
+            filter: Criteria evaluated by the sidecar before sending, with the same
+                results as ``filter_events`` on the fetched events
             **kwargs: Additional parameters (limit, offset, search_in)
 
         Returns:
@@ -378,6 +925,11 @@ class Exchange(ABC):
             for key, value in kwargs.items():
                 search_params[key] = value
 
+            if fields is not None:
+                search_params["fields"] = event_fields(fields)
+            if filter is not None:
+                search_params["filter"] = event_criteria(filter)
+
             if search_params:
                 body_dict["args"] = [search_params]
             
@@ -388,15 +940,14 @@ class Exchange(ABC):
             
             request_body = internal_models.FetchEventsRequest.from_dict(body_dict)
             
-            response = self._api.fetch_events(
-                exchange=self.exchange_name,
-                fetch_events_request=request_body,
+            data = self._handle_response(
+                self._call_api("fetch_events", fetch_events_request=request_body, timeout=timeout)
             )
-            
-            data = self._handle_response(response.to_dict())
-            return [_convert_event(e) for e in data]
-        except ApiException as e:
-            raise Exception(f"Failed to fetch events: {self._extract_api_error(e)}") from None
+            events = [_convert_event(e) for e in data]
+            self.registry.add_events(events)
+            return events
+        except _TRANSPORT_ERRORS as e:
+            raise self._api_error(e, "Failed to fetch events") from None
 
     # ----------------------------------------------------------------------------
     # Filtering Methods
@@ -621,6 +1172,7 @@ class Exchange(ABC):
         limit: Optional[int] = None,
         start: Optional[datetime] = None,
         end: Optional[datetime] = None,
+        timeout: Optional[float] = None,
         **kwargs
     ) -> List[PriceCandle]:
         """
@@ -636,6 +1188,7 @@ class Exchange(ABC):
             limit: Maximum number of candles to return
             start: Start datetime for historical data
             end: End datetime for historical data
+            timeout: Per-call time budget in seconds (defaults to the client timeout)
             **kwargs: Additional parameters
 
         Returns:
@@ -669,22 +1222,20 @@ class Exchange(ABC):
             request_body_dict = {"args": [outcome_id, params_dict]}
             request_body = internal_models.FetchOHLCVRequest.from_dict(request_body_dict)
             
-            response = self._api.fetch_ohlcv(
-                exchange=self.exchange_name,
-                fetch_ohlcv_request=request_body,
+            data = self._handle_response(
+                self._call_api("fetch_ohlcv", fetch_ohlcv_request=request_body, timeout=timeout)
             )
-            
-            data = self._handle_response(response.to_dict())
             return [_convert_candle(c) for c in data]
-        except ApiException as e:
-            raise Exception(f"Failed to fetch OHLCV: {self._extract_api_error(e)}") from None
+        except _TRANSPORT_ERRORS as e:
+            raise self._api_error(e, "Failed to fetch OHLCV") from None
     
-    def fetch_order_book(self, outcome_id: str) -> OrderBook:
+    def fetch_order_book(self, outcome_id: str, timeout: Optional[float] = None) -> OrderBook:
         """
         Get current order book for an outcome.
         
         Args:
             outcome_id: Outcome ID
+            timeout: Per-call time budget in seconds (defaults to the client timeout)
             
         Returns:
             Current order book
@@ -698,21 +1249,19 @@ class Exchange(ABC):
             body_dict = {"args": [outcome_id]}
             request_body = internal_models.FetchOrderBookRequest.from_dict(body_dict)
             
-            response = self._api.fetch_order_book(
-                exchange=self.exchange_name,
-                fetch_order_book_request=request_body,
+            data = self._handle_response(
+                self._call_api("fetch_order_book", fetch_order_book_request=request_body, timeout=timeout)
             )
-            
-            data = self._handle_response(response.to_dict())
             return _convert_order_book(data)
-        except ApiException as e:
-            raise Exception(f"Failed to fetch order book: {self._extract_api_error(e)}") from None
+        except _TRANSPORT_ERRORS as e:
+            raise self._api_error(e, "Failed to fetch order book") from None
     
     def fetch_trades(
         self,
         outcome_id: str,
         limit: Optional[int] = None,
         since: Optional[int] = None,
+        timeout: Optional[float] = None,
         **kwargs
     ) -> List[Trade]:
         """
@@ -724,6 +1273,7 @@ class Exchange(ABC):
             outcome_id: Outcome ID (from market.outcomes[].outcome_id)
             limit: Maximum number of trades to return
             since: Return trades since this timestamp (Unix milliseconds)
+            timeout: Per-call time budget in seconds (defaults to the client timeout)
             **kwargs: Additional parameters
 
         Returns:
@@ -747,19 +1297,21 @@ class Exchange(ABC):
             request_body_dict = {"args": [outcome_id, params_dict]}
             request_body = internal_models.FetchTradesRequest.from_dict(request_body_dict)
             
-            response = self._api.fetch_trades(
-                exchange=self.exchange_name,
-                fetch_trades_request=request_body,
+            data = self._handle_response(
+                self._call_api("fetch_trades", fetch_trades_request=request_body, timeout=timeout)
             )
-            
-            data = self._handle_response(response.to_dict())
             return [_convert_trade(t) for t in data]
-        except ApiException as e:
-            raise Exception(f"Failed to fetch trades: {self._extract_api_error(e)}") from None
+        except _TRANSPORT_ERRORS as e:
+            raise self._api_error(e, "Failed to fetch trades") from None
     
     # WebSocket Streaming Methods
     
-    def watch_order_book(self, outcome_id: str, limit: Optional[int] = None) -> OrderBook:
+    def watch_order_book(
+        self,
+        outcome_id: str,
+        limit: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> OrderBook:
         """
         Watch real-time order book updates via WebSocket.
         
@@ -769,6 +1321,7 @@ class Exchange(ABC):
         Args:
             outcome_id: Outcome ID to watch
             limit: Optional depth limit for order book
+            timeout: Per-call time budget in seconds (defaults to the client timeout)
             
         Returns:
             Next order book update
@@ -794,21 +1347,19 @@ class Exchange(ABC):
             
             request_body = internal_models.WatchOrderBookRequest.from_dict(body_dict)
             
-            response = self._api.watch_order_book(
-                exchange=self.exchange_name,
-                watch_order_book_request=request_body,
+            data = self._handle_response(
+                self._call_api("watch_order_book", watch_order_book_request=request_body, timeout=timeout)
             )
-            
-            data = self._handle_response(response.to_dict())
             return _convert_order_book(data)
-        except ApiException as e:
-            raise Exception(f"Failed to watch order book: {self._extract_api_error(e)}") from None
+        except _TRANSPORT_ERRORS as e:
+            raise self._api_error(e, "Failed to watch order book") from None
     
     def watch_trades(
         self,
         outcome_id: str,
         since: Optional[int] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        timeout: Optional[float] = None,
     ) -> List[Trade]:
         """
         Watch real-time trade updates via WebSocket.
@@ -820,6 +1371,7 @@ class Exchange(ABC):
             outcome_id: Outcome ID to watch
             since: Optional timestamp to filter trades from
             limit: Optional limit for number of trades
+            timeout: Per-call time budget in seconds (defaults to the client timeout)
             
         Returns:
             Next trade update(s)
@@ -847,23 +1399,26 @@ class Exchange(ABC):
             
             request_body = internal_models.WatchTradesRequest.from_dict(body_dict)
             
-            response = self._api.watch_trades(
-                exchange=self.exchange_name,
-                watch_trades_request=request_body,
+            data = self._handle_response(
+                self._call_api("watch_trades", watch_trades_request=request_body, timeout=timeout)
             )
-            
-            data = self._handle_response(response.to_dict())
             return [_convert_trade(t) for t in data]
-        except ApiException as e:
-            raise Exception(f"Failed to watch trades: {self._extract_api_error(e)}") from None
+        except _TRANSPORT_ERRORS as e:
+            raise self._api_error(e, "Failed to watch trades") from None
 
-    def watch_prices(self, market_address: str, callback: Optional[Any] = None) -> Any:
+    def watch_prices(
+        self,
+        market_address: str,
+        callback: Optional[Any] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
         """
         Watch real-time AMM price updates via WebSocket.
         
         Args:
             market_address: Market contract address
             callback: Optional callback for price updates (if supported by implementation)
+            timeout: Per-call time budget in seconds (defaults to the client timeout)
             
         Returns:
             Next price update
@@ -878,22 +1433,24 @@ class Exchange(ABC):
             
             request_body = internal_models.WatchPricesRequest.from_dict(body_dict)
             
-            response = self._api.watch_prices(
-                exchange=self.exchange_name,
-                watch_prices_request=request_body,
+            return self._handle_response(
+                self._call_api("watch_prices", watch_prices_request=request_body, timeout=timeout)
             )
-            
-            return self._handle_response(response.to_dict())
-        except ApiException as e:
-            raise Exception(f"Failed to watch prices: {self._extract_api_error(e)}") from None
+        except _TRANSPORT_ERRORS as e:
+            raise self._api_error(e, "Failed to watch prices") from None
 
-    def watch_user_positions(self, callback: Optional[Any] = None) -> List[Position]:
+    def watch_user_positions(
+        self,
+        callback: Optional[Any] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Position]:
         """
         Watch real-time user position updates via WebSocket.
         Requires API key authentication.
         
         Args:
             callback: Optional callback for position updates
+            timeout: Per-call time budget in seconds (defaults to the client timeout)
             
         Returns:
             Next position update
@@ -908,23 +1465,25 @@ class Exchange(ABC):
             
             request_body = internal_models.WatchUserPositionsRequest.from_dict(body_dict)
             
-            response = self._api.watch_user_positions(
-                exchange=self.exchange_name,
-                watch_user_positions_request=request_body,
+            data = self._handle_response(
+                self._call_api("watch_user_positions", watch_user_positions_request=request_body, timeout=timeout)
             )
-            
-            data = self._handle_response(response.to_dict())
             return [_convert_position(p) for p in data]
-        except ApiException as e:
-            raise Exception(f"Failed to watch user positions: {self._extract_api_error(e)}") from None
+        except _TRANSPORT_ERRORS as e:
+            raise self._api_error(e, "Failed to watch user positions") from None
 
-    def watch_user_transactions(self, callback: Optional[Any] = None) -> Any:
+    def watch_user_transactions(
+        self,
+        callback: Optional[Any] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
         """
         Watch real-time user transaction updates via WebSocket.
         Requires API key authentication.
         
         Args:
             callback: Optional callback for transaction updates
+            timeout: Per-call time budget in seconds (defaults to the client timeout)
             
         Returns:
             Next transaction update
@@ -939,14 +1498,11 @@ class Exchange(ABC):
             
             request_body = internal_models.WatchUserPositionsRequest.from_dict(body_dict)
             
-            response = self._api.watch_user_transactions(
-                exchange=self.exchange_name,
-                watch_user_positions_request=request_body,
+            return self._handle_response(
+                self._call_api("watch_user_transactions", watch_user_positions_request=request_body, timeout=timeout)
             )
-            
-            return self._handle_response(response.to_dict())
-        except ApiException as e:
-            raise Exception(f"Failed to watch user transactions: {self._extract_api_error(e)}") from None
+        except _TRANSPORT_ERRORS as e:
+            raise self._api_error(e, "Failed to watch user transactions") from None
     
     # Trading Methods (require authentication)
     
@@ -959,6 +1515,7 @@ class Exchange(ABC):
         amount: float,
         price: Optional[float] = None,
         fee: Optional[int] = None,
+        timeout: Optional[float] = None,
     ) -> Order:
         """
         Create a new order.
@@ -971,6 +1528,7 @@ class Exchange(ABC):
             amount: Number of contracts
             price: Limit price (required for limit orders, 0.0-1.0)
             fee: Optional fee rate (e.g., 1000 for 0.1%)
+            timeout: Per-call time budget in seconds (defaults to the client timeout)
 
         Returns:
             Created order
@@ -1007,22 +1565,20 @@ class Exchange(ABC):
             
             request_body = internal_models.CreateOrderRequest.from_dict(request_body_dict)
             
-            response = self._api.create_order(
-                exchange=self.exchange_name,
-                create_order_request=request_body,
+            data = self._handle_response(
+                self._call_api("create_order", create_order_request=request_body, timeout=timeout)
             )
-            
-            data = self._handle_response(response.to_dict())
             return _convert_order(data)
-        except ApiException as e:
-            raise Exception(f"Failed to create order: {self._extract_api_error(e)}") from None
+        except _TRANSPORT_ERRORS as e:
+            raise self._api_error(e, "Failed to create order") from None
     
-    def cancel_order(self, order_id: str) -> Order:
+    def cancel_order(self, order_id: str, timeout: Optional[float] = None) -> Order:
         """
         Cancel an open order.
         
         Args:
             order_id: Order ID to cancel
+            timeout: Per-call time budget in seconds (defaults to the client timeout)
             
         Returns:
             Cancelled order
@@ -1037,22 +1593,20 @@ class Exchange(ABC):
             
             request_body = internal_models.CancelOrderRequest.from_dict(body_dict)
             
-            response = self._api.cancel_order(
-                exchange=self.exchange_name,
-                cancel_order_request=request_body,
+            data = self._handle_response(
+                self._call_api("cancel_order", cancel_order_request=request_body, timeout=timeout)
             )
-            
-            data = self._handle_response(response.to_dict())
             return _convert_order(data)
-        except ApiException as e:
-            raise Exception(f"Failed to cancel order: {self._extract_api_error(e)}") from None
+        except _TRANSPORT_ERRORS as e:
+            raise self._api_error(e, "Failed to cancel order") from None
     
-    def fetch_order(self, order_id: str) -> Order:
+    def fetch_order(self, order_id: str, timeout: Optional[float] = None) -> Order:
         """
         Get details of a specific order.
         
         Args:
             order_id: Order ID
+            timeout: Per-call time budget in seconds (defaults to the client timeout)
             
         Returns:
             Order details
@@ -1067,22 +1621,24 @@ class Exchange(ABC):
             
             request_body = internal_models.FetchOrderRequest.from_dict(body_dict)
             
-            response = self._api.fetch_order(
-                exchange=self.exchange_name,
-                fetch_order_request=request_body,
+            data = self._handle_response(
+                self._call_api("fetch_order", fetch_order_request=request_body, timeout=timeout)
             )
-            
-            data = self._handle_response(response.to_dict())
             return _convert_order(data)
-        except ApiException as e:
-            raise Exception(f"Failed to fetch order: {self._extract_api_error(e)}") from None
+        except _TRANSPORT_ERRORS as e:
+            raise self._api_error(e, "Failed to fetch order") from None
     
-    def fetch_open_orders(self, market_id: Optional[str] = None) -> List[Order]:
+    def fetch_open_orders(
+        self,
+        market_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Order]:
         """
         Get all open orders, optionally filtered by market.
         
         Args:
             market_id: Optional market ID to filter by
+            timeout: Per-call time budget in seconds (defaults to the client timeout)
             
         Returns:
             List of open orders
@@ -1101,22 +1657,22 @@ class Exchange(ABC):
             
             request_body = internal_models.FetchOpenOrdersRequest.from_dict(body_dict)
             
-            response = self._api.fetch_open_orders(
-                exchange=self.exchange_name,
-                fetch_open_orders_request=request_body,
+            data = self._handle_response(
+                self._call_api("fetch_open_orders", fetch_open_orders_request=request_body, timeout=timeout)
             )
-            
-            data = self._handle_response(response.to_dict())
             return [_convert_order(o) for o in data]
-        except ApiException as e:
-            raise Exception(f"Failed to fetch open orders: {self._extract_api_error(e)}") from None
+        except _TRANSPORT_ERRORS as e:
+            raise self._api_error(e, "Failed to fetch open orders") from None
     
     # Account Methods
     
-    def fetch_positions(self) -> List[Position]:
+    def fetch_positions(self, timeout: Optional[float] = None) -> List[Position]:
         """
         Get current positions across all markets.
         
+        Args:
+            timeout: Per-call time budget in seconds (defaults to the client timeout)
+
         Returns:
             List of positions
         """
@@ -1130,20 +1686,20 @@ class Exchange(ABC):
             
             request_body = internal_models.FetchPositionsRequest.from_dict(body_dict)
             
-            response = self._api.fetch_positions(
-                exchange=self.exchange_name,
-                fetch_positions_request=request_body,
+            data = self._handle_response(
+                self._call_api("fetch_positions", fetch_positions_request=request_body, timeout=timeout)
             )
-            
-            data = self._handle_response(response.to_dict())
             return [_convert_position(p) for p in data]
-        except ApiException as e:
-            raise Exception(f"Failed to fetch positions: {self._extract_api_error(e)}") from None
+        except _TRANSPORT_ERRORS as e:
+            raise self._api_error(e, "Failed to fetch positions") from None
     
-    def fetch_balance(self) -> List[Balance]:
+    def fetch_balance(self, timeout: Optional[float] = None) -> List[Balance]:
         """
         Get account balance.
         
+        Args:
+            timeout: Per-call time budget in seconds (defaults to the client timeout)
+
         Returns:
             List of balances (by currency)
         """
@@ -1159,21 +1715,19 @@ class Exchange(ABC):
             # if the schemas are identical (empty args array)
             request_body = internal_models.FetchPositionsRequest.from_dict(body_dict)
             
-            response = self._api.fetch_balance(
-                exchange=self.exchange_name,
-                fetch_positions_request=request_body,
+            data = self._handle_response(
+                self._call_api("fetch_balance", fetch_positions_request=request_body, timeout=timeout)
             )
-            
-            data = self._handle_response(response.to_dict())
             return [_convert_balance(b) for b in data]
-        except ApiException as e:
-            raise Exception(f"Failed to fetch balance: {self._extract_api_error(e)}") from None
+        except _TRANSPORT_ERRORS as e:
+            raise self._api_error(e, "Failed to fetch balance") from None
 
     def get_execution_price(
         self,
         order_book: OrderBook,
         side: Literal["buy", "sell"],
-        amount: float
+        amount: float,
+        timeout: Optional[float] = None,
     ) -> float:
         """
         Calculate the average execution price for a given amount.
@@ -1182,18 +1736,20 @@ class Exchange(ABC):
             order_book: The current order book
             side: "buy" or "sell"
             amount: The amount to execute
+            timeout: Per-call time budget in seconds (defaults to the client timeout)
             
         Returns:
             The volume-weighted average price, or 0 if insufficient liquidity
         """
-        result = self.get_execution_price_detailed(order_book, side, amount)
+        result = self.get_execution_price_detailed(order_book, side, amount, timeout=timeout)
         return result.price if result.fully_filled else 0
 
     def get_execution_price_detailed(
         self,
         order_book: OrderBook,
         side: Literal["buy", "sell"],
-        amount: float
+        amount: float,
+        timeout: Optional[float] = None,
     ) -> ExecutionPriceResult:
         """
         Calculate detailed execution price information.
@@ -1202,10 +1758,12 @@ class Exchange(ABC):
             order_book: The current order book
             side: "buy" or "sell"
             amount: The amount to execute
+            timeout: Per-call time budget in seconds (defaults to the client timeout)
             
         Returns:
             Detailed execution result
         """
+        self._ensure_server()
         try:
             # Convert order_book to dict for API call
             bids = [{"price": b.price, "size": b.size} for b in order_book.bids]
@@ -1224,12 +1782,18 @@ class Exchange(ABC):
             
             headers = {"Content-Type": "application/json", "Accept": "application/json"}
             headers.update(self._api_client.default_headers)
+
+            if timeout is None:
+                timeout = self.timeout
+            if timeout is not None:
+                headers[TIMEOUT_HEADER] = str(max(1, int(timeout * 1000)))
             
             response = self._api_client.call_api(
                 method="POST",
                 url=url,
                 body=body,
-                header_params=headers
+                header_params=headers,
+                _request_timeout=timeout,
             )
             
             response.read()
@@ -1238,7 +1802,7 @@ class Exchange(ABC):
             data = self._handle_response(data_json)
             return _convert_execution_result(data)
         except Exception as e:
-            raise Exception(f"Failed to get execution price: {self._extract_api_error(e)}") from None
+            raise self._api_error(e, "Failed to get execution price") from None
 
 
 class Polymarket(Exchange):
@@ -1262,6 +1826,7 @@ class Polymarket(Exchange):
         auto_start_server: bool = True,
         proxy_address: Optional[str] = None,
         signature_type: Optional[Any] = "gnosis-safe",
+        **kwargs,
     ):
         """
         Initialize Polymarket client.
@@ -1272,6 +1837,7 @@ class Polymarket(Exchange):
             auto_start_server: Automatically start server if not running (default: True)
             proxy_address: Optional Polymarket Proxy/Smart Wallet address
             signature_type: Optional signature type (0=EOA, 1=Proxy)
+            **kwargs: Additional client options passed to Exchange (e.g. rate_limiter)
         """
         super().__init__(
             exchange_name="polymarket",
@@ -1280,6 +1846,7 @@ class Polymarket(Exchange):
             auto_start_server=auto_start_server,
             proxy_address=proxy_address,
             signature_type=signature_type,
+            **kwargs,
         )
 
 
@@ -1306,6 +1873,7 @@ class Kalshi(Exchange):
         private_key: Optional[str] = None,
         base_url: str = "http://localhost:3847",
         auto_start_server: bool = True,
+        **kwargs,
     ):
         """
         Initialize Kalshi client.
@@ -1315,6 +1883,7 @@ class Kalshi(Exchange):
             private_key: Kalshi private key (required for trading)
             base_url: Base URL of the PMXT sidecar server
             auto_start_server: Automatically start server if not running (default: True)
+            **kwargs: Additional client options passed to Exchange (e.g. rate_limiter)
         """
         super().__init__(
             exchange_name="kalshi",
@@ -1322,6 +1891,7 @@ class Kalshi(Exchange):
             private_key=private_key,
             base_url=base_url,
             auto_start_server=auto_start_server,
+            **kwargs,
         )
 
 
@@ -1348,6 +1918,7 @@ class Limitless(Exchange):
         private_key: Optional[str] = None,
         base_url: str = "http://localhost:3847",
         auto_start_server: bool = True,
+        **kwargs,
     ):
         """
         Initialize Limitless client.
@@ -1357,6 +1928,7 @@ class Limitless(Exchange):
             private_key: Ethereum private key (required for trading)
             base_url: Base URL of the PMXT sidecar server
             auto_start_server: Automatically start server if not running (default: True)
+            **kwargs: Additional client options passed to Exchange (e.g. rate_limiter)
         """
         super().__init__(
             exchange_name="limitless",
@@ -1364,4 +1936,5 @@ class Limitless(Exchange):
             private_key=private_key,
             base_url=base_url,
             auto_start_server=auto_start_server,
+            **kwargs,
         )
@@ -0,0 +1,69 @@
+"""
+Response compression negotiation with the sidecar.
+
+Compression is opt-in (``Exchange(compression=True)``). The SDK advertises
+the encodings urllib3 can decode here via ``Accept-Encoding``; the sidecar
+compresses JSON responses above a size threshold (``PMXT_COMPRESSION_THRESHOLD``,
+1 KiB by default) and urllib3 decodes them transparently.
+
+Worth enabling when the sidecar is remote or catalog responses are large.
+Over loopback the CPU cost usually outweighs the bytes saved.
+"""
+
+from typing import Optional, Sequence, Tuple, Union
+
+GZIP = "gzip"
+BROTLI = "br"
+ZSTD = "zstd"
+
+# Client preference when compression=True: best ratio for JSON first
+PREFERENCE = (ZSTD, BROTLI, GZIP)
+
+# Packages urllib3 needs to decode each optional encoding
+_DECODERS = {BROTLI: "brotli", ZSTD: "zstandard"}
+
+Compression = Union[bool, str, Sequence[str]]
+
+
+def supported_encodings() -> Tuple[str, ...]:
+    """Encodings urllib3 can decode in this environment, in preference order."""
+    from urllib3.util.request import ACCEPT_ENCODING
+
+    available = {encoding.strip() for encoding in ACCEPT_ENCODING.split(",")}
+    return tuple(encoding for encoding in PREFERENCE if encoding in available)
+
+
+def accept_encoding(compression: Compression) -> Optional[str]:
+    """
+    Build the Accept-Encoding header for a ``compression=`` setting.
+
+    Args:
+        compression: False for none, True for every encoding available here,
+            or one encoding / a list of encodings in order of preference
+
+    Returns:
+        Header value, or None if compression is off
+
+    Raises:
+        ValueError: If an encoding is unknown or can't be decoded here
+    """
+    if not compression:
+        return None
+
+    supported = supported_encodings()
+    if compression is True:
+        wanted: Sequence[str] = supported
+    else:
+        wanted = (compression,) if isinstance(compression, str) else tuple(compression)
+        for encoding in wanted:
+            if encoding not in PREFERENCE:
+                raise ValueError(f"compression must be one of {PREFERENCE}, got {encoding!r}")
+            if encoding not in supported:
+                raise ValueError(
+                    f"{encoding!r} responses can't be decoded: pip install {_DECODERS[encoding]}"
+                )
+
+    # Descending q-values so the sidecar honours our order
+    return ", ".join(
+        f"{encoding};q={1 - index / 10:.1f}" for index, encoding in enumerate(wanted)
+    )
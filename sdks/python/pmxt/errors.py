@@ -0,0 +1,239 @@
+"""
+Error types for PMXT.
+
+The sidecar reports failures as ``{message, code, retryable, retryAfter}``
+(see ``core/src/errors.ts``). These classes mirror that hierarchy so
+callers can tell a transient outage from a bad request:
+
+    >>> try:
+    ...     poly.fetch_order_book(outcome_id)
+    ... except pmxt.RateLimitExceeded as e:
+    ...     time.sleep(e.retry_after or 1)
+    ... except pmxt.PmxtError as e:
+    ...     if not e.retryable:
+    ...         raise
+
+All errors subclass ``PmxtError``, which subclasses ``Exception``, so
+existing ``except Exception`` handlers keep working.
+"""
+
+from typing import Any, Dict, Optional, Union
+
+
+class PmxtError(Exception):
+    """Base class for all errors raised by the PMXT SDK."""
+
+    code: str = "UNKNOWN_ERROR"
+    """Machine-readable error code"""
+
+    status: Optional[int] = None
+    """HTTP status code reported by the sidecar"""
+
+    retryable: bool = False
+    """Whether the operation can be retried"""
+
+    def __init__(
+        self,
+        message: str,
+        code: Optional[str] = None,
+        status: Optional[int] = None,
+        retryable: Optional[bool] = None,
+        retry_after: Optional[float] = None,
+        exchange: Optional[str] = None,
+    ):
+        super().__init__(message)
+        self.message = message
+        if code is not None:
+            self.code = code
+        if status is not None:
+            self.status = status
+        if retryable is not None:
+            self.retryable = retryable
+        self.retry_after = retry_after
+        """Seconds to wait before retrying, if the exchange said so"""
+        self.exchange = exchange
+        """Which exchange raised the error"""
+
+
+# ----------------------------------------------------------------------------
+# 4xx Client Errors
+# ----------------------------------------------------------------------------
+
+class BadRequest(PmxtError):
+    """The request was malformed or contains invalid parameters."""
+    code = "BAD_REQUEST"
+    status = 400
+
+
+class AuthenticationError(PmxtError):
+    """Authentication credentials are missing or invalid."""
+    code = "AUTHENTICATION_ERROR"
+    status = 401
+
+
+class SessionNotFound(PmxtError):
+    """The sidecar session is unknown or expired (the SDK opens a new one)."""
+    code = "SESSION_NOT_FOUND"
+    status = 401
+
+
+class PermissionDenied(PmxtError):
+    """The authenticated user doesn't have permission."""
+    code = "PERMISSION_DENIED"
+    status = 403
+
+
+class NotFound(PmxtError):
+    """The requested resource doesn't exist."""
+    code = "NOT_FOUND"
+    status = 404
+
+
+class OrderNotFound(PmxtError):
+    """The requested order doesn't exist."""
+    code = "ORDER_NOT_FOUND"
+    status = 404
+
+
+class MarketNotFound(PmxtError):
+    """The requested market doesn't exist."""
+    code = "MARKET_NOT_FOUND"
+    status = 404
+
+
+class RateLimitExceeded(PmxtError):
+    """Rate limit exceeded; ``retry_after`` says how long to back off."""
+    code = "RATE_LIMIT_EXCEEDED"
+    status = 429
+    retryable = True
+
+
+class InvalidOrder(PmxtError):
+    """The order parameters are invalid."""
+    code = "INVALID_ORDER"
+    status = 400
+
+
+class InsufficientFunds(PmxtError):
+    """Insufficient funds to complete the operation."""
+    code = "INSUFFICIENT_FUNDS"
+    status = 400
+
+
+class ValidationError(PmxtError):
+    """Input validation failed."""
+    code = "VALIDATION_ERROR"
+    status = 400
+
+
+# ----------------------------------------------------------------------------
+# 5xx Server/Network Errors
+# ----------------------------------------------------------------------------
+
+class NetworkError(PmxtError):
+    """Network connectivity issues, including an unreachable sidecar (retryable)."""
+    code = "NETWORK_ERROR"
+    status = 503
+    retryable = True
+
+
+class ExchangeNotAvailable(PmxtError):
+    """Exchange is down or unreachable (retryable)."""
+    code = "EXCHANGE_NOT_AVAILABLE"
+    status = 503
+    retryable = True
+
+
+class RequestTimeout(PmxtError):
+    """The call did not complete within its time budget (retryable)."""
+    code = "REQUEST_TIMEOUT"
+    status = 504
+    retryable = True
+
+
+class CircuitOpen(PmxtError):
+    """
+    The client's circuit breaker is failing calls fast (retryable).
+
+    Raised locally, without contacting the sidecar; ``retry_after`` says
+    when trial calls will be let through again.
+    """
+    code = "CIRCUIT_OPEN"
+    status = 503
+    retryable = True
+
+
+_ERRORS_BY_CODE = {
+    cls.code: cls
+    for cls in (
+        BadRequest,
+        AuthenticationError,
+        SessionNotFound,
+        PermissionDenied,
+        NotFound,
+        OrderNotFound,
+        MarketNotFound,
+        RateLimitExceeded,
+        InvalidOrder,
+        InsufficientFunds,
+        ValidationError,
+        NetworkError,
+        ExchangeNotAvailable,
+        RequestTimeout,
+    )
+}
+
+# Fallbacks for errors the sidecar didn't classify (no ``code``)
+_ERRORS_BY_STATUS = {
+    400: BadRequest,
+    401: AuthenticationError,
+    403: PermissionDenied,
+    404: NotFound,
+    429: RateLimitExceeded,
+    502: ExchangeNotAvailable,
+    503: ExchangeNotAvailable,
+    504: RequestTimeout,
+}
+
+
+def error_from_detail(
+    detail: Union[str, Dict[str, Any], None],
+    status: Optional[int] = None,
+    prefix: Optional[str] = None,
+) -> PmxtError:
+    """
+    Build a typed error from the sidecar's ``error`` payload.
+
+    Args:
+        detail: The ``error`` field of a failed response (object or plain string)
+        status: HTTP status code of the response, if known
+        prefix: Optional context prepended to the message (e.g. "Failed to fetch markets")
+
+    Returns:
+        The most specific PmxtError subclass for the error code or status
+    """
+    if isinstance(detail, dict):
+        message = detail.get("message") or "Unknown error"
+        code = detail.get("code")
+        retryable = detail.get("retryable")
+        retry_after = detail.get("retryAfter")
+        exchange = detail.get("exchange")
+    else:
+        message = detail or "Unknown error"
+        code = retryable = retry_after = exchange = None
+
+    cls = _ERRORS_BY_CODE.get(code) if code else None
+    if cls is None:
+        cls = _ERRORS_BY_STATUS.get(status, PmxtError)
+
+    if prefix:
+        message = f"{prefix}: {message}"
+
+    return cls(
+        message,
+        code=code,
+        status=status,
+        retryable=retryable,
+        retry_after=float(retry_after) if retry_after is not None else None,
+        exchange=exchange,
+    )
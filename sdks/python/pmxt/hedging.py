@@ -0,0 +1,250 @@
+"""
+Hedged requests for latency-critical reads.
+
+Upstream tail latency can be an order of magnitude above the median. With
+hedging enabled, an idempotent read that has not answered within a
+percentile of its recent latency gets a second, identical request. The
+first response wins. A load budget caps how many extra requests hedging
+may add.
+
+Calls that can't be hedged (while latencies are warming up, or with no
+budget or hedge capacity left) run on the caller's thread. A call that may
+be hedged starts its request on a thread of its own, so the caller can take
+whichever answer comes first; hedges run on a bounded pool and are skipped,
+never queued, when it is busy.
+
+Example:
+    >>> hedge = pmxt.HedgePolicy(percentile=95, max_extra_load=0.05)
+    >>> poly = pmxt.Polymarket(hedge_policy=hedge)
+    >>> book = poly.fetch_order_book(outcome_id)
+    >>> stats = hedge.stats()["polymarket.fetch_order_book"]
+    >>> print(stats.hedge_rate, stats.win_rate)
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, FrozenSet, List, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+# Market data reads. watch_* calls are long-polls whose latency is set by the
+# market, not the upstream, so hedging them only adds load.
+HEDGEABLE_METHODS = frozenset({
+    "fetch_markets",
+    "fetch_events",
+    "fetch_ohlcv",
+    "fetch_order_book",
+    "fetch_trades",
+})
+
+
+@dataclass
+class HedgeStats:
+    """Hedging counters for one exchange/method pair."""
+
+    requests: int = 0
+    """Calls that went through the policy"""
+
+    hedged: int = 0
+    """Calls for which a second request was sent"""
+
+    hedge_wins: int = 0
+    """Hedged calls answered by the second request"""
+
+    @property
+    def hedge_rate(self) -> float:
+        """Fraction of calls that were hedged (extra load added)."""
+        return self.hedged / self.requests if self.requests else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of hedges that beat the original request."""
+        return self.hedge_wins / self.hedged if self.hedged else 0.0
+
+
+class HedgePolicy:
+    """
+    Fire a backup request when a read is slower than its recent percentile.
+
+    Latency is tracked per exchange/method over a sliding window of
+    successful attempts. Until ``min_samples`` latencies are known, calls
+    are not hedged.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        min_delay: float = 0.01,
+        max_extra_load: float = 0.1,
+        window: int = 200,
+        min_samples: int = 20,
+        methods: FrozenSet[str] = HEDGEABLE_METHODS,
+        max_workers: int = 16,
+    ):
+        """
+        Args:
+            percentile: Latency percentile after which a hedge is sent
+            min_delay: Lower bound for the hedge delay (seconds)
+            max_extra_load: Upper bound on hedges as a fraction of calls (0.1 = +10%)
+            window: Number of recent latencies kept per exchange/method
+            min_samples: Latencies required before hedging starts
+            methods: Methods the policy applies to
+            max_workers: Hedges allowed in flight at once (across all
+                methods); calls aren't hedged while this many are running
+        """
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile must be in (0, 100]")
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_extra_load = max_extra_load
+        self.window = window
+        self.min_samples = min_samples
+        self.methods = methods
+        self.max_workers = max_workers
+
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._stats: Dict[str, HedgeStats] = {}
+        # Hedge budget: every call earns ``max_extra_load`` credits, a hedge spends one
+        self._credits = 1.0
+        self._hedges_in_flight = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="pmxt-hedge"
+                )
+            return self._executor
+
+    def delay(self, key: str) -> Optional[float]:
+        """
+        Current hedge delay for an exchange/method.
+
+        Args:
+            key: "<exchange>.<method>"
+
+        Returns:
+            Seconds to wait before hedging, or None while warming up
+        """
+        with self._lock:
+            samples = self._latencies.get(key)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return max(self.min_delay, ordered[index])
+
+    def _record(self, key: str, latency: float) -> None:
+        with self._lock:
+            samples = self._latencies.get(key)
+            if samples is None:
+                samples = self._latencies[key] = deque(maxlen=self.window)
+            samples.append(latency)
+
+    def _can_hedge(self) -> bool:
+        # Called with the lock held
+        return self._credits >= 1.0 and self._hedges_in_flight < self.max_workers
+
+    def _try_start_hedge(self) -> bool:
+        with self._lock:
+            if not self._can_hedge():
+                return False
+            self._credits -= 1.0
+            self._hedges_in_flight += 1
+            return True
+
+    def _hedge(self, attempt: Callable[[], T]) -> Callable[[], T]:
+        def run() -> T:
+            try:
+                return attempt()
+            finally:
+                with self._lock:
+                    self._hedges_in_flight -= 1
+        return run
+
+    @staticmethod
+    def _start(attempt: Callable[[], T]) -> "Future[T]":
+        # A thread of its own: the attempt starts now instead of waiting in a queue
+        future: "Future[T]" = Future()
+
+        def run() -> None:
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(attempt())
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, name="pmxt-hedge-primary", daemon=True).start()
+        return future
+
+    def _timed(self, key: str, call: Callable[[], T]) -> Callable[[], T]:
+        def run() -> T:
+            start = time.monotonic()
+            result = call()
+            self._record(key, time.monotonic() - start)
+            return result
+        return run
+
+    def run(self, key: str, call: Callable[[], T]) -> T:
+        """
+        Run ``call``, hedging it if it is slower than the tracked percentile.
+
+        Args:
+            key: "<exchange>.<method>" used for latency tracking and stats
+            call: The idempotent operation to run
+
+        Returns:
+            The first successful result
+
+        Raises:
+            The original request's exception if every attempt fails
+        """
+        with self._lock:
+            stats = self._stats.setdefault(key, HedgeStats())
+            stats.requests += 1
+            self._credits = min(self._credits + self.max_extra_load, 10.0)
+            can_hedge = self._can_hedge()
+
+        delay = self.delay(key)
+        attempt = self._timed(key, call)
+        if delay is None or not can_hedge:
+            return attempt()
+
+        primary = self._start(attempt)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._try_start_hedge():
+            return primary.result()
+
+        hedge = self._pool().submit(self._hedge(attempt))
+        with self._lock:
+            stats.hedged += 1
+
+        pending: List[Future] = [primary, hedge]
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.remove(future)
+                if future.exception() is None:
+                    if future is hedge:
+                        with self._lock:
+                            stats.hedge_wins += 1
+                    return future.result()
+
+        # Both attempts failed: report the original request's error
+        return primary.result()
+
+    def stats(self) -> Dict[str, HedgeStats]:
+        """
+        Snapshot of hedging counters.
+
+        Returns:
+            Mapping of "<exchange>.<method>" to a copy of its HedgeStats
+        """
+        with self._lock:
+            return {key: HedgeStats(**vars(s)) for key, s in self._stats.items()}
@@ -0,0 +1,96 @@
+"""
+Field projection for fetch_markets / fetch_events.
+
+``fields=[...]`` names the model attributes to return. The sidecar drops
+everything else before serializing, and the SDK builds partial models from
+what comes back: attributes that weren't requested keep their defaults
+(None, 0 or an empty list).
+
+Dotted paths reach into nested models, e.g. ``"yes.price"`` on a market or
+``"markets.volume_24h"`` on an event. Naming a model keeps it whole.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Python attribute -> (sidecar field, nested schema)
+_Schema = Dict[str, Tuple[str, Optional[str]]]
+
+_OUTCOME: _Schema = {
+    "outcome_id": ("outcomeId", None),
+    "label": ("label", None),
+    "price": ("price", None),
+    "price_change_24h": ("priceChange24h", None),
+    "metadata": ("metadata", None),
+}
+
+_MARKET: _Schema = {
+    "market_id": ("marketId", None),
+    "title": ("title", None),
+    "outcomes": ("outcomes", "outcome"),
+    "volume_24h": ("volume24h", None),
+    "liquidity": ("liquidity", None),
+    "url": ("url", None),
+    "description": ("description", None),
+    "resolution_date": ("resolutionDate", None),
+    "volume": ("volume", None),
+    "open_interest": ("openInterest", None),
+    "image": ("image", None),
+    "category": ("category", None),
+    "tags": ("tags", None),
+    "yes": ("yes", "outcome"),
+    "no": ("no", "outcome"),
+    "up": ("up", "outcome"),
+    "down": ("down", "outcome"),
+}
+
+_EVENT: _Schema = {
+    "id": ("id", None),
+    "title": ("title", None),
+    "description": ("description", None),
+    "slug": ("slug", None),
+    "markets": ("markets", "market"),
+    "url": ("url", None),
+    "image": ("image", None),
+    "category": ("category", None),
+    "tags": ("tags", None),
+}
+
+_SCHEMAS: Dict[str, _Schema] = {"outcome": _OUTCOME, "market": _MARKET, "event": _EVENT}
+
+
+def _translate(fields: Sequence[str], model: str) -> List[str]:
+    if isinstance(fields, str):
+        raise TypeError("fields must be a list of field names, not a string")
+
+    translated = []
+    for field in fields:
+        schema: Optional[_Schema] = _SCHEMAS[model]
+        wire = []
+        for segment in field.split("."):
+            if schema is None or segment not in schema:
+                raise ValueError(f"Unknown {model} field: {field!r}")
+            name, nested = schema[segment]
+            wire.append(name)
+            schema = _SCHEMAS[nested] if nested else None
+        translated.append(".".join(wire))
+    return translated
+
+
+def market_fields(fields: Sequence[str]) -> List[str]:
+    """
+    Translate UnifiedMarket attribute paths to sidecar field paths.
+
+    Raises:
+        ValueError: If a path doesn't name a market attribute
+    """
+    return _translate(fields, "market")
+
+
+def event_fields(fields: Sequence[str]) -> List[str]:
+    """
+    Translate UnifiedEvent attribute paths to sidecar field paths.
+
+    Raises:
+        ValueError: If a path doesn't name an event attribute
+    """
+    return _translate(fields, "event")
@@ -0,0 +1,105 @@
+"""
+Filter pushdown for fetch_markets / fetch_events.
+
+``filter=`` takes the same criteria as ``filter_markets`` / ``filter_events``
+(a search string or a criteria dict). The sidecar evaluates it before
+serializing, so only matching markets are sent and converted. Predicate
+functions can't be sent; filter locally for those.
+
+A few criteria match differently in ``filter_markets`` / ``filter_events``
+than on the sidecar, so they are rejected rather than pushed down (the
+sidecar's ``parseCriteria`` rejects the same):
+
+- an empty ``text`` or ``category``, a constraint locally but ignored by the
+  sidecar
+- ``price`` / ``price_change_24h`` bounds without an ``outcome``, which match
+  everything locally but nothing on the sidecar
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Union
+
+# Criteria key -> sidecar key
+_MARKET_KEYS = {
+    "text": "text",
+    "search_in": "searchIn",
+    "volume_24h": "volume24h",
+    "volume": "volume",
+    "liquidity": "liquidity",
+    "open_interest": "openInterest",
+    "resolution_date": "resolutionDate",
+    "category": "category",
+    "tags": "tags",
+    "price": "price",
+    "price_change_24h": "priceChange24h",
+}
+
+_EVENT_KEYS = {
+    "text": "text",
+    "search_in": "searchIn",
+    "category": "category",
+    "tags": "tags",
+    "market_count": "marketCount",
+    "total_volume": "totalVolume",
+}
+
+
+def _timestamp(value: datetime) -> str:
+    # Naive datetimes are taken as UTC, like the SDK's resolution dates
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.isoformat()
+
+
+def _check_portable(criteria: Dict[str, Any]) -> None:
+    # Criteria the sidecar would match differently from filter_markets()
+    for key in ("text", "category"):
+        if criteria.get(key) == "":
+            raise ValueError(f"An empty {key} filter can't be pushed down; leave it out or filter locally")
+    for key in ("price", "price_change_24h"):
+        if key in criteria and not (criteria[key] or {}).get("outcome"):
+            raise ValueError(f"{key} filter needs an outcome (e.g. {{'outcome': 'yes', 'min': 0.5}})")
+
+
+def _translate(criteria: Any, keys: Dict[str, str], kind: str) -> Union[str, Dict[str, Any]]:
+    if isinstance(criteria, str):
+        return criteria
+    if callable(criteria):
+        raise TypeError(
+            f"filter can't send a function to the sidecar; use filter_{kind}s() on the results"
+        )
+    if not isinstance(criteria, dict):
+        raise TypeError(f"filter must be a search string or {kind} criteria dict")
+
+    _check_portable(criteria)
+    translated: Dict[str, Any] = {}
+    for key, value in criteria.items():
+        if key not in keys:
+            raise ValueError(f"Unknown {kind} filter criterion: {key!r}")
+        if key == "resolution_date":
+            value = {bound: _timestamp(date) for bound, date in value.items()}
+        translated[keys[key]] = value
+    return translated
+
+
+def market_criteria(criteria: Any) -> Union[str, Dict[str, Any]]:
+    """
+    Translate MarketFilterCriteria (or a search string) for the sidecar.
+
+    Raises:
+        TypeError: For predicate functions, which only work locally
+        ValueError: For unknown criteria keys, an empty text or category, or
+            price bounds without an outcome
+    """
+    return _translate(criteria, _MARKET_KEYS, "market")
+
+
+def event_criteria(criteria: Any) -> Union[str, Dict[str, Any]]:
+    """
+    Translate EventFilterCriteria (or a search string) for the sidecar.
+
+    Raises:
+        TypeError: For predicate functions, which only work locally
+        ValueError: For unknown criteria keys, or an empty text or category
+    """
+    return _translate(criteria, _EVENT_KEYS, "event")
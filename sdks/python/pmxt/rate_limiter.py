@@ -0,0 +1,286 @@
+"""
+Client-side rate limiting for PMXT.
+
+Exchanges enforce their own request budgets and the sidecar surfaces
+upstream 429s as ``RateLimitExceeded``. Rather than bursting into those
+limits and failing, an ``Exchange`` can be given a ``RateLimiter`` that
+keeps token buckets per exchange and per endpoint class (market data
+versus trading). Calls that exceed the budget queue locally until a
+token is available.
+
+Example:
+    >>> import pmxt
+    >>> limiter = pmxt.RateLimiter(
+    ...     default=pmxt.RateLimit(rate=10, burst=20),
+    ...     classes={"trading": pmxt.RateLimit(rate=2)},
+    ... )
+    >>> poly = pmxt.Polymarket(rate_limiter=limiter)
+    >>> kalshi = pmxt.Kalshi(rate_limiter=limiter)  # Separate buckets per exchange
+    >>> limiter.stats()["polymarket.market_data"].avg_wait
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .errors import RequestTimeout
+
+
+# Endpoint classes
+MARKET_DATA = "market_data"
+TRADING = "trading"
+
+# Methods that hit authenticated trading/account endpoints upstream.
+# Everything else is treated as market data.
+TRADING_METHODS = frozenset({
+    "create_order",
+    "cancel_order",
+    "fetch_order",
+    "fetch_open_orders",
+    "fetch_positions",
+    "fetch_balance",
+    "watch_user_positions",
+    "watch_user_transactions",
+})
+
+
+def endpoint_class(method: str) -> str:
+    """Return the endpoint class ("market_data" or "trading") for an API method."""
+    return TRADING if method in TRADING_METHODS else MARKET_DATA
+
+
+@dataclass
+class RateLimit:
+    """A request budget for a single token bucket."""
+
+    rate: float
+    """Sustained requests per second"""
+
+    burst: Optional[float] = None
+    """Bucket capacity (defaults to ``rate``, i.e. one second of burst, and at least 1)"""
+
+
+@dataclass
+class QueueStats:
+    """Queueing metrics for one exchange/endpoint-class pair."""
+
+    calls: int = 0
+    """Total calls that passed through the limiter"""
+
+    queued: int = 0
+    """Calls that had to wait for a token"""
+
+    waiting: int = 0
+    """Calls currently waiting for a token"""
+
+    total_wait: float = 0.0
+    """Cumulative queue wait (seconds)"""
+
+    max_wait: float = 0.0
+    """Longest single queue wait (seconds)"""
+
+    @property
+    def avg_wait(self) -> float:
+        """Average queue wait per call (seconds)."""
+        return self.total_wait / self.calls if self.calls else 0.0
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket.
+
+    Tokens are reserved rather than polled: a caller that finds the bucket
+    empty drives the balance negative and is told how long to wait. This
+    serves concurrent callers in arrival order without a condition variable.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            rate: Refill rate in tokens per second
+            burst: Bucket capacity (defaults to ``rate``, and at least 1 so
+                slow buckets still admit a call)
+            clock: Monotonic clock, injectable for testing
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(rate, 1.0))
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds the caller must wait before the reservation is usable
+            (0.0 if tokens were available immediately)
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def refund(self, tokens: float = 1.0) -> None:
+        """Return tokens from a reservation that will not be used."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+    def pause(self, seconds: float) -> None:
+        """Drain the bucket so that no token becomes available for ``seconds``."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+class RateLimiter:
+    """
+    Per-exchange and per-endpoint-class request budgets.
+
+    Every call acquires a token from its exchange bucket and from the
+    bucket for its endpoint class on that exchange. A single limiter can
+    be shared by many ``Exchange`` instances; buckets are still kept
+    separately for each exchange name.
+    """
+
+    def __init__(
+        self,
+        default: Optional[RateLimit] = None,
+        exchanges: Optional[Dict[str, RateLimit]] = None,
+        classes: Optional[Dict[str, RateLimit]] = None,
+        on_wait: Optional[Callable[[str, str, float], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            default: Budget for exchanges not listed in ``exchanges`` (None = unlimited)
+            exchanges: Budget per exchange name (e.g. {"kalshi": RateLimit(rate=10)})
+            classes: Budget per endpoint class ("market_data", "trading"),
+                applied separately on each exchange
+            on_wait: Optional callback ``(exchange, endpoint_class, seconds)``
+                invoked after every acquire, for exporting queue wait metrics
+            clock: Monotonic clock, injectable for testing
+            sleep: Sleep function, injectable for testing
+        """
+        self.default = default
+        self.exchanges = dict(exchanges or {})
+        self.classes = dict(classes or {})
+        self.on_wait = on_wait
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: Dict[Tuple[str, Optional[str]], Optional[TokenBucket]] = {}
+        self._stats: Dict[Tuple[str, str], QueueStats] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, exchange: str, cls: Optional[str]) -> Optional[TokenBucket]:
+        key = (exchange, cls)
+        bucket = self._buckets.get(key)
+        if bucket is None and key not in self._buckets:
+            if cls is None:
+                limit = self.exchanges.get(exchange, self.default)
+            else:
+                limit = self.classes.get(cls)
+            bucket = TokenBucket(limit.rate, limit.burst, self._clock) if limit else None
+            self._buckets[key] = bucket
+        return bucket
+
+    def _buckets_for(self, exchange: str, cls: str) -> List[TokenBucket]:
+        with self._lock:
+            buckets = [self._bucket(exchange, None), self._bucket(exchange, cls)]
+        return [b for b in buckets if b is not None]
+
+    def acquire(self, exchange: str, method: str, timeout: Optional[float] = None) -> float:
+        """
+        Block until the call is within budget.
+
+        Args:
+            exchange: Exchange name (e.g. "polymarket")
+            method: API method name (e.g. "fetch_order_book")
+            timeout: Longest acceptable queue wait (seconds). If the wait
+                would exceed it, the reservation is released and the call fails.
+
+        Returns:
+            Seconds spent waiting in the queue
+
+        Raises:
+            RequestTimeout: If the queue wait would exceed ``timeout``
+        """
+        cls = endpoint_class(method)
+        buckets = self._buckets_for(exchange, cls)
+        wait = max([b.reserve() for b in buckets], default=0.0)
+
+        if timeout is not None and wait > timeout:
+            for bucket in buckets:
+                bucket.refund()
+            raise RequestTimeout(
+                f"Rate limit queue wait ({wait:.2f}s) exceeds the {timeout:.2f}s time budget",
+                exchange=exchange,
+            )
+
+        with self._lock:
+            stats = self._stats.setdefault((exchange, cls), QueueStats())
+            stats.calls += 1
+            if wait > 0:
+                stats.queued += 1
+                stats.waiting += 1
+                stats.total_wait += wait
+                stats.max_wait = max(stats.max_wait, wait)
+
+        if wait > 0:
+            try:
+                self._sleep(wait)
+            finally:
+                with self._lock:
+                    stats.waiting -= 1
+
+        if self.on_wait is not None:
+            self.on_wait(exchange, cls, wait)
+        return wait
+
+    def pause(self, exchange: str, method: str, seconds: float) -> None:
+        """
+        Hold back calls to an exchange after it asked us to back off.
+
+        Called when a 429 arrives with a ``retry_after`` hint, so that other
+        callers sharing the budget wait too instead of hitting the limit again.
+
+        Args:
+            exchange: Exchange name
+            method: API method that was rate limited
+            seconds: How long to hold calls back
+        """
+        for bucket in self._buckets_for(exchange, endpoint_class(method)):
+            bucket.pause(seconds)
+
+    def stats(self) -> Dict[str, QueueStats]:
+        """
+        Snapshot of queue metrics.
+
+        Returns:
+            Mapping of "<exchange>.<endpoint_class>" to a copy of its QueueStats
+        """
+        with self._lock:
+            return {
+                f"{exchange}.{cls}": QueueStats(**vars(stats))
+                for (exchange, cls), stats in self._stats.items()
+            }
@@ -0,0 +1,311 @@
+"""
+Recording and replay of market data streams.
+
+A ``Recorder`` wraps an exchange client: its ``watch_order_book`` and
+``watch_trades`` return what the exchange returns and also append each
+update, stamped with the time it was received, to an append-only binary
+log. A ``Replay`` reads the log back through the same watch methods (or as
+an iterator of ``ReplayEvent``) without a sidecar or network, at the
+original pace, sped up, or as fast as possible. Anything that only needs
+those methods (``OrderBookStream``, ``TradeTracker``, ``SharedBookFeeder``,
+strategies) can run against a replay; once an outcome's updates run out,
+the watch methods raise ``EOFError``, which those consumers treat as the
+end of that outcome's feed.
+
+Log layout (little-endian): the magic ``PMXTREC1``, then one record per
+update::
+
+    u8 kind, f64 received_at, u16 outcome ID length, u32 payload length, outcome ID, payload
+
+Order book payloads are ``i64 timestamp, u32 bids, u32 asks`` followed by
+(price, size) doubles; trade payloads are a ``u32`` count followed by
+``u16 id length, id, i64 timestamp, f64 price, f64 amount, u8 side`` per
+trade, where an id length of ``0xFFFF`` stands for a trade without an ID.
+A record cut short by a crash ends the log.
+
+Example:
+    >>> recorder = pmxt.Recorder(poly, "session.rec")
+    >>> book = recorder.watch_order_book(outcome_id)     # recorded
+    >>> recorder.close()
+    >>>
+    >>> replay = pmxt.Replay("session.rec", speed=10)     # 10x faster
+    >>> stream = pmxt.OrderBookStream(replay)
+"""
+
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .models import OrderBook, OrderLevel, Trade
+
+if TYPE_CHECKING:
+    from .client import Exchange
+
+MAGIC = b"PMXTREC1"
+
+ORDER_BOOK = 1
+TRADES = 2
+
+_RECORD = struct.Struct("<BdHI")
+_BOOK = struct.Struct("<qII")
+_TRADE = struct.Struct("<qddB")
+
+_NO_TIMESTAMP = -(2 ** 63)
+_NO_ID = 0xFFFF
+_SIDES = {"buy": 1, "sell": 2}
+_SIDE_NAMES = {1: "buy", 2: "sell", 0: "unknown"}
+
+
+def _encode_book(book: OrderBook) -> bytes:
+    timestamp = book.timestamp if book.timestamp is not None else _NO_TIMESTAMP
+    levels = [value for level in (*book.bids, *book.asks) for value in (level.price, level.size)]
+    return _BOOK.pack(timestamp, len(book.bids), len(book.asks)) + struct.pack(f"<{len(levels)}d", *levels)
+
+
+def _decode_book(data: bytes) -> OrderBook:
+    timestamp, bid_count, ask_count = _BOOK.unpack_from(data, 0)
+    values = struct.unpack_from(f"<{(bid_count + ask_count) * 2}d", data, _BOOK.size)
+    levels = [OrderLevel(price=values[i], size=values[i + 1]) for i in range(0, len(values), 2)]
+    return OrderBook(
+        bids=levels[:bid_count],
+        asks=levels[bid_count:],
+        timestamp=timestamp if timestamp != _NO_TIMESTAMP else None,
+    )
+
+
+def _encode_trades(trades: List[Trade]) -> bytes:
+    parts = [struct.pack("<I", len(trades))]
+    for trade in trades:
+        if trade.id is None:
+            parts.append(struct.pack("<H", _NO_ID))
+        else:
+            trade_id = trade.id.encode("utf-8")
+            parts.append(struct.pack("<H", len(trade_id)) + trade_id)
+        parts.append(_TRADE.pack(int(trade.timestamp), trade.price, trade.amount, _SIDES.get(trade.side, 0)))
+    return b"".join(parts)
+
+
+def _decode_trades(data: bytes) -> List[Trade]:
+    (count,), position = struct.unpack_from("<I", data, 0), 4
+    trades = []
+    for _ in range(count):
+        (id_length,) = struct.unpack_from("<H", data, position)
+        position += 2
+        trade_id = None
+        if id_length != _NO_ID:
+            trade_id = data[position:position + id_length].decode("utf-8")
+            position += id_length
+        timestamp, price, amount, side = _TRADE.unpack_from(data, position)
+        position += _TRADE.size
+        trades.append(Trade(id=trade_id, timestamp=timestamp, price=price, amount=amount, side=_SIDE_NAMES[side]))
+    return trades
+
+
+@dataclass
+class ReplayEvent:
+    """One recorded update."""
+
+    kind: str
+    """Either order_book or trades"""
+
+    outcome_id: str
+    """Outcome the update belongs to"""
+
+    received_at: float
+    """Wall-clock time (``time.time()``) the update was received when recording"""
+
+    data: Union[OrderBook, List[Trade]]
+    """The update as the watch method returned it"""
+
+
+_KIND_NAMES = {ORDER_BOOK: "order_book", TRADES: "trades"}
+
+
+class Recorder:
+    """
+    Exchange wrapper that logs every watch_order_book / watch_trades update.
+
+    Other attributes are forwarded to the wrapped exchange.
+
+    Args:
+        exchange: Exchange client to record from
+        path: Log file; appended to if it exists
+    """
+
+    def __init__(self, exchange: "Exchange", path: str):
+        self._exchange = exchange
+        self.path = path
+        self._file = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+            self._file.flush()
+        self._lock = threading.Lock()
+        self.records = 0
+        """Updates written by this recorder"""
+
+    def _write(self, kind: int, outcome_id: str, payload: bytes) -> None:
+        encoded = outcome_id.encode("utf-8")
+        record = _RECORD.pack(kind, time.time(), len(encoded), len(payload)) + encoded + payload
+        with self._lock:
+            # One write per record so concurrent watchers never interleave
+            self._file.write(record)
+            self._file.flush()
+            self.records += 1
+
+    def watch_order_book(self, outcome_id: str, limit: Optional[int] = None, timeout: Optional[float] = None) -> OrderBook:
+        book = self._exchange.watch_order_book(outcome_id, limit=limit, timeout=timeout)
+        self._write(ORDER_BOOK, outcome_id, _encode_book(book))
+        return book
+
+    def watch_trades(
+        self,
+        outcome_id: str,
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Trade]:
+        trades = self._exchange.watch_trades(outcome_id, since=since, limit=limit, timeout=timeout)
+        self._write(TRADES, outcome_id, _encode_trades(trades))
+        return trades
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._exchange, name)
+
+
+class Replay:
+    """
+    Plays a recording back through the watch_order_book / watch_trades API.
+
+    Updates are released on the recorded timeline, starting when the
+    replay is created (or ``restart()``-ed). Each watch call returns the
+    next update for that outcome and kind, waiting until its release time.
+
+    Args:
+        path: Log written by a Recorder
+        speed: Playback rate (1 = original pace, 10 = ten times faster,
+            None = as fast as possible)
+
+    Raises:
+        ValueError: If the file is not a recording
+    """
+
+    def __init__(self, path: str, speed: Optional[float] = 1.0):
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive (or None for as fast as possible)")
+        self.speed = speed
+        with open(path, "rb") as f:
+            self._data = f.read()
+        if not self._data.startswith(MAGIC):
+            raise ValueError(f"{path} is not a pmxt recording")
+
+        # (kind, outcome ID, received_at, payload start, payload end) in recorded order
+        self._index: List[Tuple[int, str, float, int, int]] = []
+        position = len(MAGIC)
+        while position + _RECORD.size <= len(self._data):
+            kind, received_at, id_length, length = _RECORD.unpack_from(self._data, position)
+            start = position + _RECORD.size + id_length
+            if start + length > len(self._data):
+                break  # Truncated final record
+            outcome_id = self._data[position + _RECORD.size:start].decode("utf-8")
+            self._index.append((kind, outcome_id, received_at, start, start + length))
+            position = start + length
+
+        self._lock = threading.Lock()
+        self.restart()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def duration(self) -> float:
+        """Recorded seconds between the first and last update."""
+        return self._index[-1][2] - self._index[0][2] if self._index else 0.0
+
+    def restart(self) -> None:
+        """Rewind to the first update and restart the clock."""
+        with self._lock:
+            # Positions in self._index, per (kind, outcome)
+            self._queues: Dict[Tuple[int, str], List[int]] = {}
+            for number, (kind, outcome_id, _, _, _) in enumerate(self._index):
+                self._queues.setdefault((kind, outcome_id), []).append(number)
+            self._cursors: Dict[Tuple[int, str], int] = {}
+            self._started = time.monotonic()
+
+    def _event(self, number: int) -> ReplayEvent:
+        kind, outcome_id, received_at, start, end = self._index[number]
+        payload = self._data[start:end]
+        data = _decode_book(payload) if kind == ORDER_BOOK else _decode_trades(payload)
+        return ReplayEvent(kind=_KIND_NAMES[kind], outcome_id=outcome_id, received_at=received_at, data=data)
+
+    def _wait_until_due(self, number: int, deadline: Optional[float]) -> None:
+        if self.speed is None:
+            return
+        due = self._started + (self._index[number][2] - self._index[0][2]) / self.speed
+        if deadline is not None and due > deadline:
+            time.sleep(max(0.0, deadline - time.monotonic()))
+            raise TimeoutError("No recorded update within the timeout")
+        delay = due - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _next(self, kind: int, outcome_id: str, timeout: Optional[float]) -> Any:
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        key = (kind, outcome_id)
+        with self._lock:
+            queue = self._queues.get(key, [])
+            cursor = self._cursors.get(key, 0)
+            if cursor >= len(queue):
+                raise EOFError(f"No more recorded {_KIND_NAMES[kind]} updates for {outcome_id}")
+            self._cursors[key] = cursor + 1
+        number = queue[cursor]
+        try:
+            self._wait_until_due(number, deadline)
+        except TimeoutError:
+            with self._lock:
+                self._cursors[key] = cursor  # Not consumed
+            raise
+        return self._event(number).data
+
+    def watch_order_book(self, outcome_id: str, limit: Optional[int] = None, timeout: Optional[float] = None) -> OrderBook:
+        """
+        Next recorded book for ``outcome_id``.
+
+        Raises:
+            EOFError: When the recording has no more books for the outcome
+            TimeoutError: If the next book is not due within ``timeout``
+        """
+        book = self._next(ORDER_BOOK, outcome_id, timeout)
+        if limit is not None:
+            book = OrderBook(bids=book.bids[:limit], asks=book.asks[:limit], timestamp=book.timestamp)
+        return book
+
+    def watch_trades(
+        self,
+        outcome_id: str,
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Trade]:
+        """
+        Next recorded trades for ``outcome_id``.
+
+        Raises:
+            EOFError: When the recording has no more trades for the outcome
+            TimeoutError: If the next trades are not due within ``timeout``
+        """
+        trades = self._next(TRADES, outcome_id, timeout)
+        if since is not None:
+            trades = [t for t in trades if t.timestamp >= since]
+        return trades[:limit] if limit is not None else trades
+
+    def __iter__(self) -> Iterator[ReplayEvent]:
+        """Every update in recorded order, paced like the watch methods."""
+        for number in range(len(self._index)):
+            self._wait_until_due(number, None)
+            yield self._event(number)
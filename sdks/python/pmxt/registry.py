@@ -0,0 +1,181 @@
+"""
+Lookup index for markets and events seen by a client.
+
+Trading and streaming methods take an ``outcome_id``; mapping it (or a
+``Position.outcome_id``) back to its market and event otherwise means
+scanning market lists. Every exchange client keeps a ``MarketRegistry``
+filled from ``fetch_markets`` / ``fetch_events`` results, indexing
+market IDs, outcome IDs, event IDs and event slugs for O(1) lookups.
+
+The registry is an LRU cache: it holds at most ``max_markets`` markets and
+``max_events`` events, dropping the least recently looked up or refreshed
+first. Newer fetches replace older versions of the same market or event.
+
+Example:
+    >>> poly.fetch_events("Fed")
+    >>> for position in poly.fetch_positions():
+    ...     market, event = poly.registry.lookup(position.outcome_id)
+    ...     print(event.title if event else "-", market.title, position.size)
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from .models import MarketOutcome, UnifiedEvent, UnifiedMarket
+
+
+DEFAULT_MAX_MARKETS = 50_000
+DEFAULT_MAX_EVENTS = 5_000
+
+
+def _outcome_ids(market: UnifiedMarket) -> Iterable[str]:
+    seen = set()
+    for outcome in (*market.outcomes, market.yes, market.no, market.up, market.down):
+        if outcome is not None and outcome.outcome_id and outcome.outcome_id not in seen:
+            seen.add(outcome.outcome_id)
+            yield outcome.outcome_id
+
+
+class MarketRegistry:
+    """
+    Bounded index of markets and events by ID, outcome ID and slug.
+
+    Args:
+        max_markets: Markets kept before the least recently used are dropped
+        max_events: Events kept before the least recently used are dropped
+    """
+
+    def __init__(self, max_markets: int = DEFAULT_MAX_MARKETS, max_events: int = DEFAULT_MAX_EVENTS):
+        if max_markets < 1 or max_events < 1:
+            raise ValueError("max_markets and max_events must be at least 1")
+        self.max_markets = max_markets
+        self.max_events = max_events
+        self._markets: "OrderedDict[str, UnifiedMarket]" = OrderedDict()
+        self._events: "OrderedDict[str, UnifiedEvent]" = OrderedDict()
+        self._outcomes: Dict[str, str] = {}  # outcome_id -> market_id
+        self._slugs: Dict[str, str] = {}  # event slug -> event id
+        self._market_events: Dict[str, str] = {}  # market_id -> event id
+        self._lock = threading.Lock()
+
+    def add_markets(self, markets: Iterable[UnifiedMarket]) -> None:
+        """Index (or refresh) markets. Projected markets without a market_id are skipped."""
+        with self._lock:
+            for market in markets:
+                self._put_market(market)
+
+    def add_events(self, events: Iterable[UnifiedEvent]) -> None:
+        """Index (or refresh) events along with their markets."""
+        with self._lock:
+            for event in events:
+                if not event.id:
+                    continue
+                previous = self._events.pop(event.id, None)
+                if previous is not None:
+                    self._unlink_event(previous)
+                self._events[event.id] = event
+                if event.slug:
+                    self._slugs[event.slug] = event.id
+                for market in event.markets:
+                    if self._put_market(market):
+                        self._market_events[market.market_id] = event.id
+            while len(self._events) > self.max_events:
+                _, oldest = self._events.popitem(last=False)
+                self._unlink_event(oldest)
+
+    def _put_market(self, market: UnifiedMarket) -> bool:
+        if not market.market_id:
+            return False
+        previous = self._markets.pop(market.market_id, None)
+        if previous is not None:
+            self._unlink_outcomes(previous)
+        self._markets[market.market_id] = market
+        for outcome_id in _outcome_ids(market):
+            self._outcomes[outcome_id] = market.market_id
+        while len(self._markets) > self.max_markets:
+            _, oldest = self._markets.popitem(last=False)
+            self._unlink_outcomes(oldest)
+            self._market_events.pop(oldest.market_id, None)
+        return True
+
+    def _unlink_outcomes(self, market: UnifiedMarket) -> None:
+        for outcome_id in _outcome_ids(market):
+            if self._outcomes.get(outcome_id) == market.market_id:
+                del self._outcomes[outcome_id]
+
+    def _unlink_event(self, event: UnifiedEvent) -> None:
+        if event.slug and self._slugs.get(event.slug) == event.id:
+            del self._slugs[event.slug]
+        for market in event.markets:
+            if self._market_events.get(market.market_id) == event.id:
+                del self._market_events[market.market_id]
+
+    def _touch_market(self, market_id: Optional[str]) -> Optional[UnifiedMarket]:
+        market = self._markets.get(market_id) if market_id else None
+        if market is not None:
+            self._markets.move_to_end(market_id)
+        return market
+
+    def _touch_event(self, event_id: Optional[str]) -> Optional[UnifiedEvent]:
+        event = self._events.get(event_id) if event_id else None
+        if event is not None:
+            self._events.move_to_end(event_id)
+        return event
+
+    def market(self, market_id: str) -> Optional[UnifiedMarket]:
+        """The market with this ID, if indexed."""
+        with self._lock:
+            return self._touch_market(market_id)
+
+    def market_for_outcome(self, outcome_id: str) -> Optional[UnifiedMarket]:
+        """The market an outcome belongs to, if indexed."""
+        with self._lock:
+            return self._touch_market(self._outcomes.get(outcome_id))
+
+    def outcome(self, outcome_id: str) -> Optional[MarketOutcome]:
+        """The outcome with this ID, if its market is indexed."""
+        market = self.market_for_outcome(outcome_id)
+        if market is None:
+            return None
+        for outcome in (*market.outcomes, market.yes, market.no, market.up, market.down):
+            if outcome is not None and outcome.outcome_id == outcome_id:
+                return outcome
+        return None
+
+    def event(self, id_or_slug: str) -> Optional[UnifiedEvent]:
+        """The event with this ID or slug, if indexed."""
+        with self._lock:
+            return self._touch_event(id_or_slug if id_or_slug in self._events else self._slugs.get(id_or_slug))
+
+    def event_for_market(self, market_id: str) -> Optional[UnifiedEvent]:
+        """The event a market was fetched with, if indexed."""
+        with self._lock:
+            return self._touch_event(self._market_events.get(market_id))
+
+    def lookup(self, outcome_id: str) -> Optional[Tuple[UnifiedMarket, Optional[UnifiedEvent]]]:
+        """
+        Resolve an outcome ID to its market and event.
+
+        Returns:
+            ``(market, event)``, with ``event`` None if the market wasn't
+            fetched as part of an event, or None if the outcome is unknown
+        """
+        with self._lock:
+            market = self._touch_market(self._outcomes.get(outcome_id))
+            if market is None:
+                return None
+            return market, self._touch_event(self._market_events.get(market.market_id))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._markets.clear()
+            self._events.clear()
+            self._outcomes.clear()
+            self._slugs.clear()
+            self._market_events.clear()
+
+    def __len__(self) -> int:
+        return len(self._markets)
+
+    def __contains__(self, market_id: object) -> bool:
+        return market_id in self._markets
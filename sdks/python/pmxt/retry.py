@@ -0,0 +1,136 @@
+"""
+Automatic retries for transient failures.
+
+Retries are opt-in and only apply to idempotent methods. An ``Exchange``
+given a ``RetryPolicy`` retries errors the sidecar marks as retryable
+(rate limits, network errors, exchange outages). It uses jittered
+exponential backoff, honors the exchange's ``retryAfter`` hint, and
+stops once the per-call deadline is spent.
+
+Example:
+    >>> poly = pmxt.Polymarket(
+    ...     retry_policy=pmxt.RetryPolicy(max_attempts=4, deadline=5.0)
+    ... )
+"""
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, FrozenSet, Optional, TypeVar
+
+from .errors import PmxtError
+
+
+T = TypeVar("T")
+
+# Methods that are safe to repeat: reads and long-polls, but not order placement
+# or cancellation.
+IDEMPOTENT_METHODS = frozenset({
+    "fetch_markets",
+    "sync_markets",
+    "fetch_events",
+    "fetch_ohlcv",
+    "fetch_order_book",
+    "fetch_trades",
+    "fetch_order",
+    "fetch_open_orders",
+    "fetch_positions",
+    "fetch_balance",
+    "watch_order_book",
+    "watch_trades",
+    "watch_prices",
+    "watch_user_positions",
+    "watch_user_transactions",
+})
+
+
+@dataclass
+class RetryPolicy:
+    """Jittered exponential backoff for retryable errors."""
+
+    max_attempts: int = 3
+    """Total attempts per call, including the first"""
+
+    base_delay: float = 0.1
+    """Delay before the first retry (seconds)"""
+
+    max_delay: float = 5.0
+    """Upper bound for a single backoff delay (seconds)"""
+
+    multiplier: float = 2.0
+    """Backoff growth factor per attempt"""
+
+    jitter: float = 0.5
+    """Fraction of each delay that is randomized (0 = none, 1 = full jitter)"""
+
+    deadline: Optional[float] = None
+    """Total time budget per call, retries included (seconds)"""
+
+    methods: FrozenSet[str] = IDEMPOTENT_METHODS
+    """Methods the policy applies to"""
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Delay before the next attempt.
+
+        Args:
+            attempt: Number of attempts made so far (1 after the first failure)
+            retry_after: Server-provided minimum wait, if any
+
+        Returns:
+            Seconds to sleep
+        """
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        delay *= 1 - self.jitter * random.random()
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def run(
+        self,
+        call: Callable[[], T],
+        classify: Callable[[Exception], PmxtError],
+        on_retry: Optional[Callable[[PmxtError, float], None]] = None,
+        deadline: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> T:
+        """
+        Run ``call``, retrying retryable failures.
+
+        Args:
+            call: The operation to attempt
+            classify: Maps a raised exception to a PmxtError (to read retryability)
+            on_retry: Optional hook ``(error, delay)`` invoked before each retry
+            deadline: Per-call time budget (seconds) tightening ``self.deadline``
+            clock: Monotonic clock, injectable for testing
+            sleep: Sleep function, injectable for testing
+
+        Returns:
+            The result of the first successful attempt
+
+        Raises:
+            The last exception raised by ``call`` once retries are exhausted,
+            the error is not retryable, or the deadline would be exceeded.
+        """
+        if deadline is None or (self.deadline is not None and self.deadline < deadline):
+            deadline = self.deadline
+
+        start = clock()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return call()
+            except Exception as e:
+                error = classify(e)
+                if not error.retryable or attempt >= self.max_attempts:
+                    raise
+
+                delay = self.backoff(attempt, error.retry_after)
+                if deadline is not None and clock() - start + delay > deadline:
+                    raise
+
+                if on_retry is not None:
+                    on_retry(error, delay)
+                sleep(delay)
@@ -7,23 +7,76 @@ The pattern implemented here is universal and can be replicated in any language
 Universal Pattern:
 1. Check if server is running (via lock file + process check)
 2. If not running, call pmxt-ensure-server launcher
-3. Wait for health check to confirm server is ready
+3. Wait for the server's readiness signal (or poll the health check)
 4. Proceed with API calls
 
 This ensures zero-configuration usage across all SDKs.
+
+Startup can also run in the background (``start_background``) so that
+constructing a client doesn't block; the first API call waits for
+readiness instead.
+
+In supervisor mode (``supervise``), a watchdog thread restarts a dead or
+unhealthy server with backoff, and clients replay idempotent calls that
+failed while it was down.
 """
 
 import os
 import json
+import select
+import threading
 import time
 import subprocess
 import shutil
+from concurrent.futures import Future
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 import urllib.request
 import urllib.error
 
 
+@dataclass
+class _Discovery:
+    """What this process knows about the server behind one lock file."""
+
+    stamp: Tuple[int, int, int]
+    """(mtime_ns, size, inode) of the lock file when it was read"""
+
+    info: Optional[Dict[str, Any]]
+    """Parsed lock file contents (None if unreadable)"""
+
+    healthy: bool = False
+    """Whether the server described by ``info`` passed a health check"""
+
+
+# Process-wide discovery cache, keyed by lock file path. An entry is only
+# trusted while the lock file's stamp is unchanged, so a restarted server
+# (which rewrites the lock file) is picked up on the next lookup.
+_discovery_cache: Dict[str, _Discovery] = {}
+_discovery_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _expected_version() -> Optional[str]:
+    """Version of the bundled (or monorepo) server package, read once per process."""
+    try:
+        # 1. Check production path (bundled)
+        pkg_path = Path(__file__).parent / '_server' / 'package.json'
+        
+        # 2. Check dev path (monorepo)
+        if not pkg_path.exists():
+            # Traverse up to find core/package.json
+            pkg_path = Path(__file__).parent.parent.parent.parent / 'core' / 'package.json'
+
+        if pkg_path.exists():
+            return json.loads(pkg_path.read_text()).get('version')
+    except:
+        pass
+    return None
+
+
 class ServerManager:
     """
     Manages the PMXT sidecar server lifecycle.
@@ -35,15 +88,30 @@ class ServerManager:
     DEFAULT_PORT = 3847
     HEALTH_CHECK_TIMEOUT = 10  # seconds
     HEALTH_CHECK_INTERVAL = 0.1  # seconds
+
+    # Env var naming the pipe fd the server writes "ready <port>" to once listening
+    READY_FD_ENV = 'PMXT_READY_FD'
+
+    # Process-wide background startups, shared by managers for the same
+    # server: keyed by (lock file, port, shards)
+    _startups: Dict[Tuple[str, int, Optional[int]], Future] = {}
+    _startup_lock = threading.Lock()
+
+    # Process-wide watchdog (see ``supervise``)
+    _supervisor: Optional["_Supervisor"] = None
     
-    def __init__(self, base_url: str = "http://localhost:3847"):
+    def __init__(self, base_url: str = "http://localhost:3847", shards: Optional[int] = None):
         """
         Initialize the server manager.
         
         Args:
             base_url: Base URL where server should be running
+            shards: Number of sidecar processes to launch if the server has to be
+                started (default: ``PMXT_SHARDS`` or 1). Each listens on its own
+                port; a server that is already running is reused as-is.
         """
         self.base_url = base_url
+        self.shards = shards
         self.lock_path = Path.home() / '.pmxt' / 'server.lock'
         self._port = self._extract_port_from_url(base_url)
     
@@ -81,11 +149,71 @@ class ServerManager:
             else:
                 return
         
-        # Step 3: Start server via launcher
-        self._start_server_via_launcher()
-        
-        # Step 4: Wait for health check
-        self._wait_for_health()
+        # Step 3: Start server via launcher, with a readiness pipe where supported
+        if os.name == "nt":
+            self._start_server_via_launcher()
+            self._wait_for_health()
+            return
+
+        read_fd, write_fd = os.pipe()
+        try:
+            try:
+                self._start_server_via_launcher(ready_fd=write_fd)
+            finally:
+                os.close(write_fd)
+
+            # Step 4: Wait for the server to signal readiness. Older launchers
+            # wait for health themselves and never signal, so check first.
+            if self._check_health(self.get_running_port(), timeout=1):
+                return
+            if not self._wait_for_ready_signal(read_fd):
+                self._wait_for_health()
+        finally:
+            os.close(read_fd)
+
+    def start_background(self) -> Future:
+        """
+        Start the server in a background thread without blocking.
+
+        Startup is shared process-wide: concurrent and repeated calls from
+        managers for the same server (lock file, port and shard count) reuse
+        the same attempt until it fails or the server is stopped.
+
+        Returns:
+            Future resolved once the server is ready
+        """
+        key = (str(self.lock_path), self._port, self.shards)
+        with ServerManager._startup_lock:
+            startup = ServerManager._startups.get(key)
+            if startup is None or (startup.done() and startup.exception() is not None):
+                startup = ServerManager._startups[key] = Future()
+                threading.Thread(
+                    target=self._run_startup,
+                    args=(startup,),
+                    name="pmxt-server-start",
+                    daemon=True,
+                ).start()
+            return startup
+
+    def _run_startup(self, startup: Future) -> None:
+        try:
+            self.ensure_server_running()
+        except BaseException as e:
+            startup.set_exception(e)
+        else:
+            startup.set_result(None)
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> None:
+        """
+        Block until the server is ready, starting it in the background if needed.
+
+        Args:
+            timeout: Maximum seconds to wait (None = until startup finishes)
+
+        Raises:
+            Exception: If the server fails to start
+        """
+        self.start_background().result(timeout=timeout)
 
     def _is_version_mismatch(self) -> bool:
         """Check if running server version matches expected version."""
@@ -95,36 +223,26 @@ class ServerManager:
         
         # Get expected version
         try:
-            # 1. Check production path (bundled)
-            pkg_path = Path(__file__).parent / '_server' / 'package.json'
+            expected_version = _expected_version()
+            server_version = server_info['version']
             
-            # 2. Check dev path (monorepo)
-            if not pkg_path.exists():
-                # Traverse up to find core/package.json
-                pkg_path = Path(__file__).parent.parent.parent.parent / 'core' / 'package.json'
-
-            if pkg_path.exists():
-                data = json.loads(pkg_path.read_text())
-                expected_version = data.get('version')
-                server_version = server_info['version']
+            if expected_version:
+                # Extract major.minor.patch (ignore prerelease/dev suffixes)
+                def normalize_version(v: str) -> str:
+                    """Extract major.minor.patch, ignoring -dev, -b4, etc."""
+                    # Remove -dev.xxx or -b4 suffixes
+                    base = v.split('-')[0]
+                    # Get major.minor.patch
+                    parts = base.split('.')[:3]
+                    return '.'.join(parts)
                 
-                if expected_version:
-                    # Extract major.minor.patch (ignore prerelease/dev suffixes)
-                    def normalize_version(v: str) -> str:
-                        """Extract major.minor.patch, ignoring -dev, -b4, etc."""
-                        # Remove -dev.xxx or -b4 suffixes
-                        base = v.split('-')[0]
-                        # Get major.minor.patch
-                        parts = base.split('.')[:3]
-                        return '.'.join(parts)
-                    
-                    expected_base = normalize_version(expected_version)
-                    server_base = normalize_version(server_version)
-                    
-                    # Only restart if major.minor.patch differs
-                    # This allows 1.0.0 and 1.0.0-b4 to coexist in dev
-                    if expected_base != server_base:
-                        return True
+                expected_base = normalize_version(expected_version)
+                server_base = normalize_version(server_version)
+                
+                # Only restart if major.minor.patch differs
+                # This allows 1.0.0 and 1.0.0-b4 to coexist in dev
+                if expected_base != server_base:
+                    return True
         except:
             pass
             
@@ -135,7 +253,9 @@ class ServerManager:
         Stop the currently running server.
         
         This reads the lock file to find the process ID and sends a SIGTERM.
+        Supervision, if active, is stopped first so the server stays down.
         """
+        self.stop_supervising()
         self._kill_old_server()
 
     def restart(self) -> None:
@@ -144,9 +264,76 @@ class ServerManager:
         
         Stops the current server if running, and starts a fresh one.
         """
-        self.stop()
+        self._kill_old_server()
         self.ensure_server_running()
 
+    def supervise(
+        self,
+        interval: float = 1.0,
+        unhealthy_threshold: int = 3,
+        max_backoff: float = 30.0,
+    ) -> None:
+        """
+        Start a process-wide watchdog that keeps the server running.
+
+        The watchdog checks the server every ``interval`` seconds (or as soon
+        as a client reports it unreachable). A dead server is restarted
+        immediately; one that is alive but fails ``unhealthy_threshold``
+        health checks in a row is killed and restarted. Failed restarts are
+        retried with exponential backoff. Calling this again while a
+        watchdog is running has no effect.
+
+        Args:
+            interval: Seconds between health checks
+            unhealthy_threshold: Consecutive failed health checks before a live
+                server is restarted
+            max_backoff: Upper bound for the delay between failed restarts (seconds)
+        """
+        with ServerManager._startup_lock:
+            if ServerManager._supervisor is None:
+                ServerManager._supervisor = _Supervisor(
+                    self, interval, unhealthy_threshold, max_backoff
+                )
+
+    @property
+    def supervised(self) -> bool:
+        """Whether a watchdog started by ``supervise`` is running."""
+        return ServerManager._supervisor is not None
+
+    def stop_supervising(self) -> None:
+        """Stop the watchdog started by ``supervise``, if any."""
+        with ServerManager._startup_lock:
+            supervisor, ServerManager._supervisor = ServerManager._supervisor, None
+        if supervisor is not None:
+            supervisor.stop()
+
+    def supervisor_stats(self) -> Optional["SupervisorStats"]:
+        """
+        Restart and downtime counters of the watchdog.
+
+        Returns:
+            A SupervisorStats snapshot, or None if the server isn't supervised
+        """
+        supervisor = ServerManager._supervisor
+        return supervisor.stats() if supervisor is not None else None
+
+    def wait_for_recovery(self, timeout: Optional[float] = None) -> bool:
+        """
+        Report the server unreachable and wait until the watchdog has checked
+        it (restarting it if needed).
+
+        Args:
+            timeout: Maximum seconds to wait (None = no limit)
+
+        Returns:
+            True if the server is healthy again, False if unsupervised or
+            the timeout elapsed first
+        """
+        supervisor = ServerManager._supervisor
+        if supervisor is None:
+            return False
+        return supervisor.wait_for_recovery(timeout)
+
     def _kill_old_server(self) -> None:
         """Kill the currently running server (Internal)."""
         server_info = self.get_server_info()
@@ -159,6 +346,10 @@ class ServerManager:
             except:
                 pass
         self._remove_stale_lock()
+        with ServerManager._startup_lock:
+            # Every startup recorded against this lock file described the killed server
+            for key in [key for key in ServerManager._startups if key[0] == str(self.lock_path)]:
+                del ServerManager._startups[key]
     
     def is_server_alive(self) -> bool:
         """
@@ -169,37 +360,40 @@ class ServerManager:
         2. Check if process exists
         3. Optionally verify health endpoint
         
+        The lock file and health result are cached process-wide; once a
+        server has passed a health check, later calls only re-check the
+        process while the lock file is unchanged.
+        
         Returns:
             True if server is running and healthy, False otherwise
         """
-        # Check lock file exists
-        if not self.lock_path.exists():
+        # Read lock file (cached until it changes)
+        discovery = self._discovery()
+        if discovery is None or not isinstance(discovery.info, dict):
+            return False
+        
+        pid = discovery.info.get('pid')
+        port = discovery.info.get('port', self.DEFAULT_PORT)
+        
+        if not pid:
+            return False
+        
+        # Check if process exists (cross-platform)
+        if not self._is_process_running(pid):
+            # Process doesn't exist, remove stale lock file
+            self._remove_stale_lock()
             return False
         
+        if discovery.healthy:
+            return True
+        
+        # Quick health check to verify server is responsive
         try:
-            # Read lock file
-            lock_data = json.loads(self.lock_path.read_text())
-            pid = lock_data.get('pid')
-            port = lock_data.get('port', self.DEFAULT_PORT)
-            
-            if not pid:
-                return False
-            
-            # Check if process exists (cross-platform)
-            if not self._is_process_running(pid):
-                # Process doesn't exist, remove stale lock file
-                self._remove_stale_lock()
-                return False
-            
-            # Quick health check to verify server is responsive
-            try:
-                return self._check_health(port, timeout=1)
-            except:
-                # Process exists but not responding
-                return False
-                
-        except (json.JSONDecodeError, OSError):
+            discovery.healthy = self._check_health(port, timeout=1)
+        except:
+            # Process exists but not responding
             return False
+        return discovery.healthy
     
     def _is_process_running(self, pid: int) -> bool:
         """
@@ -220,10 +414,50 @@ class ServerManager:
             self.lock_path.unlink()
         except:
             pass
+        with _discovery_lock:
+            _discovery_cache.pop(str(self.lock_path), None)
+
+    def _discovery(self) -> Optional[_Discovery]:
+        """
+        Cached discovery entry for the lock file.
+
+        Costs a single ``stat`` while the lock file is unchanged; it is only
+        re-read (and the health result forgotten) when its mtime, size or
+        inode changes.
+        
+        Returns:
+            The entry, or None if there is no lock file
+        """
+        key = str(self.lock_path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            with _discovery_lock:
+                _discovery_cache.pop(key, None)
+            return None
+        stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+        
+        with _discovery_lock:
+            entry = _discovery_cache.get(key)
+        if entry is not None and entry.stamp == stamp:
+            return entry
+        
+        try:
+            info = json.loads(self.lock_path.read_text())
+        except (ValueError, OSError):
+            info = None
+        entry = _Discovery(stamp=stamp, info=info)
+        with _discovery_lock:
+            _discovery_cache[key] = entry
+        return entry
     
-    def _start_server_via_launcher(self) -> None:
+    def _start_server_via_launcher(self, ready_fd: Optional[int] = None) -> None:
         """
         Start the server using the pmxt-ensure-server launcher.
+
+        Args:
+            ready_fd: Write end of a pipe handed down to the server, which
+                writes "ready <port>" to it once listening
         """
         # 1. Check for bundled server (PRODUCTION - installed via pip)
         launcher_filename = 'pmxt-ensure-server'
@@ -261,11 +495,21 @@ class ServerManager:
             if launcher.endswith('.js') or not os.access(launcher, os.X_OK):
                 cmd = ['node', launcher]
 
+            env = dict(os.environ)
+            pass_fds = ()
+            if ready_fd is not None:
+                env[self.READY_FD_ENV] = str(ready_fd)
+                pass_fds = (ready_fd,)
+            if self.shards is not None:
+                env['PMXT_SHARDS'] = str(self.shards)
+
             result = subprocess.run(
                 cmd,
                 capture_output=True,
                 text=True,
-                timeout=self.HEALTH_CHECK_TIMEOUT
+                timeout=self.HEALTH_CHECK_TIMEOUT,
+                env=env,
+                pass_fds=pass_fds
             )
             
             if result.returncode != 0:
@@ -277,6 +521,30 @@ class ServerManager:
         except Exception as e:
             raise Exception(f"Failed to start server: {e}")
     
+    def _wait_for_ready_signal(self, fd: int) -> bool:
+        """
+        Wait for the server's readiness line on a pipe.
+
+        Returns:
+            True if the server reported ready, False if the pipe closed
+            without a signal or the startup timeout elapsed
+        """
+        deadline = time.monotonic() + self.HEALTH_CHECK_TIMEOUT
+        data = b""
+        while b"\n" not in data:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            readable, _, _ = select.select([fd], [], [], remaining)
+            if not readable:
+                return False
+            chunk = os.read(fd, 64)
+            if not chunk:
+                # Every writer closed without signalling (e.g. the server crashed)
+                return False
+            data += chunk
+        return data.startswith(b"ready")
+
     def _wait_for_health(self) -> None:
         """
         Wait for the server to respond to health checks.
@@ -329,13 +597,10 @@ class ServerManager:
         Returns:
             Dictionary with server info (port, pid, timestamp) or None
         """
-        if not self.lock_path.exists():
-            return None
-        
-        try:
-            return json.loads(self.lock_path.read_text())
-        except:
+        discovery = self._discovery()
+        if discovery is None or discovery.info is None:
             return None
+        return dict(discovery.info) if isinstance(discovery.info, dict) else discovery.info
     
     def get_running_port(self) -> int:
         """
@@ -351,3 +616,148 @@ class ServerManager:
         if info and 'port' in info:
             return info['port']
         return self.DEFAULT_PORT
+
+    def get_shard_ports(self) -> List[int]:
+        """
+        Get the ports of every sidecar shard.
+        
+        Returns:
+            One port per shard (a single port for an unsharded server)
+        """
+        info = self.get_server_info()
+        if info and info.get('shards'):
+            return list(info['shards'])
+        return [self.get_running_port()]
+
+
+@dataclass
+class SupervisorStats:
+    """Counters kept by the server watchdog."""
+
+    restarts: int = 0
+    """Successful restarts"""
+
+    failed_restarts: int = 0
+    """Restart attempts that failed (retried with backoff)"""
+
+    downtime: float = 0.0
+    """Total seconds the server was detected down, including any ongoing outage"""
+
+    down: bool = False
+    """Whether the server is currently down"""
+
+    last_restart: Optional[float] = None
+    """Wall-clock time (``time.time()``) of the last successful restart"""
+
+
+class _Supervisor:
+    """Watchdog thread restarting a dead or unhealthy server."""
+
+    def __init__(
+        self,
+        manager: ServerManager,
+        interval: float,
+        unhealthy_threshold: int,
+        max_backoff: float,
+    ):
+        self._manager = manager
+        self._interval = interval
+        self._unhealthy_threshold = unhealthy_threshold
+        self._max_backoff = max_backoff
+
+        self._stats = SupervisorStats()
+        self._down_since: Optional[float] = None
+        self._failed_checks = 0
+        # Completed check cycles; waiters use it to know a fresh check has run
+        self._epoch = 0
+        self._condition = threading.Condition()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+
+        self._thread = threading.Thread(target=self._run, name="pmxt-supervisor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._wake.set()
+
+    def stats(self) -> SupervisorStats:
+        with self._condition:
+            stats = SupervisorStats(**vars(self._stats))
+            if self._down_since is not None:
+                stats.downtime += time.monotonic() - self._down_since
+            return stats
+
+    def wait_for_recovery(self, timeout: Optional[float]) -> bool:
+        with self._condition:
+            epoch = self._epoch
+        self._wake.set()
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._stopped.is_set() or (self._epoch > epoch and not self._stats.down),
+                timeout=timeout,
+            )
+            return self._epoch > epoch and not self._stats.down
+
+    def _probe(self) -> Tuple[bool, bool]:
+        """Returns (process alive, healthy)."""
+        info = self._manager.get_server_info()
+        if not isinstance(info, dict) or not info.get('pid'):
+            return False, False
+        if not self._manager._is_process_running(info['pid']):
+            return False, False
+        return True, self._manager._check_health(info.get('port', ServerManager.DEFAULT_PORT), timeout=2)
+
+    def _set_down(self, down: bool) -> None:
+        # Called with the condition held
+        if down and self._down_since is None:
+            self._down_since = time.monotonic()
+        elif not down and self._down_since is not None:
+            self._stats.downtime += time.monotonic() - self._down_since
+            self._down_since = None
+        self._stats.down = down
+
+    def _run(self) -> None:
+        backoff = 0.0
+        while not self._stopped.is_set():
+            self._wake.wait(backoff or self._interval)
+            self._wake.clear()
+            if self._stopped.is_set():
+                break
+
+            alive, healthy = self._probe()
+            if healthy:
+                self._failed_checks = 0
+                backoff = 0.0
+                self._finish_cycle(down=False)
+                continue
+
+            self._failed_checks += 1
+            if alive and self._failed_checks < self._unhealthy_threshold:
+                # Possibly just busy: don't kill it yet, and leave waiters
+                # waiting until the next check settles it
+                continue
+
+            with self._condition:
+                self._set_down(True)
+            try:
+                self._manager._kill_old_server()
+                self._manager.ensure_server_running()
+            except Exception:
+                backoff = min(self._max_backoff, max(self._interval, backoff * 2))
+                with self._condition:
+                    self._stats.failed_restarts += 1
+                self._finish_cycle(down=True)
+            else:
+                self._failed_checks = 0
+                backoff = 0.0
+                with self._condition:
+                    self._stats.restarts += 1
+                    self._stats.last_restart = time.time()
+                self._finish_cycle(down=False)
+
+    def _finish_cycle(self, down: bool) -> None:
+        with self._condition:
+            self._set_down(down)
+            self._epoch += 1
+            self._condition.notify_all()
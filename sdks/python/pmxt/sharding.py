@@ -0,0 +1,91 @@
+"""
+Request distribution across a sharded sidecar.
+
+With ``PMXT_SHARDS=N`` (or ``shards=N``), the sidecar runs N Node processes
+on separate ports so CPU-heavy work isn't capped at one event loop. A
+``ShardPool`` spreads requests across them:
+
+- ``"least_outstanding"`` (default): the shard with the fewest requests
+  in flight from this process, ties broken round-robin.
+- ``"round_robin"``: shards in turn.
+
+Stream subscriptions (``watch_*``) are pinned by a stable hash of what is
+being watched, so repeated calls reuse the shard that already holds the
+upstream subscription, from any process.
+"""
+
+import threading
+import zlib
+from contextlib import contextmanager
+from typing import Generic, Iterator, List, Optional, Sequence, TypeVar
+
+
+T = TypeVar("T")
+
+ROUND_ROBIN = "round_robin"
+LEAST_OUTSTANDING = "least_outstanding"
+STRATEGIES = (ROUND_ROBIN, LEAST_OUTSTANDING)
+
+
+class ShardPool(Generic[T]):
+    """Picks a shard per request and tracks requests in flight."""
+
+    def __init__(self, shards: Sequence[T], strategy: str = LEAST_OUTSTANDING):
+        """
+        Args:
+            shards: One client per sidecar shard
+            strategy: "least_outstanding" or "round_robin"
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"strategy must be one of {STRATEGIES}, got {strategy!r}")
+        if not shards:
+            raise ValueError("ShardPool needs at least one shard")
+        self.strategy = strategy
+        self._shards = list(shards)
+        self._outstanding = [0] * len(self._shards)
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._shards)
+
+    def _pick(self, pin: Optional[str]) -> int:
+        # Called with the lock held
+        count = len(self._shards)
+        if pin is not None:
+            return zlib.crc32(pin.encode()) % count
+
+        start = self._next
+        index = start
+        if self.strategy == LEAST_OUTSTANDING:
+            for offset in range(count):
+                candidate = (start + offset) % count
+                if self._outstanding[candidate] < self._outstanding[index]:
+                    index = candidate
+        self._next = (index + 1) % count
+        return index
+
+    @contextmanager
+    def checkout(self, pin: Optional[str] = None) -> Iterator[T]:
+        """
+        Borrow a shard for one request.
+
+        Args:
+            pin: Affinity key; requests with the same pin always use the same shard
+
+        Yields:
+            The shard's client
+        """
+        with self._lock:
+            index = self._pick(pin)
+            self._outstanding[index] += 1
+        try:
+            yield self._shards[index]
+        finally:
+            with self._lock:
+                self._outstanding[index] -= 1
+
+    def outstanding(self) -> List[int]:
+        """Requests currently in flight per shard."""
+        with self._lock:
+            return list(self._outstanding)
@@ -0,0 +1,495 @@
+"""
+Order books shared across processes on one host.
+
+Strategy processes that each call ``watch_order_book`` for overlapping
+outcomes duplicate sidecar subscriptions, HTTP long-polls and conversion
+work. With a ``SharedBookFeeder`` one process watches every outcome any
+process asked for and writes the books into a shared memory table of
+fixed-size slots; ``SharedBookReader`` processes subscribe to outcomes and
+read the books without locks or copies through the sidecar.
+
+- Each slot holds one outcome's book as packed (price, size) doubles, up to
+  ``depth`` levels a side, guarded by a seqlock: readers copy the slot and
+  retry if a write overlapped, so they never block the feeder.
+- The seqlock counter doubles as the book's sequence number; it only
+  grows, so readers can tell a new book from one they've seen.
+- Subscriptions are reference-counted in the table, each reference tagged
+  with the PID of the process holding it. The feeder watches an outcome
+  while any process holds a reference and stops when the last one is
+  released; references of processes that died without releasing them
+  (e.g. killed with SIGKILL) are dropped by the feeder. On Windows dead
+  processes aren't detected, so their references last until the feeder
+  restarts. Writers (the feeder and subscribing readers) serialize on a
+  lock file next to the shared memory.
+- One feeder publishes under a name at a time; it holds a second lock file
+  for as long as it runs.
+
+Example:
+    >>> # Feeder process
+    >>> feeder = pmxt.SharedBookFeeder(poly, "poly-books")
+    >>> feeder.start()
+    >>>
+    >>> # Strategy processes
+    >>> books = pmxt.SharedBookReader("poly-books")
+    >>> books.subscribe(outcome_id)
+    >>> sequence, book = books.watch(outcome_id)          # next update
+    >>> sequence, book = books.snapshot(outcome_id)       # latest, never blocks
+"""
+
+import atexit
+import os
+import struct
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import IO, TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple
+
+from .models import OrderBook, OrderLevel
+from .shared_catalog import _attach
+
+if TYPE_CHECKING:
+    from .client import Exchange
+
+MAGIC = b"PMXTBOOK"
+
+DEFAULT_SLOTS = 256
+DEFAULT_DEPTH = 50
+MAX_OUTCOME_ID = 128
+MAX_REFERENCES = 32
+
+_HEADER = struct.Struct("<8sII")  # magic, slots, depth
+# sequence (odd while writing), reference count, outcome ID length, outcome ID,
+# timestamp (see below), bid levels, ask levels
+_SLOT = struct.Struct(f"<QiI{MAX_OUTCOME_ID}sqII")
+# PIDs of the processes holding each reference (0 = free), then the levels
+_HOLDERS = struct.Struct(f"<{MAX_REFERENCES}I")
+_LEVELS = _SLOT.size + _HOLDERS.size
+_SEQUENCE = struct.Struct("<Q")
+
+# Timestamp values of a slot with no book yet / a book without a timestamp
+_NO_BOOK = -(2 ** 63)
+_NO_TIMESTAMP = -1
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    with open(path, "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _try_lock(path: str) -> Optional[IO[bytes]]:
+    # Lock ``path`` without waiting; the lock is held until the file is closed
+    f = open(path, "a+b")
+    try:
+        if os.name == "nt":
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        f.close()
+        return None
+    return f
+
+
+def _process_alive(pid: int) -> bool:
+    if os.name == "nt":
+        return True  # Signal 0 would terminate the process on Windows
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # Alive, owned by another user
+    return True
+
+
+class _BookTable:
+    """Slot layout over a shared memory buffer."""
+
+    def __init__(self, name: str, segment: shared_memory.SharedMemory):
+        self.segment = segment
+        self.buffer = segment.buf
+        magic, self.slots, self.depth = _HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{name!r} is not a shared book table")
+        self.slot_size = self.size_of_slot(self.depth)
+        self.lock_path = os.path.join(tempfile.gettempdir(), f"{name}.lock")
+
+    @staticmethod
+    def size_of_slot(depth: int) -> int:
+        return _LEVELS + depth * 4 * 8
+
+    @classmethod
+    def size(cls, slots: int, depth: int) -> int:
+        return _HEADER.size + slots * cls.size_of_slot(depth)
+
+    def offset(self, slot: int) -> int:
+        return _HEADER.size + slot * self.slot_size
+
+    def header(self, slot: int) -> Tuple[int, int, str, int, int, int]:
+        sequence, refs, id_length, outcome_id, timestamp, bids, asks = _SLOT.unpack_from(
+            self.buffer, self.offset(slot)
+        )
+        return sequence, refs, outcome_id[:id_length].decode("utf-8"), timestamp, bids, asks
+
+    def find(self, outcome_id: str) -> Optional[int]:
+        for slot in range(self.slots):
+            if self.header(slot)[2] == outcome_id:
+                return slot
+        return None
+
+    def holders(self, slot: int) -> List[int]:
+        return list(_HOLDERS.unpack_from(self.buffer, self.offset(slot) + _SLOT.size))
+
+    def set_holders(self, slot: int, holders: List[int]) -> int:
+        """Store the reference holders of a slot and its count; returns the count."""
+        # Called with the lock file held; readers of books never look at these
+        offset = self.offset(slot)
+        refs = sum(1 for pid in holders if pid)
+        _HOLDERS.pack_into(self.buffer, offset + _SLOT.size, *holders)
+        struct.pack_into("<i", self.buffer, offset + 8, refs)
+        return refs
+
+    def write(self, slot: int, refs: int, outcome_id: str, book: Optional[OrderBook]) -> None:
+        # Called with the lock file held: there is a single writer at a time
+        offset = self.offset(slot)
+        sequence = _SEQUENCE.unpack_from(self.buffer, offset)[0]
+        _SEQUENCE.pack_into(self.buffer, offset, sequence + 1)
+
+        encoded = outcome_id.encode("utf-8")
+        bids = book.bids[:self.depth] if book is not None else []
+        asks = book.asks[:self.depth] if book is not None else []
+        if book is None:
+            timestamp = _NO_BOOK
+        else:
+            timestamp = book.timestamp if book.timestamp is not None else _NO_TIMESTAMP
+        _SLOT.pack_into(
+            self.buffer, offset, sequence + 1, refs, len(encoded), encoded, timestamp, len(bids), len(asks)
+        )
+        levels = offset + _LEVELS
+        for level in bids:
+            struct.pack_into("<dd", self.buffer, levels, level.price, level.size)
+            levels += 16
+        levels = offset + _LEVELS + self.depth * 16
+        for level in asks:
+            struct.pack_into("<dd", self.buffer, levels, level.price, level.size)
+            levels += 16
+
+        _SEQUENCE.pack_into(self.buffer, offset, sequence + 2)
+
+    def read(self, slot: int) -> Tuple[int, str, Optional[OrderBook]]:
+        """Consistent (sequence number, outcome ID, book) of a slot, without locking."""
+        offset = self.offset(slot)
+        while True:
+            before = _SEQUENCE.unpack_from(self.buffer, offset)[0]
+            if before & 1:
+                time.sleep(0)
+                continue
+            data = bytes(self.buffer[offset:offset + self.slot_size])
+            if _SEQUENCE.unpack_from(self.buffer, offset)[0] == before:
+                break
+
+        _, _, id_length, outcome_id, timestamp, bid_count, ask_count = _SLOT.unpack_from(data, 0)
+        outcome_id = outcome_id[:id_length].decode("utf-8")
+        # Updates are every other step of the seqlock counter
+        sequence = before // 2
+        if timestamp == _NO_BOOK:
+            return sequence, outcome_id, None
+
+        def levels(start: int, count: int) -> List[OrderLevel]:
+            values = struct.unpack_from(f"<{count * 2}d", data, start)
+            return [OrderLevel(price=values[i], size=values[i + 1]) for i in range(0, count * 2, 2)]
+
+        book = OrderBook(
+            bids=levels(_LEVELS, bid_count),
+            asks=levels(_LEVELS + self.depth * 16, ask_count),
+            timestamp=timestamp if timestamp != _NO_TIMESTAMP else None,
+        )
+        return sequence, outcome_id, book
+
+
+class SharedBookFeeder:
+    """
+    Watches the outcomes readers subscribed to and publishes their books.
+
+    Args:
+        exchange: Exchange client used for ``watch_order_book``
+        name: Shared memory name the readers attach to
+        slots: Maximum number of outcomes watched at once
+        depth: Levels kept per side of each book
+        poll_interval: Seconds between checks for new or dropped subscriptions
+
+    Raises:
+        RuntimeError: If another feeder is running under ``name``
+    """
+
+    def __init__(
+        self,
+        exchange: "Exchange",
+        name: str = "pmxt-books",
+        slots: int = DEFAULT_SLOTS,
+        depth: int = DEFAULT_DEPTH,
+        poll_interval: float = 0.1,
+    ):
+        self._exchange = exchange
+        self.name = name
+        self._poll_interval = poll_interval
+        size = _BookTable.size(slots, depth)
+        # Held for the feeder's lifetime and released by the OS if it dies.
+        # The file is never deleted: a process could lock the unlinked copy
+        # while another creates and locks a new one.
+        self._owner = _try_lock(os.path.join(tempfile.gettempdir(), f"{name}.feeder.lock"))
+        if self._owner is None:
+            raise RuntimeError(f"A SharedBookFeeder is already running for {name!r}")
+        try:
+            try:
+                segment = shared_memory.SharedMemory(name=name, create=True, size=size)
+            except FileExistsError:
+                # No feeder holds the lock, so this was left behind by one
+                # that didn't shut down; start clean
+                stale = shared_memory.SharedMemory(name=name)
+                stale.close()
+                stale.unlink()
+                segment = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except BaseException:
+            self._owner.close()
+            raise
+        segment.buf[:size] = bytes(size)
+        _HEADER.pack_into(segment.buf, 0, MAGIC, slots, depth)
+        self._table = _BookTable(name, segment)
+
+        self._watchers: Dict[str, threading.Thread] = {}
+        self._stopped = threading.Event()
+        # Held while writing, so stop() never unmaps the table under a watcher
+        self._write_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.errors: Dict[str, BaseException] = {}
+        """Last watch error per outcome ID (cleared by the next update)"""
+
+        self.ended: Set[str] = set()
+        """Outcome IDs whose feed ended (``watch_order_book`` raised EOFError, e.g. a finished Replay)"""
+
+    def start(self) -> None:
+        """Start watching subscribed outcomes on background threads."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="pmxt-book-feeder", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop watching and remove the shared table.
+
+        Watch calls still in flight are abandoned; their results are dropped.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._watchers.clear()
+        with self._write_lock:
+            self._table.segment.close()
+            self._table.segment.unlink()
+        try:
+            os.unlink(self._table.lock_path)
+        except OSError:
+            pass
+        self._owner.close()
+
+    def subscribed(self) -> Dict[str, int]:
+        """
+        Outcome IDs with live subscriptions, and their reference counts.
+
+        References held by processes that have exited are released first.
+        """
+        subscriptions = {}
+        with _file_lock(self._table.lock_path):
+            for slot in range(self._table.slots):
+                _, refs, outcome_id, _, _, _ = self._table.header(slot)
+                if refs <= 0:
+                    continue
+                holders = self._table.holders(slot)
+                live = [pid if pid and _process_alive(pid) else 0 for pid in holders]
+                if live != holders:
+                    refs = self._table.set_holders(slot, live)
+                if refs > 0:
+                    subscriptions[outcome_id] = refs
+        return subscriptions
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            for outcome_id in self.subscribed():
+                watcher = self._watchers.get(outcome_id)
+                if outcome_id not in self.ended and (watcher is None or not watcher.is_alive()):
+                    watcher = threading.Thread(
+                        target=self._watch, args=(outcome_id,), name="pmxt-book-watch", daemon=True
+                    )
+                    self._watchers[outcome_id] = watcher
+                    watcher.start()
+            self._stopped.wait(self._poll_interval)
+
+    def _watch(self, outcome_id: str) -> None:
+        backoff = 0.0
+        while not self._stopped.wait(backoff):
+            try:
+                book = self._exchange.watch_order_book(outcome_id, limit=self._table.depth)
+            except EOFError:
+                self.ended.add(outcome_id)  # Readers keep the last book
+                return
+            except Exception as e:
+                self.errors[outcome_id] = e
+                backoff = min(max(backoff * 2, 0.5), 30.0)
+                continue
+            backoff = 0.0
+            self.errors.pop(outcome_id, None)
+            with self._write_lock:
+                if self._stopped.is_set():
+                    return
+                with _file_lock(self._table.lock_path):
+                    slot = self._table.find(outcome_id)
+                    refs = self._table.header(slot)[1] if slot is not None else 0
+                    if refs <= 0:
+                        return  # Last subscriber left
+                    self._table.write(slot, refs, outcome_id, book)
+
+
+class SharedBookReader:
+    """
+    Subscribes to outcomes and reads their books from a SharedBookFeeder.
+
+    Subscriptions held by a reader are released by ``close()`` or at exit.
+
+    Args:
+        name: Shared memory name the feeder publishes under
+
+    Raises:
+        FileNotFoundError: If no feeder has created ``name``
+    """
+
+    def __init__(self, name: str = "pmxt-books"):
+        self.name = name
+        self._table = _BookTable(name, _attach(name))
+        self._slots: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def subscribe(self, outcome_id: str) -> None:
+        """
+        Ask the feeder to watch ``outcome_id`` (once per reader; repeats are no-ops).
+
+        Raises:
+            ValueError: If the outcome ID is too long for a slot
+            RuntimeError: If every slot is taken by other outcomes, or the
+                outcome already has ``MAX_REFERENCES`` subscriptions
+        """
+        if len(outcome_id.encode("utf-8")) > MAX_OUTCOME_ID:
+            raise ValueError(f"Outcome IDs are limited to {MAX_OUTCOME_ID} bytes")
+        with self._lock:
+            if outcome_id in self._slots:
+                return
+            with _file_lock(self._table.lock_path):
+                slot = self._table.find(outcome_id)
+                if slot is not None:
+                    refs = self._table.header(slot)[1]
+                    if refs > 0:
+                        # Add a reference in place; the book stays as it is
+                        holders = self._table.holders(slot)
+                        if 0 not in holders:
+                            raise RuntimeError(f"{outcome_id} already has {MAX_REFERENCES} subscriptions")
+                        holders[holders.index(0)] = os.getpid()
+                        self._table.set_holders(slot, holders)
+                        self._slots[outcome_id] = slot
+                        return
+                else:
+                    slot = next(
+                        (s for s in range(self._table.slots) if self._table.header(s)[1] <= 0), None
+                    )
+                    if slot is None:
+                        raise RuntimeError(f"All {self._table.slots} shared book slots are in use")
+                self._table.write(slot, 1, outcome_id, None)
+                self._table.set_holders(slot, [os.getpid()] + [0] * (MAX_REFERENCES - 1))
+                self._slots[outcome_id] = slot
+
+    def unsubscribe(self, outcome_id: str) -> None:
+        """Release this reader's reference; the feeder stops once no process holds one."""
+        with self._lock:
+            slot = self._slots.pop(outcome_id, None)
+            if slot is None:
+                return
+            with _file_lock(self._table.lock_path):
+                holders = self._table.holders(slot)
+                if os.getpid() in holders:
+                    holders[holders.index(os.getpid())] = 0
+                    self._table.set_holders(slot, holders)
+
+    def snapshot(self, outcome_id: str) -> Optional[Tuple[int, OrderBook]]:
+        """
+        Latest book of a subscribed outcome, without waiting or locking.
+
+        Returns:
+            ``(sequence number, book)``, or None before the first update
+
+        Raises:
+            KeyError: If this reader hasn't subscribed to ``outcome_id``
+        """
+        sequence, current, book = self._table.read(self._slots[outcome_id])
+        if current != outcome_id or book is None:
+            return None
+        return sequence, book
+
+    def watch(
+        self, outcome_id: str, after: Optional[int] = None, timeout: Optional[float] = None
+    ) -> Tuple[int, OrderBook]:
+        """
+        Wait for a book newer than sequence number ``after``.
+
+        Args:
+            outcome_id: Subscribed outcome ID
+            after: Last sequence number seen (default: the current one)
+            timeout: Seconds to wait (None = no limit)
+
+        Raises:
+            TimeoutError: If no newer book arrived in time
+        """
+        if after is None:
+            current = self.snapshot(outcome_id)
+            after = current[0] if current is not None else -1
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        delay = 0.0005
+        while True:
+            current = self.snapshot(outcome_id)
+            if current is not None and current[0] > after:
+                return current
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"No order book update for {outcome_id} within {timeout}s")
+            time.sleep(delay)
+            delay = min(delay * 2, 0.01)
+
+    def close(self) -> None:
+        """Release every subscription and detach."""
+        for outcome_id in list(self._slots):
+            self.unsubscribe(outcome_id)
+        atexit.unregister(self.close)
+        if self._table.buffer is not None:
+            self._table.buffer = None
+            self._table.segment.close()
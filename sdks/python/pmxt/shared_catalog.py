@@ -0,0 +1,422 @@
+"""
+Market catalogs shared across processes.
+
+Worker processes that each convert and hold the full catalog multiply its
+memory by the number of workers. Here one process publishes the catalog
+into shared memory as a columnar ``MarketFrame`` and the others attach
+read-only: numeric columns are zero-copy ``memoryview``s (ready for
+``numpy.frombuffer``), text is decoded per cell, and full ``UnifiedMarket``
+objects are only built for the rows asked for.
+
+Each publish writes a new segment and then bumps a version number in a
+small control segment, so readers switch from one complete catalog to the
+next and never see a partial one. The previous segment is kept until the
+following publish, which leaves readers time to attach.
+
+Example:
+    >>> # Publisher
+    >>> writer = pmxt.SharedCatalogWriter("poly-catalog")
+    >>> catalog = pmxt.MarketCatalog(poly, limit=5000)
+    >>> catalog.subscribe(lambda diff: writer.publish(catalog))
+    >>> catalog.start(interval=30)
+    >>>
+    >>> # Workers
+    >>> reader = pmxt.SharedCatalogReader("poly-catalog")
+    >>> frame = reader.frame()
+    >>> prices = frame.column("yes_price")          # memoryview of doubles
+    >>> market = frame.market(frame.find("0x1234"))
+"""
+
+import json
+import math
+import struct
+import time
+from dataclasses import asdict
+from datetime import datetime, timezone
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .models import MarketOutcome, UnifiedMarket
+
+MAGIC = b"PMXTFRM1"
+
+FLOAT = "float"
+TEXT = "text"
+JSON = "json"
+
+# Column name -> kind. Floats are NaN where the market has no value.
+COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("market_id", TEXT),
+    ("title", TEXT),
+    ("url", TEXT),
+    ("description", TEXT),
+    ("image", TEXT),
+    ("category", TEXT),
+    ("volume_24h", FLOAT),
+    ("liquidity", FLOAT),
+    ("volume", FLOAT),
+    ("open_interest", FLOAT),
+    ("resolution_date", FLOAT),
+    ("yes_outcome_id", TEXT),
+    ("yes_price", FLOAT),
+    ("no_outcome_id", TEXT),
+    ("no_price", FLOAT),
+    ("tags", JSON),
+    ("outcomes", JSON),
+    ("yes", JSON),
+    ("no", JSON),
+    ("up", JSON),
+    ("down", JSON),
+)
+
+_KINDS = {FLOAT: 0, TEXT: 1, JSON: 2}
+_KIND_NAMES = {code: kind for kind, code in _KINDS.items()}
+
+_HEADER = struct.Struct("<8sQII")  # magic, version, rows, columns
+_COLUMN = struct.Struct("<BHQ")  # kind, name length, data offset
+_CONTROL = struct.Struct("<QQ")  # sequence (odd while writing), version
+
+
+def _float(value: Optional[float]) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _timestamp(value: Optional[datetime]) -> float:
+    if value is None:
+        return math.nan
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _outcome(outcome: Optional[MarketOutcome]) -> Optional[Dict[str, Any]]:
+    return asdict(outcome) if outcome is not None else None
+
+
+def _cell(market: UnifiedMarket, name: str) -> Any:
+    if name == "resolution_date":
+        return _timestamp(market.resolution_date)
+    if name in ("yes_outcome_id", "no_outcome_id", "yes_price", "no_price"):
+        side, attribute = name.split("_", 1)
+        outcome = getattr(market, side)
+        return getattr(outcome, attribute) if outcome is not None else None
+    if name == "outcomes":
+        return [asdict(outcome) for outcome in market.outcomes]
+    if name in ("yes", "no", "up", "down"):
+        return _outcome(getattr(market, name))
+    return getattr(market, name)
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def _text_section(values: List[Optional[str]]) -> bytes:
+    # rows null flags, padding, (rows + 1) u64 offsets into the blob, blob
+    rows = len(values)
+    flags = bytearray(rows)
+    offsets = [0]
+    blob = bytearray()
+    for row, value in enumerate(values):
+        if value is None:
+            flags[row] = 1
+        else:
+            blob += value.encode("utf-8")
+        offsets.append(len(blob))
+    flags += bytes(_align(rows) - rows)
+    return bytes(flags) + struct.pack(f"<{rows + 1}Q", *offsets) + bytes(blob)
+
+
+def encode_frame(markets: Iterable[UnifiedMarket], version: int = 0) -> bytes:
+    """Serialize markets into the columnar MarketFrame layout."""
+    markets = list(markets)
+    rows = len(markets)
+
+    sections = []
+    for name, kind in COLUMNS:
+        values = [_cell(market, name) for market in markets]
+        if kind == FLOAT:
+            section = struct.pack(f"<{rows}d", *[_float(v) for v in values])
+        elif kind == TEXT:
+            section = _text_section([None if v is None else str(v) for v in values])
+        else:
+            section = _text_section(
+                [None if v is None else json.dumps(v, separators=(",", ":"), default=str) for v in values]
+            )
+        sections.append(section + bytes(_align(len(section)) - len(section)))
+
+    names = [name.encode("ascii") for name, _ in COLUMNS]
+    offset = _align(_HEADER.size + sum(_COLUMN.size + len(name) for name in names))
+    header = bytearray(_HEADER.pack(MAGIC, version, rows, len(COLUMNS)))
+    for (_, kind), name, section in zip(COLUMNS, names, sections):
+        header += _COLUMN.pack(_KINDS[kind], len(name), offset) + name
+        offset += len(section)
+    header += bytes(_align(len(header)) - len(header))
+    return bytes(header) + b"".join(sections)
+
+
+class MarketFrame:
+    """
+    Read-only columnar view of a published catalog.
+
+    Args:
+        buffer: Bytes-like object holding an encoded frame (not copied)
+    """
+
+    def __init__(self, buffer: Union[bytes, memoryview]):
+        self._buffer = memoryview(buffer)
+        magic, self.version, self._rows, count = _HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a MarketFrame buffer")
+        self._columns: Dict[str, Tuple[str, int]] = {}
+        position = _HEADER.size
+        for _ in range(count):
+            kind, name_length, offset = _COLUMN.unpack_from(self._buffer, position)
+            position += _COLUMN.size
+            name = bytes(self._buffer[position:position + name_length]).decode("ascii")
+            position += name_length
+            self._columns[name] = (_KIND_NAMES[kind], offset)
+        self._views: Dict[str, memoryview] = {}
+        self._ids: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return self._rows
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    def column(self, name: str) -> memoryview:
+        """
+        Zero-copy view of a float column (format ``"d"``, NaN for missing values).
+
+        Raises:
+            KeyError: For unknown columns
+            TypeError: For text and JSON columns; use ``value()`` for those
+        """
+        kind, offset = self._columns[name]
+        if kind != FLOAT:
+            raise TypeError(f"{name!r} is a {kind} column; read cells with value()")
+        view = self._views.get(name)
+        if view is None:
+            view = self._views[name] = self._buffer[offset:offset + self._rows * 8].cast("d")
+        return view
+
+    def value(self, name: str, row: int) -> Any:
+        """One cell: a float, a string (or None), or a decoded JSON value."""
+        if not 0 <= row < self._rows:
+            raise IndexError(row)
+        kind, offset = self._columns[name]
+        if kind == FLOAT:
+            return self.column(name)[row]
+        if self._buffer[offset + row]:
+            return None
+        offsets = offset + _align(self._rows)
+        start, end = struct.unpack_from("<QQ", self._buffer, offsets + row * 8)
+        blob = offsets + (self._rows + 1) * 8
+        text = bytes(self._buffer[blob + start:blob + end]).decode("utf-8")
+        return json.loads(text) if kind == JSON else text
+
+    def find(self, market_id: str) -> Optional[int]:
+        """Row of a market ID, or None. The ID index is built on first use."""
+        if self._ids is None:
+            self._ids = {self.value("market_id", row): row for row in range(self._rows)}
+        return self._ids.get(market_id)
+
+    def market(self, row: int) -> UnifiedMarket:
+        """Build the UnifiedMarket stored at ``row``."""
+        def number(name: str) -> Optional[float]:
+            value = self.column(name)[row]
+            return None if math.isnan(value) else value
+
+        def outcome(name: str) -> Optional[MarketOutcome]:
+            data = self.value(name, row)
+            return MarketOutcome(**data) if data is not None else None
+
+        resolution = number("resolution_date")
+        return UnifiedMarket(
+            market_id=self.value("market_id", row),
+            title=self.value("title", row),
+            outcomes=[MarketOutcome(**o) for o in self.value("outcomes", row)],
+            volume_24h=number("volume_24h"),
+            liquidity=number("liquidity"),
+            url=self.value("url", row),
+            description=self.value("description", row),
+            resolution_date=(
+                datetime.fromtimestamp(resolution, tz=timezone.utc) if resolution is not None else None
+            ),
+            volume=number("volume"),
+            open_interest=number("open_interest"),
+            image=self.value("image", row),
+            category=self.value("category", row),
+            tags=self.value("tags", row),
+            yes=outcome("yes"),
+            no=outcome("no"),
+            up=outcome("up"),
+            down=outcome("down"),
+        )
+
+    def release(self) -> None:
+        """Drop the views into the underlying buffer."""
+        for view in self._views.values():
+            view.release()
+        self._views.clear()
+        self._buffer.release()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    # Readers must not register segments with the resource tracker, or it
+    # unlinks them when the reader exits (track= exists from Python 3.13)
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        segment = shared_memory.SharedMemory(name=name)
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(segment._name, "shared_memory")
+        except Exception:
+            pass
+        return segment
+
+
+def _segment_name(name: str, version: int) -> str:
+    return f"{name}-{version}"
+
+
+class SharedCatalogWriter:
+    """
+    Publishes catalogs into shared memory for SharedCatalogReader processes.
+
+    Args:
+        name: Shared memory name the readers attach to
+    """
+
+    def __init__(self, name: str = "pmxt-catalog"):
+        self.name = name
+        try:
+            self._control = shared_memory.SharedMemory(name=name, create=True, size=_CONTROL.size)
+            _CONTROL.pack_into(self._control.buf, 0, 0, 0)
+        except FileExistsError:
+            # Left behind by an earlier writer: continue its version numbers
+            self._control = shared_memory.SharedMemory(name=name)
+        self._sequence, self.version = _CONTROL.unpack_from(self._control.buf, 0)
+        self._sequence += self._sequence & 1
+        self._segments: List[shared_memory.SharedMemory] = []
+
+    def publish(self, markets: Iterable[UnifiedMarket]) -> int:
+        """
+        Publish a complete catalog.
+
+        Returns:
+            The new version number
+        """
+        version = self.version + 1
+        data = encode_frame(markets, version)
+        segment_name = _segment_name(self.name, version)
+        try:
+            segment = shared_memory.SharedMemory(name=segment_name, create=True, size=len(data))
+        except FileExistsError:
+            # An earlier writer died between creating and announcing it
+            stale = shared_memory.SharedMemory(name=segment_name)
+            stale.close()
+            stale.unlink()
+            segment = shared_memory.SharedMemory(name=segment_name, create=True, size=len(data))
+        segment.buf[:len(data)] = data
+
+        # Seqlock: readers retry while the sequence is odd or changes under them
+        buffer = self._control.buf
+        self._sequence += 1
+        struct.pack_into("<Q", buffer, 0, self._sequence)
+        struct.pack_into("<Q", buffer, 8, version)
+        self._sequence += 1
+        struct.pack_into("<Q", buffer, 0, self._sequence)
+        self.version = version
+
+        self._segments.append(segment)
+        while len(self._segments) > 2:
+            old = self._segments.pop(0)
+            old.close()
+            old.unlink()
+        return version
+
+    def close(self) -> None:
+        """Unlink every segment; attached readers keep their current frame."""
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+        self._segments = []
+        self._control.close()
+        self._control.unlink()
+
+
+class SharedCatalogReader:
+    """
+    Read-only access to catalogs published by a SharedCatalogWriter.
+
+    Args:
+        name: Shared memory name the writer publishes under
+
+    Raises:
+        FileNotFoundError: If no writer has created ``name`` yet
+    """
+
+    def __init__(self, name: str = "pmxt-catalog"):
+        self.name = name
+        self._control = _attach(name)
+        self._segment: Optional[shared_memory.SharedMemory] = None
+        self._frame: Optional[MarketFrame] = None
+        # Superseded segments still exported elsewhere (e.g. numpy arrays)
+        self._retired: List[shared_memory.SharedMemory] = []
+
+    @property
+    def version(self) -> int:
+        """Latest published version (0 before the first publish)."""
+        while True:
+            before, version = _CONTROL.unpack_from(self._control.buf, 0)
+            after, _ = _CONTROL.unpack_from(self._control.buf, 0)
+            if before == after and not before & 1:
+                return version
+            time.sleep(0)
+
+    def frame(self) -> MarketFrame:
+        """
+        The latest published catalog.
+
+        A frame stays valid until this returns a newer version, so hold on to
+        one (rather than calling this per row) for a consistent view.
+
+        Raises:
+            LookupError: If nothing has been published yet
+        """
+        while True:
+            version = self.version
+            if version == 0:
+                raise LookupError(f"Nothing published to {self.name!r} yet")
+            if self._frame is not None and self._frame.version == version:
+                return self._frame
+            try:
+                segment = _attach(_segment_name(self.name, version))
+            except FileNotFoundError:
+                continue  # Superseded while we attached; read the version again
+            self._retire()
+            self._segment, self._frame = segment, MarketFrame(segment.buf)
+            return self._frame
+
+    def _retire(self) -> None:
+        if self._frame is not None:
+            self._frame.release()
+            self._frame = None
+        if self._segment is not None:
+            self._retired.append(self._segment)
+            self._segment = None
+        still_exported = []
+        for segment in self._retired:
+            try:
+                segment.close()
+            except BufferError:
+                still_exported.append(segment)
+        self._retired = still_exported
+
+    def close(self) -> None:
+        self._retire()
+        self._control.close()
@@ -0,0 +1,206 @@
+"""
+On-disk market snapshots.
+
+A snapshot file holds one raw record (the sidecar's JSON for a market) per
+key, each stamped with the time it was last confirmed live. It is
+memory-mapped when opened: only the small index is parsed up front, and
+records are decoded when read, so opening a large catalog takes
+milliseconds.
+
+Layout (little-endian)::
+
+    header   "PMXTSNAP", u16 version, u16 reserved, u32 count, f64 saved_at
+    index    count x (f64 fetched_at, u64 offset, u32 length, u16 key length, key)
+    records  JSON bytes, located by the index
+
+The snapshot path itself is a small pointer file naming the current data
+file (a uniquely named ``<name>.*.snapdata`` beside it). A write creates a new data
+file, then atomically replaces the pointer, so readers never see a partial
+snapshot and a file that is still mapped is never renamed over (which
+Windows refuses). Superseded data files are deleted once no longer mapped;
+on Windows one still open is left for a later write to remove. Missing,
+unreadable or foreign files open as empty.
+"""
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+import time
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+MAGIC = b"PMXTSNAP"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sHHId")
+_ENTRY = struct.Struct("<dQIH")
+
+_DATA_SUFFIX = ".snapdata"
+
+
+def _data_path(path: str) -> Optional[str]:
+    # The data file named by the pointer at ``path``
+    try:
+        with open(path, "rb") as f:
+            name = f.read(256).decode("utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if not name.endswith(_DATA_SUFFIX) or os.path.basename(name) != name:
+        return None
+    return os.path.join(os.path.dirname(os.path.abspath(path)), name)
+
+
+def _replace(source: str, destination: str) -> None:
+    # Windows refuses to replace a file another process has open; readers
+    # only hold the pointer for the moment it takes to read it
+    for attempt in range(20):
+        try:
+            os.replace(source, destination)
+            return
+        except PermissionError:
+            if attempt == 19:
+                raise
+            time.sleep(0.01)
+
+
+def encode_record(raw: Dict[str, Any]) -> bytes:
+    """Serialize a raw sidecar record for storage."""
+    return json.dumps(raw, separators=(",", ":"), default=str).encode("utf-8")
+
+
+class MarketSnapshot:
+    """
+    Read-only view of a snapshot file.
+
+    The data file is resolved once, when the snapshot is opened; later
+    writes are seen by opening a new ``MarketSnapshot``.
+
+    Args:
+        path: Snapshot file; a missing file opens as an empty snapshot
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.saved_at: Optional[float] = None
+        """Wall-clock time (``time.time()``) the snapshot was written"""
+
+        self._map: Optional[mmap.mmap] = None
+        self._index: Dict[str, Tuple[float, int, int]] = {}
+        for _ in range(3):
+            data_path = _data_path(path)
+            if data_path is None:
+                return
+            try:
+                with open(data_path, "rb") as f:
+                    if os.fstat(f.fileno()).st_size >= _HEADER.size:
+                        self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                break
+            except FileNotFoundError:
+                continue  # Superseded and deleted after the pointer was read
+            except OSError:
+                return
+        if self._map is not None and not self._read_index():
+            self.close()
+            self._index = {}
+
+    def _read_index(self) -> bool:
+        data = self._map
+        magic, version, _, count, saved_at = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            return False
+        position = _HEADER.size
+        try:
+            for _ in range(count):
+                fetched_at, offset, length, key_length = _ENTRY.unpack_from(data, position)
+                position += _ENTRY.size
+                key = data[position:position + key_length].decode("utf-8")
+                position += key_length
+                if offset + length > len(data):
+                    return False
+                self._index[key] = (fetched_at, offset, length)
+        except (struct.error, UnicodeDecodeError):
+            return False
+        self.saved_at = saved_at
+        return True
+
+    def raw(self, key: str) -> Optional[bytes]:
+        """The stored bytes of a record, or None if absent."""
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        _, offset, length = entry
+        return self._map[offset:offset + length]
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """The decoded record, or None if absent."""
+        data = self.raw(key)
+        return json.loads(data) if data is not None else None
+
+    def fetched_at(self, key: str) -> Optional[float]:
+        """When the record was last confirmed live (``time.time()``), or None if absent."""
+        entry = self._index.get(key)
+        return entry[0] if entry is not None else None
+
+    def keys(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    @staticmethod
+    def write(path: str, records: Iterable[Tuple[str, float, bytes]], saved_at: float) -> None:
+        """
+        Atomically replace the snapshot at ``path`` with ``records``.
+
+        Safe while readers have the current snapshot open. Writes to one
+        path must not run concurrently.
+
+        Args:
+            path: Snapshot (pointer) file
+            records: ``(key, fetched_at, raw bytes)`` triples
+            saved_at: Wall-clock time recorded in the header
+        """
+        records = list(records)
+        keys = [key.encode("utf-8") for key, _, _ in records]
+        offset = _HEADER.size + sum(_ENTRY.size + len(key) for key in keys)
+
+        directory, name = os.path.split(os.path.abspath(path))
+        fd, data_path = tempfile.mkstemp(prefix=f"{name}.{time.time_ns():x}-", suffix=_DATA_SUFFIX, dir=directory)
+        tmp_path = None
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(MAGIC, VERSION, 0, len(records), saved_at))
+                for key, (_, fetched_at, data) in zip(keys, records):
+                    f.write(_ENTRY.pack(fetched_at, offset, len(data), len(key)))
+                    f.write(key)
+                    offset += len(data)
+                for _, _, data in records:
+                    f.write(data)
+            fd, tmp_path = tempfile.mkstemp(prefix=".pmxt-snapshot-", dir=directory)
+            with os.fdopen(fd, "wb") as f:
+                f.write(os.path.basename(data_path).encode("utf-8"))
+            _replace(tmp_path, path)
+        except BaseException:
+            for leftover in (data_path, tmp_path):
+                try:
+                    if leftover is not None:
+                        os.unlink(leftover)
+                except OSError:
+                    pass
+            raise
+
+        for entry in os.listdir(directory):
+            if entry.startswith(f"{name}.") and entry.endswith(_DATA_SUFFIX) and entry != os.path.basename(data_path):
+                try:
+                    os.unlink(os.path.join(directory, entry))
+                except OSError:
+                    pass  # Still mapped on Windows; removed by a later write
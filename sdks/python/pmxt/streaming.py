@@ -0,0 +1,268 @@
+"""
+Order book streams for consumers slower than the feed.
+
+Calling ``watch_order_book`` in the strategy loop means updates that arrive
+while the strategy is busy are lost, and buffering them naively grows
+without bound. An ``OrderBookStream`` watches outcomes on background
+threads and hands updates to the consumer through a bounded buffer per
+subscription, with a policy for what happens when the consumer falls
+behind:
+
+- ``"conflate"``: keep only the latest book per outcome. Intermediate books
+  are counted as conflated. Best for strategies that only need the
+  current state.
+- ``"drop_oldest"``: keep the last ``maxsize`` books; older ones are dropped
+  and counted.
+- ``"block"``: keep up to ``maxsize`` books, then stop watching until the
+  consumer catches up. Nothing is dropped locally, but the sidecar's
+  long-poll only reports the latest book once watching resumes.
+
+Updates from all subscriptions are delivered in arrival order. A
+``watch_order_book`` that raises ``EOFError`` (a finished ``Replay``) ends
+its subscription; iteration stops once every subscription has ended and
+its books were delivered.
+
+Example:
+    >>> stream = pmxt.OrderBookStream(poly)
+    >>> stream.subscribe(outcome_a)                              # conflated
+    >>> stream.subscribe(outcome_b, policy="drop_oldest", maxsize=100)
+    >>> for outcome_id, book in stream:
+    ...     slow_strategy(outcome_id, book)
+    >>> stream.stats()[outcome_a].conflated
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from itertools import count
+from typing import TYPE_CHECKING, Deque, Dict, Iterator, Optional, Tuple
+
+from .models import OrderBook
+
+if TYPE_CHECKING:
+    from .client import Exchange
+
+
+CONFLATE = "conflate"
+DROP_OLDEST = "drop_oldest"
+BLOCK = "block"
+POLICIES = (CONFLATE, DROP_OLDEST, BLOCK)
+
+
+@dataclass
+class StreamStats:
+    """Counters for one subscription of an OrderBookStream."""
+
+    policy: str
+    """Backpressure policy of the subscription"""
+
+    received: int = 0
+    """Books received from the exchange"""
+
+    delivered: int = 0
+    """Books handed to the consumer"""
+
+    dropped: int = 0
+    """Books discarded by ``drop_oldest``"""
+
+    conflated: int = 0
+    """Books replaced by a newer one before delivery (``conflate``)"""
+
+    queue_depth: int = 0
+    """Books waiting for the consumer"""
+
+    max_queue_depth: int = 0
+    """Highest queue depth seen"""
+
+    blocked: float = 0.0
+    """Seconds the watcher spent waiting for the consumer (``block``)"""
+
+    last_error: Optional[BaseException] = None
+    """Last error from watching, cleared by the next update"""
+
+    ended: bool = False
+    """The feed ended (``watch_order_book`` raised EOFError); no more books will arrive"""
+
+
+class _Subscription:
+    def __init__(self, outcome_id: str, policy: str, maxsize: int):
+        self.outcome_id = outcome_id
+        self.maxsize = 1 if policy == CONFLATE else maxsize
+        self.policy = policy
+        # (arrival number, book), oldest first
+        self.queue: Deque[Tuple[int, OrderBook]] = deque()
+        self.stats = StreamStats(policy=policy)
+        self.active = True
+
+
+class OrderBookStream:
+    """
+    Watches order books in the background and buffers them per policy.
+
+    Args:
+        exchange: Exchange client used for ``watch_order_book``
+        limit: Optional depth limit passed to ``watch_order_book``
+        timeout: Time budget per ``watch_order_book`` call (defaults to the client timeout)
+    """
+
+    def __init__(self, exchange: "Exchange", limit: Optional[int] = None, timeout: Optional[float] = None):
+        self._exchange = exchange
+        self._limit = limit
+        self._timeout = timeout
+        self._subscriptions: Dict[str, _Subscription] = {}
+        self._arrivals = count()
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def subscribe(self, outcome_id: str, policy: str = CONFLATE, maxsize: int = 1000) -> None:
+        """
+        Start watching an outcome.
+
+        Args:
+            outcome_id: Outcome to watch
+            policy: "conflate", "drop_oldest" or "block"
+            maxsize: Buffered books before the policy applies (ignored for "conflate")
+
+        Raises:
+            ValueError: For unknown policies, a non-positive maxsize, or an
+                outcome that is already subscribed
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}, got {policy!r}")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Stream is closed")
+            if outcome_id in self._subscriptions:
+                raise ValueError(f"Already subscribed to {outcome_id}")
+            subscription = self._subscriptions[outcome_id] = _Subscription(outcome_id, policy, maxsize)
+        threading.Thread(
+            target=self._watch, args=(subscription,), name="pmxt-book-stream", daemon=True
+        ).start()
+
+    def unsubscribe(self, outcome_id: str) -> None:
+        """Stop watching an outcome and discard its buffered books."""
+        with self._condition:
+            subscription = self._subscriptions.pop(outcome_id, None)
+            if subscription is not None:
+                subscription.active = False
+                self._condition.notify_all()
+
+    def _watch(self, subscription: _Subscription) -> None:
+        backoff = 0.0
+        while True:
+            with self._condition:
+                if backoff:
+                    self._condition.wait_for(lambda: not subscription.active, timeout=backoff)
+                if not subscription.active:
+                    return
+            try:
+                book = self._exchange.watch_order_book(
+                    subscription.outcome_id, limit=self._limit, timeout=self._timeout
+                )
+            except EOFError:
+                with self._condition:
+                    subscription.stats.ended = True
+                    self._condition.notify_all()
+                return
+            except Exception as e:
+                subscription.stats.last_error = e
+                backoff = min(max(backoff * 2, 0.5), 30.0)
+                continue
+            backoff = 0.0
+            self._push(subscription, book)
+
+    def _push(self, subscription: _Subscription, book: OrderBook) -> None:
+        stats = subscription.stats
+        with self._condition:
+            stats.received += 1
+            stats.last_error = None
+            queue = subscription.queue
+            if len(queue) >= subscription.maxsize:
+                if subscription.policy == CONFLATE:
+                    # Keep its place in arrival order, replace the book
+                    queue[0] = (queue[0][0], book)
+                    stats.conflated += 1
+                    return
+                if subscription.policy == DROP_OLDEST:
+                    queue.popleft()
+                    stats.dropped += 1
+                else:
+                    started = time.monotonic()
+                    self._condition.wait_for(
+                        lambda: len(queue) < subscription.maxsize or not subscription.active
+                    )
+                    stats.blocked += time.monotonic() - started
+                    if not subscription.active:
+                        return
+            queue.append((next(self._arrivals), book))
+            stats.queue_depth = len(queue)
+            stats.max_queue_depth = max(stats.max_queue_depth, stats.queue_depth)
+            self._condition.notify_all()
+
+    def _next(self) -> Optional[Tuple[str, OrderBook]]:
+        # Called with the condition held: the subscription with the oldest book
+        oldest: Optional[_Subscription] = None
+        for subscription in self._subscriptions.values():
+            if subscription.queue and (oldest is None or subscription.queue[0][0] < oldest.queue[0][0]):
+                oldest = subscription
+        if oldest is None:
+            return None
+        _, book = oldest.queue.popleft()
+        oldest.stats.delivered += 1
+        oldest.stats.queue_depth = len(oldest.queue)
+        self._condition.notify_all()
+        return oldest.outcome_id, book
+
+    def get(self, timeout: Optional[float] = None) -> Tuple[str, OrderBook]:
+        """
+        Next buffered update, waiting for one if needed.
+
+        Returns:
+            ``(outcome_id, book)``
+
+        Raises:
+            TimeoutError: If nothing arrived within ``timeout`` seconds
+            StopIteration: If the stream was closed, or every subscription
+                has ended and its books were delivered
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise StopIteration
+                update = self._next()
+                if update is not None:
+                    return update
+                if self._subscriptions and all(s.stats.ended for s in self._subscriptions.values()):
+                    raise StopIteration
+                remaining = deadline - time.monotonic() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No order book update within {timeout}s")
+                self._condition.wait(remaining)
+
+    def __iter__(self) -> Iterator[Tuple[str, OrderBook]]:
+        while True:
+            try:
+                yield self.get()
+            except StopIteration:
+                return
+
+    def stats(self) -> Dict[str, StreamStats]:
+        """Snapshot of the counters of each subscription, by outcome ID."""
+        with self._condition:
+            return {
+                outcome_id: StreamStats(**vars(subscription.stats))
+                for outcome_id, subscription in self._subscriptions.items()
+            }
+
+    def close(self) -> None:
+        """Stop watching everything; iteration ends once this is called."""
+        with self._condition:
+            self._closed = True
+            for subscription in self._subscriptions.values():
+                subscription.active = False
+            self._subscriptions.clear()
+            self._condition.notify_all()
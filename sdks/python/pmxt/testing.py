@@ -0,0 +1,594 @@
+"""
+A stand-in sidecar for offline tests and benchmarks.
+
+``FakeSidecar`` serves the sidecar's HTTP contract (``GET /health``,
+``POST /session/:exchange`` and ``POST /api/:exchange/:method`` with
+``{args, credentials}`` bodies and ``{success, data | error}`` responses)
+from a local thread, so the SDK can be exercised without Node, exchanges or
+a network. Responses come from fixtures, or from seeded synthetic
+generators for the market data methods (markets, events, order books,
+trades, candles), whose payload sizes are configurable. Like the sidecar,
+it applies the ``filter`` and ``fields`` that ``fetchMarkets``,
+``fetchEvents`` and ``syncMarkets`` carry in their first argument to the
+results, whether generated or from a fixture.
+
+For resilience and performance tests it can add latency (fixed, jittered,
+or per method), honour the client's time budget header with
+``REQUEST_TIMEOUT`` errors like the real sidecar, inject errors at random
+or on schedule, drop connections, and compress or MessagePack-encode
+responses when asked to. ``calls`` counts requests per method.
+
+Example:
+    >>> from pmxt.testing import FakeSidecar
+    >>> with FakeSidecar(markets=5_000, latency=0.02, seed=1) as sidecar:
+    ...     poly = sidecar.exchange("polymarket", retry_policy=pmxt.RetryPolicy())
+    ...     sidecar.fail("fetchMarkets", pmxt.ExchangeNotAvailable, times=2)
+    ...     markets = poly.fetch_markets()           # retried twice, then served
+    ...     sidecar.calls["fetchMarkets"]            # 3
+"""
+
+import gzip
+import json
+import random
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Type, Union
+
+from .client import MSGPACK_CONTENT_TYPE, SESSION_HEADER, TIMEOUT_HEADER, Exchange, _convert_event, _convert_market
+from .errors import BadRequest, ExchangeNotAvailable, PmxtError, RequestTimeout, SessionNotFound
+from .pushdown import _EVENT_KEYS, _MARKET_KEYS
+
+DISCONNECT = "disconnect"
+"""``fail()`` error that closes the connection without a response"""
+
+ACCESS_TOKEN_HEADER = "x-pmxt-access-token"
+
+_COMPRESSION_THRESHOLD = 1024
+_CATEGORIES = ("Politics", "Crypto", "Sports", "Economics", "Science")
+
+Fixture = Union[Any, Callable[[str, List[Any]], Any]]
+
+# Methods taking a filter and field projection -> sidecar filter key -> criteria key
+_FILTER_KEYS = {
+    "fetchMarkets": {sidecar: key for key, sidecar in _MARKET_KEYS.items()},
+    "fetchEvents": {sidecar: key for key, sidecar in _EVENT_KEYS.items()},
+    "syncMarkets": {sidecar: key for key, sidecar in _MARKET_KEYS.items()},
+}
+
+
+class _Reply(Exception):
+    """Raised by handlers to answer with an error status and payload."""
+
+    def __init__(self, status: int, error: Any):
+        super().__init__(status)
+        self.status = status
+        self.error = error
+
+
+def _error_reply(error: Type[PmxtError], message: str, exchange: str, retry_after: Optional[float] = None) -> _Reply:
+    detail: Dict[str, Any] = {
+        "message": message,
+        "code": error.code,
+        "retryable": error.retryable,
+        "exchange": exchange,
+    }
+    if retry_after is not None:
+        detail["retryAfter"] = retry_after
+    return _Reply(error.status or 500, detail)
+
+
+def _criteria(raw: Any, keys: Dict[str, str]) -> Union[str, Dict[str, Any]]:
+    # A received filter as filter_markets() / filter_events() criteria,
+    # rejecting what the sidecar's parseCriteria rejects
+    if isinstance(raw, str):
+        return raw
+    if not isinstance(raw, dict):
+        raise BadRequest("filter must be a search string or a criteria object")
+    for key in ("text", "category"):
+        if raw.get(key) == "":
+            raise BadRequest(f"filter.{key} must not be empty; leave it out instead")
+    for key in ("price", "priceChange24h"):
+        if key in raw and not (isinstance(raw[key], dict) and raw[key].get("outcome")):
+            raise BadRequest(f"filter.{key} needs an outcome (yes, no, up or down)")
+
+    criteria: Dict[str, Any] = {}
+    for key, value in raw.items():
+        if key not in keys:
+            continue  # Ignored, like the sidecar's filterMarkets does
+        if key == "resolutionDate":
+            dates = {}
+            for bound, date in (value or {}).items():
+                if date is None:
+                    continue
+                try:
+                    dates[bound] = datetime.fromisoformat(str(date).replace("Z", "+00:00"))
+                except ValueError:
+                    raise BadRequest(f"filter.resolutionDate.{bound} is not a valid date: {date}")
+            value = dates
+        criteria[keys[key]] = value
+    return criteria
+
+
+def _field_tree(fields: Any) -> Dict[str, Any]:
+    # Dotted paths (["title", "yes.price"]) as a tree; True keeps a field whole
+    if not isinstance(fields, list) or any(not isinstance(field, str) or not field for field in fields):
+        raise BadRequest("fields must be a list of field names")
+    tree: Dict[str, Any] = {}
+    for field in fields:
+        node = tree
+        *parents, leaf = field.split(".")
+        for segment in parents:
+            if node.get(segment) is True:
+                break  # A parent field is already kept whole
+            node = node.setdefault(segment, {})
+        else:
+            node[leaf] = True
+    return tree
+
+
+def _project(value: Any, tree: Dict[str, Any]) -> Any:
+    # Keep only the fields in tree; fields missing from the value are skipped
+    if isinstance(value, list):
+        return [_project(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    return {
+        field: value[field] if child is True else _project(value[field], child)
+        for field, child in tree.items()
+        if field in value
+    }
+
+
+class FakeSidecar:
+    """
+    In-process HTTP server speaking the sidecar protocol.
+
+    Fixtures are keyed by wire method name (``"fetchMarkets"``,
+    ``"watchOrderBook"``, ...) and are either the ``data`` to return or a
+    callable ``(exchange, args) -> data``; raising a ``PmxtError`` subclass
+    from one answers with that error. Fixtures take precedence over the
+    synthetic generators, and methods with neither answer 404 like an
+    exchange without the method.
+
+    Args:
+        port: Port to listen on (0 picks a free one)
+        fixtures: Responses by method name
+        markets: Synthetic markets in the catalog
+        markets_per_event: Synthetic markets grouped into each event
+        book_depth: Levels per side of synthetic order books
+        trades: Synthetic trades returned by ``fetchTrades``
+        latency: Seconds added to every call, or seconds by method name
+        jitter: Up to this many extra seconds, uniformly at random
+        error_rate: Fraction of API calls failing with ``ExchangeNotAvailable``
+        watch_interval: Seconds a ``watch*`` call waits before the next update
+        access_token: Token required in ``x-pmxt-access-token`` (None = no check)
+        seed: Seed for the synthetic data and random faults
+    """
+
+    def __init__(
+        self,
+        port: int = 0,
+        fixtures: Optional[Dict[str, Fixture]] = None,
+        markets: int = 100,
+        markets_per_event: int = 5,
+        book_depth: int = 20,
+        trades: int = 100,
+        latency: Union[float, Dict[str, float]] = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        watch_interval: float = 0.05,
+        access_token: Optional[str] = None,
+        seed: Optional[int] = None,
+    ):
+        self.fixtures: Dict[str, Fixture] = dict(fixtures or {})
+        self.book_depth = book_depth
+        self.trades = trades
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.watch_interval = watch_interval
+        self.access_token = access_token
+        self.seed = seed
+        self.calls: Counter = Counter()
+        """Requests received per method name (including failed ones)"""
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._faults: Deque[List[Any]] = deque()  # [method, error, remaining, retry_after]
+        self._sessions: Dict[str, str] = {}  # session ID -> exchange
+        self._books: Dict[str, Tuple[random.Random, float, int]] = {}  # outcome -> (rng, mid, version)
+        self._trade_counters: Counter = Counter()
+        self._sync_version = 0
+        self._markets = [self._make_market(n) for n in range(markets)]
+        self._events = [
+            self._make_event(n, self._markets[start:start + markets_per_event])
+            for n, start in enumerate(range(0, markets, max(1, markets_per_event)))
+        ]
+
+        self._local = Exchange("fake", auto_start_server=False)  # Evaluates received filters
+
+        handler = type("Handler", (_Handler,), {"sidecar": self})
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    # Lifecycle
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self) -> "FakeSidecar":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever,
+                kwargs={"poll_interval": 0.05},  # Bounds how long stop() waits
+                name="pmxt-fake-sidecar",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeSidecar":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def exchange(self, name: str = "polymarket", **options: Any) -> Exchange:
+        """
+        Exchange client pointed at this sidecar (never starts a real one).
+
+        Args:
+            name: Exchange name sent in request paths
+            **options: Exchange arguments (retry_policy, timeout, wire_format, ...)
+        """
+        client = Exchange(name, base_url=self.url, auto_start_server=False, **options)
+        if self.access_token is not None:
+            client._api_client.default_headers[ACCESS_TOKEN_HEADER] = self.access_token
+        return client
+
+    # Faults
+
+    def fail(
+        self,
+        method: Optional[str] = None,
+        error: Union[Type[PmxtError], str] = ExchangeNotAvailable,
+        times: int = 1,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """
+        Fail the next ``times`` calls to ``method`` (any method if None).
+
+        Args:
+            method: Wire method name
+            error: PmxtError subclass to answer with, or ``DISCONNECT`` to
+                close the connection without answering
+            times: Calls to fail
+            retry_after: ``retryAfter`` seconds to report with the error
+        """
+        with self._lock:
+            self._faults.append([method, error, times, retry_after])
+
+    def _take_fault(self, method: str) -> Optional[List[Any]]:
+        with self._lock:
+            for fault in self._faults:
+                if fault[0] is None or fault[0] == method:
+                    fault[2] -= 1
+                    if fault[2] <= 0:
+                        self._faults.remove(fault)
+                    return fault
+            if self.error_rate and self._random.random() < self.error_rate:
+                return [method, ExchangeNotAvailable, 0, None]
+        return None
+
+    def _delay(self, method: str) -> float:
+        latency = self.latency
+        delay = latency.get(method, 0.0) if isinstance(latency, dict) else latency
+        if self.jitter:
+            with self._lock:
+                delay += self._random.uniform(0, self.jitter)
+        if method.startswith("watch"):
+            delay += self.watch_interval
+        return delay
+
+    # Requests
+
+    def handle(self, exchange: str, method: str, body: Dict[str, Any], headers: Any) -> Any:
+        """
+        Answer one API call.
+
+        Returns:
+            The ``data`` of a successful response
+
+        Raises:
+            _Reply: For error responses
+        """
+        with self._lock:
+            self.calls[method] += 1
+        session_id = headers.get(SESSION_HEADER)
+        if session_id and self._sessions.get(session_id) != exchange:
+            raise _error_reply(SessionNotFound, f"Unknown or expired session for {exchange}", exchange)
+
+        delay = self._delay(method)
+        timeout_ms = headers.get(TIMEOUT_HEADER)
+        budget = int(timeout_ms) / 1000 if timeout_ms and timeout_ms.isdigit() else None
+        if budget is not None and delay > budget:
+            time.sleep(budget)
+            raise _error_reply(RequestTimeout, f"{exchange}.{method} timed out after {timeout_ms}ms", exchange)
+        time.sleep(delay)
+
+        fault = self._take_fault(method)
+        if fault is not None:
+            error = fault[1]
+            if error == DISCONNECT:
+                raise ConnectionAbortedError(method)
+            raise _error_reply(error, f"Injected {error.__name__} for {method}", exchange, fault[3])
+
+        args = body.get("args") if isinstance(body.get("args"), list) else []
+        criteria: Optional[Union[str, Dict[str, Any]]] = None
+        fields: Optional[Dict[str, Any]] = None
+        if method in _FILTER_KEYS and args and isinstance(args[0], dict):
+            params = dict(args[0])
+            try:
+                if "fields" in params:
+                    fields = _field_tree(params.pop("fields"))
+                    if method == "syncMarkets":
+                        fields["marketId"] = True  # Deltas are keyed by market
+                if "filter" in params:
+                    criteria = _criteria(params.pop("filter"), _FILTER_KEYS[method])
+            except PmxtError as e:
+                raise _error_reply(type(e), e.message, exchange)
+            args = [params, *args[1:]]
+
+        fixture = self.fixtures.get(method)
+        if fixture is not None:
+            try:
+                data = fixture(exchange, args) if callable(fixture) else fixture
+            except PmxtError as e:
+                raise _error_reply(type(e), e.message, exchange, e.retry_after)
+        else:
+            generator = getattr(self, f"_generate_{method}", None)
+            if generator is None:
+                raise _Reply(404, f"Method '{method}' not found on {exchange}")
+            data = generator(args)
+        return self._shape(method, data, criteria, fields)
+
+    def _shape(
+        self,
+        method: str,
+        data: Any,
+        criteria: Optional[Union[str, Dict[str, Any]]],
+        fields: Optional[Dict[str, Any]],
+    ) -> Any:
+        # Filter, then project, the result as the sidecar does before replying
+        if method == "syncMarkets" and isinstance(data, dict):
+            return dict(data, upserts=self._shape("fetchMarkets", data.get("upserts") or [], criteria, fields))
+        if criteria is not None and isinstance(data, list):
+            convert, keep = (
+                (_convert_event, self._local.filter_events)
+                if method == "fetchEvents"
+                else (_convert_market, self._local.filter_markets)
+            )
+            models = [convert(item) for item in data]
+            kept = {id(model) for model in keep(models, criteria)}
+            data = [item for item, model in zip(data, models) if id(model) in kept]
+        if fields is not None:
+            data = _project(data, fields)
+        return data
+
+    def open_session(self, exchange: str, body: Dict[str, Any]) -> Dict[str, str]:
+        credentials = body.get("credentials") or {}
+        if not (credentials.get("privateKey") or credentials.get("apiKey")):
+            raise _error_reply(BadRequest, "Credentials are required to open a session", exchange)
+        session_id = uuid.uuid4().hex
+        with self._lock:
+            self._sessions[session_id] = exchange
+        return {"sessionId": session_id}
+
+    # Synthetic data
+
+    def _make_market(self, n: int) -> Dict[str, Any]:
+        rng = random.Random(f"{self.seed}:market:{n}")
+        price = round(rng.uniform(0.02, 0.98), 3)
+        yes = {"outcomeId": f"{n}-yes", "label": "Yes", "price": price, "priceChange24h": round(rng.uniform(-0.1, 0.1), 3)}
+        no = {"outcomeId": f"{n}-no", "label": "No", "price": round(1 - price, 3), "priceChange24h": -yes["priceChange24h"]}
+        volume = round(rng.uniform(1_000, 5_000_000), 2)
+        category = rng.choice(_CATEGORIES)
+        return {
+            "marketId": str(n),
+            "title": f"Synthetic market {n}",
+            "description": f"Synthetic {category.lower()} market {n} served by the fake sidecar",
+            "outcomes": [yes, no],
+            "resolutionDate": "2030-01-01T00:00:00.000Z",
+            "volume24h": round(volume * rng.uniform(0.01, 0.2), 2),
+            "volume": volume,
+            "liquidity": round(rng.uniform(100, 500_000), 2),
+            "openInterest": round(rng.uniform(100, 1_000_000), 2),
+            "url": f"https://example.com/markets/{n}",
+            "category": category,
+            "tags": [category, f"tag-{n % 10}"],
+            "yes": yes,
+            "no": no,
+        }
+
+    def _make_event(self, n: int, markets: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "id": f"event-{n}",
+            "title": f"Synthetic event {n}",
+            "description": f"Synthetic event {n} served by the fake sidecar",
+            "slug": f"synthetic-event-{n}",
+            "markets": markets,
+            "url": f"https://example.com/events/{n}",
+            "category": markets[0]["category"] if markets else None,
+            "tags": markets[0]["tags"] if markets else [],
+        }
+
+    @staticmethod
+    def _page(items: List[Dict[str, Any]], args: List[Any]) -> List[Dict[str, Any]]:
+        params = args[0] if args and isinstance(args[0], dict) else {}
+        query = (params.get("query") or "").lower()
+        if query:
+            items = [item for item in items if query in item["title"].lower()]
+        offset = int(params.get("offset") or 0)
+        limit = params.get("limit")
+        return items[offset:offset + int(limit)] if limit else items[offset:]
+
+    def _generate_fetchMarkets(self, args: List[Any]) -> List[Dict[str, Any]]:
+        return self._page(self._markets, args)
+
+    def _generate_fetchEvents(self, args: List[Any]) -> List[Dict[str, Any]]:
+        return self._page(self._events, args)
+
+    def _generate_syncMarkets(self, args: List[Any]) -> Dict[str, Any]:
+        # Always a full snapshot: valid for any cursor, and exercises reconciliation
+        with self._lock:
+            self._sync_version += 1
+            cursor = f"fake-{self._sync_version}"
+        return {"cursor": cursor, "full": True, "upserts": self._page(self._markets, args[:1]), "removed": []}
+
+    def _book(self, outcome_id: str, advance: bool) -> Dict[str, Any]:
+        with self._lock:
+            rng, mid, version = self._books.get(outcome_id) or (
+                random.Random(f"{self.seed}:book:{outcome_id}"), 0.5, 0
+            )
+            if advance or version == 0:
+                mid = min(0.9, max(0.1, mid + rng.choice((-0.01, 0.0, 0.01))))
+                version += 1
+            self._books[outcome_id] = (rng, mid, version)
+            sizes = [round(rng.uniform(1, 1_000), 2) for _ in range(2 * self.book_depth)]
+        bid, ask = round(mid - 0.01, 2), round(mid + 0.01, 2)
+        return {
+            "bids": [{"price": round(bid - i * 0.001, 3), "size": sizes[i]} for i in range(self.book_depth)],
+            "asks": [{"price": round(ask + i * 0.001, 3), "size": sizes[self.book_depth + i]} for i in range(self.book_depth)],
+            "timestamp": int(time.time() * 1000),
+        }
+
+    def _generate_fetchOrderBook(self, args: List[Any]) -> Dict[str, Any]:
+        return self._book(str(args[0]), advance=False)
+
+    def _generate_watchOrderBook(self, args: List[Any]) -> Dict[str, Any]:
+        book = self._book(str(args[0]), advance=True)
+        if len(args) > 1 and args[1]:
+            book["bids"], book["asks"] = book["bids"][:args[1]], book["asks"][:args[1]]
+        return book
+
+    def _make_trades(self, outcome_id: str, count: int) -> List[Dict[str, Any]]:
+        with self._lock:
+            first = self._trade_counters[outcome_id]
+            self._trade_counters[outcome_id] += count
+        rng = random.Random(f"{self.seed}:trades:{outcome_id}:{first}")
+        now = int(time.time() * 1000)
+        return [
+            {
+                "id": f"{outcome_id}-{first + i}",
+                "price": round(rng.uniform(0.3, 0.7), 3),
+                "amount": round(rng.uniform(1, 500), 2),
+                "side": rng.choice(("buy", "sell")),
+                "timestamp": now - (count - 1 - i) * 1000,
+            }
+            for i in range(count)
+        ]
+
+    def _generate_fetchTrades(self, args: List[Any]) -> List[Dict[str, Any]]:
+        params = args[1] if len(args) > 1 and isinstance(args[1], dict) else {}
+        return self._make_trades(str(args[0]), int(params.get("limit") or self.trades))
+
+    def _generate_watchTrades(self, args: List[Any]) -> List[Dict[str, Any]]:
+        return self._make_trades(str(args[0]), 1 + self._random.randrange(3))
+
+    def _generate_fetchOHLCV(self, args: List[Any]) -> List[Dict[str, Any]]:
+        params = args[1] if len(args) > 1 and isinstance(args[1], dict) else {}
+        rng = random.Random(f"{self.seed}:ohlcv:{args[0]}")
+        now = int(time.time() // 3600 * 3600 * 1000)
+        count = int(params.get("limit") or 100)
+        candles, close = [], 0.5
+        for i in range(count):
+            open_ = close
+            close = min(0.99, max(0.01, open_ + rng.uniform(-0.02, 0.02)))
+            candles.append({
+                "timestamp": now - (count - 1 - i) * 3_600_000,
+                "open": round(open_, 4),
+                "high": round(max(open_, close) + rng.uniform(0, 0.01), 4),
+                "low": round(min(open_, close) - rng.uniform(0, 0.01), 4),
+                "close": round(close, 4),
+                "volume": round(rng.uniform(0, 10_000), 2),
+            })
+        return candles
+
+
+class _Handler(BaseHTTPRequestHandler):
+    sidecar: FakeSidecar
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send(200, {"status": "ok", "timestamp": int(time.time() * 1000)})
+        else:
+            self._send(404, {"success": False, "error": f"Cannot GET {self.path}"})
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        parts = self.path.strip("/").split("/")
+        sidecar = self.sidecar
+        if sidecar.access_token is not None and self.headers.get(ACCESS_TOKEN_HEADER) != sidecar.access_token:
+            self._send(401, {"success": False, "error": "Unauthorized: Invalid or missing access token"})
+            return
+        try:
+            body = json.loads(raw) if raw else {}
+            if len(parts) == 2 and parts[0] == "session":
+                data = sidecar.open_session(parts[1].lower(), body)
+            elif len(parts) == 3 and parts[0] == "api":
+                data = sidecar.handle(parts[1].lower(), parts[2], body, self.headers)
+            else:
+                self._send(404, {"success": False, "error": f"Cannot POST {self.path}"})
+                return
+        except _Reply as reply:
+            self._send(reply.status, {"success": False, "error": reply.error})
+            return
+        except ConnectionAbortedError:
+            self.close_connection = True
+            return
+        except ValueError as e:
+            self._send(400, {"success": False, "error": {"message": str(e), "code": "BAD_REQUEST"}})
+            return
+        self._send(200, {"success": True, "data": data})
+
+    def _send(self, status: int, payload: Dict[str, Any]) -> None:
+        content_type, body = "application/json", None
+        if MSGPACK_CONTENT_TYPE in (self.headers.get("Accept") or ""):
+            try:
+                import msgpack
+            except ImportError:
+                pass  # Answer in JSON; the client decodes by Content-Type
+            else:
+                content_type, body = MSGPACK_CONTENT_TYPE, msgpack.packb(payload)
+        if body is None:
+            body = json.dumps(payload).encode("utf-8")
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        if len(body) >= _COMPRESSION_THRESHOLD and "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            body = gzip.compress(body, compresslevel=1)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
@@ -0,0 +1,331 @@
+"""
+Rolling trade statistics.
+
+Recomputing VWAP, volume and buy/sell imbalance from lists of trades on
+every ``watch_trades`` update costs time proportional to the window. A
+``TradeBuffer`` keeps an outcome's recent trades in fixed-capacity arrays
+(a ring buffer) and maintains running sums for a set of windows, each
+updated in O(1) amortized time per trade:
+
+- time windows (``windows=``, seconds): trades in the last N seconds
+- count windows (``counts=``, trades): the last N trades
+
+Windows cannot reach further back than the buffer's ``capacity`` trades;
+``stats.saturated`` says when a time window was cut short by it. Other
+windows can still be queried by scanning the buffer.
+
+Example:
+    >>> tracker = pmxt.TradeTracker(poly, windows=(60, 300), counts=(50,))
+    >>> tracker.track(outcome_id)
+    >>> stats = tracker[outcome_id].window(60)
+    >>> print(stats.vwap, stats.volume, stats.imbalance)
+    >>> tracker[outcome_id].last(50).vwap
+"""
+
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Set
+
+from .models import Trade
+
+if TYPE_CHECKING:
+    from .client import Exchange
+
+
+_SIGNS = {"buy": 1.0, "sell": -1.0}
+
+
+@dataclass
+class TradeWindowStats:
+    """Aggregates of the trades in one window."""
+
+    trades: int = 0
+    """Number of trades"""
+
+    volume: float = 0.0
+    """Contracts traded"""
+
+    notional: float = 0.0
+    """Sum of price x amount"""
+
+    buy_volume: float = 0.0
+    """Contracts traded on buy-side trades"""
+
+    sell_volume: float = 0.0
+    """Contracts traded on sell-side trades (trades of unknown side count in neither)"""
+
+    saturated: bool = False
+    """Whether the window reaches past the oldest buffered trade"""
+
+    @property
+    def vwap(self) -> Optional[float]:
+        """Volume-weighted average price, or None without volume."""
+        return self.notional / self.volume if self.volume > 0 else None
+
+    @property
+    def signed_flow(self) -> float:
+        """Buy volume minus sell volume."""
+        return self.buy_volume - self.sell_volume
+
+    @property
+    def imbalance(self) -> Optional[float]:
+        """Signed flow as a fraction of volume (-1 to 1), or None without volume."""
+        return self.signed_flow / self.volume if self.volume > 0 else None
+
+
+class _Window:
+    """Running sums over trades ``start`` (an absolute trade number) onwards."""
+
+    __slots__ = ("start", "trades", "volume", "notional", "buy_volume", "sell_volume", "cut")
+
+    def __init__(self) -> None:
+        self.start = 0
+        self.cut = False  # Lost trades to the ring's capacity rather than expiry
+        self.reset()
+
+    def reset(self) -> None:
+        self.trades = 0
+        self.volume = self.notional = self.buy_volume = self.sell_volume = 0.0
+
+    def add(self, price: float, amount: float, sign: float, factor: float) -> None:
+        self.trades += 1 if factor > 0 else -1
+        self.volume += factor * amount
+        self.notional += factor * price * amount
+        if sign > 0:
+            self.buy_volume += factor * amount
+        elif sign < 0:
+            self.sell_volume += factor * amount
+
+    def snapshot(self) -> TradeWindowStats:
+        return TradeWindowStats(
+            trades=self.trades,
+            volume=self.volume,
+            notional=self.notional,
+            buy_volume=self.buy_volume,
+            sell_volume=self.sell_volume,
+            saturated=self.cut,
+        )
+
+
+class TradeBuffer:
+    """
+    Fixed-capacity trade history of one outcome with rolling aggregates.
+
+    Trades are expected roughly in time order, as ``watch_trades`` delivers
+    them; repeated trade IDs are ignored.
+
+    Args:
+        capacity: Trades kept; older ones are overwritten
+        windows: Time windows (seconds) maintained incrementally
+        counts: Count windows (trades) maintained incrementally
+    """
+
+    def __init__(self, capacity: int = 10_000, windows: Sequence[float] = (60.0,), counts: Sequence[int] = ()):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if any(n < 1 or n > capacity for n in counts):
+            raise ValueError("count windows must be between 1 and capacity")
+        self.capacity = capacity
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._prices = array("d", bytes(8 * capacity))
+        self._amounts = array("d", bytes(8 * capacity))
+        self._signs = array("d", bytes(8 * capacity))
+        self._ids: List[Optional[str]] = [None] * capacity
+        self._seen: Dict[str, int] = {}  # trade ID -> trade number, for buffered trades
+        self._total = 0  # Trades ingested; trade n lives at slot n % capacity
+        self._windows = {float(seconds): _Window() for seconds in windows}
+        self._counts = {int(n): _Window() for n in counts}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return min(self._total, self.capacity)
+
+    @property
+    def _oldest(self) -> int:
+        return max(0, self._total - self.capacity)
+
+    def add(self, trades: Iterable[Trade]) -> int:
+        """
+        Ingest trades.
+
+        Returns:
+            Number of new trades (repeats are skipped)
+        """
+        added = 0
+        with self._lock:
+            for trade in trades:
+                if trade.id is not None and trade.id in self._seen:
+                    continue
+                self._append(trade)
+                added += 1
+            if added:
+                newest = self._timestamps[(self._total - 1) % self.capacity]
+                for seconds, window in self._windows.items():
+                    self._expire(window, newest - seconds * 1000)
+        return added
+
+    def _append(self, trade: Trade) -> None:
+        number = self._total
+        slot = number % self.capacity
+        if number >= self.capacity:
+            # Overwriting the oldest trade: it leaves every window still holding it
+            evicted = self._ids[slot]
+            if evicted is not None:
+                self._seen.pop(evicted, None)
+            for window in self._windows.values():
+                if window.start <= number - self.capacity:
+                    self._drop_oldest(window)
+                    window.cut = True
+            for window in self._counts.values():
+                if window.start <= number - self.capacity:
+                    self._drop_oldest(window)
+
+        price, amount = float(trade.price), float(trade.amount)
+        sign = _SIGNS.get(trade.side, 0.0)
+        self._timestamps[slot] = float(trade.timestamp)
+        self._prices[slot] = price
+        self._amounts[slot] = amount
+        self._signs[slot] = sign
+        self._ids[slot] = trade.id
+        if trade.id is not None:
+            self._seen[trade.id] = number
+        self._total += 1
+
+        for window in self._windows.values():
+            window.add(price, amount, sign, 1.0)
+        for n, window in self._counts.items():
+            window.add(price, amount, sign, 1.0)
+            if window.trades > n:
+                self._drop_oldest(window)
+
+    def _drop_oldest(self, window: _Window) -> None:
+        slot = window.start % self.capacity
+        window.add(self._prices[slot], self._amounts[slot], self._signs[slot], -1.0)
+        window.start += 1
+        if window.trades == 0:
+            window.reset()  # Clear accumulated rounding error
+
+    def _expire(self, window: _Window, cutoff: float) -> None:
+        while window.start < self._total and self._timestamps[window.start % self.capacity] < cutoff:
+            self._drop_oldest(window)
+            window.cut = False
+
+    def window(self, seconds: float, now: Optional[float] = None) -> TradeWindowStats:
+        """
+        Aggregates of the trades in the last ``seconds``.
+
+        Configured windows are answered from running sums; others by
+        scanning the buffer.
+
+        Args:
+            seconds: Window length
+            now: Window end as a Unix timestamp in seconds (default: now)
+        """
+        cutoff = ((time.time() if now is None else now) - seconds) * 1000
+        with self._lock:
+            window = self._windows.get(float(seconds))
+            if window is not None:
+                self._expire(window, cutoff)
+                return window.snapshot()
+            start = self._total
+            while start > self._oldest and self._timestamps[(start - 1) % self.capacity] >= cutoff:
+                start -= 1
+            stats = self._scan(start)
+            stats.saturated = start == self._oldest and self._total > self.capacity
+            return stats
+
+    def last(self, count: int) -> TradeWindowStats:
+        """Aggregates of the last ``count`` trades (at most ``capacity``)."""
+        with self._lock:
+            window = self._counts.get(count)
+            if window is not None:
+                return window.snapshot()
+            stats = self._scan(max(self._oldest, self._total - count))
+            stats.saturated = count > self.capacity and self._total > self.capacity
+            return stats
+
+    def _scan(self, start: int) -> TradeWindowStats:
+        window = _Window()
+        for number in range(start, self._total):
+            slot = number % self.capacity
+            window.add(self._prices[slot], self._amounts[slot], self._signs[slot], 1.0)
+        return window.snapshot()
+
+    def last_prices(self, count: int) -> List[float]:
+        """Prices of the last ``count`` trades, oldest first."""
+        with self._lock:
+            start = max(self._oldest, self._total - count)
+            return [self._prices[n % self.capacity] for n in range(start, self._total)]
+
+    def last_price(self) -> Optional[float]:
+        with self._lock:
+            return self._prices[(self._total - 1) % self.capacity] if self._total else None
+
+
+class TradeTracker:
+    """
+    Feeds one TradeBuffer per outcome from ``watch_trades`` in the background.
+
+    Args:
+        exchange: Exchange client used for ``watch_trades``
+        **buffer_options: TradeBuffer arguments (capacity, windows, counts)
+    """
+
+    def __init__(self, exchange: "Exchange", **buffer_options):
+        self._exchange = exchange
+        self._buffer_options = buffer_options
+        self._buffers: Dict[str, TradeBuffer] = {}
+        self._stopped: Dict[str, threading.Event] = {}
+        self.errors: Dict[str, BaseException] = {}
+        """Last watch error per outcome ID (cleared by the next update)"""
+
+        self.ended: Set[str] = set()
+        """Outcome IDs whose feed ended (``watch_trades`` raised EOFError, e.g. a finished Replay)"""
+
+    def track(self, outcome_id: str) -> TradeBuffer:
+        """Start watching an outcome's trades (no-op if already tracked)."""
+        if outcome_id not in self._buffers:
+            self._buffers[outcome_id] = TradeBuffer(**self._buffer_options)
+            self._stopped[outcome_id] = threading.Event()
+            threading.Thread(
+                target=self._watch, args=(outcome_id,), name="pmxt-trade-tracker", daemon=True
+            ).start()
+        return self._buffers[outcome_id]
+
+    def untrack(self, outcome_id: str) -> None:
+        """Stop watching an outcome; its buffer is discarded."""
+        stopped = self._stopped.pop(outcome_id, None)
+        if stopped is not None:
+            stopped.set()
+        self._buffers.pop(outcome_id, None)
+
+    def close(self) -> None:
+        for outcome_id in list(self._buffers):
+            self.untrack(outcome_id)
+
+    def __getitem__(self, outcome_id: str) -> TradeBuffer:
+        return self._buffers[outcome_id]
+
+    def __contains__(self, outcome_id: object) -> bool:
+        return outcome_id in self._buffers
+
+    def _watch(self, outcome_id: str) -> None:
+        buffer = self._buffers[outcome_id]
+        stopped = self._stopped[outcome_id]
+        backoff = 0.0
+        while not stopped.wait(backoff):
+            try:
+                trades = self._exchange.watch_trades(outcome_id)
+            except EOFError:
+                self.ended.add(outcome_id)  # The buffer keeps what was fed
+                return
+            except Exception as e:
+                self.errors[outcome_id] = e
+                backoff = min(max(backoff * 2, 0.5), 30.0)
+                continue
+            backoff = 0.0
+            self.errors.pop(outcome_id, None)
+            if not stopped.is_set():
+                buffer.add(trades)
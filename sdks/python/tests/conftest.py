@@ -0,0 +1,28 @@
+import os
+import sys
+from unittest.mock import MagicMock
+
+import pmxt
+
+# Tests use the generated client directly; the SDK only adds it to the path
+# when the first Exchange is created.
+_GENERATED_PATH = os.path.join(os.path.dirname(__file__), "..", "generated")
+if os.path.isdir(_GENERATED_PATH) and _GENERATED_PATH not in sys.path:
+    sys.path.insert(0, _GENERATED_PATH)
+
+
+# Shared helpers for the unittest-style tests, which can't take pytest
+# fixtures as arguments: ``from .conftest import make_exchange, ok``.
+
+def ok(data):
+    """A generated-client response wrapping ``data`` in a successful envelope."""
+    response = MagicMock()
+    response.to_dict.return_value = {"success": True, "data": data}
+    return response
+
+
+def make_exchange(cls=None, **options):
+    """An exchange that never starts a sidecar, with the generated API mocked."""
+    exchange = (cls or pmxt.Polymarket)(auto_start_server=False, **options)
+    exchange._api = MagicMock()
+    return exchange
@@ -0,0 +1,85 @@
+import math
+import random
+import unittest
+
+from pmxt.book_analytics import BookAnalytics, BookAnalyticsBatch
+from pmxt.models import OrderBook, OrderLevel
+
+
+def random_book(rng):
+    bids = sorted({round(rng.uniform(0.01, 0.49), 2) for _ in range(rng.randint(0, 15))}, reverse=True)
+    asks = sorted({round(rng.uniform(0.51, 0.99), 2) for _ in range(rng.randint(0, 15))})
+    return OrderBook(
+        bids=[OrderLevel(price, rng.uniform(1, 100)) for price in bids],
+        asks=[OrderLevel(price, rng.uniform(1, 100)) for price in asks],
+    )
+
+
+def reference(book, band):
+    """Metrics by walking the levels."""
+    best_bid = max((l.price for l in book.bids), default=None)
+    best_ask = min((l.price for l in book.asks), default=None)
+    bid_depth = sum(l.size for l in book.bids if best_bid is not None and l.price >= best_bid - band - 1e-9)
+    ask_depth = sum(l.size for l in book.asks if best_ask is not None and l.price <= best_ask + band + 1e-9)
+    return best_bid, best_ask, bid_depth, ask_depth
+
+
+class TestBookAnalytics(unittest.TestCase):
+    def test_top_of_book_metrics(self):
+        analytics = BookAnalytics(tick=0.01, depth_band=0.02)
+        analytics.update(OrderBook(
+            bids=[OrderLevel(0.40, 300), OrderLevel(0.39, 50), OrderLevel(0.30, 1000)],
+            asks=[OrderLevel(0.42, 100), OrderLevel(0.45, 10)],
+            timestamp=5,
+        ))
+        self.assertEqual((analytics.best_bid, analytics.best_ask), (0.40, 0.42))
+        self.assertEqual(analytics.spread, 0.02)
+        self.assertAlmostEqual(analytics.mid, 0.41)
+        self.assertAlmostEqual(analytics.microprice, (0.40 * 100 + 0.42 * 300) / 400)
+        self.assertEqual(analytics.depth_within(0.02), (350, 100))
+        self.assertAlmostEqual(analytics.imbalance, (350 - 100) / 450)
+        self.assertEqual(analytics.timestamp, 5)
+
+        analytics.apply("ask", 0.42, 0)
+        self.assertEqual((analytics.best_ask, analytics.best_ask_size), (0.45, 10))
+
+    def test_empty_sides(self):
+        analytics = BookAnalytics()
+        self.assertIsNone(analytics.mid)
+        self.assertIsNone(analytics.imbalance)
+        analytics.apply("bid", 0.5, 10)
+        self.assertEqual(analytics.best_bid, 0.5)
+        self.assertIsNone(analytics.spread)
+        self.assertEqual(analytics.imbalance, 1.0)
+        with self.assertRaises(ValueError):
+            analytics.apply("bid", 1.5, 1)
+
+    def test_matches_full_recompute(self):
+        rng = random.Random(3)
+        analytics = BookAnalytics(tick=0.01, depth_band=0.05)
+        for _ in range(300):
+            book = random_book(rng)
+            analytics.update(book)
+            best_bid, best_ask, bid_depth, ask_depth = reference(book, 0.05)
+            self.assertEqual(analytics.best_bid, best_bid)
+            self.assertEqual(analytics.best_ask, best_ask)
+            self.assertAlmostEqual(analytics.bid_depth, bid_depth, places=6)
+            self.assertAlmostEqual(analytics.ask_depth, ask_depth, places=6)
+
+
+class TestBookAnalyticsBatch(unittest.TestCase):
+    def test_columns(self):
+        batch = BookAnalyticsBatch(tick=0.01)
+        batch.update("a", OrderBook(bids=[OrderLevel(0.4, 1)], asks=[OrderLevel(0.6, 1)]))
+        batch.update("b", OrderBook(bids=[OrderLevel(0.2, 1)], asks=[]))
+
+        columns = batch.columns()
+        self.assertEqual(columns["outcome_id"], ["a", "b"])
+        self.assertEqual(list(columns["best_bid"]), [0.4, 0.2])
+        self.assertAlmostEqual(columns["mid"][0], 0.5)
+        self.assertTrue(math.isnan(columns["mid"][1]))
+        self.assertEqual(batch["a"].spread, 0.2)
+
+
+if __name__ == '__main__':
+    unittest.main()
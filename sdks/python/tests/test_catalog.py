@@ -0,0 +1,70 @@
+import unittest
+
+from pmxt.catalog import MarketCatalog
+
+from .conftest import make_exchange, ok
+
+
+def raw(market_id, price):
+    return {"marketId": market_id, "title": market_id, "yes": {"outcomeId": market_id + "-y", "label": "Yes", "price": price}}
+
+
+class TestMarketCatalog(unittest.TestCase):
+    def setUp(self):
+        self.exchange = make_exchange()
+        self.catalog = MarketCatalog(self.exchange, limit=100)
+
+    def respond(self, cursor, full, upserts, removed=()):
+        self.exchange._api.sync_markets.return_value = ok(
+            {"cursor": cursor, "full": full, "upserts": upserts, "removed": list(removed)}
+        )
+
+    def sent_args(self):
+        return self.exchange._api.sync_markets.call_args.kwargs["sync_markets_request"].to_dict()["args"]
+
+    def test_applies_deltas(self):
+        self.respond("c1", True, [raw("a", 0.1), raw("b", 0.2)])
+        diff = self.catalog.sync()
+        self.assertEqual(self.sent_args(), [{"limit": 100}])
+        self.assertTrue(diff.full)
+        self.assertEqual([m.market_id for m in diff.added], ["a", "b"])
+
+        self.respond("c2", False, [raw("b", 0.3), raw("c", 0.5)], removed=["a"])
+        diff = self.catalog.sync()
+        self.assertEqual(self.sent_args(), [{"limit": 100}, "c1"])
+        self.assertEqual([m.market_id for m in diff.added], ["c"])
+        self.assertEqual([m.market_id for m in diff.updated], ["b"])
+        self.assertEqual([m.market_id for m in diff.removed], ["a"])
+        self.assertEqual(sorted(m.market_id for m in self.catalog), ["b", "c"])
+        self.assertEqual(self.catalog["b"].yes.price, 0.3)
+        self.assertNotIn("a", self.catalog)
+
+    def test_reconciles_full_snapshot(self):
+        self.respond("c1", True, [raw("a", 0.1), raw("b", 0.2)])
+        self.catalog.sync()
+
+        # Sidecar lost the cursor: the full snapshot is diffed locally
+        self.respond("c2", True, [raw("a", 0.1), raw("c", 0.4)])
+        diff = self.catalog.sync()
+        self.assertEqual([m.market_id for m in diff.added], ["c"])
+        self.assertEqual(diff.updated, [])
+        self.assertEqual([m.market_id for m in diff.removed], ["b"])
+        self.assertEqual(len(self.catalog), 2)
+
+    def test_subscribers_get_non_empty_diffs(self):
+        seen = []
+        self.catalog.subscribe(seen.append)
+        self.respond("c1", True, [raw("a", 0.1)])
+        self.catalog.sync()
+        self.respond("c2", False, [])
+        self.assertFalse(self.catalog.sync())
+        self.assertEqual(len(seen), 1)
+
+        self.catalog.unsubscribe(seen.append)
+        self.respond("c3", False, [raw("b", 0.2)])
+        self.catalog.sync()
+        self.assertEqual(len(seen), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,196 @@
+import threading
+import unittest
+
+import pmxt
+from pmxt.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from pmxt.errors import CircuitOpen, ExchangeNotAvailable, MarketNotFound
+
+from .conftest import make_exchange, ok
+
+KEY = "polymarket.fetch_order_book"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def trip(breaker, calls=4):
+    for _ in range(calls):
+        breaker.allow(KEY)
+        breaker.record(KEY, failed=True, latency=0.01)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.changes = []
+        self.breaker = CircuitBreaker(
+            failure_rate=0.5,
+            window=4,
+            min_calls=4,
+            open_duration=10.0,
+            clock=self.clock,
+            on_state_change=lambda *change: self.changes.append(change),
+        )
+
+    def test_stays_closed_below_min_calls(self):
+        trip(self.breaker, calls=3)
+        self.assertEqual(self.breaker.state(KEY), CLOSED)
+
+    def test_opens_on_error_rate_and_fails_fast(self):
+        trip(self.breaker)
+        self.assertEqual(self.breaker.state(KEY), OPEN)
+        self.assertEqual(self.changes, [(KEY, CLOSED, OPEN)])
+
+        self.clock.now = 4.0
+        with self.assertRaises(CircuitOpen) as ctx:
+            self.breaker.allow(KEY)
+        self.assertAlmostEqual(ctx.exception.retry_after, 6.0)
+        self.assertTrue(ctx.exception.retryable)
+
+    def test_circuits_are_independent(self):
+        trip(self.breaker)
+        self.breaker.allow("polymarket.fetch_markets")
+        self.breaker.allow("kalshi.fetch_order_book")
+
+    def test_half_open_success_closes(self):
+        trip(self.breaker)
+        self.clock.now = 10.0
+
+        self.breaker.allow(KEY)
+        self.assertEqual(self.breaker.state(KEY), HALF_OPEN)
+        with self.assertRaises(CircuitOpen):
+            self.breaker.allow(KEY)  # Only one trial call at a time
+
+        self.breaker.record(KEY, failed=False, latency=0.01)
+        self.assertEqual(self.breaker.state(KEY), CLOSED)
+        self.assertEqual(self.breaker.states()[KEY].calls, 0)
+
+    def test_half_open_needs_every_trial_call(self):
+        breaker = CircuitBreaker(failure_rate=0.5, window=4, min_calls=4, half_open_calls=3, clock=self.clock)
+        trip(breaker)
+        self.clock.now = 30.0
+
+        for _ in range(3):
+            breaker.allow(KEY)
+        with self.assertRaises(CircuitOpen):
+            breaker.allow(KEY)
+        for _ in range(2):
+            breaker.record(KEY, failed=False, latency=0.01)
+            self.assertEqual(breaker.state(KEY), HALF_OPEN)
+        breaker.record(KEY, failed=False, latency=0.01)
+        self.assertEqual(breaker.state(KEY), CLOSED)
+
+    def test_half_open_failure_reopens(self):
+        trip(self.breaker)
+        self.clock.now = 10.0
+        self.breaker.allow(KEY)
+        self.breaker.record(KEY, failed=True, latency=0.01)
+
+        self.assertEqual(self.breaker.state(KEY), OPEN)
+        self.assertEqual(self.breaker.states()[KEY].times_opened, 2)
+        self.assertEqual(self.breaker.states()[KEY].opened_at, 10.0)
+
+    def test_opens_on_slow_calls(self):
+        breaker = CircuitBreaker(
+            slow_call_duration=1.0, slow_call_rate=0.75, window=4, min_calls=4, clock=self.clock
+        )
+        for latency in (2.0, 2.0, 0.1, 2.0):
+            breaker.allow(KEY)
+            breaker.record(KEY, failed=False, latency=latency)
+        self.assertEqual(breaker.state(KEY), OPEN)
+
+    def test_states_snapshot(self):
+        self.breaker.allow(KEY)
+        self.breaker.record(KEY, failed=True, latency=0.01)
+        self.breaker.allow(KEY)
+        self.breaker.record(KEY, failed=False, latency=0.01)
+
+        stats = self.breaker.states()[KEY]
+        self.assertEqual((stats.state, stats.calls, stats.failures), (CLOSED, 2, 1))
+        self.assertEqual(stats.failure_rate, 0.5)
+
+
+class TestExchangeCircuitBreaker(unittest.TestCase):
+    def make_exchange(self, **kwargs):
+        breaker = CircuitBreaker(failure_rate=0.5, window=2, min_calls=2, **kwargs)
+        return make_exchange(circuit_breaker=breaker), breaker
+
+    def test_fails_fast_without_calling_sidecar(self):
+        exchange, breaker = self.make_exchange()
+        exchange._api.fetch_order_book.side_effect = ExchangeNotAvailable("down")
+
+        for _ in range(2):
+            with self.assertRaises(ExchangeNotAvailable):
+                exchange.fetch_order_book("x")
+        with self.assertRaises(CircuitOpen):
+            exchange.fetch_order_book("x")
+        self.assertEqual(exchange._api.fetch_order_book.call_count, 2)
+        self.assertEqual(breaker.state(KEY), OPEN)
+
+    def test_client_errors_do_not_trip(self):
+        exchange, breaker = self.make_exchange()
+        exchange._api.fetch_order_book.side_effect = MarketNotFound("no such market")
+
+        for _ in range(3):
+            with self.assertRaises(MarketNotFound):
+                exchange.fetch_order_book("x")
+        self.assertEqual(breaker.state(KEY), CLOSED)
+
+    def test_serves_last_good_read_while_open(self):
+        exchange, _ = self.make_exchange(serve_stale=True)
+        book = {"bids": [{"price": 0.4, "size": 10}], "asks": []}
+        exchange._api.fetch_order_book.side_effect = [ok(book), ExchangeNotAvailable("down")]
+
+        exchange.fetch_order_book("x")
+        with self.assertRaises(ExchangeNotAvailable):
+            exchange.fetch_order_book("x")  # 1 of 2 failed: circuit opens
+
+        stale = exchange.fetch_order_book("x")
+        self.assertEqual(stale.bids[0].price, 0.4)
+        self.assertEqual(exchange._api.fetch_order_book.call_count, 2)
+
+        # Nothing cached for a different outcome
+        with self.assertRaises(CircuitOpen):
+            exchange.fetch_order_book("y")
+
+    def test_stale_cache_is_keyed_without_credentials(self):
+        breaker = CircuitBreaker(failure_rate=0.5, min_calls=2, serve_stale=True)
+        exchange = make_exchange(
+            pmxt.Kalshi, api_key="key", private_key="secret", use_sessions=False, circuit_breaker=breaker
+        )
+        exchange._api.fetch_markets.return_value = ok([])
+
+        exchange.fetch_markets()
+        request = exchange._api.fetch_markets.call_args.kwargs["fetch_markets_request"]
+        self.assertIn("credentials", request.to_dict())  # Sent, but not kept
+        self.assertEqual(len(exchange._stale_responses), 1)
+        self.assertNotIn("secret", next(iter(exchange._stale_responses)))
+
+    def test_stale_cache_is_safe_across_threads(self):
+        exchange, _ = self.make_exchange(serve_stale=True)
+        exchange._api.fetch_order_book.return_value = ok({"bids": [], "asks": []})
+        errors = []
+
+        def fetch(thread):
+            try:
+                for n in range(400):
+                    exchange.fetch_order_book(f"{thread}-{n}")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=fetch, args=(t,)) for t in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(exchange._stale_responses), 256)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from unittest.mock import patch
+
+import pmxt
+from pmxt.compression import accept_encoding
+
+ALL = ("zstd", "br", "gzip")
+
+
+@patch("pmxt.compression.supported_encodings", return_value=ALL)
+class TestAcceptEncoding(unittest.TestCase):
+    def test_off_by_default(self, _):
+        self.assertIsNone(accept_encoding(False))
+
+    def test_true_offers_everything_decodable(self, supported):
+        self.assertEqual(accept_encoding(True), "zstd;q=1.0, br;q=0.9, gzip;q=0.8")
+        supported.return_value = ("gzip",)
+        self.assertEqual(accept_encoding(True), "gzip;q=1.0")
+
+    def test_explicit_order(self, _):
+        self.assertEqual(accept_encoding("gzip"), "gzip;q=1.0")
+        self.assertEqual(accept_encoding(["gzip", "br"]), "gzip;q=1.0, br;q=0.9")
+
+    def test_rejects_unknown_or_undecodable(self, supported):
+        with self.assertRaises(ValueError):
+            accept_encoding("deflate")
+        supported.return_value = ("gzip",)
+        with self.assertRaisesRegex(ValueError, "zstandard"):
+            accept_encoding("zstd")
+
+
+class TestExchangeCompression(unittest.TestCase):
+    def test_header_sent_only_when_enabled(self):
+        plain = pmxt.Polymarket(auto_start_server=False)
+        self.assertNotIn("Accept-Encoding", plain._api_client.default_headers)
+
+        with patch("pmxt.compression.supported_encodings", return_value=ALL):
+            compressed = pmxt.Polymarket(auto_start_server=False, compression="br")
+        self.assertEqual(compressed._api_client.default_headers["Accept-Encoding"], "br;q=1.0")
+
+
+if __name__ == '__main__':
+    unittest.main()
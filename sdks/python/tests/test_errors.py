@@ -0,0 +1,165 @@
+import json
+import unittest
+from unittest.mock import MagicMock
+
+from pmxt.errors import (
+    PmxtError,
+    BadRequest,
+    RateLimitExceeded,
+    ExchangeNotAvailable,
+    MarketNotFound,
+    error_from_detail,
+)
+from pmxt.rate_limiter import RateLimit, RateLimiter
+from pmxt.retry import RetryPolicy
+from pmxt_internal.exceptions import ApiException
+
+from .conftest import make_exchange, ok
+
+
+def api_exception(status, error):
+    return ApiException(status=status, reason="error", body=json.dumps({"success": False, "error": error}))
+
+
+class TestErrorFromDetail(unittest.TestCase):
+    def test_maps_code_to_subclass(self):
+        error = error_from_detail(
+            {"message": "Slow down", "code": "RATE_LIMIT_EXCEEDED", "retryable": True, "retryAfter": 2},
+            status=429,
+            prefix="Failed to fetch markets",
+        )
+        self.assertIsInstance(error, RateLimitExceeded)
+        self.assertIsInstance(error, PmxtError)
+        self.assertEqual(str(error), "Failed to fetch markets: Slow down")
+        self.assertEqual(error.code, "RATE_LIMIT_EXCEEDED")
+        self.assertTrue(error.retryable)
+        self.assertEqual(error.retry_after, 2.0)
+
+    def test_falls_back_to_status(self):
+        error = error_from_detail({"message": "Bad gateway"}, status=503)
+        self.assertIsInstance(error, ExchangeNotAvailable)
+        self.assertTrue(error.retryable)
+
+    def test_plain_string_detail(self):
+        error = error_from_detail("Unauthorized", status=None)
+        self.assertIs(type(error), PmxtError)
+        self.assertFalse(error.retryable)
+        self.assertEqual(error.message, "Unauthorized")
+
+    def test_sidecar_retryable_flag_wins(self):
+        error = error_from_detail({"message": "nope", "code": "MARKET_NOT_FOUND", "retryable": False}, 404)
+        self.assertIsInstance(error, MarketNotFound)
+        self.assertFalse(error.retryable)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def setUp(self):
+        self.sleeps = []
+        self.now = 0.0
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def run_policy(self, policy, call):
+        return policy.run(call, classify=lambda e: e, clock=self.clock, sleep=self.sleep)
+
+    def test_retries_retryable_errors(self):
+        results = [ExchangeNotAvailable("down"), ExchangeNotAvailable("down"), "ok"]
+
+        def call():
+            r = results.pop(0)
+            if isinstance(r, Exception):
+                raise r
+            return r
+
+        policy = RetryPolicy(max_attempts=3, base_delay=0.1, jitter=0)
+        self.assertEqual(self.run_policy(policy, call), "ok")
+        self.assertEqual(self.sleeps, [0.1, 0.2])
+
+    def test_does_not_retry_client_errors(self):
+        call = MagicMock(side_effect=BadRequest("bad"))
+        with self.assertRaises(BadRequest):
+            self.run_policy(RetryPolicy(), call)
+        self.assertEqual(call.call_count, 1)
+
+    def test_honors_retry_after(self):
+        call = MagicMock(side_effect=[RateLimitExceeded("slow", retry_after=1.5), "ok"])
+        self.assertEqual(self.run_policy(RetryPolicy(base_delay=0.1), call), "ok")
+        self.assertEqual(self.sleeps, [1.5])
+
+    def test_gives_up_at_max_attempts(self):
+        call = MagicMock(side_effect=ExchangeNotAvailable("down"))
+        with self.assertRaises(ExchangeNotAvailable):
+            self.run_policy(RetryPolicy(max_attempts=4, jitter=0), call)
+        self.assertEqual(call.call_count, 4)
+
+    def test_deadline_stops_retries(self):
+        call = MagicMock(side_effect=ExchangeNotAvailable("down"))
+        policy = RetryPolicy(max_attempts=10, base_delay=1.0, jitter=0, deadline=2.5)
+        with self.assertRaises(ExchangeNotAvailable):
+            self.run_policy(policy, call)
+        # Slept 1.0, then 2.0 would overrun the 2.5s budget
+        self.assertEqual(self.sleeps, [1.0])
+        self.assertEqual(call.call_count, 2)
+
+    def test_jitter_stays_within_bounds(self):
+        policy = RetryPolicy(base_delay=1.0, jitter=0.5)
+        for _ in range(100):
+            self.assertTrue(0.5 <= policy.backoff(1) <= 1.0)
+
+
+class TestExchangeErrors(unittest.TestCase):
+    def test_raises_typed_error(self):
+        exchange = make_exchange()
+        exchange._api.fetch_order_book.side_effect = api_exception(
+            404, {"message": "Market not found: x", "code": "MARKET_NOT_FOUND", "retryable": False}
+        )
+
+        with self.assertRaises(MarketNotFound) as ctx:
+            exchange.fetch_order_book("x")
+        self.assertEqual(str(ctx.exception), "Failed to fetch order book: Market not found: x")
+        self.assertEqual(ctx.exception.status, 404)
+
+    def test_retries_idempotent_calls(self):
+        exchange = make_exchange(retry_policy=RetryPolicy(base_delay=0, jitter=0))
+        exchange._api.fetch_order_book.side_effect = [
+            api_exception(503, {"message": "down", "code": "EXCHANGE_NOT_AVAILABLE", "retryable": True}),
+            ok({"bids": [], "asks": []}),
+        ]
+
+        book = exchange.fetch_order_book("x")
+        self.assertEqual(book.bids, [])
+        self.assertEqual(exchange._api.fetch_order_book.call_count, 2)
+
+    def test_never_retries_order_placement(self):
+        exchange = make_exchange(retry_policy=RetryPolicy(base_delay=0))
+        exchange._api.create_order.side_effect = api_exception(
+            503, {"message": "down", "code": "EXCHANGE_NOT_AVAILABLE", "retryable": True}
+        )
+
+        with self.assertRaises(ExchangeNotAvailable):
+            exchange.create_order("m", "o", "buy", "limit", 1, price=0.5)
+        self.assertEqual(exchange._api.create_order.call_count, 1)
+
+    def test_rate_limit_pauses_shared_limiter(self):
+        limiter = RateLimiter(default=RateLimit(rate=100, burst=100))
+        limiter.pause = MagicMock()
+        exchange = make_exchange(
+            rate_limiter=limiter,
+            retry_policy=RetryPolicy(base_delay=0, jitter=0),
+        )
+        exchange._api.fetch_markets.side_effect = [
+            api_exception(429, {"message": "slow", "code": "RATE_LIMIT_EXCEEDED", "retryAfter": 0.01}),
+            ok([]),
+        ]
+
+        self.assertEqual(exchange.fetch_markets(), [])
+        limiter.pause.assert_called_once_with("polymarket", "fetch_markets", 0.01)
+
+
+if __name__ == '__main__':
+    unittest.main()
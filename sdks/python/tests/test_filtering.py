@@ -8,7 +8,8 @@ from pmxt.models import (
 
 @pytest.fixture
 def api():
-    return Polymarket()
+    # filter_markets runs locally: no sidecar needed
+    return Polymarket(auto_start_server=False)
 
 @pytest.fixture
 def mock_markets():
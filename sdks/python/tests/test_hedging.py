@@ -0,0 +1,182 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from pmxt.hedging import HedgePolicy
+
+from .conftest import make_exchange, ok
+
+KEY = "polymarket.fetch_order_book"
+
+
+def warm_up(policy, latency=0.001, samples=20):
+    for _ in range(samples):
+        policy._record(KEY, latency)
+
+
+class TestHedgePolicy(unittest.TestCase):
+    def test_no_hedging_until_warmed_up(self):
+        policy = HedgePolicy(min_samples=5)
+        self.assertIsNone(policy.delay(KEY))
+
+        for _ in range(4):
+            self.assertEqual(policy.run(KEY, lambda: "ok"), "ok")
+        self.assertIsNone(policy.delay(KEY))
+        self.assertEqual(policy.run(KEY, lambda: "ok"), "ok")
+        self.assertIsNotNone(policy.delay(KEY))
+        self.assertEqual(policy.stats()[KEY].hedged, 0)
+
+    def test_delay_tracks_percentile(self):
+        policy = HedgePolicy(percentile=90, min_delay=0, min_samples=10)
+        for i in range(1, 101):
+            policy._record(KEY, i / 1000)
+        self.assertAlmostEqual(policy.delay(KEY), 0.091)
+
+    def test_slow_primary_is_hedged(self):
+        policy = HedgePolicy(min_delay=0.01, max_extra_load=1.0)
+        warm_up(policy)
+        calls = []
+        lock = threading.Lock()
+
+        def call():
+            with lock:
+                calls.append(None)
+                n = len(calls)
+            if n == 1:
+                time.sleep(0.5)  # Stuck primary
+                return "primary"
+            return "hedge"
+
+        start = time.monotonic()
+        self.assertEqual(policy.run(KEY, call), "hedge")
+        self.assertLess(time.monotonic() - start, 0.4)
+
+        stats = policy.stats()[KEY]
+        self.assertEqual((stats.requests, stats.hedged, stats.hedge_wins), (1, 1, 1))
+        self.assertEqual(stats.hedge_rate, 1.0)
+        self.assertEqual(stats.win_rate, 1.0)
+
+    def test_fast_primary_is_not_hedged(self):
+        policy = HedgePolicy(min_delay=0.2, max_extra_load=1.0)
+        warm_up(policy)
+
+        self.assertEqual(policy.run(KEY, lambda: "primary"), "primary")
+        self.assertEqual(policy.stats()[KEY].hedged, 0)
+
+    def test_extra_load_is_capped(self):
+        policy = HedgePolicy(min_delay=0.001, max_extra_load=0.25)
+        warm_up(policy)
+        policy._credits = 0.0
+
+        def slow():
+            time.sleep(0.01)
+            return "ok"
+
+        for _ in range(8):
+            policy.run(KEY, slow)
+
+        # 8 calls * 0.25 credits = at most 2 hedges
+        self.assertLessEqual(policy.stats()[KEY].hedged, 2)
+
+    def test_failed_attempt_falls_back_to_other(self):
+        policy = HedgePolicy(min_delay=0.01, max_extra_load=1.0)
+        warm_up(policy)
+        results = iter([ValueError("primary failed"), "hedge"])
+
+        def call():
+            r = next(results)
+            if isinstance(r, Exception):
+                time.sleep(0.05)
+                raise r
+            return r
+
+        self.assertEqual(policy.run(KEY, call), "hedge")
+
+    def test_all_attempts_failing_raises_primary_error(self):
+        policy = HedgePolicy(min_delay=0.01, max_extra_load=1.0)
+        warm_up(policy)
+        errors = iter([ValueError("primary"), ValueError("hedge")])
+
+        def call():
+            error = next(errors)
+            time.sleep(0.05)
+            raise error
+
+        with self.assertRaisesRegex(ValueError, "primary"):
+            policy.run(KEY, call)
+
+    def test_unhedged_calls_run_on_the_callers_thread(self):
+        policy = HedgePolicy(min_samples=5)
+        self.assertIs(policy.run(KEY, threading.current_thread), threading.current_thread())
+
+        warm_up(policy)
+        policy._credits = -10.0  # Out of budget
+        self.assertIs(policy.run(KEY, threading.current_thread), threading.current_thread())
+
+    def test_concurrent_calls_are_not_capped(self):
+        for warm in (False, True):
+            policy = HedgePolicy(max_workers=2)
+            if warm:
+                warm_up(policy, latency=5.0)  # Hedge-eligible, but never slow enough
+            barrier = threading.Barrier(8, timeout=2)
+            errors = []
+
+            def call():
+                try:
+                    policy.run(KEY, barrier.wait)
+                except threading.BrokenBarrierError as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=call) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(errors, [])
+
+    def test_hedges_are_skipped_not_queued_when_busy(self):
+        policy = HedgePolicy(min_delay=0.01, max_extra_load=1.0, max_workers=1)
+        warm_up(policy)
+        release = threading.Event()
+        self.addCleanup(release.set)
+        calls = []
+
+        def first():
+            calls.append(None)
+            if len(calls) == 1:
+                time.sleep(0.1)
+                return "primary"
+            release.wait(5)  # The hedge hangs, holding the only hedge slot
+            return "hedge"
+
+        self.assertEqual(policy.run(KEY, first), "primary")
+
+        def slow():
+            time.sleep(0.05)
+            return "second"
+
+        self.assertEqual(policy.run(KEY, slow), "second")
+        self.assertEqual(policy.stats()[KEY].hedged, 1)
+        release.set()
+
+
+class TestExchangeHedging(unittest.TestCase):
+    def test_only_market_data_reads_are_hedged(self):
+        policy = HedgePolicy()
+        policy.run = MagicMock(side_effect=lambda key, call: call())
+        exchange = make_exchange(hedge_policy=policy)
+        response = ok({"bids": [], "asks": []})
+        exchange._api.fetch_order_book.return_value = response
+
+        exchange.fetch_order_book("x")
+        policy.run.assert_called_once()
+        self.assertEqual(policy.run.call_args[0][0], KEY)
+
+        exchange._api.create_order.return_value = response
+        exchange.create_order("m", "o", "buy", "limit", 1, price=0.5)
+        self.assertEqual(policy.run.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+import unittest
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Generous so the test is stable on loaded CI machines; a regression that
+# pulls the generated client back in costs several times this.
+IMPORT_BUDGET_US = 150_000
+
+
+def import_pmxt(code="import pmxt"):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [PACKAGE_ROOT, env.get("PYTHONPATH")]))
+    env.pop("PMXT_PRESPAWN", None)
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+
+
+def cumulative_us(importtime_log, module):
+    # Lines look like "import time:   self [us] | cumulative | module"
+    for line in importtime_log.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1])
+    raise AssertionError(f"{module} not in import log")
+
+
+class TestImportTime(unittest.TestCase):
+    def test_generated_client_is_not_imported(self):
+        result = import_pmxt(
+            "import sys, pmxt; "
+            "print(','.join(m for m in ('pmxt_internal', 'pydantic', 'pmxt.client') if m in sys.modules))"
+        )
+        self.assertEqual(result.stdout.strip(), "")
+
+    def test_import_within_budget(self):
+        result = import_pmxt()
+        self.assertLess(cumulative_us(result.stderr, "pmxt"), IMPORT_BUDGET_US)
+
+    def test_exports_resolve_on_access(self):
+        result = import_pmxt(
+            "import sys, pmxt; pmxt.CircuitBreaker; "
+            "print('pmxt.circuit_breaker' in sys.modules, 'Polymarket' in dir(pmxt))"
+        )
+        self.assertEqual(result.stdout.strip(), "True True")
+
+    def test_unknown_attribute(self):
+        import pmxt
+
+        with self.assertRaises(AttributeError):
+            pmxt.NoSuchThing
+
+
+if __name__ == '__main__':
+    unittest.main()
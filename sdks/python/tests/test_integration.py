@@ -5,22 +5,43 @@ These tests verify that the Python SDK correctly communicates with the PMXT serv
 and returns properly structured, validated data.
 
 Prerequisites:
-- PMXT server must be running (use pmxt-ensure-server)
+- PMXT server must be running (use pmxt-ensure-server), or set
+  PMXT_FAKE_SIDECAR=1 to run against pmxt.testing.FakeSidecar offline
 - No API keys required for read-only operations
 """
 
+import os
+
 import pytest
 import pmxt
 from datetime import datetime
 
 
+@pytest.fixture(scope="module")
+def sidecar():
+    """A FakeSidecar when PMXT_FAKE_SIDECAR is set, otherwise None (live server)."""
+    if not os.environ.get("PMXT_FAKE_SIDECAR"):
+        yield None
+        return
+    from pmxt.testing import FakeSidecar
+
+    with FakeSidecar(seed=0) as fake:
+        yield fake
+
+
+def make_client(cls, sidecar):
+    if sidecar is None:
+        return cls()
+    return cls(base_url=sidecar.url, auto_start_server=False)
+
+
 class TestPolymarketIntegration:
     """Test Polymarket SDK integration with live server"""
 
     @pytest.fixture
-    def client(self):
+    def client(self, sidecar):
         """Create a Polymarket client instance"""
-        return pmxt.Polymarket()
+        return make_client(pmxt.Polymarket, sidecar)
 
     def test_fetch_markets_returns_valid_structure(self, client):
         """Verify fetchMarkets returns properly structured data"""
@@ -90,9 +111,9 @@ class TestKalshiIntegration:
     """Test Kalshi SDK integration with live server"""
 
     @pytest.fixture
-    def client(self):
+    def client(self, sidecar):
         """Create a Kalshi client instance"""
-        return pmxt.Kalshi()
+        return make_client(pmxt.Kalshi, sidecar)
 
     def test_fetch_markets_returns_valid_structure(self, client):
         """Verify fetchMarkets returns properly structured data"""
@@ -122,13 +143,13 @@ class TestKalshiIntegration:
 class TestCrossExchangeConsistency:
     """Test that both exchanges return data in the same normalized format"""
 
-    def test_both_exchanges_return_same_structure(self):
+    def test_both_exchanges_return_same_structure(self, sidecar):
         """Verify Polymarket and Kalshi return identically structured data"""
         # Initialize one at a time to ensure valid tokens
-        poly = pmxt.Polymarket()
+        poly = make_client(pmxt.Polymarket, sidecar)
         poly_markets = poly.fetch_markets()
         
-        kalshi = pmxt.Kalshi()
+        kalshi = make_client(pmxt.Kalshi, sidecar)
         kalshi_markets = kalshi.fetch_markets()
         
         # Both should return lists
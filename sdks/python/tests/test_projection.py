@@ -0,0 +1,66 @@
+import unittest
+
+from pmxt.projection import event_fields, market_fields
+
+from .conftest import make_exchange, ok
+
+
+class TestFieldTranslation(unittest.TestCase):
+    def test_market_fields(self):
+        self.assertEqual(
+            market_fields(["market_id", "volume_24h", "yes.price", "outcomes.price_change_24h"]),
+            ["marketId", "volume24h", "yes.price", "outcomes.priceChange24h"],
+        )
+
+    def test_event_fields_reach_into_markets(self):
+        self.assertEqual(
+            event_fields(["id", "markets.open_interest", "markets.no.outcome_id"]),
+            ["id", "markets.openInterest", "markets.no.outcomeId"],
+        )
+
+    def test_rejects_unknown_fields(self):
+        with self.assertRaises(ValueError):
+            market_fields(["volume24h"])
+        with self.assertRaises(ValueError):
+            market_fields(["title.length"])
+        with self.assertRaises(TypeError):
+            market_fields("title")
+
+
+class TestExchangeProjection(unittest.TestCase):
+    def setUp(self):
+        self.exchange = make_exchange()
+
+    def test_fetch_markets_builds_partial_models(self):
+        self.exchange._api.fetch_markets.return_value = ok(
+            [{"marketId": "m1", "title": "Will it rain?", "volume24h": 1200.0, "yes": {"price": 0.31}}]
+        )
+
+        markets = self.exchange.fetch_markets(
+            limit=5, fields=["market_id", "title", "volume_24h", "yes.price"]
+        )
+
+        request = self.exchange._api.fetch_markets.call_args.kwargs["fetch_markets_request"]
+        self.assertEqual(
+            request.to_dict()["args"],
+            [{"limit": 5, "fields": ["marketId", "title", "volume24h", "yes.price"]}],
+        )
+        market = markets[0]
+        self.assertEqual((market.market_id, market.volume_24h, market.yes.price), ("m1", 1200.0, 0.31))
+        self.assertIsNone(market.description)
+        self.assertEqual(market.outcomes, [])
+
+    def test_fetch_events_sends_translated_fields(self):
+        self.exchange._api.fetch_events.return_value = ok(
+            [{"id": "e1", "markets": [{"marketId": "m1"}]}]
+        )
+
+        events = self.exchange.fetch_events("rain", fields=["id", "markets.market_id"])
+
+        request = self.exchange._api.fetch_events.call_args.kwargs["fetch_events_request"]
+        self.assertEqual(request.to_dict()["args"][0]["fields"], ["id", "markets.marketId"])
+        self.assertEqual(events[0].markets[0].market_id, "m1")
+
+
+if __name__ == '__main__':
+    unittest.main()
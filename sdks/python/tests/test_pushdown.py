@@ -0,0 +1,96 @@
+import unittest
+from datetime import datetime, timezone
+
+from pmxt.models import UnifiedMarket
+from pmxt.pushdown import event_criteria, market_criteria
+
+from .conftest import make_exchange, ok
+
+
+class TestCriteriaTranslation(unittest.TestCase):
+    def test_market_criteria(self):
+        translated = market_criteria({
+            "text": "rain",
+            "search_in": ["title", "tags"],
+            "volume_24h": {"min": 1000},
+            "price_change_24h": {"outcome": "yes", "max": -0.05},
+            "resolution_date": {
+                "before": datetime(2026, 1, 1, tzinfo=timezone.utc),
+                "after": datetime(2025, 6, 1),
+            },
+        })
+        self.assertEqual(translated, {
+            "text": "rain",
+            "searchIn": ["title", "tags"],
+            "volume24h": {"min": 1000},
+            "priceChange24h": {"outcome": "yes", "max": -0.05},
+            "resolutionDate": {
+                "before": "2026-01-01T00:00:00+00:00",
+                "after": "2025-06-01T00:00:00+00:00",
+            },
+        })
+
+    def test_event_criteria(self):
+        self.assertEqual(
+            event_criteria({"market_count": {"min": 5}, "total_volume": {"max": 10}}),
+            {"marketCount": {"min": 5}, "totalVolume": {"max": 10}},
+        )
+        self.assertEqual(event_criteria("Election"), "Election")
+
+    def test_rejects_what_cannot_be_pushed_down(self):
+        with self.assertRaises(TypeError):
+            market_criteria(lambda m: m.liquidity > 0)
+        with self.assertRaises(ValueError):
+            market_criteria({"volume24h": {"min": 1}})
+        with self.assertRaises(ValueError):
+            event_criteria({"liquidity": {"min": 1}})
+
+
+class TestExchangePushdown(unittest.TestCase):
+    def test_fetch_markets_sends_filter(self):
+        exchange = make_exchange()
+        exchange._api.fetch_markets.return_value = ok([{"marketId": "m1", "liquidity": 60000}])
+
+        markets = exchange.fetch_markets(
+            query="rain", filter={"liquidity": {"min": 50000}}, fields=["market_id"]
+        )
+
+        request = exchange._api.fetch_markets.call_args.kwargs["fetch_markets_request"]
+        self.assertEqual(request.to_dict()["args"], [{
+            "query": "rain",
+            "fields": ["marketId"],
+            "filter": {"liquidity": {"min": 50000}},
+        }])
+        self.assertEqual([m.market_id for m in markets], ["m1"])
+
+
+class TestFilterParity(unittest.TestCase):
+    """Criteria filter_markets matches differently from the sidecar (see core/test/unit/pushdown.test.ts)."""
+
+    def setUp(self):
+        self.exchange = make_exchange()
+        self.markets = [
+            UnifiedMarket(market_id="1", title="A", outcomes=[], volume_24h=1, liquidity=1, url="", category="Politics"),
+            UnifiedMarket(market_id="2", title="B", outcomes=[], volume_24h=1, liquidity=1, url="", category=None),
+        ]
+
+    def test_empty_text_or_category_is_not_pushed_down(self):
+        # Locally an empty category only matches markets without one
+        self.assertEqual(self.exchange.filter_markets(self.markets, {"category": ""}), [])
+        for criteria in ({"category": ""}, {"text": ""}):
+            with self.assertRaises(ValueError):
+                self.exchange.fetch_markets(filter=criteria)
+            with self.assertRaises(ValueError):
+                event_criteria(criteria)
+        self.exchange._api.fetch_markets.assert_not_called()
+
+    def test_price_bounds_need_an_outcome_to_be_pushed_down(self):
+        for criteria in ({"price": {"max": 0.3}}, {"price_change_24h": {"min": 0}}):
+            # Locally they constrain nothing
+            self.assertEqual(self.exchange.filter_markets(self.markets, criteria), self.markets)
+            with self.assertRaises(ValueError):
+                self.exchange.fetch_markets(filter=criteria)
+        self.exchange._api.fetch_markets.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+import threading
+import unittest
+
+from pmxt.rate_limiter import RateLimit, RateLimiter, TokenBucket, endpoint_class
+
+
+class FakeClock:
+    """Manually advanced monotonic clock; sleeping advances time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_queue(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=2, clock=clock)
+
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.0)
+        # Bucket is empty: callers queue in arrival order
+        self.assertAlmostEqual(bucket.reserve(), 0.5)
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+
+    def test_default_burst(self):
+        self.assertEqual(TokenBucket(rate=5).capacity, 5)
+        # Below one request per second the bucket still holds a whole token
+        self.assertEqual(TokenBucket(rate=0.2).capacity, 1)
+
+    def test_refill_is_capped_at_burst(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, burst=3, clock=clock)
+        for _ in range(3):
+            bucket.reserve()
+
+        clock.now += 100
+        for _ in range(3):
+            self.assertEqual(bucket.reserve(), 0.0)
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+
+    def test_rejects_non_positive_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_endpoint_classes(self):
+        self.assertEqual(endpoint_class("fetch_order_book"), "market_data")
+        self.assertEqual(endpoint_class("create_order"), "trading")
+        self.assertEqual(endpoint_class("fetch_balance"), "trading")
+
+    def test_unlimited_by_default(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        for _ in range(100):
+            self.assertEqual(limiter.acquire("polymarket", "fetch_markets"), 0.0)
+        self.assertEqual(clock.sleeps, [])
+
+    def test_exchange_budgets_are_independent(self):
+        clock = FakeClock()
+        limiter = RateLimiter(default=RateLimit(rate=1, burst=1), clock=clock, sleep=clock.sleep)
+
+        self.assertEqual(limiter.acquire("polymarket", "fetch_markets"), 0.0)
+        self.assertEqual(limiter.acquire("kalshi", "fetch_markets"), 0.0)
+        self.assertAlmostEqual(limiter.acquire("polymarket", "fetch_markets"), 1.0)
+
+    def test_trading_class_budget(self):
+        clock = FakeClock()
+        limiter = RateLimiter(
+            classes={"trading": RateLimit(rate=1, burst=1)},
+            clock=clock,
+            sleep=clock.sleep,
+        )
+
+        self.assertEqual(limiter.acquire("kalshi", "create_order"), 0.0)
+        # Market data is not limited by the trading budget
+        self.assertEqual(limiter.acquire("kalshi", "fetch_order_book"), 0.0)
+        self.assertAlmostEqual(limiter.acquire("kalshi", "cancel_order"), 1.0)
+
+    def test_pause_holds_back_shared_budget(self):
+        clock = FakeClock()
+        limiter = RateLimiter(default=RateLimit(rate=10, burst=10), clock=clock, sleep=clock.sleep)
+
+        limiter.pause("polymarket", "fetch_markets", 2.0)
+        self.assertAlmostEqual(limiter.acquire("polymarket", "fetch_order_book"), 2.1)
+        self.assertEqual(limiter.acquire("kalshi", "fetch_order_book"), 0.0)
+
+    def test_stats_and_wait_callback(self):
+        clock = FakeClock()
+        waits = []
+        limiter = RateLimiter(
+            exchanges={"polymarket": RateLimit(rate=4, burst=1)},
+            on_wait=lambda exchange, cls, seconds: waits.append((exchange, cls, seconds)),
+            clock=clock,
+            sleep=lambda s: None,  # Don't advance time: every later call queues
+        )
+
+        for _ in range(3):
+            limiter.acquire("polymarket", "fetch_order_book")
+
+        stats = limiter.stats()["polymarket.market_data"]
+        self.assertEqual(stats.calls, 3)
+        self.assertEqual(stats.queued, 2)
+        self.assertEqual(stats.waiting, 0)
+        self.assertAlmostEqual(stats.total_wait, 0.25 + 0.5)
+        self.assertAlmostEqual(stats.max_wait, 0.5)
+        self.assertAlmostEqual(stats.avg_wait, 0.25)
+        self.assertEqual([w[2] for w in waits], [0.0, 0.25, 0.5])
+
+    def test_concurrent_callers_queue_instead_of_failing(self):
+        limiter = RateLimiter(default=RateLimit(rate=200, burst=5))
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(5):
+                    limiter.acquire("polymarket", "fetch_markets")
+            except Exception as e:  # pragma: no cover - surfaced below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(errors, [])
+        stats = limiter.stats()["polymarket.market_data"]
+        self.assertEqual(stats.calls, 20)
+        self.assertGreaterEqual(stats.queued, 15)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+import os
+import queue
+import tempfile
+import time
+import unittest
+import uuid
+
+from pmxt.models import OrderBook, OrderLevel, Trade
+from pmxt.recording import Recorder, Replay
+from pmxt.shared_books import SharedBookFeeder, SharedBookReader
+from pmxt.streaming import OrderBookStream
+from pmxt.trades import TradeBuffer, TradeTracker
+
+
+def book(bid, ask, timestamp=None):
+    return OrderBook(bids=[OrderLevel(bid, 10.0), OrderLevel(bid - 0.01, 5.0)], asks=[OrderLevel(ask, 7.5)], timestamp=timestamp)
+
+
+class FakeExchange:
+    def __init__(self):
+        self.books = queue.Queue()
+        self.trades = queue.Queue()
+        self.other_calls = 0
+
+    def watch_order_book(self, outcome_id, limit=None, timeout=None):
+        return self.books.get()
+
+    def watch_trades(self, outcome_id, since=None, limit=None, timeout=None):
+        return self.trades.get()
+
+    def fetch_markets(self):
+        self.other_calls += 1
+        return []
+
+
+class TestRecording(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "session.rec")
+        self.exchange = FakeExchange()
+
+    def record(self, updates, gap=0.0):
+        recorder = Recorder(self.exchange, self.path)
+        for kind, outcome_id, data in updates:
+            if kind == "order_book":
+                self.exchange.books.put(data)
+                self.assertEqual(recorder.watch_order_book(outcome_id), data)
+            else:
+                self.exchange.trades.put(data)
+                self.assertEqual(recorder.watch_trades(outcome_id), data)
+            time.sleep(gap)
+        recorder.close()
+        return recorder
+
+    def test_round_trip(self):
+        trades = [
+            Trade(id="t1", timestamp=1_700_000_000_123, price=0.42, amount=3.0, side="buy"),
+            Trade(id="t2", timestamp=1_700_000_000_456, price=0.41, amount=1.5, side="unknown"),
+        ]
+        updates = [
+            ("order_book", "a", book(0.40, 0.45, 1_700_000_000_000)),
+            ("trades", "a", trades),
+            ("order_book", "b", book(0.60, 0.61)),
+            ("order_book", "a", OrderBook(bids=[], asks=[])),
+        ]
+        recorder = self.record(updates)
+        self.assertEqual(recorder.records, 4)
+
+        replay = Replay(self.path, speed=None)
+        self.assertEqual(len(replay), 4)
+        events = list(replay)
+        self.assertEqual([(e.kind, e.outcome_id, e.data) for e in events], updates)
+        self.assertEqual(events, sorted(events, key=lambda e: e.received_at))
+
+        self.assertEqual(replay.watch_order_book("a"), updates[0][2])
+        self.assertEqual(replay.watch_order_book("a"), updates[3][2])
+        self.assertEqual(replay.watch_order_book("b", limit=1).bids, [OrderLevel(0.60, 10.0)])
+        self.assertEqual(replay.watch_trades("a", limit=1), trades[:1])
+        with self.assertRaises(EOFError):
+            replay.watch_order_book("a")
+
+        replay.restart()
+        self.assertEqual(replay.watch_trades("a", since=1_700_000_000_200), trades[1:])
+
+    def test_trades_without_ids(self):
+        trades = [
+            Trade(id=None, timestamp=1, price=0.4, amount=1.0, side="buy"),
+            Trade(id=None, timestamp=2, price=0.5, amount=1.0, side="sell"),
+            Trade(id="", timestamp=3, price=0.6, amount=1.0, side="buy"),
+        ]
+        self.record([("trades", "a", trades)])
+        replayed = Replay(self.path, speed=None).watch_trades("a")
+        self.assertEqual(replayed, trades)
+        # Trades without IDs are never deduplicated
+        self.assertEqual(TradeBuffer().add(replayed), 3)
+
+    def test_appends_and_forwards(self):
+        self.record([("order_book", "a", book(0.40, 0.45))])
+        recorder = Recorder(self.exchange, self.path)
+        recorder.fetch_markets()
+        self.assertEqual(self.exchange.other_calls, 1)
+        recorder.close()
+        self.record([("order_book", "a", book(0.41, 0.45))])
+        self.assertEqual(len(Replay(self.path)), 2)
+
+    def test_ignores_truncated_record(self):
+        self.record([("order_book", "a", book(0.40, 0.45)), ("order_book", "a", book(0.41, 0.45))])
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 3)
+        self.assertEqual(len(Replay(self.path)), 1)
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a recording")
+        with self.assertRaises(ValueError):
+            Replay(self.path)
+        with self.assertRaises(ValueError):
+            Replay(self.path, speed=0)
+
+    def test_paces_replay(self):
+        self.record([("order_book", "a", book(0.40, 0.45)), ("order_book", "a", book(0.41, 0.45))], gap=0.2)
+
+        replay = Replay(self.path, speed=1)
+        self.assertGreaterEqual(replay.duration, 0.2)
+        replay.watch_order_book("a")
+        with self.assertRaises(TimeoutError):
+            replay.watch_order_book("a", timeout=0.01)
+        started = time.monotonic()
+        self.assertEqual(replay.watch_order_book("a").bids[0].price, 0.41)
+        self.assertGreater(time.monotonic() - started, 0.1)
+
+        replay = Replay(self.path, speed=20)
+        started = time.monotonic()
+        self.assertEqual(len(list(replay)), 2)
+        self.assertLess(time.monotonic() - started, 0.15)
+
+    def test_drives_order_book_stream(self):
+        self.record([("order_book", "a", book(price, 0.50)) for price in (0.40, 0.41, 0.42, 0.43, 0.44)])
+        stream = OrderBookStream(Replay(self.path, speed=None))
+        self.addCleanup(stream.close)
+        stream.subscribe("a", policy="block", maxsize=10)
+        # Iteration ends with the recording
+        prices = [book.bids[0].price for _, book in stream]
+        self.assertEqual(prices, [0.40, 0.41, 0.42, 0.43, 0.44])
+        self.assertTrue(stream.stats()["a"].ended)
+        self.assertIsNone(stream.stats()["a"].last_error)
+
+    def wait_until(self, condition):
+        deadline = time.monotonic() + 5
+        while not condition():
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.005)
+
+    def test_drives_trade_tracker(self):
+        self.record([("trades", "a", [Trade(id=str(n), timestamp=n, price=0.4, amount=1.0, side="buy")]) for n in range(3)])
+        tracker = TradeTracker(Replay(self.path, speed=None))
+        self.addCleanup(tracker.close)
+        buffer = tracker.track("a")
+        self.wait_until(lambda: "a" in tracker.ended)
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(tracker.errors, {})
+
+    def test_drives_shared_book_feeder(self):
+        self.record([("order_book", "a", book(0.40, 0.45))])
+        name = "pmxt-books-" + uuid.uuid4().hex[:8]
+        feeder = SharedBookFeeder(Replay(self.path, speed=None), name, slots=2, depth=2, poll_interval=0.01)
+        self.addCleanup(feeder.stop)
+        reader = SharedBookReader(name)
+        self.addCleanup(reader.close)
+        reader.subscribe("a")
+        feeder.start()
+        self.assertEqual(reader.watch("a", after=-1, timeout=5)[1].bids[0].price, 0.40)
+        self.wait_until(lambda: "a" in feeder.ended)
+        self.assertEqual(feeder.errors, {})
+        # The last book stays readable
+        self.assertEqual(reader.snapshot("a")[1], book(0.40, 0.45))
+
+
+if __name__ == "__main__":
+    unittest.main()
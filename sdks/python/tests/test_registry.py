@@ -0,0 +1,74 @@
+import unittest
+
+from pmxt.models import MarketOutcome, UnifiedEvent, UnifiedMarket
+from pmxt.registry import MarketRegistry
+
+from .conftest import make_exchange, ok
+
+
+def market(market_id, *outcome_ids):
+    outcomes = [MarketOutcome(outcome_id=o, label=o, price=0.5) for o in outcome_ids]
+    return UnifiedMarket(
+        market_id=market_id, title=market_id, outcomes=outcomes, volume_24h=0,
+        liquidity=0, url="", yes=outcomes[0] if outcomes else None,
+    )
+
+
+def event(event_id, slug, *markets):
+    return UnifiedEvent(id=event_id, title=event_id, description="", slug=slug, markets=list(markets), url="")
+
+
+class TestMarketRegistry(unittest.TestCase):
+    def test_lookups(self):
+        registry = MarketRegistry()
+        registry.add_markets([market("m1", "o1", "o2")])
+        registry.add_events([event("e1", "fed-rates", market("m2", "o3"))])
+
+        self.assertEqual(registry.market_for_outcome("o2").market_id, "m1")
+        self.assertEqual(registry.outcome("o2").label, "o2")
+        self.assertEqual(registry.lookup("o1")[1], None)
+        found_market, found_event = registry.lookup("o3")
+        self.assertEqual((found_market.market_id, found_event.id), ("m2", "e1"))
+        self.assertIs(registry.event("fed-rates"), registry.event("e1"))
+        self.assertEqual(registry.event_for_market("m2").slug, "fed-rates")
+        self.assertIsNone(registry.lookup("missing"))
+
+    def test_refresh_replaces_outcomes(self):
+        registry = MarketRegistry()
+        registry.add_markets([market("m1", "o1", "o2")])
+        registry.add_markets([market("m1", "o1")])
+        self.assertIsNone(registry.market_for_outcome("o2"))
+        self.assertEqual(len(registry), 1)
+
+    def test_bounded_lru(self):
+        registry = MarketRegistry(max_markets=2, max_events=1)
+        registry.add_markets([market("m1", "o1"), market("m2", "o2")])
+        registry.market("m1")
+        registry.add_markets([market("m3", "o3")])
+        self.assertNotIn("m2", registry)
+        self.assertIsNone(registry.market_for_outcome("o2"))
+        self.assertEqual(registry.market_for_outcome("o1").market_id, "m1")
+
+        registry.add_events([event("e1", "a", market("m4")), event("e2", "b", market("m5"))])
+        self.assertIsNone(registry.event("a"))
+        self.assertIsNone(registry.event_for_market("m4"))
+        self.assertEqual(registry.event("b").id, "e2")
+
+    def test_populated_by_fetches(self):
+        exchange = make_exchange()
+        exchange._api.fetch_events.return_value = ok([{
+            "id": "e1", "slug": "rain", "title": "Rain",
+            "markets": [{"marketId": "m1", "outcomes": [{"outcomeId": "o1", "label": "Yes", "price": 0.4}]}],
+        }])
+        exchange._api.fetch_markets.return_value = ok([{"title": "projected, no id"}])
+
+        exchange.fetch_events("rain")
+        exchange.fetch_markets(fields=["title"])
+
+        market_found, event_found = exchange.registry.lookup("o1")
+        self.assertEqual((market_found.market_id, event_found.slug), ("m1", "rain"))
+        self.assertEqual(len(exchange.registry), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
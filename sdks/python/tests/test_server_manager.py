@@ -3,6 +3,10 @@ from unittest.mock import patch, MagicMock
 from pathlib import Path
 import os
 import shutil
+import json
+import tempfile
+import threading
+import pmxt.server_manager as sm
 from pmxt.server_manager import ServerManager
 
 class TestServerManagerCrossPlatform(unittest.TestCase):
@@ -81,5 +85,153 @@ class TestServerManagerCrossPlatform(unittest.TestCase):
         self.assertTrue(launcher_js.exists(), "pmxt-ensure-server.js should exist in core/bin")
         self.assertTrue(os.access(launcher_js, os.X_OK), "pmxt-ensure-server.js should be executable")
 
+
+class TestBackgroundStartup(unittest.TestCase):
+    """
+    Tests non-blocking startup: shared background start and the readiness pipe.
+    """
+
+    def setUp(self):
+        ServerManager._startups.clear()
+        self.manager = ServerManager()
+
+    def tearDown(self):
+        ServerManager._startups.clear()
+
+    def test_background_start_is_shared(self):
+        release = threading.Event()
+        with patch.object(ServerManager, 'ensure_server_running', side_effect=lambda: release.wait(1)) as ensure:
+            first = self.manager.start_background()
+            second = ServerManager().start_background()
+            self.assertIs(first, second)
+            self.assertFalse(first.done())
+
+            release.set()
+            ServerManager().wait_until_ready(timeout=1)
+            self.assertEqual(ensure.call_count, 1)
+
+    def test_background_start_is_per_server(self):
+        release = threading.Event()
+        with patch.object(ServerManager, 'ensure_server_running', side_effect=lambda: release.wait(1)) as ensure:
+            first = ServerManager("http://localhost:3847").start_background()
+            other_port = ServerManager("http://localhost:4000").start_background()
+            sharded = ServerManager("http://localhost:3847", shards=2).start_background()
+            self.assertIsNot(first, other_port)
+            self.assertIsNot(first, sharded)
+            self.assertIs(first, ServerManager("http://localhost:3847").start_background())
+
+            release.set()
+            for startup in (first, other_port, sharded):
+                startup.result(timeout=1)
+            self.assertEqual(ensure.call_count, 3)
+
+    def test_failed_start_is_retried(self):
+        with patch.object(ServerManager, 'ensure_server_running', side_effect=[Exception("boom"), None]):
+            with self.assertRaisesRegex(Exception, "boom"):
+                self.manager.wait_until_ready(timeout=1)
+            self.manager.wait_until_ready(timeout=1)
+
+    def test_ready_signal(self):
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"ready 3847\n")
+        os.close(write_fd)
+        try:
+            self.assertTrue(self.manager._wait_for_ready_signal(read_fd))
+        finally:
+            os.close(read_fd)
+
+    def test_closed_pipe_without_signal(self):
+        read_fd, write_fd = os.pipe()
+        os.close(write_fd)
+        try:
+            self.assertFalse(self.manager._wait_for_ready_signal(read_fd))
+        finally:
+            os.close(read_fd)
+
+    def test_exchange_construction_does_not_block(self):
+        import pmxt
+
+        with patch.object(ServerManager, 'start_background') as start, \
+                patch.object(ServerManager, 'wait_until_ready') as wait, \
+                patch.object(ServerManager, 'get_running_port', return_value=4000), \
+                patch.object(ServerManager, 'get_server_info', return_value={'accessToken': 'secret'}):
+            exchange = pmxt.Polymarket()
+            start.assert_called_once()
+            wait.assert_not_called()
+
+            exchange._api = MagicMock()
+            exchange._api.fetch_markets.return_value.to_dict.return_value = {"success": True, "data": []}
+            exchange.fetch_markets()
+
+            wait.assert_called_once()
+            self.assertEqual(exchange._api_client.configuration.host, "http://localhost:4000")
+            self.assertEqual(exchange._api_client.default_headers['x-pmxt-access-token'], 'secret')
+
+
+class TestDiscoveryCache(unittest.TestCase):
+    """
+    Tests the process-wide lock file / health cache.
+    """
+
+    def setUp(self):
+        sm._discovery_cache.clear()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.lock_path = Path(self.tmp.name) / 'server.lock'
+        self.write_lock(port=4000, pid=os.getpid(), accessToken='a')
+
+    def tearDown(self):
+        sm._discovery_cache.clear()
+        self.tmp.cleanup()
+
+    def write_lock(self, **info):
+        self.lock_path.write_text(json.dumps(info))
+
+    def make_manager(self):
+        manager = ServerManager()
+        manager.lock_path = self.lock_path
+        return manager
+
+    def test_lock_file_read_once_across_managers(self):
+        with patch.object(Path, 'read_text', autospec=True, side_effect=Path.read_text) as read:
+            for _ in range(5):
+                manager = self.make_manager()
+                self.assertEqual(manager.get_running_port(), 4000)
+                self.assertEqual(manager.get_server_info()['accessToken'], 'a')
+        self.assertEqual(read.call_count, 1)
+
+    def test_rewritten_lock_file_is_reread(self):
+        manager = self.make_manager()
+        self.assertEqual(manager.get_running_port(), 4000)
+
+        self.write_lock(port=40001, pid=os.getpid(), accessToken='b')
+        self.assertEqual(self.make_manager().get_running_port(), 40001)
+
+    def test_health_checked_once_per_lock_file(self):
+        with patch.object(ServerManager, '_check_health', return_value=True) as health:
+            self.assertTrue(self.make_manager().is_server_alive())
+            self.assertTrue(self.make_manager().is_server_alive())
+            self.assertEqual(health.call_count, 1)
+
+            self.write_lock(port=40001, pid=os.getpid(), accessToken='b')
+            self.assertTrue(self.make_manager().is_server_alive())
+            self.assertEqual(health.call_count, 2)
+
+    def test_dead_process_invalidates_cache(self):
+        manager = self.make_manager()
+        with patch.object(ServerManager, '_check_health', return_value=True):
+            self.assertTrue(manager.is_server_alive())
+        with patch.object(ServerManager, '_is_process_running', return_value=False):
+            self.assertFalse(manager.is_server_alive())
+        self.assertFalse(self.lock_path.exists())
+        self.assertIsNone(manager.get_server_info())
+
+    def test_package_version_read_once(self):
+        sm._expected_version.cache_clear()
+        with patch.object(Path, 'read_text', autospec=True, side_effect=Path.read_text) as read:
+            sm._expected_version()
+            sm._expected_version()
+        self.assertLessEqual(read.call_count, 1)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,102 @@
+import json
+import unittest
+from unittest.mock import MagicMock
+
+from pmxt_internal.exceptions import ApiException
+
+import pmxt
+from pmxt.client import SESSION_HEADER
+
+from .conftest import make_exchange, ok
+
+
+def handshake(*session_ids, status=200):
+    responses = []
+    for session_id in session_ids:
+        response = MagicMock(status=status)
+        response.data = json.dumps({"success": True, "data": {"sessionId": session_id}})
+        responses.append(response)
+    return responses
+
+
+def session_not_found():
+    body = json.dumps({"success": False, "error": {"message": "Unknown session", "code": "SESSION_NOT_FOUND"}})
+    return ApiException(status=401, reason="Unauthorized", body=body)
+
+
+class TestSessions(unittest.TestCase):
+    def make_exchange(self, **kwargs):
+        return make_exchange(pmxt.Kalshi, api_key="key", private_key="secret", **kwargs)
+
+    def sent(self, exchange, call_index=-1):
+        args, kwargs = exchange._api.fetch_positions.call_args_list[call_index]
+        request = kwargs["fetch_positions_request"]
+        return request.to_dict(), kwargs.get("_headers", {})
+
+    def test_session_replaces_credentials(self):
+        exchange = self.make_exchange()
+        exchange._api.api_client.call_api.side_effect = handshake("s1")
+        exchange._api.fetch_positions.return_value = ok([])
+
+        exchange.fetch_positions()
+        exchange.fetch_positions()
+
+        body, headers = self.sent(exchange)
+        self.assertNotIn("credentials", body)
+        self.assertEqual(headers[SESSION_HEADER], "s1")
+        # Handshake happens once
+        self.assertEqual(exchange._api.api_client.call_api.call_count, 1)
+        handshake_body = exchange._api.api_client.call_api.call_args[1]["body"]
+        self.assertEqual(handshake_body["credentials"]["apiKey"], "key")
+
+    def test_expired_session_is_reopened(self):
+        exchange = self.make_exchange()
+        exchange._api.api_client.call_api.side_effect = handshake("s1", "s2")
+        exchange._api.fetch_positions.side_effect = [session_not_found(), ok([])]
+
+        self.assertEqual(exchange.fetch_positions(), [])
+        _, headers = self.sent(exchange)
+        self.assertEqual(headers[SESSION_HEADER], "s2")
+
+    def test_handshake_uses_the_call_budget(self):
+        exchange = self.make_exchange(timeout=5)
+        exchange._api.api_client.call_api.side_effect = handshake("s1")
+        exchange._api.fetch_positions.return_value = ok([])
+
+        exchange.fetch_positions()
+        handshake_timeout = exchange._api.api_client.call_api.call_args[1]["_request_timeout"]
+        self.assertIsNotNone(handshake_timeout)
+        self.assertLessEqual(handshake_timeout, 5)
+
+    def test_sidecar_without_sessions_gets_credentials(self):
+        exchange = self.make_exchange()
+        exchange._api.api_client.call_api.side_effect = handshake("unused", status=404)
+        exchange._api.fetch_positions.return_value = ok([])
+
+        exchange.fetch_positions()
+        exchange.fetch_positions()
+
+        body, headers = self.sent(exchange)
+        self.assertEqual(body["credentials"]["apiKey"], "key")
+        self.assertNotIn(SESSION_HEADER, headers)
+        self.assertEqual(exchange._api.api_client.call_api.call_count, 1)
+
+    def test_sessions_can_be_disabled(self):
+        exchange = self.make_exchange(use_sessions=False)
+        exchange._api.fetch_positions.return_value = ok([])
+
+        exchange.fetch_positions()
+        body, _ = self.sent(exchange)
+        self.assertIn("credentials", body)
+        exchange._api.api_client.call_api.assert_not_called()
+
+    def test_public_calls_skip_handshake(self):
+        exchange = make_exchange(pmxt.Kalshi)
+        exchange._api.fetch_markets.return_value = ok([])
+
+        exchange.fetch_markets()
+        exchange._api.api_client.call_api.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
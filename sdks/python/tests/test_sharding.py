@@ -0,0 +1,117 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pmxt
+import pmxt.server_manager as sm
+from pmxt.server_manager import ServerManager
+from pmxt.sharding import ROUND_ROBIN, ShardPool
+
+from .conftest import make_exchange, ok
+
+
+class TestShardPool(unittest.TestCase):
+    def test_round_robin(self):
+        pool = ShardPool(["a", "b", "c"], strategy=ROUND_ROBIN)
+        picked = []
+        for _ in range(6):
+            with pool.checkout() as shard:
+                picked.append(shard)
+        self.assertEqual(picked, ["a", "b", "c", "a", "b", "c"])
+
+    def test_least_outstanding_avoids_busy_shard(self):
+        pool = ShardPool(["a", "b"])
+        with pool.checkout() as first:
+            self.assertEqual(first, "a")
+            self.assertEqual(pool.outstanding(), [1, 0])
+            for _ in range(3):
+                with pool.checkout() as shard:
+                    self.assertEqual(shard, "b")
+        self.assertEqual(pool.outstanding(), [0, 0])
+
+    def test_pinned_requests_are_consistent(self):
+        pool = ShardPool(["a", "b", "c", "d"])
+        with pool.checkout("polymarket:123") as first:
+            pass
+        for _ in range(5):
+            with pool.checkout("polymarket:123") as shard:
+                self.assertEqual(shard, first)
+
+    def test_rejects_unknown_strategy(self):
+        with self.assertRaises(ValueError):
+            ShardPool(["a"], strategy="random")
+
+
+class TestShardedExchange(unittest.TestCase):
+    def make_exchange(self, shards=2):
+        exchange = make_exchange()
+        self.apis = [MagicMock() for _ in range(shards)]
+        exchange._shards = ShardPool(self.apis)
+        return exchange
+
+    def test_reads_are_spread_across_shards(self):
+        exchange = self.make_exchange()
+        for api in self.apis:
+            api.fetch_markets.return_value = ok([])
+
+        for _ in range(4):
+            exchange.fetch_markets()
+        self.assertEqual([api.fetch_markets.call_count for api in self.apis], [2, 2])
+        exchange._api.fetch_markets.assert_not_called()
+
+    def test_streams_are_pinned_per_outcome(self):
+        exchange = self.make_exchange(shards=4)
+        for api in self.apis:
+            api.watch_trades.return_value = ok([])
+
+        for _ in range(5):
+            exchange.watch_trades("outcome-1")
+        counts = [api.watch_trades.call_count for api in self.apis]
+        self.assertEqual(sorted(counts), [0, 0, 0, 5])
+
+    def test_catalog_sync_stays_on_the_shard_holding_its_cursor(self):
+        exchange = self.make_exchange(shards=4)
+        for shard, api in enumerate(self.apis):
+            issued = set()
+
+            def sync(shard=shard, issued=issued, **kwargs):
+                # Like the sidecar: a cursor from another process means a full snapshot
+                args = kwargs["sync_markets_request"].to_dict()["args"]
+                cursor = args[1] if len(args) > 1 else None
+                issued.add(f"{shard}-{len(issued)}")
+                return ok({"cursor": f"{shard}-{len(issued) - 1}", "full": cursor not in issued, "upserts": [], "removed": []})
+
+            api.sync_markets.side_effect = sync
+
+        catalog = pmxt.MarketCatalog(exchange)
+        self.assertTrue(catalog.sync().full)
+        for _ in range(5):
+            self.assertFalse(catalog.sync().full)
+        self.assertEqual(sorted(api.sync_markets.call_count for api in self.apis), [0, 0, 0, 6])
+
+
+class TestShardPorts(unittest.TestCase):
+    def setUp(self):
+        sm._discovery_cache.clear()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.manager = ServerManager()
+        self.manager.lock_path = Path(self.tmp.name) / 'server.lock'
+
+    def tearDown(self):
+        sm._discovery_cache.clear()
+        self.tmp.cleanup()
+
+    def test_ports_from_lock_file(self):
+        self.manager.lock_path.write_text(json.dumps({"port": 3847, "pid": os.getpid(), "shards": [3847, 3848]}))
+        self.assertEqual(self.manager.get_shard_ports(), [3847, 3848])
+
+    def test_unsharded_server(self):
+        self.manager.lock_path.write_text(json.dumps({"port": 3850, "pid": os.getpid()}))
+        self.assertEqual(self.manager.get_shard_ports(), [3850])
+
+
+if __name__ == '__main__':
+    unittest.main()
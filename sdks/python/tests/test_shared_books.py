@@ -0,0 +1,169 @@
+import os
+import queue
+import signal
+import subprocess
+import sys
+import time
+import unittest
+import uuid
+from multiprocessing import shared_memory
+
+from pmxt.models import OrderBook, OrderLevel
+from pmxt.shared_books import SharedBookFeeder, SharedBookReader
+
+
+def book(bid, ask, timestamp=1):
+    return OrderBook(bids=[OrderLevel(bid, 10.0), OrderLevel(bid - 0.01, 5.0)], asks=[OrderLevel(ask, 7.0)], timestamp=timestamp)
+
+
+class FakeExchange:
+    def __init__(self):
+        self.updates = {}
+        self.calls = []
+
+    def feed(self, outcome_id, update):
+        self.updates.setdefault(outcome_id, queue.Queue()).put(update)
+
+    def watch_order_book(self, outcome_id, limit=None, timeout=None):
+        self.calls.append(outcome_id)
+        return self.updates.setdefault(outcome_id, queue.Queue()).get(timeout=5)
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while not condition():
+        if time.time() > deadline:
+            raise AssertionError("condition not met")
+        time.sleep(0.005)
+
+
+class TestSharedBooks(unittest.TestCase):
+    def setUp(self):
+        self.name = "pmxt-books-" + uuid.uuid4().hex[:8]
+        self.exchange = FakeExchange()
+        self.feeder = SharedBookFeeder(self.exchange, self.name, slots=4, depth=2, poll_interval=0.01)
+        self.feeder.start()
+
+    def tearDown(self):
+        for outcome_id in list(self.exchange.updates):
+            self.exchange.feed(outcome_id, book(0.1, 0.2))
+        self.feeder.stop()
+
+    def test_fan_out(self):
+        first, second = SharedBookReader(self.name), SharedBookReader(self.name)
+        first.subscribe("o1")
+        second.subscribe("o1")
+        self.assertEqual(self.feeder.subscribed(), {"o1": 2})
+        self.assertIsNone(first.snapshot("o1"))
+
+        self.exchange.feed("o1", book(0.40, 0.45, timestamp=123))
+        sequence, seen = first.watch("o1", timeout=5)
+        self.assertEqual(seen, book(0.40, 0.45, timestamp=123))
+        self.assertEqual(second.snapshot("o1"), (sequence, seen))
+
+        self.exchange.feed("o1", book(0.41, 0.45))
+        newer, _ = second.watch("o1", after=sequence, timeout=5)
+        self.assertGreater(newer, sequence)
+        # One watch per update, however many readers
+        wait_until(lambda: self.exchange.calls.count("o1") >= 3)
+        self.assertEqual(len(self.exchange.calls), 3)
+
+        first.close()
+        self.assertEqual(self.feeder.subscribed(), {"o1": 1})
+        second.unsubscribe("o1")
+        self.assertEqual(self.feeder.subscribed(), {})
+        second.close()
+
+    def test_depth_and_slot_limits(self):
+        reader = SharedBookReader(self.name)
+        reader.subscribe("o1")
+        deep = OrderBook(bids=[OrderLevel(0.5 - i / 100, 1.0) for i in range(5)], asks=[], timestamp=None)
+        self.exchange.feed("o1", deep)
+        _, seen = reader.watch("o1", timeout=5)
+        self.assertEqual([level.price for level in seen.bids], [0.5, 0.49])
+        self.assertIsNone(seen.timestamp)
+
+        for outcome_id in ("o2", "o3", "o4"):
+            reader.subscribe(outcome_id)
+        with self.assertRaises(RuntimeError):
+            reader.subscribe("o5")
+        reader.unsubscribe("o4")
+        reader.subscribe("o5")
+        with self.assertRaises(TimeoutError):
+            reader.watch("o5", timeout=0.05)
+        reader.close()
+
+    def test_reader_in_another_process(self):
+        code = (
+            "from pmxt.shared_books import SharedBookReader\n"
+            f"reader = SharedBookReader({self.name!r})\n"
+            "reader.subscribe('o1')\n"
+            "print(reader.watch('o1', timeout=5)[1].bids[0].price)\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        process = subprocess.Popen(
+            [sys.executable, "-c", code], env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        )
+        wait_until(lambda: self.feeder.subscribed() == {"o1": 1})
+        self.exchange.feed("o1", book(0.33, 0.4))
+        out, err = process.communicate(timeout=10)
+        self.assertEqual(out.strip(), "0.33", err)
+        # Released at exit
+        self.assertEqual(self.feeder.subscribed(), {})
+
+    @unittest.skipIf(os.name == "nt", "dead readers aren't detected on Windows")
+    def test_reaps_references_of_killed_readers(self):
+        code = (
+            "import sys\n"
+            "from pmxt.shared_books import SharedBookReader\n"
+            f"reader = SharedBookReader({self.name!r})\n"
+            "reader.subscribe('o1')\n"
+            "print('subscribed', flush=True)\n"
+            "sys.stdin.read()\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        process = subprocess.Popen(
+            [sys.executable, "-c", code], env=env, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True
+        )
+        self.assertEqual(process.stdout.readline().strip(), "subscribed")
+        reader = SharedBookReader(self.name)
+        reader.subscribe("o1")
+        self.assertEqual(self.feeder.subscribed(), {"o1": 2})
+
+        # No atexit handler runs, so only the feeder can drop its reference
+        process.send_signal(signal.SIGKILL)
+        process.wait()
+        process.stdin.close()
+        process.stdout.close()
+        self.assertEqual(self.feeder.subscribed(), {"o1": 1})
+        reader.close()
+        self.assertEqual(self.feeder.subscribed(), {})
+
+
+class TestFeederOwnership(unittest.TestCase):
+    def setUp(self):
+        self.name = "pmxt-books-" + uuid.uuid4().hex[:8]
+
+    def test_refuses_to_replace_a_running_feeder(self):
+        feeder = SharedBookFeeder(FakeExchange(), self.name, slots=2, depth=1)
+        self.addCleanup(feeder.stop)
+        reader = SharedBookReader(self.name)
+        self.addCleanup(reader.close)
+        reader.subscribe("o1")
+
+        with self.assertRaises(RuntimeError):
+            SharedBookFeeder(FakeExchange(), self.name, slots=2, depth=1)
+        self.assertEqual(feeder.subscribed(), {"o1": 1})
+
+    def test_replaces_segment_left_by_a_dead_feeder(self):
+        stale = shared_memory.SharedMemory(name=self.name, create=True, size=64)
+        stale.close()
+        feeder = SharedBookFeeder(FakeExchange(), self.name, slots=2, depth=1)
+        feeder.stop()
+
+        # The name is free again once the feeder stops
+        SharedBookFeeder(FakeExchange(), self.name, slots=2, depth=1).stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import math
+import os
+import subprocess
+import sys
+import unittest
+import uuid
+from datetime import datetime, timezone
+
+from pmxt.models import MarketOutcome, UnifiedMarket
+from pmxt.shared_catalog import MarketFrame, SharedCatalogReader, SharedCatalogWriter, encode_frame
+
+
+def market(market_id, price, **extra):
+    yes = MarketOutcome(outcome_id=market_id + "-y", label="Yes", price=price)
+    no = MarketOutcome(outcome_id=market_id + "-n", label="No", price=1 - price, price_change_24h=0.01)
+    return UnifiedMarket(
+        market_id=market_id, title=f"Market {market_id} ✓", outcomes=[yes, no], volume_24h=10.0,
+        liquidity=5.0, url="https://example.com/" + market_id, yes=yes, no=no, **extra,
+    )
+
+
+class TestMarketFrame(unittest.TestCase):
+    def test_round_trip(self):
+        original = market(
+            "a", 0.25, tags=["rain"], resolution_date=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        )
+        frame = MarketFrame(encode_frame([original, market("b", 0.5)], version=7))
+
+        self.assertEqual((len(frame), frame.version), (2, 7))
+        self.assertEqual(list(frame.column("yes_price")), [0.25, 0.5])
+        self.assertTrue(math.isnan(frame.column("volume")[0]))
+        self.assertEqual(frame.value("no_outcome_id", 1), "b-n")
+        self.assertIsNone(frame.value("description", 0))
+        self.assertEqual(frame.find("b"), 1)
+        self.assertIsNone(frame.find("missing"))
+        self.assertEqual(frame.market(0), original)
+
+    def test_rejects_text_columns_as_arrays(self):
+        frame = MarketFrame(encode_frame([market("a", 0.1)]))
+        with self.assertRaises(TypeError):
+            frame.column("title")
+        with self.assertRaises(IndexError):
+            frame.value("title", 1)
+
+
+class TestSharedCatalog(unittest.TestCase):
+    def setUp(self):
+        self.name = "pmxt-test-" + uuid.uuid4().hex[:8]
+        self.writer = SharedCatalogWriter(self.name)
+
+    def tearDown(self):
+        self.writer.close()
+
+    def test_publish_and_attach(self):
+        reader = SharedCatalogReader(self.name)
+        with self.assertRaises(LookupError):
+            reader.frame()
+
+        self.assertEqual(self.writer.publish([market("a", 0.1)]), 1)
+        first = reader.frame()
+        self.assertEqual((first.version, first.value("market_id", 0)), (1, "a"))
+        self.assertIs(reader.frame(), first)
+
+        self.writer.publish([market("a", 0.2), market("b", 0.3)])
+        second = reader.frame()
+        self.assertEqual((reader.version, len(second)), (2, 2))
+        self.assertEqual(list(second.column("yes_price")), [0.2, 0.3])
+        reader.close()
+
+    def test_other_process_reads_published_catalog(self):
+        self.writer.publish([market("a", 0.1), market("b", 0.9)])
+        code = (
+            "from pmxt.shared_catalog import SharedCatalogReader\n"
+            f"reader = SharedCatalogReader({self.name!r})\n"
+            "frame = reader.frame()\n"
+            "print(frame.version, sum(frame.column('yes_price')), frame.market(1).title)\n"
+            "reader.close()\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        output = subprocess.run(
+            [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+        )
+        self.assertEqual(output.stdout.strip(), "1 1.0 Market b ✓")
+        self.assertNotIn("leaked", output.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
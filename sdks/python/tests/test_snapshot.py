@@ -0,0 +1,133 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from pmxt.catalog import MarketCatalog
+from pmxt.snapshot import MarketSnapshot, encode_record
+
+from .conftest import make_exchange, ok
+
+
+def raw(market_id, price):
+    return {"marketId": market_id, "title": market_id, "yes": {"outcomeId": market_id + "-y", "label": "Yes", "price": price}}
+
+
+class TestMarketSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "markets.snap")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_round_trip(self):
+        MarketSnapshot.write(
+            self.path,
+            [("a", 100.0, encode_record(raw("a", 0.1))), ("ü", 200.0, encode_record(raw("ü", 0.2)))],
+            saved_at=300.0,
+        )
+        snapshot = MarketSnapshot(self.path)
+        self.assertEqual(sorted(snapshot.keys()), ["a", "ü"])
+        self.assertEqual(snapshot.get("ü")["yes"]["price"], 0.2)
+        self.assertEqual((snapshot.fetched_at("a"), snapshot.saved_at), (100.0, 300.0))
+        self.assertIsNone(snapshot.get("missing"))
+        snapshot.close()
+        files = sorted(os.listdir(self.dir.name))
+        self.assertEqual(len(files), 2)
+        self.assertEqual(files[0], "markets.snap")
+        self.assertTrue(files[1].startswith("markets.snap.") and files[1].endswith(".snapdata"))
+
+    def test_replaces_snapshot_while_mapped(self):
+        MarketSnapshot.write(self.path, [("a", 1.0, encode_record(raw("a", 0.1)))], saved_at=1.0)
+        old = MarketSnapshot(self.path)
+        self.addCleanup(old.close)
+        old_data = [f for f in os.listdir(self.dir.name) if f.endswith(".snapdata")]
+
+        # Windows can neither rename over nor delete a mapped file
+        real_unlink = os.unlink
+
+        def unlink(path):
+            if os.path.basename(path) in old_data:
+                raise PermissionError(path)
+            real_unlink(path)
+
+        with patch("pmxt.snapshot.os.replace", side_effect=self.replace_unless_mapped), \
+                patch("pmxt.snapshot.os.unlink", side_effect=unlink):
+            MarketSnapshot.write(self.path, [("b", 2.0, encode_record(raw("b", 0.2)))], saved_at=2.0)
+
+        new = MarketSnapshot(self.path)
+        self.addCleanup(new.close)
+        self.assertEqual((list(old.keys()), old.get("a")["yes"]["price"]), (["a"], 0.1))
+        self.assertEqual((list(new.keys()), new.saved_at), (["b"], 2.0))
+        self.assertEqual(len([f for f in os.listdir(self.dir.name) if f.endswith(".snapdata")]), 2)
+
+        # The superseded file is removed by the next write once it can be
+        old.close()
+        MarketSnapshot.write(self.path, [("c", 3.0, encode_record(raw("c", 0.3)))], saved_at=3.0)
+        self.assertEqual(len(os.listdir(self.dir.name)), 2)
+        self.assertEqual(list(MarketSnapshot(self.path).keys()), ["c"])
+
+    def replace_unless_mapped(self, source, destination):
+        with open(destination, "rb") as f:
+            if f.read(8) == b"PMXTSNAP":
+                raise PermissionError(destination)
+        os.rename(source, destination)
+
+    def test_missing_or_foreign_files_open_empty(self):
+        self.assertEqual(len(MarketSnapshot(self.path)), 0)
+        with open(self.path, "wb") as f:
+            f.write(b"not a snapshot, just some other file" * 4)
+        self.assertEqual(len(MarketSnapshot(self.path)), 0)
+
+
+class TestCatalogWarmStart(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "markets.snap")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def catalog(self, *responses):
+        exchange = make_exchange()
+        exchange._api.sync_markets.side_effect = [ok(r) for r in responses]
+        return MarketCatalog(exchange, snapshot_path=self.path, limit=10)
+
+    def test_serves_snapshot_then_reconciles(self):
+        first = self.catalog({"cursor": "c1", "full": True, "upserts": [raw("a", 0.1), raw("b", 0.2)], "removed": []})
+        first.sync()
+        saved = first.fetched_at("a")
+
+        # After a restart the table is available before any sync
+        second = self.catalog({"cursor": "x1", "full": True, "upserts": [raw("a", 0.1), raw("c", 0.3)], "removed": []})
+        self.assertEqual(len(second), 2)
+        self.assertIsNone(second.synced_at)
+        self.assertEqual(second["b"].yes.price, 0.2)
+        self.assertEqual(second.fetched_at("b"), saved)
+
+        diff = second.sync()
+        self.assertEqual([m.market_id for m in diff.added], ["c"])
+        self.assertEqual(diff.updated, [])
+        self.assertEqual([m.market_id for m in diff.removed], ["b"])
+        self.assertGreaterEqual(second.fetched_at("a"), saved)
+
+        third = self.catalog()
+        self.assertEqual(sorted(m.market_id for m in third), ["a", "c"])
+        self.assertEqual(third["c"].yes.price, 0.3)
+
+    def test_background_refresh(self):
+        catalog = self.catalog({"cursor": "c1", "full": True, "upserts": [raw("a", 0.1)], "removed": []})
+        catalog.start(interval=60)
+        deadline = time.time() + 5
+        while catalog.synced_at is None and time.time() < deadline:
+            time.sleep(0.01)
+        catalog.stop()
+        self.assertIn("a", catalog)
+        self.assertIsNone(catalog.last_error)
+        self.assertLess(catalog.age("a"), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import queue
+import threading
+import time
+import unittest
+
+from pmxt.models import OrderBook, OrderLevel
+from pmxt.streaming import OrderBookStream
+
+
+def book(price):
+    return OrderBook(bids=[OrderLevel(price, 1.0)], asks=[], timestamp=int(price * 1000))
+
+
+class FakeExchange:
+    def __init__(self):
+        self.updates = {}
+
+    def feed(self, outcome_id, *prices):
+        for price in prices:
+            self.updates.setdefault(outcome_id, queue.Queue()).put(book(price))
+
+    def watch_order_book(self, outcome_id, limit=None, timeout=None):
+        update = self.updates.setdefault(outcome_id, queue.Queue()).get()
+        if isinstance(update, Exception):
+            raise update
+        return update
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while not condition():
+        if time.time() > deadline:
+            raise AssertionError("condition not met")
+        time.sleep(0.005)
+
+
+class TestOrderBookStream(unittest.TestCase):
+    def setUp(self):
+        self.exchange = FakeExchange()
+        self.stream = OrderBookStream(self.exchange)
+
+    def tearDown(self):
+        self.stream.close()
+        for updates in self.exchange.updates.values():
+            updates.put(book(0))
+
+    def received(self, outcome_id, count):
+        wait_until(lambda: self.stream.stats()[outcome_id].received >= count)
+
+    def test_conflate_keeps_latest(self):
+        self.stream.subscribe("o1")
+        self.exchange.feed("o1", 0.1, 0.2, 0.3, 0.4)
+        self.received("o1", 4)
+
+        self.assertEqual(self.stream.get(timeout=1), ("o1", book(0.4)))
+        stats = self.stream.stats()["o1"]
+        self.assertEqual((stats.conflated, stats.delivered, stats.queue_depth), (3, 1, 0))
+        with self.assertRaises(TimeoutError):
+            self.stream.get(timeout=0.01)
+
+    def test_drop_oldest_is_bounded(self):
+        self.stream.subscribe("o1", policy="drop_oldest", maxsize=2)
+        self.exchange.feed("o1", 0.1, 0.2, 0.3, 0.4, 0.5)
+        self.received("o1", 5)
+
+        self.assertEqual([self.stream.get(timeout=1)[1] for _ in range(2)], [book(0.4), book(0.5)])
+        stats = self.stream.stats()["o1"]
+        self.assertEqual((stats.dropped, stats.max_queue_depth), (3, 2))
+
+    def test_block_waits_for_the_consumer(self):
+        self.stream.subscribe("o1", policy="block", maxsize=1)
+        self.exchange.feed("o1", 0.1, 0.2, 0.3)
+        self.received("o1", 2)
+        time.sleep(0.05)
+        self.assertEqual(self.stream.stats()["o1"].queue_depth, 1)
+
+        prices = [self.stream.get(timeout=1)[1].bids[0].price for _ in range(3)]
+        self.assertEqual(prices, [0.1, 0.2, 0.3])
+        stats = self.stream.stats()["o1"]
+        self.assertEqual((stats.dropped, stats.conflated), (0, 0))
+        self.assertGreater(stats.blocked, 0)
+
+    def test_arrival_order_across_subscriptions(self):
+        self.stream.subscribe("a", policy="drop_oldest")
+        self.stream.subscribe("b", policy="drop_oldest")
+        self.exchange.feed("a", 0.1)
+        self.received("a", 1)
+        self.exchange.feed("b", 0.2)
+        self.received("b", 1)
+        self.exchange.feed("a", 0.3)
+        self.received("a", 2)
+        self.assertEqual([self.stream.get(timeout=1)[0] for _ in range(3)], ["a", "b", "a"])
+
+    def test_errors_are_reported_and_close_ends_iteration(self):
+        self.stream.subscribe("o1")
+        self.exchange.updates.setdefault("o1", queue.Queue()).put(RuntimeError("boom"))
+        wait_until(lambda: self.stream.stats()["o1"].last_error is not None)
+
+        seen = []
+        consumer = threading.Thread(target=lambda: seen.extend(self.stream))
+        consumer.start()
+        self.exchange.feed("o1", 0.5)
+        wait_until(lambda: seen)
+        self.stream.close()
+        consumer.join(timeout=5)
+        self.assertFalse(consumer.is_alive())
+        self.assertEqual(seen, [("o1", book(0.5))])
+
+    def test_rejects_bad_subscriptions(self):
+        with self.assertRaises(ValueError):
+            self.stream.subscribe("o1", policy="unbounded")
+        self.stream.subscribe("o1")
+        with self.assertRaises(ValueError):
+            self.stream.subscribe("o1")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import time
+import unittest
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from urllib3.exceptions import MaxRetryError, ProtocolError
+
+import pmxt
+from pmxt.server_manager import ServerManager
+
+from .conftest import make_exchange, ok
+
+
+def connection_refused():
+    return MaxRetryError(None, "/api", ProtocolError("Connection refused"))
+
+
+class TestSupervisor(unittest.TestCase):
+    def setUp(self):
+        self.manager = ServerManager()
+        patches = {
+            'get_server_info': MagicMock(return_value={'pid': 1234, 'port': 3847}),
+            '_is_process_running': MagicMock(return_value=True),
+            '_check_health': MagicMock(return_value=True),
+            '_kill_old_server': MagicMock(),
+            'ensure_server_running': MagicMock(),
+        }
+        for name, mock in patches.items():
+            patcher = patch.object(ServerManager, name, mock)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.mocks = patches
+        self.addCleanup(self.manager.stop_supervising)
+
+    def wait_until(self, predicate, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            if time.monotonic() > deadline:
+                self.fail("condition not reached")
+            time.sleep(0.005)
+
+    def test_healthy_server_is_left_alone(self):
+        self.manager.supervise(interval=0.01)
+        time.sleep(0.05)
+        self.mocks['ensure_server_running'].assert_not_called()
+        self.assertEqual(self.manager.supervisor_stats().restarts, 0)
+
+    def test_dead_server_is_restarted(self):
+        self.mocks['_is_process_running'].return_value = False
+        self.mocks['ensure_server_running'].side_effect = lambda: self.mocks['_is_process_running'].configure_mock(return_value=True)
+        self.manager.supervise(interval=0.01)
+
+        self.wait_until(lambda: self.manager.supervisor_stats().restarts == 1)
+        stats = self.manager.supervisor_stats()
+        self.assertFalse(stats.down)
+        self.assertGreater(stats.downtime, 0)
+        self.assertIsNotNone(stats.last_restart)
+
+    def test_unhealthy_server_restarted_after_threshold(self):
+        self.mocks['_check_health'].return_value = False
+        self.manager.supervise(interval=0.01, unhealthy_threshold=3)
+
+        self.wait_until(lambda: self.mocks['ensure_server_running'].called)
+        self.assertGreaterEqual(self.mocks['_check_health'].call_count, 3)
+        self.mocks['_kill_old_server'].assert_called()
+
+    def test_failed_restarts_back_off(self):
+        self.mocks['_is_process_running'].return_value = False
+        self.mocks['ensure_server_running'].side_effect = Exception("port busy")
+        self.manager.supervise(interval=0.01, max_backoff=0.04)
+
+        self.wait_until(lambda: self.manager.supervisor_stats().failed_restarts >= 3)
+        stats = self.manager.supervisor_stats()
+        self.assertTrue(stats.down)
+        self.assertEqual(stats.restarts, 0)
+
+    def test_wait_for_recovery(self):
+        self.assertFalse(self.manager.wait_for_recovery(timeout=0.01))  # Not supervised
+
+        self.manager.supervise(interval=10)  # Only wakes when a client reports a failure
+        self.assertTrue(self.manager.wait_for_recovery(timeout=1))
+
+    def test_stop_ends_supervision(self):
+        self.manager.supervise(interval=0.01)
+        self.manager.stop()
+        self.assertFalse(self.manager.supervised)
+        self.assertIsNone(self.manager.supervisor_stats())
+
+
+class TestExchangeReplay(unittest.TestCase):
+    def setUp(self):
+        for name, kwargs in {
+            'supervised': {'new_callable': PropertyMock, 'return_value': True},
+            'wait_for_recovery': {'return_value': True},
+            'wait_until_ready': {},
+            'get_running_port': {'return_value': 3850},
+            'get_shard_ports': {'return_value': [3850]},
+            'get_server_info': {'return_value': {'accessToken': 'new'}},
+        }.items():
+            patcher = patch.object(ServerManager, name, **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.exchange = make_exchange()
+
+    def test_read_replayed_after_restart(self):
+        self.exchange._api.fetch_markets.side_effect = [connection_refused(), ok([])]
+
+        self.assertEqual(self.exchange.fetch_markets(), [])
+        self.assertEqual(self.exchange._api.fetch_markets.call_count, 2)
+        self.assertEqual(self.exchange._api_client.configuration.host, "http://localhost:3850")
+
+    def test_orders_are_not_replayed(self):
+        self.exchange._api.create_order.side_effect = [connection_refused(), ok({})]
+
+        with self.assertRaises(pmxt.NetworkError):
+            self.exchange.create_order("m", "o", "buy", "limit", 1, price=0.5)
+        self.assertEqual(self.exchange._api.create_order.call_count, 1)
+
+    def test_unrecovered_server_raises(self):
+        ServerManager.wait_for_recovery.return_value = False
+        self.exchange._api.fetch_markets.side_effect = connection_refused()
+
+        with self.assertRaises(pmxt.NetworkError):
+            self.exchange.fetch_markets()
+        self.assertEqual(self.exchange._api.fetch_markets.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,228 @@
+import gzip
+import http.client
+import json
+import os
+import time
+import unittest
+
+import pmxt
+from pmxt.client import SESSION_HEADER, TIMEOUT_HEADER
+from pmxt.projection import event_fields, market_fields
+from pmxt.pushdown import event_criteria, market_criteria
+from pmxt.testing import DISCONNECT, FakeSidecar
+
+_GENERATED_PATH = os.path.join(os.path.dirname(__file__), "..", "generated")
+
+
+class SidecarTestCase(unittest.TestCase):
+    sidecar_options = {}
+
+    def setUp(self):
+        self.sidecar = FakeSidecar(seed=1, **self.sidecar_options).start()
+        self.addCleanup(self.sidecar.stop)
+
+    def post(self, path, body=None, headers=None):
+        connection = http.client.HTTPConnection("127.0.0.1", self.sidecar.port, timeout=5)
+        self.addCleanup(connection.close)
+        connection.request("POST", path, json.dumps(body or {}), {"Content-Type": "application/json", **(headers or {})})
+        response = connection.getresponse()
+        data = response.read()
+        if response.getheader("Content-Encoding") == "gzip":
+            data = gzip.decompress(data)
+        return response.status, json.loads(data), response
+
+    def call(self, method, *args, **options):
+        return self.post(f"/api/polymarket/{method}", {"args": list(args)}, **options)
+
+
+class TestFakeSidecar(SidecarTestCase):
+    sidecar_options = {"markets": 12, "markets_per_event": 5, "book_depth": 3, "trades": 4}
+
+    def test_health(self):
+        connection = http.client.HTTPConnection("127.0.0.1", self.sidecar.port, timeout=5)
+        self.addCleanup(connection.close)
+        connection.request("GET", "/health")
+        self.assertEqual(json.loads(connection.getresponse().read())["status"], "ok")
+
+    def test_synthetic_market_data(self):
+        status, body, _ = self.call("fetchMarkets")
+        self.assertEqual(status, 200)
+        self.assertTrue(body["success"])
+        self.assertEqual(len(body["data"]), 12)
+        market = body["data"][0]
+        self.assertEqual(market["outcomes"][0]["outcomeId"], market["yes"]["outcomeId"])
+
+        _, body, _ = self.call("fetchMarkets", {"limit": 5, "offset": 10})
+        self.assertEqual([m["marketId"] for m in body["data"]], ["10", "11"])
+        _, body, _ = self.call("fetchEvents")
+        self.assertEqual([len(e["markets"]) for e in body["data"]], [5, 5, 2])
+
+        _, body, _ = self.call("fetchOrderBook", "1-yes")
+        book = body["data"]
+        self.assertEqual((len(book["bids"]), len(book["asks"])), (3, 3))
+        self.assertLess(book["bids"][0]["price"], book["asks"][0]["price"])
+        _, body, _ = self.call("watchOrderBook", "1-yes", 1)
+        self.assertEqual(len(body["data"]["bids"]), 1)
+
+        _, body, _ = self.call("fetchTrades", "1-yes", {})
+        self.assertEqual(len(body["data"]), 4)
+        _, body, _ = self.call("watchTrades", "1-yes")
+        self.assertTrue(body["data"][0]["id"].endswith("-4"))
+        _, body, _ = self.call("fetchOHLCV", "1-yes", {"limit": 7})
+        self.assertEqual(len(body["data"]), 7)
+
+        _, body, _ = self.call("syncMarkets", {}, "old-cursor")
+        self.assertTrue(body["data"]["full"])
+        self.assertEqual(len(body["data"]["upserts"]), 12)
+
+    def test_filter_and_fields_are_applied(self):
+        markets = self.sidecar._generate_fetchMarkets([])
+        category = markets[0]["category"]
+        params = {
+            "filter": market_criteria({"category": category, "price": {"outcome": "yes", "min": 0.0}}),
+            "fields": market_fields(["title", "yes.price"]),
+        }
+        _, body, _ = self.call("fetchMarkets", params)
+        expected = [m for m in markets if m["category"] == category]
+        self.assertEqual(body["data"], [{"title": m["title"], "yes": {"price": m["yes"]["price"]}} for m in expected])
+
+        _, body, _ = self.call("fetchEvents", {"filter": event_criteria("event 1"), "fields": event_fields(["title"])})
+        self.assertEqual(body["data"], [{"title": "Synthetic event 1"}])
+
+        # Sync deltas keep the market ID their upserts are keyed by
+        _, body, _ = self.call("syncMarkets", {"filter": "market 1", "fields": ["title"]}, None)
+        self.assertEqual([m["marketId"] for m in body["data"]["upserts"]], ["1", "10", "11"])
+        self.assertEqual(set(body["data"]["upserts"][0]), {"marketId", "title"})
+
+        # Fixtures are shaped the same way
+        self.sidecar.fixtures["fetchMarkets"] = markets[:2]
+        _, body, _ = self.call("fetchMarkets", {"filter": {"text": markets[1]["title"]}, "fields": ["marketId"]})
+        self.assertEqual(body["data"], [{"marketId": "1"}])
+
+    def test_invalid_filter_and_fields_are_rejected(self):
+        for params in (
+            {"filter": {"category": ""}},
+            {"filter": {"price": {"min": 0.5}}},
+            {"filter": {"resolutionDate": {"before": "soon"}}},
+            {"filter": 3},
+            {"fields": "title"},
+        ):
+            status, body, _ = self.call("fetchMarkets", params)
+            self.assertEqual((status, body["error"]["code"]), (400, "BAD_REQUEST"), params)
+
+    def test_seeded_data_is_deterministic(self):
+        other = FakeSidecar(seed=1, markets=12).start()
+        self.addCleanup(other.stop)
+        _, body, _ = self.call("fetchMarkets")
+        self.assertEqual(body["data"], other._generate_fetchMarkets([]))
+
+    def test_fixtures_and_unknown_methods(self):
+        self.sidecar.fixtures["fetchBalance"] = [{"currency": "USDC", "total": 10}]
+        self.sidecar.fixtures["fetchOrder"] = lambda exchange, args: {"id": args[0], "exchange": exchange}
+        self.sidecar.fixtures["cancelOrder"] = self.raise_not_found
+
+        self.assertEqual(self.call("fetchBalance")[1]["data"][0]["total"], 10)
+        self.assertEqual(self.call("fetchOrder", "o1")[1]["data"], {"id": "o1", "exchange": "polymarket"})
+        status, body, _ = self.call("cancelOrder", "o1")
+        self.assertEqual((status, body["error"]["code"]), (404, "ORDER_NOT_FOUND"))
+        status, body, _ = self.call("createOrder", {})
+        self.assertEqual(status, 404)
+        self.assertFalse(body["success"])
+        self.assertEqual(self.sidecar.calls["createOrder"], 1)
+
+    @staticmethod
+    def raise_not_found(exchange, args):
+        raise pmxt.OrderNotFound(f"No order {args[0]}")
+
+    def test_scheduled_faults(self):
+        self.sidecar.fail("fetchMarkets", pmxt.RateLimitExceeded, times=2, retry_after=1.5)
+        for _ in range(2):
+            status, body, _ = self.call("fetchMarkets")
+            self.assertEqual(status, 429)
+            self.assertEqual(body["error"]["retryAfter"], 1.5)
+            self.assertTrue(body["error"]["retryable"])
+            self.assertIsInstance(pmxt.errors.error_from_detail(body["error"], status), pmxt.RateLimitExceeded)
+        self.assertEqual(self.call("fetchMarkets")[0], 200)
+
+        self.sidecar.fail(error=DISCONNECT)
+        with self.assertRaises(http.client.HTTPException):
+            self.call("fetchEvents")
+        self.assertEqual(self.call("fetchEvents")[0], 200)
+
+    def test_error_rate(self):
+        self.sidecar.error_rate = 0.5
+        statuses = [self.call("fetchOrderBook", "x")[0] for _ in range(40)]
+        self.assertIn(503, statuses)
+        self.assertIn(200, statuses)
+
+    def test_latency_and_timeout_budget(self):
+        self.sidecar.latency = {"fetchMarkets": 0.2}
+        started = time.monotonic()
+        self.assertEqual(self.call("fetchEvents")[0], 200)
+        self.assertLess(time.monotonic() - started, 0.15)
+
+        started = time.monotonic()
+        status, body, _ = self.call("fetchMarkets", headers={TIMEOUT_HEADER: "50"})
+        self.assertEqual((status, body["error"]["code"]), (504, "REQUEST_TIMEOUT"))
+        self.assertLess(time.monotonic() - started, 0.15)
+
+        started = time.monotonic()
+        self.assertEqual(self.call("fetchMarkets")[0], 200)
+        self.assertGreaterEqual(time.monotonic() - started, 0.2)
+
+    def test_sessions(self):
+        status, body, _ = self.post("/session/kalshi", {})
+        self.assertEqual(status, 400)
+        _, body, _ = self.post("/session/kalshi", {"credentials": {"apiKey": "key"}})
+        session_id = body["data"]["sessionId"]
+
+        status, _, _ = self.post("/api/kalshi/fetchMarkets", {"args": []}, {SESSION_HEADER: session_id})
+        self.assertEqual(status, 200)
+        status, body, _ = self.post("/api/kalshi/fetchMarkets", {"args": []}, {SESSION_HEADER: "expired"})
+        self.assertEqual((status, body["error"]["code"]), (401, "SESSION_NOT_FOUND"))
+
+    def test_compresses_large_responses(self):
+        _, body, response = self.call("fetchMarkets", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(response.getheader("Content-Encoding"), "gzip")
+        self.assertEqual(len(body["data"]), 12)
+        _, _, response = self.call("fetchOrderBook", "x", headers={"Accept-Encoding": "gzip"})
+        self.assertIsNone(response.getheader("Content-Encoding"))
+
+
+class TestAccessToken(SidecarTestCase):
+    sidecar_options = {"access_token": "secret"}
+
+    def test_requires_token(self):
+        self.assertEqual(self.call("fetchMarkets")[0], 401)
+        self.assertEqual(self.call("fetchMarkets", headers={"x-pmxt-access-token": "secret"})[0], 200)
+
+
+@unittest.skipUnless(os.path.isdir(_GENERATED_PATH), "generated client not built")
+class TestClientAgainstFakeSidecar(SidecarTestCase):
+    sidecar_options = {"markets": 20}
+
+    def test_fetches_and_retries(self):
+        client = self.sidecar.exchange("polymarket", retry_policy=pmxt.RetryPolicy(base_delay=0.01))
+        self.sidecar.fail("fetchMarkets", pmxt.ExchangeNotAvailable, times=2)
+        markets = client.fetch_markets()
+        self.assertEqual(len(markets), 20)
+        self.assertEqual(self.sidecar.calls["fetchMarkets"], 3)
+        book = client.fetch_order_book(markets[0].outcomes[0].outcome_id)
+        self.assertTrue(book.bids)
+
+    def test_filter_and_fields_round_trip(self):
+        client = self.sidecar.exchange("polymarket")
+        markets = client.fetch_markets()
+        category = markets[0].category
+        expected = client.filter_markets(markets, {"category": category, "volume": {"min": 1_000_000}})
+
+        projected = client.fetch_markets(
+            filter={"category": category, "volume": {"min": 1_000_000}}, fields=["title", "volume"]
+        )
+        self.assertEqual([(m.title, m.volume) for m in projected], [(m.title, m.volume) for m in expected])
+        events = client.fetch_events(filter="event 1", fields=["title"])
+        self.assertEqual([e.title for e in events], ["Synthetic event 1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
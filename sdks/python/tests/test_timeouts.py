@@ -0,0 +1,89 @@
+import unittest
+
+from urllib3.exceptions import MaxRetryError, ReadTimeoutError
+
+from pmxt.client import TIMEOUT_HEADER
+from pmxt.errors import ExchangeNotAvailable, RequestTimeout
+from pmxt.rate_limiter import RateLimit, RateLimiter
+from pmxt.retry import RetryPolicy
+
+from .conftest import make_exchange, ok
+
+
+class TestTimeouts(unittest.TestCase):
+    def test_no_timeout_by_default(self):
+        exchange = make_exchange()
+        exchange._api.fetch_order_book.return_value = ok({"bids": [], "asks": []})
+
+        exchange.fetch_order_book("x")
+        _, kwargs = exchange._api.fetch_order_book.call_args
+        self.assertNotIn("_request_timeout", kwargs)
+        self.assertNotIn("_headers", kwargs)
+
+    def test_client_default_is_sent_to_socket_and_sidecar(self):
+        exchange = make_exchange(timeout=2.0)
+        exchange._api.fetch_order_book.return_value = ok({"bids": [], "asks": []})
+
+        exchange.fetch_order_book("x")
+        _, kwargs = exchange._api.fetch_order_book.call_args
+        self.assertTrue(0 < kwargs["_request_timeout"] <= 2.0)
+        self.assertTrue(0 < int(kwargs["_headers"][TIMEOUT_HEADER]) <= 2000)
+
+    def test_per_call_timeout_overrides_default(self):
+        exchange = make_exchange(timeout=30.0)
+        exchange._api.watch_trades.return_value = ok([])
+
+        exchange.watch_trades("x", timeout=0.5)
+        _, kwargs = exchange._api.watch_trades.call_args
+        self.assertLessEqual(kwargs["_request_timeout"], 0.5)
+
+    def test_socket_timeout_raises_request_timeout(self):
+        exchange = make_exchange(timeout=0.1)
+        exchange._api.fetch_markets.side_effect = ReadTimeoutError(None, "/api", "Read timed out.")
+
+        with self.assertRaises(RequestTimeout) as ctx:
+            exchange.fetch_markets()
+        self.assertEqual(str(ctx.exception), "Failed to fetch markets: Request timed out")
+
+    def test_wrapped_socket_timeout_raises_request_timeout(self):
+        exchange = make_exchange(timeout=0.1)
+        exchange._api.fetch_markets.side_effect = MaxRetryError(
+            None, "/api", ReadTimeoutError(None, "/api", "Read timed out.")
+        )
+
+        with self.assertRaises(RequestTimeout):
+            exchange.fetch_markets()
+
+    def test_retries_stop_at_call_budget(self):
+        exchange = make_exchange(retry_policy=RetryPolicy(max_attempts=100, base_delay=0.05, jitter=0))
+        exchange._api.fetch_order_book.side_effect = ExchangeNotAvailable("down")
+
+        with self.assertRaises(ExchangeNotAvailable):
+            exchange.fetch_order_book("x", timeout=0.2)
+        self.assertLess(exchange._api.fetch_order_book.call_count, 5)
+
+    def test_rate_limit_queue_respects_budget(self):
+        limiter = RateLimiter(default=RateLimit(rate=1, burst=1))
+        exchange = make_exchange(rate_limiter=limiter)
+        exchange._api.fetch_order_book.return_value = ok({"bids": [], "asks": []})
+
+        exchange.fetch_order_book("x")
+        with self.assertRaises(RequestTimeout):
+            exchange.fetch_order_book("x", timeout=0.1)
+        self.assertEqual(exchange._api.fetch_order_book.call_count, 1)
+
+    def test_rate_limit_timeout_refunds_reservation(self):
+        limiter = RateLimiter(default=RateLimit(rate=1, burst=1))
+        limiter.acquire("kalshi", "fetch_markets")
+
+        for _ in range(3):
+            with self.assertRaises(RequestTimeout):
+                limiter.acquire("kalshi", "fetch_markets", timeout=0.1)
+
+        # Rejected callers didn't push the queue further back
+        bucket = limiter._buckets[("kalshi", None)]
+        self.assertLessEqual(bucket.reserve(), 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import queue
+import random
+import time
+import unittest
+
+from pmxt.models import Trade
+from pmxt.trades import TradeBuffer, TradeTracker
+
+
+def trade(n, timestamp, price, amount=1.0, side="buy"):
+    return Trade(id=str(n), timestamp=timestamp, price=price, amount=amount, side=side)
+
+
+def brute_force(trades):
+    volume = sum(t.amount for t in trades)
+    notional = sum(t.price * t.amount for t in trades)
+    buys = sum(t.amount for t in trades if t.side == "buy")
+    sells = sum(t.amount for t in trades if t.side == "sell")
+    return len(trades), volume, notional, buys - sells
+
+
+class TestTradeBuffer(unittest.TestCase):
+    def test_window_aggregates(self):
+        buffer = TradeBuffer(capacity=100, windows=(10,), counts=(2,))
+        buffer.add([
+            trade(1, 1_000, 0.40, 10, "buy"),
+            trade(2, 5_000, 0.50, 30, "sell"),
+            trade(3, 12_000, 0.60, 10, "buy"),
+        ])
+
+        stats = buffer.window(10, now=12)
+        self.assertEqual((stats.trades, stats.volume), (2, 40))
+        self.assertAlmostEqual(stats.vwap, (0.5 * 30 + 0.6 * 10) / 40)
+        self.assertEqual(stats.signed_flow, -20)
+        self.assertAlmostEqual(stats.imbalance, -0.5)
+
+        self.assertEqual(buffer.last(2).trades, 2)
+        self.assertAlmostEqual(buffer.last(2).vwap, stats.vwap)
+        self.assertEqual(buffer.last_prices(2), [0.5, 0.6])
+        self.assertEqual(buffer.last_price(), 0.6)
+
+        # Time passes with no trades
+        self.assertEqual(buffer.window(10, now=16).trades, 1)
+        self.assertIsNone(buffer.window(10, now=100).vwap)
+
+    def test_skips_repeated_trades(self):
+        buffer = TradeBuffer()
+        self.assertEqual(buffer.add([trade(1, 1, 0.5), trade(2, 2, 0.5)]), 2)
+        self.assertEqual(buffer.add([trade(2, 2, 0.5), trade(3, 3, 0.5)]), 1)
+        self.assertEqual(len(buffer), 3)
+
+    def test_matches_brute_force_past_capacity(self):
+        rng = random.Random(7)
+        buffer = TradeBuffer(capacity=50, windows=(30,), counts=(20, 50))
+        history = []
+        timestamp = 0
+        for n in range(500):
+            timestamp += rng.randint(0, 2_000)
+            history.append(trade(n, timestamp, rng.random(), rng.uniform(1, 10), rng.choice(["buy", "sell", "unknown"])))
+            buffer.add(history[-1:])
+
+            now = timestamp / 1000
+            in_window = [t for t in history[-50:] if t.timestamp >= timestamp - 30_000]
+            for stats, expected in (
+                (buffer.window(30, now=now), in_window),
+                (buffer.last(20), history[-20:]),
+                (buffer.last(50), history[-50:]),
+                (buffer.window(15, now=now), [t for t in history[-50:] if t.timestamp >= timestamp - 15_000]),
+            ):
+                count, volume, notional, flow = brute_force(expected)
+                self.assertEqual(stats.trades, count)
+                self.assertAlmostEqual(stats.volume, volume, places=6)
+                self.assertAlmostEqual(stats.notional, notional, places=6)
+                self.assertAlmostEqual(stats.signed_flow, flow, places=6)
+
+    def test_saturated_time_window(self):
+        buffer = TradeBuffer(capacity=3, windows=(60,))
+        buffer.add([trade(n, n * 1000, 0.5) for n in range(5)])
+        stats = buffer.window(60, now=5)
+        self.assertEqual(stats.trades, 3)
+        self.assertTrue(stats.saturated)
+        self.assertFalse(buffer.window(1, now=5).saturated)
+
+
+class TestTradeTracker(unittest.TestCase):
+    def test_feeds_buffers_from_watch_trades(self):
+        updates = queue.Queue()
+
+        class FakeExchange:
+            def watch_trades(self, outcome_id, since=None, limit=None, timeout=None):
+                return updates.get()
+
+        tracker = TradeTracker(FakeExchange(), windows=(60,))
+        buffer = tracker.track("o1")
+        now = int(time.time() * 1000)
+        updates.put([trade(1, now, 0.4, 5), trade(2, now, 0.6, 5)])
+
+        deadline = time.time() + 5
+        while len(buffer) < 2 and time.time() < deadline:
+            time.sleep(0.005)
+        self.assertAlmostEqual(tracker["o1"].window(60).vwap, 0.5)
+        tracker.close()
+        updates.put([])
+        self.assertNotIn("o1", tracker)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import json
+import unittest
+from unittest.mock import MagicMock
+
+import pmxt
+from pmxt.client import MSGPACK_CONTENT_TYPE
+from pmxt.errors import MarketNotFound
+
+from .conftest import make_exchange
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+
+def raw_response(body, status=200, content_type=MSGPACK_CONTENT_TYPE):
+    response = MagicMock(status=status, reason="OK")
+    response.headers = {"Content-Type": content_type}
+    if content_type == MSGPACK_CONTENT_TYPE:
+        response.data = msgpack.packb(body)
+    else:
+        response.data = json.dumps(body).encode()
+    return response
+
+
+BOOK = {"bids": [{"price": 0.41, "size": 120.0}], "asks": [{"price": 0.43, "size": 80.0}], "timestamp": 1}
+
+
+class TestWireFormat(unittest.TestCase):
+    def test_rejects_unknown_format(self):
+        with self.assertRaises(ValueError):
+            pmxt.Polymarket(auto_start_server=False, wire_format="cbor")
+
+    @unittest.skipIf(msgpack is None, "msgpack not installed")
+    def test_msgpack_skips_generated_models(self):
+        exchange = make_exchange(wire_format="msgpack")
+        raw = raw_response({"success": True, "data": BOOK})
+        exchange._api.fetch_order_book_without_preload_content.return_value = raw
+
+        book = exchange.fetch_order_book("x")
+
+        self.assertEqual((book.bids[0].price, book.asks[0].size), (0.41, 80.0))
+        headers = exchange._api.fetch_order_book_without_preload_content.call_args.kwargs["_headers"]
+        self.assertEqual(headers["Accept"], MSGPACK_CONTENT_TYPE)
+        exchange._api.fetch_order_book.assert_not_called()
+        raw.release_conn.assert_called_once()
+
+    @unittest.skipIf(msgpack is None, "msgpack not installed")
+    def test_json_fallback_and_errors(self):
+        exchange = make_exchange(wire_format="msgpack")
+        exchange._api.fetch_order_book_without_preload_content.side_effect = [
+            # A sidecar without MessagePack support answers with JSON
+            raw_response({"success": True, "data": BOOK}, content_type="application/json"),
+            raw_response(
+                {"success": False, "error": {"message": "no such market", "code": "MARKET_NOT_FOUND"}},
+                status=404,
+                content_type="application/json",
+            ),
+        ]
+
+        self.assertEqual(exchange.fetch_order_book("x").bids[0].price, 0.41)
+        with self.assertRaises(MarketNotFound):
+            exchange.fetch_order_book("y")
+
+
+if __name__ == '__main__':
+    unittest.main()